@@ -1,15 +1,41 @@
 """
 Configuración y manejo de conexión a base de datos
 """
+import threading
+from contextlib import contextmanager
 import mysql.connector
 from mysql.connector import Error
+from mysql.connector.constants import ClientFlag
+from config.pool import ConnectionPool
+from config.query_stats import QueryStats
+from config.statement_cache import StatementCache, StatementCacheStats
 from utils.exceptions import DatabaseConnectionError, DatabaseOperationError
+from utils.logger import get_logger
+
+logger = get_logger('db')
 
 
 class DatabaseConnection:
     """Clase para manejar la conexión a la base de datos MySQL"""
 
-    def __init__(self):
+    ROW_RETURNING_PREFIXES = ('SELECT', 'SHOW', 'DESCRIBE', 'EXPLAIN')
+
+    def __init__(self, pool_size=None, checkout_timeout=10, statement_cache_size=64,
+                 query_stats_window=1000, stream_pool_size=2):
+        """
+        Inicializa la configuración de conexión
+
+        Args:
+            pool_size (int): Tamaño del pool de conexiones. Si es None se usa
+                una única conexión compartida (comportamiento clásico)
+            checkout_timeout (float): Segundos a esperar por una conexión libre del pool
+            statement_cache_size (int): Sentencias preparadas que se mantienen
+                abiertas por conexión física
+            query_stats_window (int): Latencias recientes que se guardan por
+                consulta para calcular percentiles
+            stream_pool_size (int): Conexiones reservadas para iter_query, aparte
+                del pool principal
+        """
         self.connection = None
         self.cursor = None
         self.config = {
@@ -17,14 +43,45 @@ class DatabaseConnection:
             'database': 'hoteel',
             'user': 'root',
             'password': '',
-            'autocommit': False,
-            'buffered': True
+            # Cada sentencia suelta se confirma en el mismo viaje al servidor;
+            # transaction() abre transacciones explícitas cuando hacen falta
+            'autocommit': True,
+            'buffered': True,
+            # rowcount de UPDATE cuenta filas encontradas, no solo modificadas,
+            # para distinguir "sin cambios" de "no existe" sin consultar antes
+            'client_flags': [ClientFlag.FOUND_ROWS]
         }
+        self.pool_size = pool_size
+        self.checkout_timeout = checkout_timeout
+        self._pool = None
+        self.stream_pool_size = stream_pool_size
+        self._stream_pool = None  # Pool aparte de iter_query, creado en el primer uso
+        self._stream_pool_lock = threading.Lock()
+        self._local = threading.local()
+        self.statement_cache_size = statement_cache_size
+        self.statement_cache_stats = StatementCacheStats()
+        # Conexión física -> StatementCache; se vacía al cerrar la conexión
+        # (la caché guarda la conexión, así que no serviría una referencia débil)
+        self._statement_caches = {}
+        self._statement_caches_lock = threading.Lock()
+        self.query_stats = QueryStats(window_size=query_stats_window)
+        self.round_trips = 0
+        self._round_trip_lock = threading.Lock()
 
     def connect(self):
         """Establece conexión con la base de datos"""
         try:
+            if self.pool_size:
+                if self._pool is None:
+                    self._pool = ConnectionPool(
+                        self.config, size=self.pool_size, checkout_timeout=self.checkout_timeout,
+                        on_discard=self._forget_connection
+                    )
+                return True
+
             if self.connection is None or not self.connection.is_connected():
+                if self.connection is not None:
+                    self._forget_connection(self.connection)
                 self.connection = mysql.connector.connect(**self.config)
                 self.cursor = self.connection.cursor(buffered=True)
             return True
@@ -34,6 +91,18 @@ class DatabaseConnection:
     def disconnect(self):
         """Cierra la conexión con la base de datos"""
         try:
+            with self._statement_caches_lock:
+                caches = list(self._statement_caches.values())
+                self._statement_caches.clear()
+            for cache in caches:
+                cache.clear()
+            if self._pool:
+                self._pool.close_all()
+                self._pool = None
+            with self._stream_pool_lock:
+                if self._stream_pool:
+                    self._stream_pool.close_all()
+                    self._stream_pool = None
             if self.cursor:
                 self.cursor.close()
                 self.cursor = None
@@ -41,14 +110,148 @@ class DatabaseConnection:
                 self.connection.close()
                 self.connection = None
         except Error as e:
-            print(f"Error al cerrar conexión: {e}")
+            logger.error("Error al cerrar conexión: %s", e)
+
+    @contextmanager
+    def borrow(self):
+        """
+        Presta una conexión durante una operación
+
+        En modo pool cada hilo conserva la misma conexión mientras dure el
+        préstamo más externo, de modo que las llamadas anidadas (y las de
+        execute_query/call_procedure dentro del bloque) la reutilizan.
+
+        Yields:
+            Conexión de mysql.connector
+        """
+        self.connect()
+
+        if self._pool is None:
+            yield self.connection
+            return
+
+        local = self._local
+        if getattr(local, 'connection', None) is not None:
+            local.depth += 1
+            try:
+                yield local.connection
+            finally:
+                local.depth -= 1
+            return
+
+        connection = self._pool.checkout()
+        local.connection = connection
+        local.depth = 1
+        try:
+            yield connection
+        finally:
+            local.connection = None
+            local.depth = 0
+            self._pool.checkin(connection)
+
+    @contextmanager
+    def transaction(self):
+        """
+        Agrupa varias operaciones en una única transacción (unidad de trabajo)
+
+        Dentro del bloque execute_query, execute_prepared, execute_many y
+        call_procedure no confirman cada sentencia: se hace un solo COMMIT al
+        salir, o ROLLBACK si el bloque lanza una excepción. Los bloques
+        anidados usan SAVEPOINT, de modo que un error interno capturado solo
+        deshace su propio tramo.
+
+            with db.transaction():
+                clientes.create(datos)
+                hoteles.update(hotel_id, otros_datos)
+
+        Yields:
+            Conexión de mysql.connector usada por toda la transacción
+        """
+        with self.borrow() as connection:
+            depth = getattr(self._local, 'transaction_depth', 0)
+            savepoint = f"sp_nivel_{depth}"
+
+            if depth:
+                self._execute_control(connection, f"SAVEPOINT {savepoint}")
+            elif self.config.get('autocommit'):
+                connection.start_transaction()
+                self._count_round_trips()
+
+            self._local.transaction_depth = depth + 1
+            try:
+                yield connection
+            except BaseException:
+                try:
+                    if depth:
+                        self._execute_control(connection, f"ROLLBACK TO SAVEPOINT {savepoint}")
+                    else:
+                        connection.rollback()
+                        self._count_round_trips()
+                except Error as e:
+                    logger.error("Error revirtiendo transacción: %s", e)
+                raise
+            else:
+                try:
+                    if depth:
+                        self._execute_control(connection, f"RELEASE SAVEPOINT {savepoint}")
+                    else:
+                        timer = self.query_stats.track("COMMIT")
+                        connection.commit()
+                        self._count_round_trips()
+                        timer.finish()
+                except Error as e:
+                    connection.rollback()
+                    raise DatabaseOperationError(f"Error confirmando transacción: {e}", errno=e.errno)
+            finally:
+                self._local.transaction_depth = depth
+
+    def in_transaction(self):
+        """
+        Indica si el hilo actual está dentro de un bloque transaction()
+
+        Returns:
+            bool: True si las sentencias no deben confirmarse individualmente
+        """
+        return getattr(self._local, 'transaction_depth', 0) > 0
+
+    @contextmanager
+    def measure_round_trips(self):
+        """
+        Cuenta los viajes al servidor hechos por el hilo actual dentro del bloque
+
+            with db.measure_round_trips() as meter:
+                clientes.update(7, datos)
+            meter.count  # -> 1
+
+        Yields:
+            RoundTripMeter: Contador cuyo atributo count se fija al salir
+        """
+        meter = RoundTripMeter()
+        start = getattr(self._local, 'round_trips', 0)
+        try:
+            yield meter
+        finally:
+            meter.count = getattr(self._local, 'round_trips', 0) - start
+
+    def pool_stats(self):
+        """
+        Obtiene el estado del pool de conexiones
+
+        Returns:
+            dict: Estadísticas del pool o None si no se usa pool
+        """
+        return self._pool.stats() if self._pool else None
 
     def test_connection(self):
         """Prueba la conexión a la base de datos"""
         try:
-            self.connect()
-            self.cursor.execute("SELECT 1")
-            result = self.cursor.fetchone()
+            with self.borrow() as connection:
+                cursor = connection.cursor(buffered=True)
+                try:
+                    cursor.execute("SELECT 1")
+                    result = cursor.fetchone()
+                finally:
+                    cursor.close()
             return result is not None
         except Exception:
             return False
@@ -64,25 +267,30 @@ class DatabaseConnection:
         Returns:
             tuple: (success, results) donde success es bool y results es list
         """
-        try:
-            self.connect()
-
-            if parameters:
-                self.cursor.callproc(procedure_name, parameters)
-            else:
-                self.cursor.callproc(procedure_name)
+        with self.borrow() as connection:
+            cursor = connection.cursor(buffered=True)
+            timer = self.query_stats.track(f"CALL {procedure_name}")
+            try:
+                if parameters:
+                    cursor.callproc(procedure_name, parameters)
+                else:
+                    cursor.callproc(procedure_name)
+                self._count_round_trips()
 
-            # Obtener resultados
-            results = []
-            for result in self.cursor.stored_results():
-                results.extend(result.fetchall())
+                # Obtener resultados
+                results = []
+                for result in cursor.stored_results():
+                    results.extend(result.fetchall())
 
-            return True, results
+                timer.finish(rows=len(results))
+                return True, results
 
-        except Error as e:
-            if self.connection:
-                self.connection.rollback()
-            raise DatabaseOperationError(f"Error ejecutando procedimiento {procedure_name}: {e}")
+            except Error as e:
+                timer.finish(failed=True)
+                self._rollback_statement(connection)
+                raise DatabaseOperationError(f"Error ejecutando procedimiento {procedure_name}: {e}", errno=e.errno)
+            finally:
+                cursor.close()
 
     def execute_query(self, query, parameters=None):
         """
@@ -96,47 +304,398 @@ class DatabaseConnection:
             list: Resultados de la consulta (solo para SELECT)
             int: Número de filas afectadas (para INSERT, UPDATE, DELETE)
         """
-        try:
-            self.connect()
-            print(f"📝 Ejecutando query: {query}")
-            print(f"📋 Parámetros: {parameters}")
+        with self.borrow() as connection:
+            cursor = connection.cursor(buffered=True)
+            timer = self.query_stats.track(query)
+            try:
+                # Los valores de los parámetros no se registran: pueden contener datos personales
+                logger.debug("Ejecutando query: %s (%d parámetros)",
+                             query, len(parameters) if parameters else 0)
 
-            if parameters:
-                self.cursor.execute(query, parameters)
-            else:
-                self.cursor.execute(query)
+                if parameters:
+                    cursor.execute(query, parameters)
+                else:
+                    cursor.execute(query)
+                self._count_round_trips()
 
-            # Verificar tipo de consulta
-            query_type = query.strip().upper()
+                # Verificar tipo de consulta
+                if self._returns_rows(query):
+                    # Para consultas que retornan datos
+                    results = cursor.fetchall()
+                    timer.finish(rows=len(results))
+                    logger.debug("Resultados obtenidos: %d filas", len(results))
+                    return results
+                else:
+                    # Para INSERT, UPDATE, DELETE - hacer commit (salvo dentro de
+                    # transaction()) y retornar filas afectadas
+                    self._commit_statement(connection)
+                    rows_affected = cursor.rowcount
+                    timer.finish(rows=rows_affected)
+                    logger.debug("Query ejecutada. Filas afectadas: %d", rows_affected)
+                    return rows_affected
 
-            if query_type.startswith('SELECT') or query_type.startswith('SHOW') or query_type.startswith('DESCRIBE'):
-                # Para consultas que retornan datos
-                results = self.cursor.fetchall()
-                print(f"📊 Resultados obtenidos: {len(results)} filas")
-                return results
-            else:
-                # Para INSERT, UPDATE, DELETE - hacer commit y retornar filas afectadas
-                self.connection.commit()
-                rows_affected = self.cursor.rowcount
-                print(f"✅ Query ejecutada. Filas afectadas: {rows_affected}")
-                return rows_affected
+            except Error as e:
+                timer.finish(failed=True)
+                self._rollback_statement(connection)
+                logger.error("Error en execute_query: %s", e)
+                raise DatabaseOperationError(f"Error ejecutando consulta: {e}", errno=e.errno)
+            finally:
+                cursor.close()
+
+    def execute_many(self, query, seq_parameters):
+        """
+        Ejecuta una sentencia con varios juegos de parámetros en una sola transacción
+
+        Para INSERT ... VALUES mysql.connector la reescribe como un único
+        INSERT multi-fila.
+
+        Args:
+            query (str): Sentencia SQL con marcadores %s
+            seq_parameters (list): Lista de tuplas de parámetros
+
+        Returns:
+            tuple: (filas afectadas, primer ID autoincremental generado)
+        """
+        if not seq_parameters:
+            return 0, None
+
+        with self.borrow() as connection:
+            cursor = connection.cursor(buffered=True)
+            timer = self.query_stats.track(query)
+            try:
+                cursor.executemany(query, seq_parameters)
+                # mysql.connector reescribe INSERT ... VALUES como una sola sentencia
+                self._count_round_trips(1 if self._is_insert(query) else len(seq_parameters))
+                self._commit_statement(connection)
+                timer.finish(rows=cursor.rowcount)
+                return cursor.rowcount, cursor.lastrowid
+            except Error as e:
+                timer.finish(failed=True)
+                self._rollback_statement(connection)
+                raise DatabaseOperationError(f"Error ejecutando inserción masiva: {e}", errno=e.errno)
+            finally:
+                cursor.close()
+
+    def execute_prepared(self, query, parameters=None):
+        """
+        Ejecuta una consulta como sentencia preparada del servidor, reutilizándola entre llamadas
+
+        Las sentencias se guardan en una caché LRU por conexión indexada por el
+        texto SQL, así que las consultas repetidas (get_by_id, update, delete)
+        solo se analizan en el servidor la primera vez. Mismo contrato de
+        retorno que execute_query.
+
+        Args:
+            query (str): Consulta SQL con marcadores %s
+            parameters (tuple): Parámetros de la consulta
+
+        Returns:
+            list: Resultados de la consulta (solo para SELECT)
+            int: Número de filas afectadas (para INSERT, UPDATE, DELETE)
+        """
+        with self.borrow() as connection:
+            cache = self._statement_cache_for(connection)
+            # La primera ejecución en esta conexión añade el PREPARE
+            prepare_trips = 0 if query in cache else 1
+            cursor = cache.get(query)
+            timer = self.query_stats.track(query)
+            try:
+                cursor.execute(query, parameters or ())
+                self._count_round_trips(1 + prepare_trips)
+
+                if self._returns_rows(query):
+                    results = cursor.fetchall()
+                    timer.finish(rows=len(results))
+                    return results
+
+                self._commit_statement(connection)
+                timer.finish(rows=cursor.rowcount)
+                return cursor.rowcount
 
+            except Error as e:
+                timer.finish(failed=True)
+                cache.discard(query)
+                self._rollback_statement(connection)
+                raise DatabaseOperationError(f"Error ejecutando consulta preparada: {e}", errno=e.errno)
+
+    def execute_insert(self, query, parameters=None):
+        """
+        Ejecuta un INSERT preparado y devuelve el ID autoincremental generado
+
+        El ID llega en la respuesta OK del propio INSERT (cursor.lastrowid), así
+        que no hace falta un SELECT LAST_INSERT_ID() posterior.
+
+        Args:
+            query (str): INSERT con marcadores %s
+            parameters (tuple): Parámetros de la consulta
+
+        Returns:
+            int: ID generado, o None si la tabla no tiene AUTO_INCREMENT
+        """
+        with self.borrow() as connection:
+            cache = self._statement_cache_for(connection)
+            prepare_trips = 0 if query in cache else 1
+            cursor = cache.get(query)
+            timer = self.query_stats.track(query)
+            try:
+                cursor.execute(query, parameters or ())
+                self._count_round_trips(1 + prepare_trips)
+                self._commit_statement(connection)
+                timer.finish(rows=cursor.rowcount)
+                return cursor.lastrowid or None
+
+            except Error as e:
+                timer.finish(failed=True)
+                cache.discard(query)
+                self._rollback_statement(connection)
+                raise DatabaseOperationError(f"Error ejecutando inserción: {e}", errno=e.errno)
+
+    def get_statement_cache_stats(self):
+        """
+        Obtiene los contadores de la caché de sentencias preparadas
+
+        Returns:
+            dict: hits, misses, evictions, hit_ratio y sentencias abiertas
+        """
+        stats = self.statement_cache_stats.as_dict()
+        with self._statement_caches_lock:
+            caches = list(self._statement_caches.values())
+        stats['open_statements'] = sum(len(cache) for cache in caches)
+        return stats
+
+    def get_query_stats(self, order_by='total_ms'):
+        """
+        Obtiene las latencias por consulta normalizada (literales reemplazados por ?)
+
+        Args:
+            order_by (str): Métrica de ordenación descendente ('total_ms',
+                'calls', 'p95_ms', ...)
+
+        Returns:
+            list: Un diccionario por consulta con calls, errors, rows, total_ms,
+                avg_ms, max_ms y p50_ms/p95_ms/p99_ms
+        """
+        return self.query_stats.snapshot(order_by=order_by)
+
+    def reset_query_stats(self):
+        """Descarta las latencias acumuladas"""
+        self.query_stats.reset()
+
+    def dump_query_stats(self, path):
+        """
+        Guarda las latencias por consulta en un archivo JSON
+
+        Args:
+            path (str): Ruta del archivo de salida
+        """
+        self.query_stats.dump_json(path)
+        logger.info("Estadísticas de consultas guardadas en %s", path)
+
+    def iter_query(self, query, parameters=None, batch_size=500):
+        """
+        Ejecuta una consulta SELECT y entrega las filas en lotes sin cargarlas todas en memoria
+
+        Usa un cursor no bufferizado y fetchmany() sobre una conexión propia
+        (ver _stream_connection), ocupada hasta que el generador se agota o se
+        cierra; el resto de consultas del hilo pueden ejecutarse entre lote y
+        lote. Dentro de transaction() se usa la conexión de la transacción
+        (para ver sus escrituras) con un cursor bufferizado, que sí lee todo el
+        resultado de una vez.
+
+        Args:
+            query (str): Consulta SQL
+            parameters (tuple): Parámetros de la consulta
+            batch_size (int): Filas pedidas al servidor en cada fetchmany()
+
+        Yields:
+            tuple: Cada fila del resultado
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size debe ser al menos 1")
+
+        with self._stream_connection() as (connection, buffered):
+            cursor = connection.cursor(buffered=buffered)
+            # Mide la iteración completa, incluido el tiempo del consumidor entre lotes
+            timer = self.query_stats.track(query)
+            row_count = 0
+            failed = False
+            try:
+                if parameters:
+                    cursor.execute(query, parameters)
+                else:
+                    cursor.execute(query)
+                self._count_round_trips()
+
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    row_count += len(rows)
+                    for row in rows:
+                        yield row
+
+            except Error as e:
+                failed = True
+                raise DatabaseOperationError(f"Error ejecutando consulta: {e}", errno=e.errno)
+            finally:
+                timer.finish(rows=row_count, failed=failed)
+                # Si el consumidor abandonó la iteración quedan filas pendientes
+                try:
+                    if connection.unread_result:
+                        connection.consume_results()
+                    cursor.close()
+                except Error:
+                    pass
+
+    @contextmanager
+    def _stream_connection(self):
+        """
+        Conexión para un cursor no bufferizado que no comparte nadie más
+
+        Un resultado sin leer bloquea su conexión ("Unread result found"), así
+        que iter_query no usa la conexión prestada al hilo. Tampoco toma
+        conexiones del pool principal, que los hilos de trabajo podrían agotar
+        dejando esperando al hilo de la interfaz: usa un pool aparte de
+        stream_pool_size conexiones y, si están todas ocupadas, abre una suelta
+        y la cierra al terminar.
+
+        Yields:
+            tuple: (conexión, True si hay que usar un cursor bufferizado)
+        """
+        if self.in_transaction():
+            with self.borrow() as connection:
+                yield connection, True
+            return
+
+        stream_pool = self._get_stream_pool()
+        pooled = None
+        if stream_pool is not None:
+            try:
+                pooled = stream_pool.checkout(timeout=0)
+            except DatabaseConnectionError:
+                pooled = None
+        if pooled is not None:
+            try:
+                yield pooled, False
+            finally:
+                stream_pool.checkin(pooled)
+            return
+
+        try:
+            connection = mysql.connector.connect(**self.config)
         except Error as e:
-            if self.connection:
-                self.connection.rollback()
-            print(f"❌ Error en execute_query: {e}")
-            raise DatabaseOperationError(f"Error ejecutando consulta: {e}")
+            raise DatabaseConnectionError(f"Error conectando a la base de datos: {e}")
+        try:
+            yield connection, False
+        finally:
+            try:
+                connection.close()
+            except Error:
+                pass
+
+    def _get_stream_pool(self):
+        """Pool de conexiones de iter_query (None si stream_pool_size es 0)"""
+        with self._stream_pool_lock:
+            if self._stream_pool is None and self.stream_pool_size:
+                self._stream_pool = ConnectionPool(
+                    self.config, size=self.stream_pool_size, checkout_timeout=0
+                )
+            return self._stream_pool
 
     def commit(self):
         """Confirma las transacciones pendientes"""
-        if self.connection:
-            self.connection.commit()
+        connection = self._current_connection()
+        if connection:
+            connection.commit()
+            self._count_round_trips()
 
     def rollback(self):
         """Revierte las transacciones pendientes"""
-        if self.connection:
-            self.connection.rollback()
+        connection = self._current_connection()
+        if connection:
+            connection.rollback()
+            self._count_round_trips()
 
     def is_connected(self):
         """Verifica si la conexión está activa"""
-        return self.connection is not None and self.connection.is_connected()
\ No newline at end of file
+        if self._pool is not None:
+            return not self._pool.closed
+        return self.connection is not None and self.connection.is_connected()
+
+    def _commit_statement(self, connection):
+        """
+        Confirma una sentencia suelta
+
+        Con autocommit el servidor ya la confirmó; dentro de transaction() lo
+        hace el bloque al salir.
+        """
+        if not self.in_transaction() and not self.config.get('autocommit'):
+            connection.commit()
+            self._count_round_trips()
+
+    def _rollback_statement(self, connection):
+        """
+        Revierte tras una sentencia fallida fuera de transaction()
+
+        Dentro de una transacción el error se propaga y es el bloque (o su
+        SAVEPOINT) quien decide qué deshacer.
+        """
+        if not self.in_transaction() and not self.config.get('autocommit'):
+            connection.rollback()
+            self._count_round_trips()
+
+    def _execute_control(self, connection, statement):
+        """Ejecuta una sentencia de control de transacción (SAVEPOINT, RELEASE...)"""
+        cursor = connection.cursor()
+        try:
+            cursor.execute(statement)
+            self._count_round_trips()
+        finally:
+            cursor.close()
+
+    def _count_round_trips(self, count=1):
+        """Suma viajes al servidor al total y al contador del hilo actual"""
+        with self._round_trip_lock:
+            self.round_trips += count
+        self._local.round_trips = getattr(self._local, 'round_trips', 0) + count
+
+    def _statement_cache_for(self, connection):
+        """Caché de sentencias preparadas asociada a una conexión física"""
+        with self._statement_caches_lock:
+            cache = self._statement_caches.get(connection)
+            if cache is None:
+                cache = StatementCache(
+                    connection, max_size=self.statement_cache_size, stats=self.statement_cache_stats
+                )
+                self._statement_caches[connection] = cache
+            return cache
+
+    def _forget_connection(self, connection):
+        """Cierra y suelta la caché de sentencias de una conexión que se va a cerrar"""
+        with self._statement_caches_lock:
+            cache = self._statement_caches.pop(connection, None)
+        if cache is not None:
+            cache.clear()
+
+    @classmethod
+    def _returns_rows(cls, query):
+        """Indica si la consulta devuelve filas que deben leerse"""
+        return query.lstrip().upper().startswith(cls.ROW_RETURNING_PREFIXES)
+
+    @staticmethod
+    def _is_insert(query):
+        """Indica si la sentencia es un INSERT (o REPLACE)"""
+        return query.lstrip().upper().startswith(('INSERT', 'REPLACE'))
+
+    def _current_connection(self):
+        """Conexión en uso por el hilo actual (o la compartida fuera del modo pool)"""
+        if self._pool is not None:
+            return getattr(self._local, 'connection', None)
+        return self.connection
+
+
+class RoundTripMeter:
+    """Resultado de DatabaseConnection.measure_round_trips()"""
+
+    def __init__(self):
+        self.count = 0
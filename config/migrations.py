@@ -0,0 +1,592 @@
+"""
+Migraciones versionadas del esquema hoteel
+
+Cada migración se aplica una sola vez y queda registrada en la tabla
+schema_migrations. Los pasos comprueban el estado actual antes de actuar
+(índice ya creado, clave primaria ya definida...), así que una migración
+interrumpida a medias puede volver a ejecutarse.
+
+Las migraciones se aplican solo desde la línea de comandos, después de
+confirmar (o con --yes); la aplicación se niega a arrancar mientras falte
+alguna obligatoria y solo avisa de las opcionales (índices y triggers).
+
+    python -m config.migrations            # aplica las pendientes (pide confirmación)
+    python -m config.migrations --yes      # aplica las pendientes sin preguntar
+    python -m config.migrations --status   # lista aplicadas y pendientes
+    python -m config.migrations --check    # EXPLAIN de las consultas frecuentes
+"""
+import json
+import sys
+from utils.exceptions import DatabaseOperationError
+from utils.logger import get_logger
+
+logger = get_logger('db')
+
+# Tabla -> columna de ID (todas INT) que pasa a ser PRIMARY KEY AUTO_INCREMENT
+PRIMARY_KEYS = (
+    ('hoteles', 'id_hotel'),
+    ('clientes', 'id_cliente'),
+    ('empleados', 'id_empleado'),
+    ('tipos_habitacion', 'id_tipo_habitacion'),
+    ('temporadas', 'id_temporada'),
+    ('tarifas', 'id_tarifas'),
+    ('salones', 'id_salon'),
+    ('habitaciones', 'id_habitacion'),
+    ('servicios', 'id_servicio'),
+    ('habitacion_servicio', 'id_habitacion_servicio'),
+    ('reservas', 'id_reserva'),
+    ('reserva_servicio', 'id_reserva_servicio'),
+    ('check_in_out', 'id_check'),
+    ('consumo_servicos', 'id_consumo_servicios'),
+    ('eventos', 'id_eventos')
+)
+
+# (tabla, nombre del índice, columnas): filtros de los modelos, columnas de
+# unión y columnas de ordenación de get_page()
+SECONDARY_INDEXES = (
+    ('clientes', 'idx_clientes_documento', ('documento_identidad',)),
+    ('clientes', 'idx_clientes_nombre', ('nombre',)),
+    ('clientes', 'idx_clientes_apellido', ('apellido',)),
+    ('hoteles', 'idx_hoteles_nombre', ('nombre_hotel',)),
+    ('hoteles', 'idx_hoteles_direccion', ('direccion',)),
+    ('empleados', 'idx_empleados_hotel', ('id_hotel',)),
+    ('salones', 'idx_salones_hotel', ('id_hotel',)),
+    ('habitaciones', 'idx_habitaciones_hotel', ('id_hotel',)),
+    ('habitaciones', 'idx_habitaciones_tipo', ('id_tipo_habitacion',)),
+    ('tarifas', 'idx_tarifas_tipo_temporada', ('id_tipo_habitacion', 'id_temporada')),
+    ('temporadas', 'idx_temporadas_fechas', ('fecha_inicio', 'fecha_fin')),
+    ('reservas', 'idx_reservas_cliente', ('id_cliente',)),
+    ('reservas', 'idx_reservas_fechas', ('fecha_llegada', 'fecha_salida')),
+    ('reservas', 'idx_reservas_tipo', ('id_tipo_habitacion',)),
+    ('reserva_servicio', 'idx_reserva_servicio_reserva', ('id_reserva',)),
+    ('habitacion_servicio', 'idx_habitacion_servicio_habitacion', ('id_habitacion',)),
+    ('check_in_out', 'idx_check_in_out_cliente', ('id_cliente',)),
+    ('check_in_out', 'idx_check_in_out_reserva', ('id_reserva',)),
+    ('check_in_out', 'idx_check_in_out_habitacion', ('id_habitacion',)),
+    ('check_in_out', 'idx_check_in_out_fechas', ('fecha_llegada', 'fecha_salida')),
+    ('consumo_servicos', 'idx_consumo_cliente', ('id_cliente',)),
+    ('consumo_servicos', 'idx_consumo_habitacion', ('id_habitacion',)),
+    ('eventos', 'idx_eventos_cliente', ('id_cliente',))
+)
+
+# Tablas cuyas escrituras mantienen table_versions (ver BaseModel.get_change_token)
+VERSIONED_TABLES = ('hoteles', 'clientes', 'check_in_out', 'reservas')
+
+# (descripción, consulta, parámetros, índice esperado) para check_indexes()
+HOT_QUERIES = (
+    ("Cliente por ID", "SELECT * FROM clientes WHERE id_cliente = %s", (1,), 'PRIMARY'),
+    ("Hotel por ID", "SELECT * FROM hoteles WHERE id_hotel = %s", (1,), 'PRIMARY'),
+    ("Cliente por documento", "SELECT * FROM clientes WHERE documento_identidad = %s", (1,),
+     'idx_clientes_documento'),
+    ("Página de clientes por nombre",
+     "SELECT nombre, id_cliente, clientes.* FROM clientes "
+     "WHERE nombre > %s OR (nombre = %s AND id_cliente > %s) "
+     "ORDER BY nombre, id_cliente LIMIT %s", ('', '', 0, 201), 'idx_clientes_nombre'),
+    ("Habitaciones de un hotel", "SELECT * FROM habitaciones WHERE id_hotel = %s", (1,),
+     'idx_habitaciones_hotel'),
+    ("Reservas de un cliente", "SELECT * FROM reservas WHERE id_cliente = %s", (1,),
+     'idx_reservas_cliente'),
+    ("Reservas que se solapan con un rango",
+     "SELECT * FROM reservas WHERE fecha_llegada < %s AND fecha_salida > %s",
+     ('2025-01-31', '2025-01-01'), 'idx_reservas_fechas'),
+    ("Estancias que se solapan con un rango",
+     "SELECT * FROM check_in_out WHERE fecha_llegada < %s AND fecha_salida > %s",
+     ('2025-01-31', '2025-01-01'), 'idx_check_in_out_fechas'),
+    ("Estancias de un cliente", "SELECT * FROM check_in_out WHERE id_cliente = %s", (1,),
+     'idx_check_in_out_cliente'),
+    ("Reservas vigentes de un hotel",
+     "SELECT * FROM reservas WHERE id_hotel = %s AND fecha_salida > %s",
+     (1, '2025-01-01'), 'idx_reservas_hotel_salida'),
+    ("Reservas de un hotel y tipo en un rango (sobreventa)",
+     "SELECT * FROM reservas WHERE id_hotel = %s AND id_tipo_habitacion = %s "
+     "AND fecha_salida > %s AND fecha_llegada < %s",
+     (1, 1, '2025-01-01', '2025-01-31'), 'idx_reservas_hotel_salida'),
+    ("Estancias vigentes (recepción)",
+     "SELECT * FROM check_in_out WHERE fecha_salida >= %s", ('2025-01-01',),
+     'idx_check_in_out_salida')
+)
+
+
+class MigrationRunner:
+    """Aplica en orden las migraciones pendientes sobre una DatabaseConnection"""
+
+    def __init__(self, db_connection):
+        """
+        Args:
+            db_connection: Instancia de DatabaseConnection
+        """
+        self.db = db_connection
+        # (versión, descripción, función, obligatoria): sin las obligatorias los
+        # modelos fallan (create() necesita AUTO_INCREMENT, las reservas leen
+        # id_hotel); sin las opcionales solo se pierde rendimiento
+        self.migrations = (
+            (1, "Claves primarias AUTO_INCREMENT sin IDs duplicados", self._migrate_primary_keys,
+             True),
+            (2, "Índices de búsqueda, unión y ordenación", self._migrate_secondary_indexes, False),
+            (3, "Tabla table_versions y triggers de cambios", self._migrate_table_versions, False),
+            (4, "Hotel de cada reserva (reservas.id_hotel)", self._migrate_reservas_hotel, True),
+            (5, "Índice de estancias por salida (check_in_out.fecha_salida)",
+             self._migrate_check_in_out_salida, False),
+            (6, "Triggers de cambios de check_in_out (recepción en varios puestos)",
+             self._migrate_check_in_out_versions, False),
+            (7, "Triggers de cambios de reservas (disponibilidad en varios puestos)",
+             self._migrate_reservas_versions, False)
+        )
+
+    def run(self):
+        """
+        Aplica las migraciones pendientes
+
+        Las migraciones no dependen unas de otras, así que un fallo no impide
+        intentar las siguientes (sin privilegio TRIGGER la 3 falla, pero la 4 y
+        la 5 se aplican igual). Los fallos se notifican todos juntos al final.
+
+        Returns:
+            list: Versiones aplicadas en esta ejecución
+
+        Raises:
+            DatabaseOperationError: Si alguna migración falla; las demás quedan
+                aplicadas y registradas
+        """
+        self._ensure_migrations_table()
+        applied = self.applied_versions()
+        done = []
+        failed = []
+        for version, description, apply, _ in self.migrations:
+            if version in applied:
+                continue
+            logger.info("Aplicando migración %s: %s", version, description)
+            try:
+                apply()
+                self.db.execute_query(
+                    "INSERT INTO schema_migrations (version, description) VALUES (%s, %s)",
+                    (version, description)
+                )
+            except DatabaseOperationError as e:
+                logger.error("Migración %s fallida: %s", version, e)
+                failed.append(f"{version} ({description}): {e}")
+                continue
+            done.append(version)
+
+        if failed:
+            raise DatabaseOperationError(
+                "Migraciones fallidas: " + "; ".join(failed)
+                + (f". Aplicadas: {done}" if done else "")
+            )
+        return done
+
+    def applied_versions(self):
+        """
+        Obtiene las versiones ya aplicadas
+
+        Returns:
+            set: Números de versión registrados en schema_migrations
+        """
+        if not self._table_exists('schema_migrations'):
+            return set()
+        rows = self.db.execute_query("SELECT version FROM schema_migrations")
+        return {row[0] for row in rows or []}
+
+    def pending(self):
+        """
+        Obtiene las migraciones que faltan por aplicar (no modifica el esquema)
+
+        Returns:
+            list: Tuplas (versión, descripción, obligatoria)
+        """
+        applied = self.applied_versions()
+        return [(version, description, required)
+                for version, description, _, required in self.migrations
+                if version not in applied]
+
+    def check_indexes(self):
+        """
+        Comprueba con EXPLAIN que las consultas frecuentes pueden usar sus índices
+
+        En tablas con pocas filas el optimizador puede preferir recorrerlas
+        enteras aunque el índice exista; por eso se distingue entre índice
+        disponible (possible_keys) e índice elegido (key).
+
+        Returns:
+            list: Diccionarios con description, table, access_type, possible_keys,
+                key, expected, usable (el índice esperado está disponible) y used
+        """
+        report = []
+        for description, query, parameters, expected in HOT_QUERIES:
+            rows = self.db.execute_query(f"EXPLAIN FORMAT=JSON {query}", parameters)
+            plan = json.loads(rows[0][0]) if rows else {}
+            table = _first_table(plan) or {}
+            possible_keys = table.get('possible_keys') or []
+            report.append({
+                'description': description,
+                'table': table.get('table_name'),
+                'access_type': table.get('access_type'),
+                'possible_keys': possible_keys,
+                'key': table.get('key'),
+                'expected': expected,
+                'usable': expected in possible_keys or table.get('key') == expected,
+                'used': table.get('key') == expected
+            })
+        return report
+
+    # Migraciones
+
+    def _migrate_primary_keys(self):
+        """
+        Renumera IDs repetidos o no positivos y define las claves primarias
+
+        Raises:
+            DatabaseOperationError: Si un ID que habría que renumerar está
+                referenciado desde otra tabla (ver _dedupe_ids)
+        """
+        for table, column in PRIMARY_KEYS:
+            if not self._table_exists(table) or self._has_primary_key(table):
+                continue
+            renumbered = self._dedupe_ids(table, column)
+            if renumbered:
+                logger.warning("%s: %d filas con %s repetido o no válido recibieron un ID nuevo "
+                               "(ver migration_id_changes)", table, renumbered, column)
+            self.db.execute_query(
+                f"ALTER TABLE {table} MODIFY {column} INT NOT NULL AUTO_INCREMENT, "
+                f"ADD PRIMARY KEY ({column})"
+            )
+
+    def _migrate_secondary_indexes(self):
+        """Crea los índices secundarios que no existan"""
+        for table, index_name, columns in SECONDARY_INDEXES:
+            if not self._table_exists(table) or self._has_index(table, index_name):
+                continue
+            self.db.execute_query(
+                f"CREATE INDEX {index_name} ON {table} ({', '.join(columns)})"
+            )
+
+    def _migrate_table_versions(self):
+        """
+        Crea table_versions y los triggers que la incrementan (igual que hoteel.sql)
+
+        Los triggers son por fila y todos actualizan la fila de su tabla en
+        table_versions: las escrituras concurrentes en una tabla versionada se
+        serializan en ese bloqueo y un INSERT multi-fila hace un incremento por
+        fila (coste aceptado en tablas de pocas escrituras, ver hoteel.sql).
+        """
+        self._create_version_triggers(('hoteles', 'clientes'))
+
+    def _migrate_check_in_out_versions(self):
+        """
+        Versiona check_in_out como la migración 3 a hoteles y clientes
+
+        models.front_desk compara la versión antes de cada consulta para ver
+        las llegadas y salidas registradas desde otros puestos; sin triggers,
+        COUNT/MAX no detecta una salida (es un UPDATE).
+        """
+        if self._table_exists('check_in_out'):
+            self._create_version_triggers(('check_in_out',))
+
+    def _migrate_reservas_versions(self):
+        """
+        Versiona reservas como la migración 3 a hoteles y clientes
+
+        models.availability compara la versión antes de cada consulta para
+        ver las reservas escritas desde otros puestos; sin triggers, COUNT/MAX
+        no detecta una cancelación ni un cambio de fechas (son UPDATE).
+        """
+        if self._table_exists('reservas'):
+            self._create_version_triggers(('reservas',))
+
+    def _create_version_triggers(self, tables):
+        """Crea table_versions si falta, la fila de cada tabla y sus tres triggers"""
+        self.db.execute_query(
+            "CREATE TABLE IF NOT EXISTS table_versions ("
+            "table_name VARCHAR(64) NOT NULL PRIMARY KEY, "
+            "version BIGINT UNSIGNED NOT NULL DEFAULT 0)"
+        )
+        for table in tables:
+            self.db.execute_query(
+                "INSERT IGNORE INTO table_versions (table_name, version) VALUES (%s, 0)", (table,)
+            )
+            for event in ('INSERT', 'UPDATE', 'DELETE'):
+                trigger = f"trg_{table}_version_{event.lower()}"
+                if self._trigger_exists(trigger):
+                    continue
+                self.db.execute_query(
+                    f"CREATE TRIGGER {trigger} AFTER {event} ON {table} FOR EACH ROW "
+                    f"INSERT INTO table_versions (table_name, version) VALUES ('{table}', 1) "
+                    f"ON DUPLICATE KEY UPDATE version = version + 1"
+                )
+
+    def _migrate_reservas_hotel(self):
+        """
+        Añade reservas.id_hotel, lo rellena desde las estancias y lo indexa
+
+        Las reservas solo guardan el tipo de habitación, así que el hotel de
+        las existentes se deduce de la habitación asignada en check_in_out;
+        las que no tienen estancia quedan con id_hotel NULL. La columna va al
+        final para que SELECT * siga devolviendo las demás en su posición.
+        """
+        if not self._table_exists('reservas'):
+            return
+        if not self._column_exists('reservas', 'id_hotel'):
+            self.db.execute_query("ALTER TABLE reservas ADD COLUMN id_hotel INT NULL")
+
+        if self._table_exists('check_in_out') and self._table_exists('habitaciones'):
+            self.db.execute_query(
+                "UPDATE reservas r JOIN ("
+                "SELECT c.id_reserva, MIN(h.id_hotel) AS id_hotel FROM check_in_out c "
+                "JOIN habitaciones h ON h.id_habitacion = c.id_habitacion "
+                "GROUP BY c.id_reserva) asignadas ON asignadas.id_reserva = r.id_reserva "
+                "SET r.id_hotel = asignadas.id_hotel WHERE r.id_hotel IS NULL"
+            )
+
+        if not self._has_index('reservas', 'idx_reservas_hotel_salida'):
+            self.db.execute_query(
+                "CREATE INDEX idx_reservas_hotel_salida ON reservas (id_hotel, fecha_salida)"
+            )
+
+    def _migrate_check_in_out_salida(self):
+        """
+        Indexa check_in_out.fecha_salida
+
+        models.front_desk carga cada día las estancias con salida desde hoy y
+        consulta las salidas de un día; idx_check_in_out_fechas empieza por
+        fecha_llegada y no sirve para ese filtro.
+        """
+        if not self._table_exists('check_in_out'):
+            return
+        if not self._has_index('check_in_out', 'idx_check_in_out_salida'):
+            self.db.execute_query(
+                "CREATE INDEX idx_check_in_out_salida ON check_in_out (fecha_salida)"
+            )
+
+    def _dedupe_ids(self, table, column):
+        """
+        Da un ID nuevo (a partir del máximo actual) a las filas con ID repetido,
+        nulo o menor que 1; la primera aparición de cada ID lo conserva
+
+        Las filas se identifican con una columna temporal _mig_row porque sin
+        clave primaria no hay otra forma de distinguir dos filas iguales. No se
+        renumera nada si otra tabla (columna con el mismo nombre) referencia
+        alguno de esos IDs, porque no se sabe a qué fila apunta. Los IDs nuevos
+        empiezan también por encima de los que usan esas tablas, para no
+        heredar referencias a filas que ya no existen; cada cambio queda
+        registrado en migration_id_changes (tabla, columna, ID anterior y nuevo).
+
+        Returns:
+            int: Filas renumeradas
+
+        Raises:
+            DatabaseOperationError: Si alguno de los IDs a renumerar está referenciado
+        """
+        rows = self.db.execute_query(
+            f"SELECT {column} FROM {table} WHERE {column} < 1 "
+            f"OR {column} IN (SELECT {column} FROM {table} GROUP BY {column} HAVING COUNT(*) > 1)"
+        )
+        ambiguous = sorted({row[0] for row in rows or []})
+        referencing = self._referencing_tables(table, column)
+        if ambiguous:
+            references = self._find_references(referencing, column, ambiguous)
+            if references:
+                raise DatabaseOperationError(
+                    f"{table}: los IDs {ambiguous} están repetidos o no son válidos y se usan en "
+                    f"{', '.join(references)}; corríjalos a mano antes de migrar"
+                )
+
+        if not self._column_exists(table, '_mig_row'):
+            self.db.execute_query(
+                f"ALTER TABLE {table} ADD COLUMN _mig_row BIGINT NOT NULL AUTO_INCREMENT UNIQUE"
+            )
+
+        rows = self.db.execute_query(f"SELECT _mig_row, {column} FROM {table} ORDER BY _mig_row")
+        seen = set()
+        to_renumber = []
+        for row_id, entity_id in rows or []:
+            if entity_id is None or entity_id < 1 or entity_id in seen:
+                to_renumber.append((row_id, entity_id))
+            else:
+                seen.add(entity_id)
+
+        if to_renumber:
+            next_id = max(max(seen, default=0),
+                          self._max_referenced_id(referencing, column)) + 1
+            changes = [(next_id + offset, row_id, old_id)
+                       for offset, (row_id, old_id) in enumerate(to_renumber)]
+            self.db.execute_query(
+                "CREATE TABLE IF NOT EXISTS migration_id_changes ("
+                "table_name VARCHAR(64) NOT NULL, "
+                "column_name VARCHAR(64) NOT NULL, "
+                "old_id INT NULL, "
+                "new_id INT NOT NULL, "
+                "changed_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP, "
+                "PRIMARY KEY (table_name, new_id))"
+            )
+            # El registro y la renumeración se confirman juntos
+            with self.db.transaction():
+                self.db.execute_many(
+                    "INSERT INTO migration_id_changes (table_name, column_name, old_id, new_id) "
+                    "VALUES (%s, %s, %s, %s)",
+                    [(table, column, old_id, new_id) for new_id, _, old_id in changes]
+                )
+                self.db.execute_many(
+                    f"UPDATE {table} SET {column} = %s WHERE _mig_row = %s",
+                    [(new_id, row_id) for new_id, row_id, _ in changes]
+                )
+
+        self.db.execute_query(f"ALTER TABLE {table} DROP COLUMN _mig_row")
+        return len(to_renumber)
+
+    def _referencing_tables(self, table, column):
+        """Otras tablas con una columna del mismo nombre que la de ID (sus referencias)"""
+        rows = self.db.execute_query(
+            "SELECT TABLE_NAME FROM information_schema.COLUMNS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND COLUMN_NAME = %s AND TABLE_NAME <> %s",
+            (column, table)
+        )
+        return [row[0] for row in rows or []]
+
+    def _find_references(self, tables, column, ids):
+        """
+        Busca cuáles de las tablas usan alguno de los IDs en la columna
+
+        Returns:
+            list: Nombres tabla.columna que referencian alguno de los IDs
+        """
+        placeholders = ', '.join(['%s'] * len(ids))
+        references = []
+        for other in tables:
+            if self._exists(f"SELECT COUNT(*) FROM {other} WHERE {column} IN ({placeholders})",
+                            tuple(ids)):
+                references.append(f"{other}.{column}")
+        return references
+
+    def _max_referenced_id(self, tables, column):
+        """Mayor ID usado en la columna por alguna de las tablas (0 si ninguno)"""
+        highest = 0
+        for other in tables:
+            rows = self.db.execute_query(f"SELECT MAX({column}) FROM {other}")
+            if rows and rows[0][0] is not None:
+                highest = max(highest, rows[0][0])
+        return highest
+
+    # Consultas de information_schema
+
+    def _ensure_migrations_table(self):
+        self.db.execute_query(
+            "CREATE TABLE IF NOT EXISTS schema_migrations ("
+            "version INT NOT NULL PRIMARY KEY, "
+            "description VARCHAR(200) NOT NULL, "
+            "applied_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP)"
+        )
+
+    def _exists(self, query, parameters):
+        rows = self.db.execute_query(query, parameters)
+        return bool(rows and rows[0][0])
+
+    def _table_exists(self, table):
+        return self._exists(
+            "SELECT COUNT(*) FROM information_schema.TABLES "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s", (table,)
+        )
+
+    def _column_exists(self, table, column):
+        return self._exists(
+            "SELECT COUNT(*) FROM information_schema.COLUMNS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND COLUMN_NAME = %s",
+            (table, column)
+        )
+
+    def _has_primary_key(self, table):
+        return self._has_index(table, 'PRIMARY')
+
+    def _has_index(self, table, index_name):
+        return self._exists(
+            "SELECT COUNT(*) FROM information_schema.STATISTICS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND INDEX_NAME = %s",
+            (table, index_name)
+        )
+
+    def _trigger_exists(self, trigger):
+        return self._exists(
+            "SELECT COUNT(*) FROM information_schema.TRIGGERS "
+            "WHERE TRIGGER_SCHEMA = DATABASE() AND TRIGGER_NAME = %s", (trigger,)
+        )
+
+
+def _first_table(plan):
+    """Busca el primer nodo con table_name en un plan de EXPLAIN FORMAT=JSON"""
+    if isinstance(plan, dict):
+        if 'table_name' in plan:
+            return plan
+        children = plan.values()
+    elif isinstance(plan, list):
+        children = plan
+    else:
+        return None
+    for child in children:
+        found = _first_table(child)
+        if found is not None:
+            return found
+    return None
+
+
+def _confirm(prompt):
+    """Pregunta sí/no en la consola; sin entrada interactiva la respuesta es no"""
+    try:
+        return input(prompt).strip().lower() in ('s', 'si', 'sí', 'y', 'yes')
+    except EOFError:
+        return False
+
+
+def main(argv=None):
+    """Punto de entrada de línea de comandos"""
+    from config.database import DatabaseConnection
+
+    argv = sys.argv[1:] if argv is None else argv
+    db = DatabaseConnection()
+    try:
+        runner = MigrationRunner(db)
+        if '--status' in argv:
+            applied = runner.applied_versions()
+            for version, description, _, required in runner.migrations:
+                state = "aplicada" if version in applied else "pendiente"
+                kind = "obligatoria" if required else "opcional"
+                print(f"{version:>3}  {state:<10} {kind:<12} {description}")
+            return 0
+
+        if '--check' in argv:
+            failed = False
+            for entry in runner.check_indexes():
+                if entry['used']:
+                    state = "OK"
+                elif entry['usable']:
+                    state = "DISPONIBLE"
+                else:
+                    state, failed = "SIN ÍNDICE", True
+                print(f"{state:<11} {entry['description']}: {entry['table']} "
+                      f"tipo={entry['access_type']} índice={entry['key']} (esperado {entry['expected']})")
+            return 1 if failed else 0
+
+        pending = runner.pending()
+        if not pending:
+            print("El esquema ya está al día")
+            return 0
+        print("Migraciones pendientes:")
+        for version, description, _ in pending:
+            print(f"{version:>3}  {description}")
+        if any(version == 1 for version, _, _ in pending):
+            print("La migración 1 da un ID nuevo a las filas con ID repetido (ver migration_id_changes)")
+        if '--yes' not in argv and not _confirm("¿Aplicarlas ahora? Haga antes una copia de "
+                                                "seguridad de la base de datos [s/N] "):
+            print("No se aplicó ninguna migración")
+            return 1
+
+        applied = runner.run()
+        print(f"Migraciones aplicadas: {applied}")
+        return 0
+    except DatabaseOperationError as e:
+        print(f"Error de migración: {e}")
+        return 1
+    finally:
+        db.disconnect()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
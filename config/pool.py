@@ -0,0 +1,188 @@
+"""
+Pool de conexiones MySQL con verificación de salud
+"""
+import queue
+import threading
+import time
+import mysql.connector
+from mysql.connector import Error
+from utils.exceptions import DatabaseConnectionError
+
+
+class ConnectionPool:
+    """Pool de conexiones con préstamo (checkout) y devolución (checkin) verificados"""
+
+    def __init__(self, config, size=5, checkout_timeout=10, health_check_interval=30,
+                 on_discard=None):
+        """
+        Inicializa el pool sin abrir conexiones (se crean bajo demanda)
+
+        Args:
+            config (dict): Parámetros de conexión de mysql.connector
+            size (int): Número máximo de conexiones abiertas
+            checkout_timeout (float): Segundos a esperar por una conexión libre
+            health_check_interval (float): Segundos de inactividad tras los cuales
+                se hace ping a la conexión antes de prestarla
+            on_discard (callable): Se llama con cada conexión que el pool cierra
+                (caída, rollback fallido o close_all), para liberar lo asociado a ella
+        """
+        if size < 1:
+            raise ValueError("El tamaño del pool debe ser al menos 1")
+
+        self.config = dict(config)
+        self.size = size
+        self.checkout_timeout = checkout_timeout
+        self.health_check_interval = health_check_interval
+        self.on_discard = on_discard
+
+        self._idle = queue.LifoQueue()
+        self._last_used = {}
+        self._created = 0
+        self._lock = threading.Lock()
+        self._closed = False
+
+    @property
+    def closed(self):
+        """Indica si el pool fue cerrado"""
+        return self._closed
+
+    def checkout(self, timeout=None):
+        """
+        Presta una conexión sana del pool
+
+        Args:
+            timeout (float): Segundos a esperar; por defecto checkout_timeout
+
+        Returns:
+            Conexión de mysql.connector
+
+        Raises:
+            DatabaseConnectionError: Si el pool está cerrado o agotado
+        """
+        if self._closed:
+            raise DatabaseConnectionError("El pool de conexiones está cerrado")
+
+        wait = self.checkout_timeout if timeout is None else timeout
+        deadline = time.monotonic() + wait
+
+        while True:
+            connection = self._take_idle_or_create(deadline)
+            if self._is_healthy(connection):
+                return connection
+            # Conexión caída: se descarta y se intenta de nuevo
+            self._discard(connection)
+
+    def checkin(self, connection):
+        """
+        Devuelve una conexión al pool
+
+        Args:
+            connection: Conexión prestada previamente con checkout()
+        """
+        if connection is None:
+            return
+
+        if self._closed:
+            self._discard(connection)
+            return
+
+        # Un resultado sin leer dejaría la conexión inservible para el siguiente usuario
+        if getattr(connection, 'unread_result', False):
+            self._discard(connection)
+            return
+
+        try:
+            # No devolver transacciones a medio terminar al siguiente usuario
+            if getattr(connection, 'in_transaction', False):
+                connection.rollback()
+        except Error:
+            self._discard(connection)
+            return
+
+        self._last_used[id(connection)] = time.monotonic()
+        self._idle.put(connection)
+
+    def close_all(self):
+        """Cierra todas las conexiones libres y marca el pool como cerrado"""
+        self._closed = True
+        while True:
+            try:
+                connection = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(connection)
+
+    def stats(self):
+        """
+        Obtiene el estado actual del pool
+
+        Returns:
+            dict: Conexiones creadas, libres y en uso
+        """
+        idle = self._idle.qsize()
+        return {
+            'size': self.size,
+            'created': self._created,
+            'idle': idle,
+            'in_use': self._created - idle
+        }
+
+    def _take_idle_or_create(self, deadline):
+        """Obtiene una conexión libre, crea una nueva o espera hasta el límite"""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            can_create = self._created < self.size
+            if can_create:
+                self._created += 1
+
+        if can_create:
+            try:
+                return self._open()
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                raise
+
+        remaining = deadline - time.monotonic()
+        try:
+            return self._idle.get(timeout=max(remaining, 0))
+        except queue.Empty:
+            raise DatabaseConnectionError(
+                f"No hay conexiones disponibles en el pool (tamaño {self.size})"
+            )
+
+    def _open(self):
+        """Abre una conexión nueva"""
+        try:
+            connection = mysql.connector.connect(**self.config)
+        except Error as e:
+            raise DatabaseConnectionError(f"Error conectando a la base de datos: {e}")
+        self._last_used[id(connection)] = time.monotonic()
+        return connection
+
+    def _is_healthy(self, connection):
+        """Hace ping solo si la conexión lleva inactiva más del intervalo configurado"""
+        idle_for = time.monotonic() - self._last_used.get(id(connection), 0)
+        if idle_for < self.health_check_interval:
+            return True
+        try:
+            connection.ping(reconnect=False)
+            return True
+        except Error:
+            return False
+
+    def _discard(self, connection):
+        """Cierra una conexión y libera su cupo en el pool"""
+        self._last_used.pop(id(connection), None)
+        if self.on_discard is not None:
+            self.on_discard(connection)
+        try:
+            connection.close()
+        except Error:
+            pass
+        with self._lock:
+            self._created -= 1
@@ -0,0 +1,196 @@
+"""
+Estadísticas de latencia por consulta normalizada (huella SQL)
+"""
+import json
+import math
+import re
+import threading
+import time
+from collections import deque
+
+_STRING_LITERAL = re.compile(r"'(?:[^'\\]|\\.|'')*'|\"(?:[^\"\\]|\\.)*\"")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_VALUES_LIST = re.compile(r"(VALUES\s*\(\s*\?[^)]*\))(?:\s*,\s*\([^)]*\))+", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def fingerprint(query):
+    """
+    Normaliza una consulta quitando literales y espacios redundantes
+
+    "SELECT * FROM clientes WHERE id_cliente = 7" y la misma consulta con
+    %s comparten huella: SELECT * FROM CLIENTES WHERE ID_CLIENTE = ?
+
+    Args:
+        query (str): Texto SQL
+
+    Returns:
+        str: Huella de la consulta
+    """
+    normalized = _STRING_LITERAL.sub('?', query)
+    normalized = normalized.replace('%s', '?')
+    normalized = _NUMBER_LITERAL.sub('?', normalized)
+    normalized = _IN_LIST.sub('(?+)', normalized)
+    normalized = _WHITESPACE.sub(' ', normalized).strip()
+    normalized = _VALUES_LIST.sub(r'\1', normalized)
+    return normalized.upper()
+
+
+def _percentile(sorted_values, fraction):
+    """Percentil por rango más cercano de una lista ya ordenada"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+class QueryTiming:
+    """Contadores y ventana de latencias recientes de una huella"""
+
+    def __init__(self, window_size):
+        self.calls = 0
+        self.errors = 0
+        self.rows = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.samples = deque(maxlen=window_size)
+
+    def record(self, elapsed_ms, rows, failed):
+        """Registra una ejecución"""
+        self.calls += 1
+        self.rows += rows
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        if failed:
+            self.errors += 1
+        self.samples.append(elapsed_ms)
+
+    def as_dict(self):
+        """
+        Obtiene el resumen de la huella
+
+        Returns:
+            dict: calls, errors, rows, total_ms, avg_ms, max_ms y p50/p95/p99_ms
+                (los percentiles se calculan sobre la ventana reciente)
+        """
+        ordered = sorted(self.samples)
+        return {
+            'calls': self.calls,
+            'errors': self.errors,
+            'rows': self.rows,
+            'total_ms': self.total_ms,
+            'avg_ms': (self.total_ms / self.calls) if self.calls else 0.0,
+            'max_ms': self.max_ms,
+            'p50_ms': _percentile(ordered, 0.50),
+            'p95_ms': _percentile(ordered, 0.95),
+            'p99_ms': _percentile(ordered, 0.99)
+        }
+
+
+class QueryStats:
+    """Registro de latencias de todas las consultas de una DatabaseConnection"""
+
+    def __init__(self, window_size=1000, max_fingerprints=500):
+        """
+        Args:
+            window_size (int): Latencias recientes que se conservan por huella
+            max_fingerprints (int): Máximo de huellas distintas registradas; las
+                nuevas por encima del límite se agrupan en "<otras>"
+        """
+        self.window_size = window_size
+        self.max_fingerprints = max_fingerprints
+        self.enabled = True
+        self._timings = {}
+        self._fingerprints = {}
+        self._lock = threading.Lock()
+
+    def record(self, query, elapsed_ms, rows=0, failed=False):
+        """
+        Registra una ejecución de consulta
+
+        Args:
+            query (str): Texto SQL tal como se ejecutó
+            elapsed_ms (float): Duración en milisegundos
+            rows (int): Filas devueltas o afectadas
+            failed (bool): Si la ejecución terminó en error
+        """
+        if not self.enabled:
+            return
+
+        key = self._fingerprints.get(query)
+        if key is None:
+            key = fingerprint(query)
+            if len(self._fingerprints) < self.max_fingerprints * 4:
+                self._fingerprints[query] = key
+
+        with self._lock:
+            timing = self._timings.get(key)
+            if timing is None:
+                if len(self._timings) >= self.max_fingerprints:
+                    key = '<otras>'
+                    timing = self._timings.get(key)
+                if timing is None:
+                    timing = QueryTiming(self.window_size)
+                    self._timings[key] = timing
+            timing.record(elapsed_ms, rows or 0, failed)
+
+    def track(self, query):
+        """
+        Crea un cronómetro para una ejecución de la consulta
+
+        Returns:
+            _QueryTimer: Objeto con finish(rows, failed)
+        """
+        return _QueryTimer(self, query)
+
+    def snapshot(self, order_by='total_ms'):
+        """
+        Obtiene el resumen de todas las huellas
+
+        Args:
+            order_by (str): Métrica de ordenación descendente
+
+        Returns:
+            list: Diccionarios con 'query' más las métricas de QueryTiming.as_dict()
+        """
+        with self._lock:
+            summary = [dict(timing.as_dict(), query=key) for key, timing in self._timings.items()]
+        summary.sort(key=lambda item: item.get(order_by, 0), reverse=True)
+        return summary
+
+    def reset(self):
+        """Descarta todas las mediciones"""
+        with self._lock:
+            self._timings.clear()
+
+    def dump_json(self, path):
+        """
+        Guarda el resumen en un archivo JSON (para comparar versiones)
+
+        Args:
+            path (str): Ruta del archivo de salida
+        """
+        payload = {
+            'generated_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'window_size': self.window_size,
+            'queries': self.snapshot()
+        }
+        with open(path, 'w', encoding='utf-8') as output:
+            json.dump(payload, output, ensure_ascii=False, indent=2)
+
+
+class _QueryTimer:
+    """Cronómetro de una ejecución; registra al llamar finish()"""
+
+    __slots__ = ('stats', 'query', 'start')
+
+    def __init__(self, stats, query):
+        self.stats = stats
+        self.query = query
+        self.start = time.perf_counter()
+
+    def finish(self, rows=0, failed=False):
+        """Registra la duración transcurrida desde la creación"""
+        elapsed_ms = (time.perf_counter() - self.start) * 1000.0
+        self.stats.record(self.query, elapsed_ms, rows, failed)
@@ -0,0 +1,112 @@
+"""
+Caché LRU de sentencias preparadas del servidor
+"""
+import threading
+from collections import OrderedDict
+from mysql.connector import Error
+
+
+class StatementCacheStats:
+    """Contadores de aciertos y fallos compartidos por todas las cachés de una conexión lógica"""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    def record(self, hit):
+        """Registra un acierto o un fallo"""
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def record_eviction(self):
+        """Registra una sentencia expulsada de la caché"""
+        with self._lock:
+            self.evictions += 1
+
+    def as_dict(self):
+        """
+        Obtiene los contadores como diccionario
+
+        Returns:
+            dict: hits, misses, evictions y hit_ratio
+        """
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_ratio': (self.hits / total) if total else 0.0
+        }
+
+
+class StatementCache:
+    """Caché LRU de cursores preparados de una conexión física, indexada por texto SQL"""
+
+    def __init__(self, connection, max_size=64, stats=None):
+        """
+        Args:
+            connection: Conexión de mysql.connector dueña de las sentencias
+            max_size (int): Máximo de sentencias preparadas abiertas
+            stats (StatementCacheStats): Contadores donde registrar aciertos y fallos
+        """
+        self.connection = connection
+        self.max_size = max_size
+        self.stats = stats or StatementCacheStats()
+        self._cursors = OrderedDict()
+
+    def get(self, query):
+        """
+        Obtiene el cursor preparado para una consulta, creándolo si no existe
+
+        Args:
+            query (str): Texto SQL (con marcadores %s)
+
+        Returns:
+            Cursor preparado de mysql.connector
+        """
+        cursor = self._cursors.get(query)
+        if cursor is not None:
+            self._cursors.move_to_end(query)
+            self.stats.record(hit=True)
+            return cursor
+
+        self.stats.record(hit=False)
+        cursor = self.connection.cursor(prepared=True)
+        self._cursors[query] = cursor
+
+        while len(self._cursors) > self.max_size:
+            _, old_cursor = self._cursors.popitem(last=False)
+            self._close(old_cursor)
+            self.stats.record_eviction()
+
+        return cursor
+
+    def discard(self, query):
+        """Elimina de la caché la sentencia de una consulta (por ejemplo tras un error)"""
+        cursor = self._cursors.pop(query, None)
+        if cursor is not None:
+            self._close(cursor)
+
+    def clear(self):
+        """Cierra todas las sentencias preparadas"""
+        while self._cursors:
+            _, cursor = self._cursors.popitem()
+            self._close(cursor)
+
+    def __len__(self):
+        return len(self._cursors)
+
+    def __contains__(self, query):
+        return query in self._cursors
+
+    def _close(self, cursor):
+        """Cierra un cursor preparado liberando la sentencia en el servidor"""
+        try:
+            cursor.close()
+        except Error:
+            pass
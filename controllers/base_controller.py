@@ -2,6 +2,7 @@
 Clase base para todos los controladores de la aplicación Northwind
 """
 from abc import ABC, abstractmethod
+from contextlib import nullcontext
 from utils.exceptions import ValidationError, DatabaseOperationError, EntityNotFoundError
 
 
@@ -36,11 +37,12 @@ class BaseController(ABC):
             # Pre-procesamiento (puede ser sobrescrito por controladores específicos)
             processed_data = self._preprocess_create_data(**kwargs)
 
-            # Crear entidad usando el modelo
-            entity_id = self.model.create(**processed_data)
+            # Crear y post-procesar en una sola transacción
+            with self._transaction():
+                entity_id = self.model.create(**processed_data)
 
-            # Post-procesamiento (puede ser sobrescrito por controladores específicos)
-            self._postprocess_create(entity_id, **processed_data)
+                # Post-procesamiento (puede ser sobrescrito por controladores específicos)
+                self._postprocess_create(entity_id, **processed_data)
 
             return entity_id
 
@@ -51,6 +53,48 @@ class BaseController(ABC):
         except Exception as e:
             raise DatabaseOperationError(f"Error inesperado creando {self.entity_name}: {str(e)}")
 
+    def create_many(self, records, chunk_size=500, atomic=False):
+        """
+        Crea entidades en lote
+
+        Args:
+            records (list): Registros a crear
+            chunk_size (int): Filas por INSERT/transacción
+            atomic (bool): Si es True toda la carga se confirma o se deshace junta
+
+        Returns:
+            tuple: (ids, errors) con los IDs en el orden de records y los errores por índice
+        """
+        try:
+            return self.model.create_many(records, chunk_size=chunk_size, atomic=atomic)
+        except AttributeError:
+            raise DatabaseOperationError(f"{self.entity_name} no admite creación en lote")
+        except (ValidationError, DatabaseOperationError):
+            raise
+        except Exception as e:
+            raise DatabaseOperationError(f"Error inesperado creando {self.entity_name}s en lote: {str(e)}")
+
+    def upsert_many(self, records, chunk_size=500, atomic=False):
+        """
+        Inserta o actualiza entidades en lote según su ID
+
+        Args:
+            records (list): Registros con ID
+            chunk_size (int): Filas por INSERT/transacción
+            atomic (bool): Si es True toda la carga se confirma o se deshace junta
+
+        Returns:
+            tuple: (ids, errors) con los IDs en el orden de records y los errores por índice
+        """
+        try:
+            return self.model.upsert_many(records, chunk_size=chunk_size, atomic=atomic)
+        except AttributeError:
+            raise DatabaseOperationError(f"{self.entity_name} no admite carga en lote")
+        except (ValidationError, DatabaseOperationError):
+            raise
+        except Exception as e:
+            raise DatabaseOperationError(f"Error inesperado cargando {self.entity_name}s en lote: {str(e)}")
+
     def get_by_id(self, entity_id):
         """
         Obtiene una entidad por su ID
@@ -102,11 +146,12 @@ class BaseController(ABC):
             # Pre-procesamiento
             processed_data = self._preprocess_update_data(entity_id, **kwargs)
 
-            # Actualizar usando el modelo
-            result = self.model.update(entity_id, **processed_data)
+            # Actualizar y post-procesar en una sola transacción
+            with self._transaction():
+                result = self.model.update(entity_id, **processed_data)
 
-            # Post-procesamiento
-            self._postprocess_update(entity_id, **processed_data)
+                # Post-procesamiento
+                self._postprocess_update(entity_id, **processed_data)
 
             return result
 
@@ -130,14 +175,16 @@ class BaseController(ABC):
             if not entity_id or entity_id <= 0:
                 raise ValidationError("ID", "debe ser un número positivo")
 
-            # Pre-procesamiento (verificaciones adicionales)
-            self._preprocess_delete(entity_id)
+            # Verificaciones, borrado y limpieza en una sola transacción
+            with self._transaction():
+                # Pre-procesamiento (verificaciones adicionales)
+                self._preprocess_delete(entity_id)
 
-            # Eliminar usando el modelo
-            result = self.model.delete(entity_id)
+                # Eliminar usando el modelo
+                result = self.model.delete(entity_id)
 
-            # Post-procesamiento (limpieza adicional)
-            self._postprocess_delete(entity_id)
+                # Post-procesamiento (limpieza adicional)
+                self._postprocess_delete(entity_id)
 
             return result
 
@@ -167,12 +214,88 @@ class BaseController(ABC):
         except Exception as e:
             raise DatabaseOperationError(f"Error obteniendo lista de {self.entity_name}s: {str(e)}")
 
-    def search(self, search_term):
+    def get_page(self, after_id=None, limit=100, order_by=None):
+        """
+        Obtiene una página de entidades (paginación por clave)
+
+        Args:
+            after_id: next_after de la página anterior, o None para la primera
+            limit (int): Máximo de entidades por página
+            order_by (str): Columna de ordenación admitida por el modelo
+
+        Returns:
+            dict: items, next_after y has_more (ver BaseModel.get_page)
+        """
+        try:
+            page = self.model.get_page(after_id=after_id, limit=limit, order_by=order_by)
+            page['items'] = [self._postprocess_get_data(entity) for entity in page['items']]
+            return page
+        except (ValueError, DatabaseOperationError):
+            raise
+        except Exception as e:
+            raise DatabaseOperationError(f"Error obteniendo página de {self.entity_name}s: {str(e)}")
+
+    def estimate_count(self):
+        """
+        Obtiene el número aproximado de entidades
+
+        Returns:
+            int: Número estimado
+        """
+        try:
+            return self.model.estimate_count()
+        except Exception:
+            return 0
+
+    def get_change_token(self):
+        """
+        Obtiene la marca de cambios de la tabla del modelo
+
+        Returns:
+            tuple: Marca comparable con ==, o None si no se puede calcular (en ese
+                caso la lista debe recargarse siempre)
+        """
+        if not hasattr(self.model, 'get_change_token'):
+            return None
+        try:
+            return self.model.get_change_token()
+        except Exception:
+            return None
+
+    def get_cache_stats(self):
+        """
+        Obtiene los contadores de la caché de entidades del modelo
+
+        Returns:
+            dict: Ver EntityCache.stats(), o None si el modelo no tiene caché activa
+        """
+        if hasattr(self.model, 'get_cache_stats'):
+            return self.model.get_cache_stats()
+        return None
+
+    def iter_all(self, batch_size=500):
+        """
+        Recorre todas las entidades en lotes (para exportaciones y reportes)
+
+        Args:
+            batch_size (int): Tamaño de lote
+
+        Yields:
+            dict: Datos de cada entidad
+        """
+        try:
+            for entity in self.model.iter_all(batch_size=batch_size):
+                yield self._postprocess_get_data(entity)
+        except Exception as e:
+            raise DatabaseOperationError(f"Error recorriendo lista de {self.entity_name}s: {str(e)}")
+
+    def search(self, search_term, limit=None):
         """
         Busca entidades por término
 
         Args:
             search_term (str): Término de búsqueda
+            limit (int): Máximo de resultados (None: el predeterminado del modelo)
 
         Returns:
             list: Lista de entidades que coinciden
@@ -185,7 +308,10 @@ class BaseController(ABC):
             processed_term = self._preprocess_search_term(search_term)
 
             # Buscar usando el modelo
-            results = self.model.search(processed_term)
+            if limit is None:
+                results = self.model.search(processed_term)
+            else:
+                results = self.model.search(processed_term, limit)
 
             # Post-procesar resultados
             processed_results = []
@@ -198,6 +324,38 @@ class BaseController(ABC):
         except Exception as e:
             raise DatabaseOperationError(f"Error buscando {self.entity_name}s: {str(e)}")
 
+    def filter_search(self, entities, search_term, previous_term):
+        """
+        Filtra los resultados de una búsqueda anterior con otro término
+
+        Las entidades se comprueban contra los search_fields del modelo con las
+        mismas reglas que search(), sin ir a la base de datos.
+
+        Args:
+            entities (list): Resultados completos de search(previous_term)
+            search_term (str): Término nuevo
+            previous_term (str): Término de la búsqueda anterior
+
+        Returns:
+            list: Entidades que cumplen search_term, o None si el modelo no
+                puede decidirlo (hay que llamar a search())
+        """
+        if not hasattr(self.model, 'search_matches') or not self.model.primary_key:
+            return None
+        key = self.model.primary_key.upper()
+        try:
+            matching = self.model.search_matches(
+                [entity.get(key) for entity in entities],
+                self._preprocess_search_term(search_term),
+                self._preprocess_search_term(previous_term)
+            )
+        except Exception:
+            return None
+        if matching is None:
+            return None
+        matching = set(matching)
+        return [entity for entity in entities if entity.get(key) in matching]
+
     def exists(self, entity_id):
         """
         Verifica si una entidad existe
@@ -337,6 +495,25 @@ class BaseController(ABC):
 
     # Métodos de utilidad
 
+    def transaction(self):
+        """
+        Unidad de trabajo para agrupar varias operaciones del controlador
+
+            with controller.transaction():
+                controller.create(datos)
+                controller.update(otro_id, otros_datos)
+
+        Returns:
+            Context manager que confirma una sola vez al salir
+        """
+        return self._transaction()
+
+    def _transaction(self):
+        """Transacción del modelo, o un contexto vacío si el modelo no la ofrece"""
+        if hasattr(self.model, 'transaction'):
+            return self.model.transaction()
+        return nullcontext()
+
     def validate_required_fields(self, data, required_fields):
         """
         Valida que los campos requeridos estén presentes
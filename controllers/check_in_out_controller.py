@@ -0,0 +1,118 @@
+from datetime import datetime
+from controllers.base_controller import BaseController
+from models.front_desk import FrontDesk
+from utils.exceptions import EntityNotFoundError, DatabaseOperationError
+from utils.logger import get_logger
+from utils.validators import Validator
+
+logger = get_logger('controllers')
+
+
+class CheckInOutController(BaseController):
+    def __init__(self, model, now=datetime.now):
+        """
+        Args:
+            model: Instancia de CheckInOut
+            now (callable): Fecha y hora actuales (día de recepción y hora de salida)
+        """
+        super().__init__(model)
+        self._now = now
+        self.front_desk = FrontDesk(model, today=lambda: self._now().date())
+
+    def get_by_id(self, entity_id):
+        """Obtiene una estancia por ID"""
+        try:
+            return self.model.get_by_id(entity_id)
+        except EntityNotFoundError:
+            raise
+        except Exception as e:
+            raise Exception(f"Error obteniendo estancia: {str(e)}")
+
+    def get_all(self):
+        """Obtiene todas las estancias"""
+        try:
+            return self.model.get_all()
+        except Exception as e:
+            raise Exception(f"Error obteniendo estancias: {str(e)}")
+
+    def create(self, form_data):
+        """Registra una estancia (check-in); el modelo valida los campos"""
+        try:
+            return self.model.create(form_data)
+        except (ValueError, DatabaseOperationError):
+            raise
+        except Exception as e:
+            raise Exception(f"Error creando estancia: {str(e)}")
+
+    def update(self, entity_id, form_data):
+        """Actualiza una estancia"""
+        try:
+            return self.model.update(entity_id, form_data)
+        except (ValueError, EntityNotFoundError, DatabaseOperationError):
+            raise
+        except Exception as e:
+            raise Exception(f"Error actualizando estancia: {str(e)}")
+
+    def check_out(self, entity_id, hora_salida=None):
+        """
+        Registra la salida de una estancia con la fecha de hoy
+
+        Args:
+            entity_id (int): ID de la estancia
+            hora_salida: Hora de salida (time o texto; None: la hora actual)
+        """
+        now = self._now()
+        hora = Validator.validate_time(hora_salida, "Hora de salida") or now.time()
+        try:
+            return self.model.check_out(entity_id, now.date(), hora.replace(second=0, microsecond=0))
+        except (EntityNotFoundError, DatabaseOperationError):
+            raise
+        except Exception as e:
+            raise Exception(f"Error registrando salida: {str(e)}")
+
+    def delete(self, entity_id):
+        """Elimina una estancia"""
+        try:
+            return self.model.delete(entity_id)
+        except EntityNotFoundError:
+            raise
+        except Exception as e:
+            raise Exception(f"Error eliminando estancia: {str(e)}")
+
+    # Recepción (índice en memoria, ver models.front_desk)
+
+    def arrivals_today(self):
+        """Estancias que llegan hoy, por hora de llegada"""
+        return self._front_desk_list(self.front_desk.arrivals, None, "llegadas")
+
+    def departures_today(self):
+        """Estancias que salen hoy, por hora de salida"""
+        return self._front_desk_list(self.front_desk.departures, None, "salidas")
+
+    def in_house(self, fecha=None):
+        """
+        Huéspedes alojados la noche de un día, por habitación
+
+        Args:
+            fecha: Día (date o texto AAAA-MM-DD; None: hoy)
+        """
+        day = Validator.validate_date(fecha, "Fecha")
+        return self._front_desk_list(self.front_desk.in_house, day, "huéspedes alojados")
+
+    def arrivals(self, fecha):
+        """Estancias que llegan un día (date o texto AAAA-MM-DD)"""
+        day = Validator.validate_date(fecha, "Fecha", allow_empty=False)
+        return self._front_desk_list(self.front_desk.arrivals, day, "llegadas")
+
+    def departures(self, fecha):
+        """Estancias que salen un día (date o texto AAAA-MM-DD)"""
+        day = Validator.validate_date(fecha, "Fecha", allow_empty=False)
+        return self._front_desk_list(self.front_desk.departures, day, "salidas")
+
+    @staticmethod
+    def _front_desk_list(lookup, day, description):
+        try:
+            return lookup(day)
+        except Exception as e:
+            logger.error("Error consultando %s: %s", description, e)
+            raise DatabaseOperationError(f"Error consultando {description}: {str(e)}")
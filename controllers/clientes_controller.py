@@ -1,5 +1,8 @@
 from controllers.base_controller import BaseController
 from utils.exceptions import EntityNotFoundError, DatabaseOperationError
+from utils.logger import get_logger
+
+logger = get_logger('controllers')
 
 
 class ClientesController(BaseController):
@@ -9,32 +12,28 @@ class ClientesController(BaseController):
     def get_by_id(self, entity_id):
         """Obtiene un cliente por ID"""
         try:
-            print(f"Controller get_by_id: {entity_id}")
+            logger.debug("Controller get_by_id: %s", entity_id)
             result = self.model.get_by_id(entity_id)
-            print(f"Resultado de get_by_id: {result}")
             return result
         except EntityNotFoundError:
-            print(f"Cliente no encontrado: {entity_id}")
+            logger.debug("Cliente no encontrado: %s", entity_id)
             raise
         except Exception as e:
-            print(f"Error en controller get_by_id: {e}")
+            logger.error("Error en controller get_by_id: %s", e)
             raise Exception(f"Error obteniendo cliente: {str(e)}")
 
     def get_all(self):
         """Obtiene todos los clientes"""
         try:
             result = self.model.get_all()
-            print(f"Controller get_all: {len(result)} clientes")
             return result
         except Exception as e:
-            print(f"Error en controller get_all: {e}")
+            logger.error("Error en controller get_all: %s", e)
             raise Exception(f"Error obteniendo clientes: {str(e)}")
 
     def create(self, form_data):
         """Crea un nuevo cliente"""
         try:
-            print("Controller create - Datos recibidos:", form_data)
-
             # Validaciones básicas
             nombre_val = form_data.get('NOMBRE', '').strip()
             apellido_val = form_data.get('APELLIDO', '').strip()
@@ -62,21 +61,19 @@ class ClientesController(BaseController):
 
             # Llamar al modelo
             new_id = self.model.create(form_data)
-            print(f"Controller create - Nuevo ID: {new_id}")
+            logger.debug("Controller create - Nuevo ID: %s", new_id)
             return new_id
 
         except ValueError as ve:
-            print(f"Error de validación en controller: {ve}")
+            logger.error("Error de validación en controller: %s", ve)
             raise ve
         except Exception as e:
-            print(f"Error en controller create: {e}")
+            logger.error("Error en controller create: %s", e)
             raise Exception(f"Error creando cliente: {str(e)}")
 
     def update(self, entity_id, form_data):
         """Actualiza un cliente"""
         try:
-            print(f"Controller update - ID: {entity_id}, datos: {form_data}")
-
             # Validaciones básicas
             nombre_val = form_data.get('NOMBRE', '').strip()
             apellido_val = form_data.get('APELLIDO', '').strip()
@@ -104,26 +101,26 @@ class ClientesController(BaseController):
 
             # Llamar al modelo
             success = self.model.update(entity_id, form_data)
-            print(f"Controller update - Resultado: {success}")
+            logger.debug("Controller update - Resultado: %s", success)
             return success
 
         except ValueError as ve:
-            print(f"Error de validación en controller update: {ve}")
+            logger.error("Error de validación en controller update: %s", ve)
             raise ve
         except Exception as e:
-            print(f"Error en controller update: {e}")
+            logger.error("Error en controller update: %s", e)
             raise Exception(f"Error actualizando cliente: {str(e)}")
 
     def delete(self, entity_id):
         """Elimina un cliente"""
         try:
-            print(f"Controller delete - ID: {entity_id}")
+            logger.debug("Controller delete - ID: %s", entity_id)
             success = self.model.delete(entity_id)
-            print(f"Controller delete - Resultado: {success}")
+            logger.debug("Controller delete - Resultado: %s", success)
             return success
         except EntityNotFoundError as enfe:
-            print(f"EntityNotFoundError en controller delete: {enfe}")
+            logger.error("EntityNotFoundError en controller delete: %s", enfe)
             raise enfe
         except Exception as e:
-            print(f"Error en controller delete: {e}")
+            logger.error("Error en controller delete: %s", e)
             raise Exception(f"Error eliminando cliente: {str(e)}")
\ No newline at end of file
@@ -0,0 +1,61 @@
+from controllers.base_controller import BaseController
+from utils.exceptions import EntityNotFoundError, DatabaseOperationError
+from utils.logger import get_logger
+
+logger = get_logger('controllers')
+
+
+class HabitacionesController(BaseController):
+    def __init__(self, model):
+        super().__init__(model)
+
+    def get_by_id(self, entity_id):
+        """Obtiene una habitación por ID"""
+        try:
+            return self.model.get_by_id(entity_id)
+        except EntityNotFoundError:
+            raise
+        except Exception as e:
+            raise Exception(f"Error obteniendo habitación: {str(e)}")
+
+    def get_all(self):
+        """Obtiene todas las habitaciones"""
+        try:
+            return self.model.get_all()
+        except Exception as e:
+            raise Exception(f"Error obteniendo habitaciones: {str(e)}")
+
+    def get_by_hotel(self, hotel_id):
+        """Obtiene las habitaciones de un hotel"""
+        try:
+            return self.model.get_by_hotel(hotel_id)
+        except Exception as e:
+            logger.error("Error obteniendo habitaciones del hotel %s: %s", hotel_id, e)
+            raise DatabaseOperationError(f"Error obteniendo habitaciones del hotel: {str(e)}")
+
+    def create(self, form_data):
+        """Crea una nueva habitación (el modelo valida los campos)"""
+        try:
+            return self.model.create(form_data)
+        except (ValueError, DatabaseOperationError):
+            raise
+        except Exception as e:
+            raise Exception(f"Error creando habitación: {str(e)}")
+
+    def update(self, entity_id, form_data):
+        """Actualiza una habitación"""
+        try:
+            return self.model.update(entity_id, form_data)
+        except (ValueError, EntityNotFoundError, DatabaseOperationError):
+            raise
+        except Exception as e:
+            raise Exception(f"Error actualizando habitación: {str(e)}")
+
+    def delete(self, entity_id):
+        """Elimina una habitación"""
+        try:
+            return self.model.delete(entity_id)
+        except EntityNotFoundError:
+            raise
+        except Exception as e:
+            raise Exception(f"Error eliminando habitación: {str(e)}")
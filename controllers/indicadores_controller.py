@@ -0,0 +1,79 @@
+import re
+from models.analytics import AnalyticsEngine, GROUPINGS
+from utils.exceptions import ValidationError
+from utils.logger import get_logger
+
+logger = get_logger('controllers')
+
+_MONTH_PATTERN = re.compile(r'^(\d{4})-(\d{1,2})$')
+
+
+class IndicadoresController:
+    """Ocupación, ADR, RevPAR e ingresos por hotel y periodo (solo lectura)"""
+
+    def __init__(self, db_connection, reservas_model, habitaciones_model, hoteles_model,
+                 rate_engine):
+        """
+        Args:
+            db_connection: Instancia de DatabaseConnection
+            reservas_model: Instancia de Reservas
+            habitaciones_model: Instancia de Habitaciones
+            hoteles_model: Instancia de Hoteles
+            rate_engine: RateEngine (normalmente el de TarifasController)
+        """
+        self.analytics = AnalyticsEngine(db_connection, reservas_model, habitaciones_model,
+                                         hoteles_model, rate_engine)
+
+    def refresh(self):
+        """
+        Pone el cubo al día; pensado para el TaskRunner (lee la base de datos)
+
+        Returns:
+            dict: Nombres de los hoteles {id_hotel: nombre}
+        """
+        self.analytics.refresh()
+        return dict(self.analytics.hotel_names)
+
+    def query(self, hotel_id=None, desde=None, hasta=None, group_by=('hotel', 'month')):
+        """
+        Consulta el cubo ya cargado (no lee la base de datos)
+
+        Args:
+            hotel_id (int): Un solo hotel (None: todos)
+            desde (str): Primer mes AAAA-MM (vacío: el primero con datos)
+            hasta (str): Último mes AAAA-MM (vacío: el último con datos)
+            group_by (tuple): Subconjunto de GROUPINGS
+
+        Returns:
+            list: Filas de MetricsCube.query() con el nombre del hotel en NOMBRE_HOTEL
+
+        Raises:
+            ValidationError: Si un mes o la agrupación no son válidos
+        """
+        first = self._parse_month(desde, 'DESDE')
+        last = self._parse_month(hasta, 'HASTA')
+        if first is not None and last is not None and last < first:
+            raise ValidationError('HASTA', "El mes final debe ser igual o posterior al inicial")
+        unknown = set(group_by) - set(GROUPINGS)
+        if unknown:
+            raise ValidationError('GROUP_BY', f"Agrupación no válida: {', '.join(sorted(unknown))}")
+
+        rows = self.analytics.query(
+            hotel_ids=[hotel_id] if hotel_id is not None else None,
+            first_month=first, last_month=last, group_by=tuple(group_by)
+        )
+        names = self.analytics.hotel_names
+        for row in rows:
+            row['NOMBRE_HOTEL'] = names.get(row['hotel'], '') if row['hotel'] is not None else ''
+        return rows
+
+    @staticmethod
+    def _parse_month(value, field_name):
+        """Convierte 'AAAA-MM' al número de mes de models.analytics (None si está vacío)"""
+        text = str(value).strip() if value is not None else ''
+        if not text:
+            return None
+        match = _MONTH_PATTERN.match(text)
+        if not match or not 1 <= int(match.group(2)) <= 12:
+            raise ValidationError(field_name, f"Mes no válido (use AAAA-MM): {text}")
+        return int(match.group(1)) * 12 + int(match.group(2)) - 1
@@ -0,0 +1,187 @@
+from controllers.base_controller import BaseController
+from models.availability import AvailabilityEngine
+from models.overbooking import OverbookingDetector
+from models.reservas import ESTADO_CANCELADA
+from utils.exceptions import EntityNotFoundError, DatabaseOperationError, ValidationError
+from utils.logger import get_logger
+from utils.validators import Validator
+
+logger = get_logger('controllers')
+
+
+class ReservasController(BaseController):
+    def __init__(self, model, habitaciones_model):
+        """
+        Args:
+            model: Instancia de Reservas
+            habitaciones_model: Instancia de Habitaciones (inventario de la disponibilidad)
+        """
+        super().__init__(model)
+        self.availability = AvailabilityEngine(model, habitaciones_model)
+        self.overbooking = OverbookingDetector(model, habitaciones_model, self.availability)
+
+    def get_by_id(self, entity_id):
+        """Obtiene una reserva por ID"""
+        try:
+            return self.model.get_by_id(entity_id)
+        except EntityNotFoundError:
+            raise
+        except Exception as e:
+            raise Exception(f"Error obteniendo reserva: {str(e)}")
+
+    def get_all(self):
+        """Obtiene todas las reservas"""
+        try:
+            return self.model.get_all()
+        except Exception as e:
+            raise Exception(f"Error obteniendo reservas: {str(e)}")
+
+    def create(self, form_data):
+        """Crea una nueva reserva si quedan habitaciones del tipo pedido"""
+        try:
+            # Comprobación y escritura en la misma transacción (ver _check_availability)
+            with self.transaction():
+                self._check_availability(form_data)
+                reserva_id = self.model.create(form_data)
+            self._warn_overbooking(reserva_id)
+            return reserva_id
+        except (ValueError, ValidationError, DatabaseOperationError):
+            raise
+        except Exception as e:
+            raise Exception(f"Error creando reserva: {str(e)}")
+
+    def update(self, entity_id, form_data):
+        """Actualiza una reserva comprobando la disponibilidad sin contar la propia reserva"""
+        try:
+            with self.transaction():
+                self._check_availability(form_data, reserva_id=entity_id)
+                result = self.model.update(entity_id, form_data)
+            self._warn_overbooking(entity_id)
+            return result
+        except (ValueError, ValidationError, EntityNotFoundError, DatabaseOperationError):
+            raise
+        except Exception as e:
+            raise Exception(f"Error actualizando reserva: {str(e)}")
+
+    def cancel(self, entity_id):
+        """Cancela una reserva"""
+        try:
+            return self.model.cancel(entity_id)
+        except EntityNotFoundError:
+            raise
+        except Exception as e:
+            raise Exception(f"Error cancelando reserva: {str(e)}")
+
+    def delete(self, entity_id):
+        """Elimina una reserva"""
+        try:
+            return self.model.delete(entity_id)
+        except EntityNotFoundError:
+            raise
+        except Exception as e:
+            raise Exception(f"Error eliminando reserva: {str(e)}")
+
+    def get_availability(self, hotel_id, fecha_llegada, fecha_salida):
+        """
+        Obtiene las habitaciones libres de cada tipo de un hotel en un rango
+
+        Args:
+            hotel_id (int): ID del hotel
+            fecha_llegada: Primera noche (date o texto AAAA-MM-DD)
+            fecha_salida: Día de salida (date o texto AAAA-MM-DD)
+
+        Returns:
+            dict: {id_tipo_habitacion: habitaciones libres todas las noches}
+        """
+        llegada, salida = self._parse_range(fecha_llegada, fecha_salida)
+        try:
+            return self.availability.hotel_availability(int(hotel_id), llegada, salida)
+        except Exception as e:
+            logger.error("Error consultando disponibilidad: %s", e)
+            raise DatabaseOperationError(f"Error consultando disponibilidad: {str(e)}")
+
+    def find_overbookings(self, since=None):
+        """
+        Revisa todas las reservas no canceladas en busca de sobreventa
+
+        Args:
+            since (date): Solo reservas que terminan después de esta fecha (None: todas)
+
+        Returns:
+            list: ConflictRecord por hotel, tipo y tramo de fechas
+        """
+        try:
+            return self.overbooking.scan(since)
+        except Exception as e:
+            logger.error("Error revisando sobreventa: %s", e)
+            raise DatabaseOperationError(f"Error revisando sobreventa: {str(e)}")
+
+    def check_overbooking(self, reserva_id):
+        """
+        Revisa la sobreventa solo en las noches de una reserva
+
+        Returns:
+            list: ConflictRecord de su hotel y tipo en sus fechas
+        """
+        try:
+            return self.overbooking.check_reservation(int(reserva_id))
+        except Exception as e:
+            logger.error("Error revisando sobreventa de la reserva %s: %s", reserva_id, e)
+            raise DatabaseOperationError(f"Error revisando sobreventa: {str(e)}")
+
+    def _warn_overbooking(self, reserva_id):
+        """
+        Registra la sobreventa que deja una escritura
+
+        Las reservas guardadas por este controlador no pueden sobrevender (el
+        cupo se comprueba bloqueado en su transacción), pero sí las
+        habitaciones que pasan a mantenimiento con reservas ya hechas o las
+        reservas escritas fuera de la aplicación. Esto no deshace la
+        escritura, solo deja en el log la sobreventa que haya en sus noches.
+        """
+        try:
+            for conflict in self.overbooking.check_reservation(int(reserva_id)):
+                logger.warning("Sobreventa tras guardar la reserva %s: %s", reserva_id, conflict)
+        except Exception as e:
+            logger.error("No se pudo revisar la sobreventa de la reserva %s: %s", reserva_id, e)
+
+    def _check_availability(self, form_data, reserva_id=None):
+        """
+        Comprueba que la reserva del formulario cabe en el inventario
+
+        Cuenta en la base de datos con AvailabilityEngine.locked_available(),
+        que bloquea el inventario del par hasta el final de la transacción:
+        debe llamarse dentro de transaction() junto con el INSERT o UPDATE,
+        de modo que dos puestos no puedan vender a la vez la última habitación.
+
+        Raises:
+            ValidationError: Si no quedan habitaciones suficientes del tipo pedido
+        """
+        estado = str(form_data.get('ESTADO_RESERVA') or '').strip()
+        if estado == ESTADO_CANCELADA:
+            return
+
+        llegada, salida = self._parse_range(form_data.get('FECHA_LLEGADA'),
+                                            form_data.get('FECHA_SALIDA'))
+        hotel_id = Validator.validate_integer(form_data.get('ID_HOTEL'), "Hotel", allow_empty=False)
+        tipo_id = Validator.validate_integer(form_data.get('ID_TIPO_HABITACION'),
+                                             "Tipo de habitación", allow_empty=False)
+        habitaciones = Validator.validate_integer(form_data.get('NUMERO_HABITACIONES'),
+                                                  "Número de habitaciones") or 1
+
+        # Al editar, la ocupación actual de la reserva no cuenta contra sí misma
+        exclude = int(reserva_id) if reserva_id is not None else None
+        libres = self.availability.locked_available(hotel_id, tipo_id, llegada, salida, exclude)
+        if libres < habitaciones:
+            raise ValidationError(
+                'NUMERO_HABITACIONES',
+                f"Solo quedan {libres} habitaciones de ese tipo entre {llegada} y {salida}"
+            )
+
+    @staticmethod
+    def _parse_range(fecha_llegada, fecha_salida):
+        llegada = Validator.validate_date(fecha_llegada, "Fecha de llegada", allow_empty=False)
+        salida = Validator.validate_date(fecha_salida, "Fecha de salida", allow_empty=False)
+        if salida <= llegada:
+            raise ValueError("La fecha de salida debe ser posterior a la de llegada")
+        return llegada, salida
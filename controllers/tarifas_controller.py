@@ -0,0 +1,105 @@
+from controllers.base_controller import BaseController
+from models.rates import RateEngine
+from utils.exceptions import EntityNotFoundError, DatabaseOperationError
+from utils.logger import get_logger
+from utils.validators import Validator
+
+logger = get_logger('controllers')
+
+
+class TarifasController(BaseController):
+    def __init__(self, model, temporadas_model):
+        """
+        Args:
+            model: Instancia de Tarifas
+            temporadas_model: Instancia de Temporadas (factores del cálculo de precios)
+        """
+        super().__init__(model)
+        self.rates = RateEngine(model, temporadas_model)
+
+    def get_by_id(self, entity_id):
+        """Obtiene una tarifa por ID"""
+        try:
+            return self.model.get_by_id(entity_id)
+        except EntityNotFoundError:
+            raise
+        except Exception as e:
+            raise Exception(f"Error obteniendo tarifa: {str(e)}")
+
+    def get_all(self):
+        """Obtiene todas las tarifas"""
+        try:
+            return self.model.get_all()
+        except Exception as e:
+            raise Exception(f"Error obteniendo tarifas: {str(e)}")
+
+    def create(self, form_data):
+        """Crea una nueva tarifa (el modelo valida los campos)"""
+        try:
+            return self.model.create(form_data)
+        except (ValueError, DatabaseOperationError):
+            raise
+        except Exception as e:
+            raise Exception(f"Error creando tarifa: {str(e)}")
+
+    def update(self, entity_id, form_data):
+        """Actualiza una tarifa"""
+        try:
+            return self.model.update(entity_id, form_data)
+        except (ValueError, EntityNotFoundError, DatabaseOperationError):
+            raise
+        except Exception as e:
+            raise Exception(f"Error actualizando tarifa: {str(e)}")
+
+    def delete(self, entity_id):
+        """Elimina una tarifa"""
+        try:
+            return self.model.delete(entity_id)
+        except EntityNotFoundError:
+            raise
+        except Exception as e:
+            raise Exception(f"Error eliminando tarifa: {str(e)}")
+
+    def quote_stay(self, tipo_id, fecha_llegada, fecha_salida):
+        """
+        Calcula el precio de una estancia
+
+        Args:
+            tipo_id (int): ID del tipo de habitación
+            fecha_llegada: Primera noche (date o texto AAAA-MM-DD)
+            fecha_salida: Día de salida (date o texto AAAA-MM-DD)
+
+        Returns:
+            dict: noches, subtotal, descuento, impuestos y total (None si el
+                tipo no tiene tarifas)
+        """
+        tipo_val = Validator.validate_integer(tipo_id, "Tipo de habitación", allow_empty=False)
+        llegada = Validator.validate_date(fecha_llegada, "Fecha de llegada", allow_empty=False)
+        salida = Validator.validate_date(fecha_salida, "Fecha de salida", allow_empty=False)
+        if salida <= llegada:
+            raise ValueError("La fecha de salida debe ser posterior a la de llegada")
+        try:
+            return self.rates.price_stay(tipo_val, llegada, salida)
+        except Exception as e:
+            logger.error("Error calculando precio: %s", e)
+            raise DatabaseOperationError(f"Error calculando precio: {str(e)}")
+
+    def quote_stays(self, tipo_ids, llegadas, salidas):
+        """
+        Calcula el precio de muchas estancias candidatas en una sola operación
+
+        Args:
+            tipo_ids: IDs de tipo de habitación
+            llegadas: Fechas de llegada (date o datetime64)
+            salidas: Fechas de salida
+
+        Returns:
+            dict: Arrays por estancia (ver RateTable.price_stays)
+        """
+        try:
+            return self.rates.price_stays(tipo_ids, llegadas, salidas)
+        except ValueError:
+            raise
+        except Exception as e:
+            logger.error("Error calculando precios: %s", e)
+            raise DatabaseOperationError(f"Error calculando precios: {str(e)}")
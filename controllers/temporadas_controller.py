@@ -0,0 +1,50 @@
+from controllers.base_controller import BaseController
+from utils.exceptions import EntityNotFoundError, DatabaseOperationError
+
+
+class TemporadasController(BaseController):
+    def __init__(self, model):
+        super().__init__(model)
+
+    def get_by_id(self, entity_id):
+        """Obtiene una temporada por ID"""
+        try:
+            return self.model.get_by_id(entity_id)
+        except EntityNotFoundError:
+            raise
+        except Exception as e:
+            raise Exception(f"Error obteniendo temporada: {str(e)}")
+
+    def get_all(self):
+        """Obtiene todas las temporadas"""
+        try:
+            return self.model.get_all()
+        except Exception as e:
+            raise Exception(f"Error obteniendo temporadas: {str(e)}")
+
+    def create(self, form_data):
+        """Crea una nueva temporada (el modelo valida los campos)"""
+        try:
+            return self.model.create(form_data)
+        except (ValueError, DatabaseOperationError):
+            raise
+        except Exception as e:
+            raise Exception(f"Error creando temporada: {str(e)}")
+
+    def update(self, entity_id, form_data):
+        """Actualiza una temporada"""
+        try:
+            return self.model.update(entity_id, form_data)
+        except (ValueError, EntityNotFoundError, DatabaseOperationError):
+            raise
+        except Exception as e:
+            raise Exception(f"Error actualizando temporada: {str(e)}")
+
+    def delete(self, entity_id):
+        """Elimina una temporada"""
+        try:
+            return self.model.delete(entity_id)
+        except EntityNotFoundError:
+            raise
+        except Exception as e:
+            raise Exception(f"Error eliminando temporada: {str(e)}")
@@ -238,8 +238,8 @@ INSERT INTO `clientes` (`id_cliente`, `nombre`, `apellido`, `documento_identidad
 (1, 'fernando', 'lopez', 1983739, 'colombiano', '1987-12-11', 'calle 13 av 23 #26-19', 3109764, 'fernando_lopez12@gmail.com', 'tipo de cama', 'oro'),
 (2, 'adriana', 'figueroa', 1109273, 'española', '1989-06-28', 'calle 18 av 12 #33-16', 31297355, 'adriana_figueroa3@gmail.com', 'vista', 'elite'),
 (3, 'carola', 'ramirez', 1387252, 'argentino', '1998-05-22', 'calle 16 av 10 #26-32', 32298736, 'cristian_ramirez09@gmail.com', 'ubicacion de la habitacion', 'ihg rewards club'),
-(0, 'tatiana', 'ramirez', 1387252, 'mexicana', '1998-05-22', 'calle 16 av 10 #26-32', 32298736, 'cristian_ramirez09@gmail.com', 'ubicacion de la habitacion', 'ihg rewards club'),
-(0, 'james', 'mosquera', 1387252, 'mexicana', '1998-05-22', 'calle 16 av 10 #26-32', 32298736, 'cristian_ramirez09@gmail.com', 'ubicacion de la habitacion', 'ihg rewards club');
+(5, 'tatiana', 'ramirez', 1387252, 'mexicana', '1998-05-22', 'calle 16 av 10 #26-32', 32298736, 'cristian_ramirez09@gmail.com', 'ubicacion de la habitacion', 'ihg rewards club'),
+(6, 'james', 'mosquera', 1387252, 'mexicana', '1998-05-22', 'calle 16 av 10 #26-32', 32298736, 'cristian_ramirez09@gmail.com', 'ubicacion de la habitacion', 'ihg rewards club');
 
 -- --------------------------------------------------------
 
@@ -397,7 +397,7 @@ CREATE TABLE `hoteles` (
 INSERT INTO `hoteles` (`id_hotel`, `nombre_hotel`, `categoria`, `direccion`, `telefono`, `correo`, `año_inauguracion`, `numero_total_habitantes`, `servicios_disponibles`, `horarios_check_in`, `horarios_check_out`, `gerente_responsable`) VALUES
 (1, 'brisa marina', 5, 'calle 27 av 38 #44-33', 57537265, 'brisa_marina.14@gmail.com', 1990, 900, 'var, restaurante, psina, cancha', '14:00:00', '11:00:00', 'carlos londoño'),
 (3, 'encanto total', 4, 'calle 44 av 63 #58-10', 76352, 'encanto_colonial.23@gmail.com', 2007, 700, 'restaurante, var, psina', '14:00:00', '11:00:00', 'andres camacho'),
-(1, 'campo libre', 3, 'calle 27 av 38 #44-33', 57537265, 'brisa_marina.14@gmail.com', 1990, 900, 'var, restaurante, psina, cancha', '14:00:00', '11:00:00', 'carlos londoño');
+(2, 'campo libre', 3, 'calle 27 av 38 #44-33', 57537265, 'brisa_marina.14@gmail.com', 1990, 900, 'var, restaurante, psina, cancha', '14:00:00', '11:00:00', 'carlos londoño');
 
 -- --------------------------------------------------------
 
@@ -914,4 +914,129 @@ BEGIN
     INSERT INTO temporadas(nombre_temporada, fecha_inicio, fecha_fin, factor_multiplicador_tarifa)
     VALUES (p_nombre_temporada, p_fecha_inicio, p_fecha_fin, p_factor_multiplicador_tarifa);
 END //
+DELIMITER ;
+
+
+#================== versiones de tablas (detección de cambios) ==================
+# Los triggers son FOR EACH ROW: cada fila escrita incrementa la misma fila de
+# table_versions, así que las escrituras concurrentes en una tabla versionada
+# esperan ese bloqueo hasta su COMMIT y un INSERT de N filas hace N
+# incrementos. Se acepta porque son tablas de pocas escrituras y evita un
+# viaje más al servidor en cada escritura de los modelos.
+
+CREATE TABLE IF NOT EXISTS table_versions (
+    table_name VARCHAR(64) NOT NULL PRIMARY KEY,
+    version BIGINT UNSIGNED NOT NULL DEFAULT 0
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
+
+INSERT IGNORE INTO table_versions (table_name, version) VALUES ('hoteles', 0), ('clientes', 0),
+    ('check_in_out', 0), ('reservas', 0);
+
+
+DELIMITER //
+CREATE TRIGGER trg_hoteles_version_insert AFTER INSERT ON hoteles
+FOR EACH ROW
+BEGIN
+    INSERT INTO table_versions (table_name, version) VALUES ('hoteles', 1)
+    ON DUPLICATE KEY UPDATE version = version + 1;
+END //
+DELIMITER ;
+
+DELIMITER //
+CREATE TRIGGER trg_hoteles_version_update AFTER UPDATE ON hoteles
+FOR EACH ROW
+BEGIN
+    INSERT INTO table_versions (table_name, version) VALUES ('hoteles', 1)
+    ON DUPLICATE KEY UPDATE version = version + 1;
+END //
+DELIMITER ;
+
+DELIMITER //
+CREATE TRIGGER trg_hoteles_version_delete AFTER DELETE ON hoteles
+FOR EACH ROW
+BEGIN
+    INSERT INTO table_versions (table_name, version) VALUES ('hoteles', 1)
+    ON DUPLICATE KEY UPDATE version = version + 1;
+END //
+DELIMITER ;
+
+DELIMITER //
+CREATE TRIGGER trg_clientes_version_insert AFTER INSERT ON clientes
+FOR EACH ROW
+BEGIN
+    INSERT INTO table_versions (table_name, version) VALUES ('clientes', 1)
+    ON DUPLICATE KEY UPDATE version = version + 1;
+END //
+DELIMITER ;
+
+DELIMITER //
+CREATE TRIGGER trg_clientes_version_update AFTER UPDATE ON clientes
+FOR EACH ROW
+BEGIN
+    INSERT INTO table_versions (table_name, version) VALUES ('clientes', 1)
+    ON DUPLICATE KEY UPDATE version = version + 1;
+END //
+DELIMITER ;
+
+DELIMITER //
+CREATE TRIGGER trg_clientes_version_delete AFTER DELETE ON clientes
+FOR EACH ROW
+BEGIN
+    INSERT INTO table_versions (table_name, version) VALUES ('clientes', 1)
+    ON DUPLICATE KEY UPDATE version = version + 1;
+END //
+DELIMITER ;
+
+DELIMITER //
+CREATE TRIGGER trg_check_in_out_version_insert AFTER INSERT ON check_in_out
+FOR EACH ROW
+BEGIN
+    INSERT INTO table_versions (table_name, version) VALUES ('check_in_out', 1)
+    ON DUPLICATE KEY UPDATE version = version + 1;
+END //
+DELIMITER ;
+
+DELIMITER //
+CREATE TRIGGER trg_check_in_out_version_update AFTER UPDATE ON check_in_out
+FOR EACH ROW
+BEGIN
+    INSERT INTO table_versions (table_name, version) VALUES ('check_in_out', 1)
+    ON DUPLICATE KEY UPDATE version = version + 1;
+END //
+DELIMITER ;
+
+DELIMITER //
+CREATE TRIGGER trg_check_in_out_version_delete AFTER DELETE ON check_in_out
+FOR EACH ROW
+BEGIN
+    INSERT INTO table_versions (table_name, version) VALUES ('check_in_out', 1)
+    ON DUPLICATE KEY UPDATE version = version + 1;
+END //
+DELIMITER ;
+
+DELIMITER //
+CREATE TRIGGER trg_reservas_version_insert AFTER INSERT ON reservas
+FOR EACH ROW
+BEGIN
+    INSERT INTO table_versions (table_name, version) VALUES ('reservas', 1)
+    ON DUPLICATE KEY UPDATE version = version + 1;
+END //
+DELIMITER ;
+
+DELIMITER //
+CREATE TRIGGER trg_reservas_version_update AFTER UPDATE ON reservas
+FOR EACH ROW
+BEGIN
+    INSERT INTO table_versions (table_name, version) VALUES ('reservas', 1)
+    ON DUPLICATE KEY UPDATE version = version + 1;
+END //
+DELIMITER ;
+
+DELIMITER //
+CREATE TRIGGER trg_reservas_version_delete AFTER DELETE ON reservas
+FOR EACH ROW
+BEGIN
+    INSERT INTO table_versions (table_name, version) VALUES ('reservas', 1)
+    ON DUPLICATE KEY UPDATE version = version + 1;
+END //
 DELIMITER ;
\ No newline at end of file
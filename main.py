@@ -1,24 +1,56 @@
 import tkinter as tk
 from views.main_window import MainWindow
 from config.database import DatabaseConnection
+from config.migrations import MigrationRunner
+from utils.exceptions import DatabaseOperationError
+import os
 import sys
+from utils.logger import configure
 
 
 def main():
     """Función principal de la aplicación"""
+    # Niveles de registro por área (variable de entorno HOTEEL_LOG)
+    configure()
+
     try:
-        # Inicializar conexión a base de datos
-        db = DatabaseConnection()
+        # Inicializar conexión a base de datos (pool para exportaciones y tareas concurrentes)
+        db = DatabaseConnection(pool_size=5)
         if not db.test_connection():
             print("Error: No se pudo conectar a la base de datos")
             sys.exit(1)
 
+        # El esquema se migra aparte (python -m config.migrations); aquí solo se
+        # comprueba, y sin las migraciones obligatorias la aplicación no arranca
+        try:
+            pending = MigrationRunner(db).pending()
+        except DatabaseOperationError as e:
+            print(f"Error: no se pudo comprobar el estado de las migraciones: {e}")
+            sys.exit(1)
+        required = [f"{version} ({description})" for version, description, mandatory in pending
+                    if mandatory]
+        if required:
+            print(f"Error: faltan migraciones del esquema: {', '.join(required)}")
+            print("Ejecute: python -m config.migrations")
+            sys.exit(1)
+        if pending:
+            print("Advertencia: migraciones opcionales pendientes: "
+                  f"{[version for version, _, _ in pending]} (python -m config.migrations)")
+
         # Crear ventana principal
         root = tk.Tk()
         app = MainWindow(root, db)
 
         # Configurar cierre de aplicación
         def on_closing():
+            app.shutdown()
+            # Volcado opcional de latencias para comparar entre versiones
+            stats_path = os.environ.get('HOTEEL_QUERY_STATS')
+            if stats_path:
+                try:
+                    db.dump_query_stats(stats_path)
+                except OSError as e:
+                    print(f"No se pudieron guardar las estadísticas de consultas: {e}")
             db.disconnect()
             root.destroy()
 
@@ -0,0 +1,483 @@
+"""
+Indicadores de ocupación e ingresos por hotel y mes
+
+MetricsCube guarda cada medida en un array NumPy de una fila por hotel y
+una columna por mes, ya agregado: cualquier corte (hoteles, rango de
+meses) y agrupación (hotel, mes, año o total) es una suma sobre un trozo
+del array, de milisegundos aunque las tablas de origen tengan millones de
+filas. Los indicadores derivados se calculan al consultar:
+
+- ocupación = noches vendidas / noches disponibles
+- ADR = ingresos por habitaciones / noches vendidas
+- RevPAR = ingresos por habitaciones / noches disponibles
+
+AnalyticsEngine llena el cubo desde reservas, check_in_out,
+consumo_servicos, habitaciones y hoteles y lo mantiene al día sin
+recalcularlo entero:
+
+- Reservas: el modelo avisa de cada escritura; en el siguiente refresh()
+  se resta la aportación anterior de esas reservas y se suma la nueva.
+- Consumos y estancias no tienen modelo: se leen solo las filas con ID
+  mayor que el último cargado. Si COUNT(*) no cuadra (se borraron o
+  renumeraron filas) esa medida se recarga completa; una fila editada
+  desde otra aplicación no se detecta hasta la siguiente recarga.
+- Un cambio en habitaciones, tarifas o temporadas recarga todo el cubo.
+
+Las noches vendidas son las de las reservas no canceladas con hotel,
+repartidas entre los meses que abarcan; su ingreso se calcula con el
+RateEngine (tarifa menos descuento, sin impuestos; 0 si el tipo no tiene
+tarifa). Las noches disponibles usan las habitaciones actuales de cada
+hotel (sin las que están fuera de servicio) para todos los meses.
+"""
+import calendar
+import threading
+import numpy as np
+from utils.logger import get_logger
+
+logger = get_logger('models')
+
+MEASURES = ('noches_vendidas', 'ingresos_habitaciones', 'ingresos_servicios', 'llegadas')
+
+GROUPINGS = ('hotel', 'month', 'year')  # Valores admitidos en MetricsCube.query(group_by=...)
+
+_MONTHS_BEFORE_1970 = 1970 * 12  # datetime64[M] cuenta meses desde 1970-01
+
+
+def month_number(day):
+    """Número de mes absoluto (año * 12 + mes - 1) de una fecha"""
+    return day.year * 12 + day.month - 1
+
+
+def month_label(number):
+    """Texto AAAA-MM de un número de mes"""
+    return f"{number // 12:04d}-{number % 12 + 1:02d}"
+
+
+class MetricsCube:
+    """Medidas agregadas por hotel (filas) y mes (columnas)"""
+
+    def __init__(self):
+        self.hotel_ids = np.zeros(0, dtype=np.int64)  # Eje de filas, ordenado
+        self.first_month = None  # Número de mes de la primera columna
+        self.rooms = np.zeros(0, dtype=np.int64)  # Habitaciones disponibles por hotel
+        self._data = {measure: np.zeros((0, 0)) for measure in MEASURES}
+
+    @property
+    def months(self):
+        return self._data[MEASURES[0]].shape[1]
+
+    def add(self, measure, hotel_ids, months, values):
+        """
+        Suma valores a una medida
+
+        Args:
+            measure (str): Una de MEASURES
+            hotel_ids: IDs de hotel (uno por valor)
+            months: Números de mes (ver month_number)
+            values: Cantidades a sumar (negativas para restar)
+        """
+        hotel_ids = np.asarray(hotel_ids, dtype=np.int64)
+        months = np.asarray(months, dtype=np.int64)
+        if not len(hotel_ids):
+            return
+        self._ensure_hotels(hotel_ids)
+        self._ensure_months(int(months.min()), int(months.max()))
+        rows = np.searchsorted(self.hotel_ids, hotel_ids)
+        np.add.at(self._data[measure], (rows, months - self.first_month), values)
+
+    def reset(self, measure):
+        """Pone a cero una medida (antes de recargarla)"""
+        self._data[measure][:] = 0
+
+    def set_rooms(self, rooms_by_hotel):
+        """
+        Fija las habitaciones disponibles de cada hotel
+
+        Args:
+            rooms_by_hotel (dict): {id_hotel: habitaciones}; los hoteles que no
+                aparecen quedan con 0
+        """
+        self._ensure_hotels(np.fromiter(rooms_by_hotel, dtype=np.int64, count=len(rooms_by_hotel)))
+        self.rooms = np.zeros(len(self.hotel_ids), dtype=np.int64)
+        for hotel_id, rooms in rooms_by_hotel.items():
+            self.rooms[np.searchsorted(self.hotel_ids, hotel_id)] = rooms
+
+    def add_hotels(self, hotel_ids):
+        """Añade hoteles al eje aunque todavía no tengan datos"""
+        self._ensure_hotels(np.asarray(list(hotel_ids), dtype=np.int64))
+
+    def query(self, hotel_ids=None, first_month=None, last_month=None, group_by=('hotel', 'month'),
+              skip_empty=True):
+        """
+        Corta y agrega el cubo
+
+        Los meses pedidos fuera de los que tienen datos cuentan como meses sin
+        ventas: aportan sus noches disponibles a la ocupación y al RevPAR.
+
+        Args:
+            hotel_ids (iterable): Hoteles incluidos (None: todos)
+            first_month (int): Primer mes incluido (None: desde el primero con datos)
+            last_month (int): Último mes incluido (None: hasta el último con datos)
+            group_by (tuple): Subconjunto de GROUPINGS; 'year' agrupa los meses
+                por año y () da un único total
+            skip_empty (bool): Omite las filas sin ventas, consumos ni llegadas
+
+        Returns:
+            list: Diccionarios con hotel (ID o None), periodo (AAAA-MM, AAAA o
+                None), las MEASURES, noches_disponibles, ocupacion, adr,
+                revpar e ingresos_totales
+        """
+        unknown = set(group_by) - set(GROUPINGS)
+        if unknown:
+            raise ValueError(f"Agrupación no válida: {', '.join(sorted(unknown))}")
+        if not len(self.hotel_ids):
+            return []
+
+        rows = np.arange(len(self.hotel_ids))
+        if hotel_ids is not None:
+            wanted = np.asarray(list(hotel_ids), dtype=np.int64)
+            rows = rows[np.isin(self.hotel_ids, wanted)]
+        data_first = self.first_month
+        data_last = data_first + self.months - 1 if data_first is not None else None
+        first = first_month if first_month is not None else data_first
+        last = last_month if last_month is not None else data_last
+        if first is None or last is None or last < first or not len(rows):
+            return []
+        month_numbers = np.arange(first, last + 1)
+
+        # Medidas del rango pedido; las columnas sin datos en el cubo quedan a cero
+        cells = {}
+        for measure in MEASURES:
+            values = np.zeros((len(rows), len(month_numbers)))
+            if data_first is not None:
+                low, high = max(first, data_first), min(last, data_last)
+                if low <= high:
+                    source = self._data[measure][rows, low - data_first:high - data_first + 1]
+                    values[:, low - first:high - first + 1] = source
+            cells[measure] = values
+
+        days = np.array([calendar.monthrange(number // 12, number % 12 + 1)[1]
+                         for number in month_numbers], dtype=np.float64)
+        cells['noches_disponibles'] = self.rooms[rows][:, None] * days[None, :]
+
+        # Columnas: meses, años o una sola
+        if 'year' in group_by:
+            years = month_numbers // 12
+            starts = np.flatnonzero(np.r_[True, years[1:] != years[:-1]])
+            periods = [str(year) for year in years[starts]]
+            cells = {name: np.add.reduceat(values, starts, axis=1) for name, values in cells.items()}
+        elif 'month' in group_by:
+            periods = [month_label(number) for number in month_numbers]
+        else:
+            periods = [None]
+            cells = {name: values.sum(axis=1, keepdims=True) for name, values in cells.items()}
+
+        # Filas: hoteles o una sola
+        if 'hotel' in group_by:
+            hotels = [int(hotel_id) for hotel_id in self.hotel_ids[rows]]
+        else:
+            hotels = [None]
+            cells = {name: values.sum(axis=0, keepdims=True) for name, values in cells.items()}
+
+        sold = cells['noches_vendidas']
+        available = cells['noches_disponibles']
+        revenue = cells['ingresos_habitaciones']
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cells['ocupacion'] = np.where(available > 0, sold / available, 0.0)
+            cells['adr'] = np.where(sold > 0, revenue / sold, 0.0)
+            cells['revpar'] = np.where(available > 0, revenue / available, 0.0)
+        cells['ingresos_totales'] = revenue + cells['ingresos_servicios']
+
+        keep = np.ones(sold.shape, dtype=bool)
+        if skip_empty:
+            keep = (sold != 0) | (cells['ingresos_servicios'] != 0) | (cells['llegadas'] != 0)
+        rows_kept, columns_kept = np.nonzero(keep)
+        names = list(cells)
+        columns_out = [cells[name][keep].astype(np.float64).tolist() for name in names]
+        results = []
+        for position, (row, column) in enumerate(zip(rows_kept.tolist(), columns_kept.tolist())):
+            entry = {'hotel': hotels[row], 'periodo': periods[column]}
+            for name, values in zip(names, columns_out):
+                entry[name] = values[position]
+            results.append(entry)
+        return results
+
+    def _ensure_hotels(self, hotel_ids):
+        """Amplía el eje de hoteles conservando los datos de los que ya estaban"""
+        missing = np.setdiff1d(hotel_ids, self.hotel_ids)
+        if not len(missing):
+            return
+        merged = np.union1d(self.hotel_ids, missing)
+        positions = np.searchsorted(merged, self.hotel_ids)
+        for measure, values in self._data.items():
+            grown = np.zeros((len(merged), values.shape[1]))
+            grown[positions] = values
+            self._data[measure] = grown
+        rooms = np.zeros(len(merged), dtype=np.int64)
+        rooms[positions] = self.rooms
+        self.rooms = rooms
+        self.hotel_ids = merged
+
+    def _ensure_months(self, first, last):
+        """Amplía el eje de meses por delante o por detrás"""
+        if self.first_month is None:
+            self.first_month = first
+            for measure, values in self._data.items():
+                self._data[measure] = np.zeros((values.shape[0], last - first + 1))
+            return
+        current_last = self.first_month + self.months - 1
+        if first >= self.first_month and last <= current_last:
+            return
+        new_first, new_last = min(first, self.first_month), max(last, current_last)
+        offset = self.first_month - new_first
+        for measure, values in self._data.items():
+            grown = np.zeros((values.shape[0], new_last - new_first + 1))
+            grown[:, offset:offset + values.shape[1]] = values
+            self._data[measure] = grown
+        self.first_month = new_first
+
+
+# Fuentes sin modelo que solo crecen: (medida, columna ID, consulta de marca, consulta de filas)
+# Las filas son (ID, id_hotel, fecha, valor) y se leen desde un ID en adelante
+APPEND_SOURCES = (
+    ('ingresos_servicios', 'id_consumo_servicios',
+     "SELECT COUNT(*), COALESCE(MAX(c.id_consumo_servicios), 0) FROM consumo_servicos c "
+     "JOIN habitaciones h ON h.id_habitacion = c.id_habitacion "
+     "WHERE c.fecha IS NOT NULL AND h.id_hotel IS NOT NULL",
+     "SELECT c.id_consumo_servicios, h.id_hotel, c.fecha, "
+     "COALESCE(c.cantidad, 1) * COALESCE(c.precio_aplicado, 0) FROM consumo_servicos c "
+     "JOIN habitaciones h ON h.id_habitacion = c.id_habitacion "
+     "WHERE c.fecha IS NOT NULL AND h.id_hotel IS NOT NULL AND c.id_consumo_servicios > %s"),
+    ('llegadas', 'id_check',
+     "SELECT COUNT(*), COALESCE(MAX(c.id_check), 0) FROM check_in_out c "
+     "JOIN habitaciones h ON h.id_habitacion = c.id_habitacion "
+     "WHERE c.fecha_llegada IS NOT NULL AND h.id_hotel IS NOT NULL",
+     "SELECT c.id_check, h.id_hotel, c.fecha_llegada, 1 FROM check_in_out c "
+     "JOIN habitaciones h ON h.id_habitacion = c.id_habitacion "
+     "WHERE c.fecha_llegada IS NOT NULL AND h.id_hotel IS NOT NULL AND c.id_check > %s")
+)
+
+
+class AnalyticsEngine:
+    """MetricsCube alimentado desde la base de datos y refrescado por partes"""
+
+    def __init__(self, db_connection, reservas_model, habitaciones_model, hoteles_model,
+                 rate_engine):
+        """
+        Args:
+            db_connection: Instancia de DatabaseConnection
+            reservas_model: Instancia de Reservas
+            habitaciones_model: Instancia de Habitaciones
+            hoteles_model: Instancia de Hoteles (nombres)
+            rate_engine: RateEngine para valorar las noches reservadas
+        """
+        self.db = db_connection
+        self.reservas = reservas_model
+        self.habitaciones = habitaciones_model
+        self.hoteles = hoteles_model
+        self.rates = rate_engine
+        self.hotel_names = {}
+        self._cube = None
+        self._bookings = {}  # id_reserva -> ocupación sumada al cubo (para restarla)
+        self._marks = {}  # medida -> (COUNT(*), MAX(ID)) de lo ya cargado
+        self._pending = set()  # Reservas escritas desde el último refresh()
+        self._stale = True  # True si hay que reconstruir el cubo entero
+        self._names_stale = True
+        self._state_lock = threading.Lock()  # Protege los avisos pendientes
+        self._refresh_lock = threading.Lock()  # Un refresh() a la vez
+        # Protege el cubo: las consultas solo esperan a los cambios incrementales;
+        # una reconstrucción se hace sobre un cubo nuevo que se cambia al final
+        self._lock = threading.Lock()
+
+        reservas_model.add_change_listener(self._reserva_changed)
+        habitaciones_model.add_change_listener(self._invalidate)
+        hoteles_model.add_change_listener(self._hotel_changed)
+        rate_engine.tarifas.add_change_listener(self._invalidate)
+        rate_engine.temporadas.add_change_listener(self._invalidate)
+
+    def refresh(self):
+        """
+        Pone el cubo al día (reconstruyéndolo si es la primera vez o cambió algo global)
+
+        Returns:
+            MetricsCube: Cubo actualizado
+        """
+        with self._refresh_lock:
+            with self._state_lock:
+                rebuild = self._stale or self._cube is None
+                pending = set() if rebuild else self._pending
+                names_stale = self._names_stale or rebuild
+                self._pending = set()
+                self._stale = False
+                self._names_stale = False
+
+            try:
+                hotel_names = self._read_hotel_names() if names_stale else None
+                if rebuild:
+                    cube, bookings, marks = self._build()
+                    with self._lock:
+                        self._cube, self._bookings, self._marks = cube, bookings, marks
+                else:
+                    current = self.reservas.get_bookings(sorted(pending)) if pending else {}
+                    with self._lock:
+                        if pending:
+                            self._apply_reservations(pending, current)
+                        for source in APPEND_SOURCES:
+                            self._refresh_source(self._cube, self._marks, source)
+                if hotel_names is not None:
+                    with self._lock:
+                        self.hotel_names = hotel_names
+                        self._cube.add_hotels(hotel_names)
+            except Exception:
+                # El cubo pudo quedar a medias: el siguiente refresh() lo reconstruye
+                self._invalidate(None)
+                raise
+            return self._cube
+
+    def query(self, hotel_ids=None, first_month=None, last_month=None,
+              group_by=('hotel', 'month'), skip_empty=True):
+        """Ver MetricsCube.query(); usa el cubo tal como quedó en el último refresh()"""
+        with self._lock:
+            if self._cube is None:
+                return []
+            return self._cube.query(hotel_ids, first_month, last_month, group_by, skip_empty)
+
+    def invalidate(self):
+        """Fuerza la reconstrucción completa en el próximo refresh()"""
+        self._invalidate(None)
+
+    # Avisos de los modelos
+
+    def _reserva_changed(self, reserva_id):
+        with self._state_lock:
+            if reserva_id is None:
+                self._stale = True
+            else:
+                self._pending.add(int(reserva_id))
+
+    def _hotel_changed(self, hotel_id):
+        with self._state_lock:
+            self._names_stale = True
+
+    def _invalidate(self, entity_id):
+        with self._state_lock:
+            self._stale = True
+
+    # Carga
+
+    def _build(self):
+        """
+        Construye un cubo nuevo desde cero
+
+        Returns:
+            tuple: (MetricsCube, reservas sumadas {id: ocupación}, marcas de las
+                fuentes que solo crecen)
+        """
+        cube = MetricsCube()
+        rooms = {}
+        for (hotel_id, _), count in self.habitaciones.count_inventory().items():
+            rooms[hotel_id] = rooms.get(hotel_id, 0) + count
+        cube.set_rooms(rooms)
+
+        bookings = {booking[0]: booking for booking in self.reservas.iter_bookings()
+                    if booking[1] is not None}
+        self._add_stays(cube, list(bookings.values()), 1)
+
+        marks = {}
+        for source in APPEND_SOURCES:
+            self._refresh_source(cube, marks, source)
+        logger.debug("Cubo de indicadores: %d hoteles x %d meses, %d reservas",
+                     len(cube.hotel_ids), cube.months, len(bookings))
+        return cube, bookings, marks
+
+    def _read_hotel_names(self):
+        """Nombres de los hoteles; también se añaden al eje aunque no tengan datos"""
+        return {hotel['ID_HOTEL']: hotel['NOMBRE_HOTEL'] for hotel in self.hoteles.get_all() if hotel}
+
+    def _apply_reservations(self, reserva_ids, current):
+        """
+        Resta la aportación anterior de unas reservas y suma la actual
+
+        Args:
+            reserva_ids (set): Reservas escritas
+            current (dict): Sus ocupaciones actuales (Reservas.get_bookings())
+        """
+        removed, added = [], []
+        for reserva_id in reserva_ids:
+            previous = self._bookings.pop(reserva_id, None)
+            if previous is not None:
+                removed.append(previous)
+            booking = current.get(reserva_id)
+            if booking is not None and booking[1] is not None:
+                self._bookings[reserva_id] = booking
+                added.append(booking)
+        self._add_stays(self._cube, removed, -1)
+        self._add_stays(self._cube, added, 1)
+
+    def _add_stays(self, cube, stays, sign):
+        """
+        Reparte noches e ingresos de reservas entre los meses que abarcan
+
+        Args:
+            cube (MetricsCube): Cubo a modificar
+            stays (list): Tuplas de Reservas.iter_bookings() con hotel
+            sign (int): 1 para sumar, -1 para restar
+        """
+        stays = [stay for stay in stays if stay[3] is not None and stay[4] is not None
+                 and stay[4] > stay[3]]
+        if not stays:
+            return
+        hotels = np.array([stay[1] for stay in stays], dtype=np.int64)
+        tipos = np.array([stay[2] if stay[2] is not None else -1 for stay in stays], dtype=np.int64)
+        starts = np.array([stay[3] for stay in stays], dtype='datetime64[D]')
+        ends = np.array([stay[4] for stay in stays], dtype='datetime64[D]')
+        rooms = np.array([stay[5] or 1 for stay in stays], dtype=np.int64)
+
+        # Un tramo por cada mes que toca la estancia
+        first_months = starts.astype('datetime64[M]')
+        spans = ((ends - 1).astype('datetime64[M]') - first_months).astype(np.int64) + 1
+        owner = np.repeat(np.arange(len(stays)), spans)
+        offsets = np.arange(spans.sum()) - np.repeat(np.cumsum(spans) - spans, spans)
+        months = first_months[owner] + offsets.astype('timedelta64[M]')
+        segment_starts = np.maximum(starts[owner], months.astype('datetime64[D]'))
+        segment_ends = np.minimum(ends[owner], (months + 1).astype('datetime64[D]'))
+
+        nights = (segment_ends - segment_starts).astype(np.int64) * rooms[owner]
+        prices = self.rates.price_stays(tipos[owner], segment_starts, segment_ends)
+        revenue = np.nan_to_num(prices['subtotal'] - prices['descuento']) * rooms[owner]
+
+        month_numbers = months.astype(np.int64) + _MONTHS_BEFORE_1970
+        cube.add('noches_vendidas', hotels[owner], month_numbers, sign * nights)
+        cube.add('ingresos_habitaciones', hotels[owner], month_numbers, sign * revenue)
+
+    def _refresh_source(self, cube, marks, source):
+        """
+        Carga las filas nuevas de una fuente que solo crece, o toda si cambió de otra forma
+
+        Args:
+            cube (MetricsCube): Cubo a modificar
+            marks (dict): Marcas de lo ya cargado (se actualiza)
+            source (tuple): Entrada de APPEND_SOURCES
+        """
+        measure, _, mark_query, rows_query = source
+        rows = self.db.execute_query(mark_query)
+        mark = tuple(rows[0]) if rows else (0, 0)
+        loaded = marks.get(measure)
+        if loaded == mark:
+            return
+
+        after_id = loaded[1] if loaded is not None else 0
+        new_rows = list(self.db.iter_query(rows_query, (after_id,), batch_size=5000))
+        if loaded is None or loaded[0] + len(new_rows) != mark[0]:
+            if loaded is not None:
+                # Se borraron o renumeraron filas ya cargadas: se recarga la medida
+                cube.reset(measure)
+                new_rows = list(self.db.iter_query(rows_query, (0,), batch_size=5000))
+        if new_rows:
+            cube.add(
+                measure,
+                [row[1] for row in new_rows],
+                [row[2].year * 12 + row[2].month - 1 for row in new_rows],
+                np.array([float(row[3] or 0) for row in new_rows])
+            )
+        marks[measure] = (mark[0], max([mark[1]] + [row[0] for row in new_rows]))
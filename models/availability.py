@@ -0,0 +1,439 @@
+"""
+Disponibilidad de habitaciones por hotel y tipo de habitación
+
+OccupancyIndex guarda, para cada par (hotel, tipo), cuántas habitaciones
+están reservadas cada noche de un horizonte fijo (365 noches desde el día
+de carga). Las habitaciones libres en un rango son el inventario del par
+menos la noche más ocupada del rango: un max() sobre un trozo de array, de
+microsegundos incluso para el horizonte completo. Crear o cancelar una
+reserva solo suma o resta en sus noches.
+
+Los rangos que salen del horizonte se resuelven recorriendo las reservas
+del par, que también se guardan por ID para poder quitarlas.
+
+    index = OccupancyIndex(date(2025, 1, 1))
+    index.set_inventory(1, 2, 10)
+    index.add(7, 1, 2, date(2025, 3, 1), date(2025, 3, 4), rooms=2)
+    index.available(1, 2, date(2025, 3, 2), date(2025, 3, 3))  # -> 8
+
+AvailabilityEngine mantiene un OccupancyIndex al día con los modelos
+Reservas y Habitaciones: lo carga en la primera consulta y aplica en la
+siguiente las reservas escritas desde entonces. Cada consulta compara
+además get_change_token() de reservas (versionada con triggers, migración
+7) y recarga el índice si la tabla cambió desde otro puesto. Para guardar
+una reserva, locked_available() cuenta el cupo en la base de datos dentro
+de la transacción de la escritura, sin el índice.
+"""
+import threading
+from array import array
+from datetime import date
+from utils.exceptions import DatabaseOperationError
+from utils.logger import get_logger
+
+logger = get_logger('models')
+
+HORIZON_DAYS = 365
+
+
+def _check_range(arrival, departure):
+    if departure <= arrival:
+        raise ValueError("La fecha de salida debe ser posterior a la de llegada")
+
+
+class OccupancyIndex:
+    """Habitaciones reservadas por noche para cada par (hotel, tipo)"""
+
+    def __init__(self, origin, horizon_days=HORIZON_DAYS):
+        """
+        Args:
+            origin (date): Primera noche del horizonte
+            horizon_days (int): Noches con ocupación precalculada
+        """
+        if horizon_days < 1:
+            raise ValueError("horizon_days debe ser al menos 1")
+        self.origin = origin
+        self.horizon_days = horizon_days
+        self._origin_day = origin.toordinal()
+        self._inventory = {}  # (hotel, tipo) -> habitaciones reservables
+        self._nights = {}  # (hotel, tipo) -> array con las habitaciones reservadas por noche
+        self._bookings = {}  # id_reserva -> ((hotel, tipo), llegada, salida, habitaciones)
+        self._by_key = {}  # (hotel, tipo) -> set de id_reserva
+        self._types_by_hotel = {}  # hotel -> set de tipos con inventario o reservas
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._bookings)
+
+    def __contains__(self, reserva_id):
+        return reserva_id in self._bookings
+
+    def set_inventory(self, hotel_id, tipo_id, rooms):
+        """Fija el número de habitaciones reservables de un par (hotel, tipo)"""
+        with self._lock:
+            self._inventory[(hotel_id, tipo_id)] = rooms
+            self._types_by_hotel.setdefault(hotel_id, set()).add(tipo_id)
+
+    def replace_inventory(self, inventory):
+        """
+        Sustituye todo el inventario
+
+        Args:
+            inventory (dict): {(hotel, tipo): habitaciones}, como
+                Habitaciones.count_inventory()
+        """
+        with self._lock:
+            self._inventory = dict(inventory)
+            types_by_hotel = {}
+            for hotel_id, tipo_id in set(self._inventory) | set(self._by_key):
+                types_by_hotel.setdefault(hotel_id, set()).add(tipo_id)
+            self._types_by_hotel = types_by_hotel
+
+    def inventory(self, hotel_id, tipo_id):
+        """Habitaciones reservables de un par (hotel, tipo); 0 si no tiene"""
+        return self._inventory.get((hotel_id, tipo_id), 0)
+
+    def add(self, reserva_id, hotel_id, tipo_id, arrival, departure, rooms=1):
+        """
+        Añade (o sustituye) la ocupación de una reserva
+
+        Args:
+            reserva_id: ID de la reserva
+            hotel_id (int): Hotel
+            tipo_id (int): Tipo de habitación
+            arrival (date): Primera noche
+            departure (date): Día de salida (su noche no se ocupa)
+            rooms (int): Habitaciones reservadas
+        """
+        _check_range(arrival, departure)
+        key = (hotel_id, tipo_id)
+        booking = (key, arrival.toordinal(), departure.toordinal(), rooms)
+        with self._lock:
+            if reserva_id in self._bookings:
+                self._remove_locked(reserva_id)
+            self._bookings[reserva_id] = booking
+            self._by_key.setdefault(key, set()).add(reserva_id)
+            self._types_by_hotel.setdefault(hotel_id, set()).add(tipo_id)
+            self._apply(booking, rooms)
+
+    def remove(self, reserva_id):
+        """Quita la ocupación de una reserva si estaba (cancelada o eliminada)"""
+        with self._lock:
+            self._remove_locked(reserva_id)
+
+    def booked(self, hotel_id, tipo_id, arrival, departure, exclude=None):
+        """
+        Habitaciones reservadas en la noche más ocupada de un rango
+
+        Args:
+            hotel_id (int): Hotel
+            tipo_id (int): Tipo de habitación
+            arrival (date): Primera noche
+            departure (date): Día de salida
+            exclude: ID de una reserva que no se cuenta (p. ej. la que se edita)
+
+        Returns:
+            int: Máximo de habitaciones reservadas en una misma noche
+        """
+        _check_range(arrival, departure)
+        start, end = arrival.toordinal(), departure.toordinal()
+        key = (hotel_id, tipo_id)
+        with self._lock:
+            excluded = self._bookings.get(exclude) if exclude is not None else None
+            if excluded is not None and excluded[0] == key:
+                counts = self.nightly_booked(hotel_id, tipo_id, arrival, departure)
+                _, booking_start, booking_end, rooms = excluded
+                for day in range(max(booking_start, start), min(booking_end, end)):
+                    counts[day - start] -= rooms
+                return max(counts)
+            first, last = start - self._origin_day, end - self._origin_day
+            if first >= 0 and last <= self.horizon_days:
+                nights = self._nights.get(key)
+                return max(nights[first:last]) if nights is not None else 0
+            return self._booked_by_scan(key, start, end)
+
+    def available(self, hotel_id, tipo_id, arrival, departure, exclude=None):
+        """
+        Habitaciones de un tipo libres todas las noches de un rango
+
+        Returns:
+            int: Inventario menos la noche más ocupada (0 si hay sobreventa)
+        """
+        with self._lock:
+            inventory = self._inventory.get((hotel_id, tipo_id), 0)
+            booked = self.booked(hotel_id, tipo_id, arrival, departure, exclude)
+            return max(inventory - booked, 0)
+
+    def hotel_availability(self, hotel_id, arrival, departure):
+        """
+        Habitaciones libres de cada tipo de un hotel en un rango
+
+        Returns:
+            dict: {id_tipo_habitacion: habitaciones libres}
+        """
+        with self._lock:
+            return {tipo_id: self.available(hotel_id, tipo_id, arrival, departure)
+                    for tipo_id in sorted(self._types_by_hotel.get(hotel_id, ()))}
+
+    def nightly_booked(self, hotel_id, tipo_id, arrival, departure):
+        """
+        Habitaciones reservadas noche a noche en un rango
+
+        Returns:
+            list: Un entero por noche, desde arrival hasta la víspera de departure
+        """
+        _check_range(arrival, departure)
+        start, end = arrival.toordinal(), departure.toordinal()
+        key = (hotel_id, tipo_id)
+        with self._lock:
+            first, last = start - self._origin_day, end - self._origin_day
+            if first >= 0 and last <= self.horizon_days:
+                nights = self._nights.get(key)
+                return list(nights[first:last]) if nights is not None else [0] * (end - start)
+            counts = [0] * (end - start)
+            for reserva_id in self._by_key.get(key, ()):
+                _, booking_start, booking_end, rooms = self._bookings[reserva_id]
+                for day in range(max(booking_start, start), min(booking_end, end)):
+                    counts[day - start] += rooms
+            return counts
+
+    def bookings_between(self, hotel_id, tipo_id, arrival, departure):
+        """
+        Reservas de un par (hotel, tipo) que ocupan alguna noche de un rango
+
+        Returns:
+            list: IDs de reserva ordenados
+        """
+        start, end = arrival.toordinal(), departure.toordinal()
+        with self._lock:
+            return sorted(
+                reserva_id for reserva_id in self._by_key.get((hotel_id, tipo_id), ())
+                if self._bookings[reserva_id][1] < end and self._bookings[reserva_id][2] > start
+            )
+
+    def _remove_locked(self, reserva_id):
+        booking = self._bookings.pop(reserva_id, None)
+        if booking is None:
+            return
+        key = booking[0]
+        self._by_key[key].discard(reserva_id)
+        self._apply(booking, -booking[3])
+
+    def _apply(self, booking, delta):
+        """Suma delta a las noches de la reserva que caen dentro del horizonte"""
+        key, start, end, _ = booking
+        first = max(start - self._origin_day, 0)
+        last = min(end - self._origin_day, self.horizon_days)
+        if first >= last:
+            return
+        nights = self._nights.get(key)
+        if nights is None:
+            nights = self._nights[key] = array('l', [0]) * self.horizon_days
+        for position in range(first, last):
+            nights[position] += delta
+
+    def _booked_by_scan(self, key, start, end):
+        """Noche más ocupada de un rango recorriendo las reservas del par (fuera del horizonte)"""
+        changes = {}
+        for reserva_id in self._by_key.get(key, ()):
+            _, booking_start, booking_end, rooms = self._bookings[reserva_id]
+            if booking_start < end and booking_end > start:
+                first, last = max(booking_start, start), min(booking_end, end)
+                changes[first] = changes.get(first, 0) + rooms
+                changes[last] = changes.get(last, 0) - rooms
+        peak = current = 0
+        for day in sorted(changes):
+            current += changes[day]
+            peak = max(peak, current)
+        return peak
+
+
+class AvailabilityEngine:
+    """OccupancyIndex alimentado por los modelos Reservas y Habitaciones"""
+
+    def __init__(self, reservas_model, habitaciones_model, horizon_days=HORIZON_DAYS,
+                 today=date.today):
+        """
+        Args:
+            reservas_model: Instancia de Reservas
+            habitaciones_model: Instancia de Habitaciones
+            horizon_days (int): Noches con ocupación precalculada desde hoy
+            today (callable): Fecha actual; al cambiar de día el índice se recarga
+                para que el horizonte avance
+        """
+        self.reservas = reservas_model
+        self.habitaciones = habitaciones_model
+        self.horizon_days = horizon_days
+        self._today = today
+        self._index = None
+        self._pending = set()  # Reservas escritas desde la última consulta
+        self._stale = False  # True si hay que recargar todas las reservas
+        self._inventory_stale = False  # True si cambió alguna habitación
+        self._token = None  # Parte de servidor de get_change_token() en la última carga
+        self._state_lock = threading.Lock()  # Protege _pending y los indicadores
+        self._load_lock = threading.Lock()  # Una sola carga o actualización a la vez
+        self.unassigned = 0  # Reservas vigentes sin hotel, fuera del índice
+
+        reservas_model.add_change_listener(self._reserva_changed)
+        habitaciones_model.add_change_listener(self._habitacion_changed)
+
+    @property
+    def origin(self):
+        """Primera noche del índice: las reservas que salen antes no están cargadas"""
+        return self._get_index().origin
+
+    def available(self, hotel_id, tipo_id, arrival, departure, exclude=None):
+        """Ver OccupancyIndex.available()"""
+        return self._get_index().available(hotel_id, tipo_id, arrival, departure, exclude)
+
+    def is_available(self, hotel_id, tipo_id, arrival, departure, rooms=1, exclude=None):
+        """
+        Indica si quedan habitaciones suficientes de un tipo en un rango
+
+        Returns:
+            bool: True si hay al menos rooms habitaciones libres todas las noches
+        """
+        return self.available(hotel_id, tipo_id, arrival, departure, exclude) >= rooms
+
+    def hotel_availability(self, hotel_id, arrival, departure):
+        """Ver OccupancyIndex.hotel_availability()"""
+        return self._get_index().hotel_availability(hotel_id, arrival, departure)
+
+    def nightly_booked(self, hotel_id, tipo_id, arrival, departure):
+        """Ver OccupancyIndex.nightly_booked()"""
+        return self._get_index().nightly_booked(hotel_id, tipo_id, arrival, departure)
+
+    def inventory(self, hotel_id, tipo_id):
+        """Ver OccupancyIndex.inventory()"""
+        return self._get_index().inventory(hotel_id, tipo_id)
+
+    def bookings_between(self, hotel_id, tipo_id, arrival, departure):
+        """Ver OccupancyIndex.bookings_between()"""
+        return self._get_index().bookings_between(hotel_id, tipo_id, arrival, departure)
+
+    def locked_available(self, hotel_id, tipo_id, arrival, departure, exclude=None):
+        """
+        Habitaciones libres de un par contadas en la base de datos
+
+        Bloquea antes el inventario del par (Habitaciones.lock_inventory), así
+        que debe llamarse dentro de db.transaction() junto con la escritura
+        de la reserva: otro puesto que reserve el mismo par espera al COMMIT y
+        cuenta ya la reserva guardada. No usa el índice en memoria.
+
+        Args:
+            hotel_id (int): Hotel
+            tipo_id (int): Tipo de habitación
+            arrival (date): Primera noche
+            departure (date): Día de salida
+            exclude: ID de una reserva que no se cuenta (p. ej. la que se edita)
+
+        Returns:
+            int: Inventario menos la noche más ocupada del rango (0 si hay sobreventa)
+        """
+        _check_range(arrival, departure)
+        # El bloqueo va primero: la lectura de reservas ya ve lo confirmado por
+        # quien lo tenía
+        rooms = self.habitaciones.lock_inventory(hotel_id, tipo_id)
+        index = OccupancyIndex(arrival, (departure - arrival).days)
+        index.set_inventory(hotel_id, tipo_id, rooms)
+        for booking in self.reservas.get_overlapping_bookings(hotel_id, tipo_id, arrival, departure):
+            self._add_booking(index, booking)
+        return index.available(hotel_id, tipo_id, arrival, departure, exclude)
+
+    def invalidate(self):
+        """Fuerza la recarga completa en la próxima consulta"""
+        with self._state_lock:
+            self._stale = True
+
+    def _reserva_changed(self, reserva_id):
+        with self._state_lock:
+            if reserva_id is None:
+                self._stale = True
+            else:
+                self._pending.add(int(reserva_id))
+
+    def _habitacion_changed(self, habitacion_id):
+        with self._state_lock:
+            self._inventory_stale = True
+
+    def _get_index(self):
+        """
+        Obtiene el índice aplicando antes las escrituras pendientes
+
+        Returns:
+            OccupancyIndex: Ocupación desde hoy
+        """
+        with self._load_lock:
+            token = self._server_token()
+            with self._state_lock:
+                index = self._index
+                reload = (index is None or self._stale or index.origin != self._today()
+                          or token != self._token)
+                reload_inventory = self._inventory_stale and not reload
+                pending = set() if reload else self._pending
+                self._pending = set()
+                self._stale = False
+                self._inventory_stale = False
+
+            if reload:
+                index = self._load()
+                self._index = index
+                # Marca tomada antes de leer: lo escrito durante la carga se recarga después
+                self._token = token
+                return index
+
+            if reload_inventory:
+                index.replace_inventory(self.habitaciones.count_inventory())
+            if pending:
+                bookings = self.reservas.get_bookings(sorted(pending))
+                for reserva_id in pending:
+                    index.remove(reserva_id)
+                    booking = bookings.get(reserva_id)
+                    if booking is not None:
+                        self._add_booking(index, booking)
+            return index
+
+    def _server_token(self):
+        """
+        Marca de cambios de reservas en el servidor (sin el contador local,
+        que ya cubren las escrituras pendientes)
+
+        Returns:
+            tuple: Marca comparable, o la de la última carga si no se pudo leer
+        """
+        try:
+            return self.reservas.get_change_token()[1:]
+        except DatabaseOperationError as e:
+            logger.warning("No se pudo comprobar si reservas cambió: %s", e)
+            return self._token
+
+    def _load(self):
+        """Construye el índice desde cero con el inventario y las reservas vigentes"""
+        index = OccupancyIndex(self._today(), self.horizon_days)
+        index.replace_inventory(self.habitaciones.count_inventory())
+        unassigned = 0
+        for booking in self.reservas.iter_bookings(index.origin):
+            if not self._add_booking(index, booking):
+                unassigned += 1
+        self.unassigned = unassigned
+        if unassigned:
+            logger.warning("%d reservas vigentes sin hotel no cuentan en la disponibilidad",
+                           unassigned)
+        return index
+
+    @staticmethod
+    def _add_booking(index, booking):
+        """
+        Añade una ocupación de Reservas.iter_bookings() al índice
+
+        Returns:
+            bool: False si la reserva no tiene hotel o tipo y queda fuera
+        """
+        reserva_id, hotel_id, tipo_id, arrival, departure, rooms = booking
+        if hotel_id is None or tipo_id is None:
+            return False
+        try:
+            index.add(reserva_id, hotel_id, tipo_id, arrival, departure, rooms)
+        except ValueError:
+            logger.warning("Reserva %s con fechas no válidas: %s - %s",
+                           reserva_id, arrival, departure)
+        return True
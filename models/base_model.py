@@ -1,8 +1,18 @@
 """
 Clase base para todos los modelos de la aplicación Northwind
 """
+import threading
 from abc import ABC, abstractmethod
-from utils.exceptions import EntityNotFoundError, DatabaseOperationError
+from contextlib import nullcontext
+from models.entity_cache import EntityCache, MISSING
+from models.records import record_type_for
+from utils.search_index import SearchIndex
+from utils.exceptions import EntityNotFoundError, DatabaseOperationError, ValidationError
+from utils.logger import get_logger
+
+logger = get_logger('models')
+
+ER_NO_SUCH_TABLE = 1146  # Código de MySQL para una tabla que no existe
 
 
 class BaseModel(ABC):
@@ -18,6 +28,20 @@ class BaseModel(ABC):
         self.db = db_connection
         self.table_name = None  # Debe ser definido por cada modelo hijo
         self.entity_name = None  # Nombre legible de la entidad
+        self.primary_key = None  # Columna única y creciente usada para paginar
+        self.sortable_columns = ()  # Columnas NOT NULL admitidas en get_page(order_by=...)
+        self.entity_cache = None  # EntityCache de get_by_id; se activa con enable_cache()
+        self._local_version = 0  # Escrituras hechas por este modelo (ver get_change_token)
+        self._version_table = None  # None: sin comprobar si existe table_versions
+        self.search_fields = ()  # Columnas de texto indexadas por search()
+        self._search_index = None  # SearchIndex, construido en la primera búsqueda
+        self._search_pending = set()  # IDs escritos desde la última búsqueda
+        self._search_stale = False  # True si hay que reconstruir el índice entero
+        self._search_lock = threading.Lock()  # Protege los campos _search_*
+        self._search_build_lock = threading.Lock()  # Una sola construcción a la vez
+        self._search_building = False
+        self._search_token = None  # Parte de servidor de get_change_token() al construir el índice
+        self._change_listeners = []  # Funciones avisadas en cada escritura (ver add_change_listener)
 
     def call_procedure(self, procedure_name, parameters=None):
         """
@@ -108,18 +132,329 @@ class BaseModel(ABC):
         """
         pass
 
-    def search(self, search_term):
+    def iter_all(self, batch_size=500):
+        """
+        Recorre todas las entidades en lotes, sin materializar la tabla completa
+
+        Implementación base basada en get_all(); los modelos con tablas grandes
+        la sobrescriben para leer de forma incremental.
+
+        Args:
+            batch_size (int): Tamaño de lote sugerido
+
+        Yields:
+            dict: Datos de cada entidad
+        """
+        for entity in self.get_all():
+            yield entity
+
+    def get_page(self, after_id=None, limit=100, order_by=None):
+        """
+        Obtiene una página de entidades con paginación por clave (keyset)
+
+        En lugar de OFFSET se filtra por la última clave vista, así que cada
+        página cuesta lo mismo sin importar lo avanzada que esté:
+
+            page = model.get_page(limit=200)
+            while page['has_more']:
+                page = model.get_page(after_id=page['next_after'], limit=200)
+
+        Args:
+            after_id: Valor de next_after de la página anterior (None para la
+                primera). Si se ordena por otra columna es la tupla (valor, id)
+            limit (int): Máximo de entidades por página
+            order_by (str): Columna de sortable_columns; por defecto primary_key
+
+        Returns:
+            dict: items (lista de entidades), next_after (clave para pedir la
+                siguiente página o None) y has_more (bool)
+
+        Raises:
+            DatabaseOperationError: Si el modelo no define primary_key o falla la consulta
+        """
+        if not self.primary_key:
+            raise DatabaseOperationError(f"{self.entity_name} no admite paginación")
+        if limit < 1:
+            raise ValueError("limit debe ser al menos 1")
+
+        pk = self.primary_key
+        if order_by and order_by != pk:
+            if order_by not in self.sortable_columns:
+                raise ValueError(f"No se puede ordenar {self.entity_name} por {order_by}")
+            key_columns = f"{order_by}, {pk}"
+            if after_id is None:
+                where, params = "", ()
+            else:
+                last_value, last_id = after_id
+                where = f"WHERE {order_by} > %s OR ({order_by} = %s AND {pk} > %s)"
+                params = (last_value, last_value, last_id)
+        else:
+            key_columns = pk
+            if after_id is None:
+                where, params = "", ()
+            else:
+                where, params = f"WHERE {pk} > %s", (after_id,)
+
+        key_count = len(key_columns.split(','))
+        query = (
+            f"SELECT {key_columns}, {self.table_name}.* FROM {self.table_name} "
+            f"{where + ' ' if where else ''}ORDER BY {key_columns} LIMIT %s"
+        )
+        # Se pide una fila de más para saber si hay otra página sin contar
+        rows = self.db.execute_prepared(query, params + (limit + 1,))
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        next_after = None
+        if has_more:
+            last_row = rows[-1]
+            next_after = last_row[0] if key_count == 1 else tuple(last_row[:key_count])
+
+        return {
+            'items': [self._map_row(row[key_count:]) for row in rows],
+            'next_after': next_after,
+            'has_more': has_more
+        }
+
+    def estimate_count(self):
+        """
+        Estima el número de entidades sin recorrer la tabla
+
+        Usa las estadísticas de information_schema (aproximadas en InnoDB) y
+        recurre a COUNT(*) si no están disponibles.
+
+        Returns:
+            int: Número aproximado de entidades
+        """
+        try:
+            results = self.db.execute_prepared(
+                "SELECT TABLE_ROWS FROM information_schema.TABLES "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s",
+                (self.table_name,)
+            )
+            if results and results[0][0] is not None:
+                return int(results[0][0])
+        except DatabaseOperationError:
+            pass
+        return self.get_count()
+
+    def get_change_token(self):
+        """
+        Obtiene una marca barata que cambia cuando cambian los datos de la tabla
+
+        Combina el contador local de escrituras del modelo con un dato del
+        servidor: la versión que mantienen los triggers de table_versions (ver
+        hoteel.sql) o, si esa tabla no existe o no tiene fila para esta tabla
+        (solo VERSIONED_TABLES tienen triggers), COUNT(*) y MAX(clave primaria).
+        Sin triggers, las ediciones hechas desde otra aplicación que no cambian
+        el número de filas ni el máximo ID no se detectan. Solo el error de
+        tabla inexistente hace que no se vuelva a consultar table_versions;
+        cualquier otro fallo (p. ej. una conexión perdida) se propaga.
+
+        Returns:
+            tuple: Marca comparable con ==
+
+        Raises:
+            DatabaseOperationError: Si falla la consulta por otro motivo
+        """
+        if self._version_table is not False:
+            try:
+                results = self.db.execute_prepared(
+                    "SELECT version FROM table_versions WHERE table_name = %s",
+                    (self.table_name,)
+                )
+                self._version_table = True
+                if results:
+                    return (self._local_version, 'version', results[0][0])
+            except DatabaseOperationError as e:
+                if e.errno != ER_NO_SUCH_TABLE:
+                    raise
+                self._version_table = False
+
+        max_column = f"MAX({self.primary_key})" if self.primary_key else "NULL"
+        results = self.db.execute_prepared(
+            f"SELECT COUNT(*), {max_column} FROM {self.table_name}", ()
+        )
+        count, max_id = results[0] if results else (0, None)
+        return (self._local_version, 'aggregate', count, max_id)
+
+    def _bump_version(self):
+        """Marca la tabla como modificada por este modelo"""
+        self._local_version += 1
+
+    def _map_row(self, row):
+        """
+        Convierte una fila de la tabla (SELECT *) en el registro de la entidad
+
+        Por defecto usa field_mapping; los modelos con su propio mapeo lo sobrescriben.
+
+        Args:
+            row (tuple): Fila de la tabla
+
+        Returns:
+            Record: Datos de la entidad (models.records)
+        """
+        return self._format_entity_data(row, getattr(self, 'field_mapping', []))
+
+    def search(self, search_term, limit=200):
         """
         Busca entidades por término de búsqueda
 
+        Usa un índice invertido en memoria (utils.search_index) sobre
+        search_fields: cada palabra del término debe aparecer, completa, como
+        prefijo o dentro de alguna palabra de la entidad, sin distinguir
+        mayúsculas ni tildes. El índice se construye en la primera búsqueda y
+        las escrituras del modelo lo mantienen al día; antes de cada búsqueda
+        se compara get_change_token() con el de la construcción y, si la tabla
+        cambió desde otro puesto, el índice se reconstruye. Los modelos sin
+        search_fields devuelven una lista vacía.
+
         Args:
             search_term (str): Término a buscar
+            limit (int): Máximo de resultados
+
+        Returns:
+            list: Lista de entidades que coinciden, de mejor a peor coincidencia
+        """
+        if not self.search_fields or not search_term or not str(search_term).strip():
+            return []
+        entity_ids = self._get_search_index().search(search_term, limit)
+        return self.get_many(entity_ids)
+
+    def search_matches(self, entity_ids, search_term, previous_term):
+        """
+        Filtra los resultados de una búsqueda anterior con las reglas de search()
+
+        Usa el índice en memoria tal como está, sin consultar la base de datos
+        ni comprobar get_change_token(). No puede decidir si el índice no está
+        construido, tiene escrituras sin aplicar o search_term puede encontrar
+        entidades que previous_term no encontraba (ver SearchIndex.narrows).
+
+        Args:
+            entity_ids (iterable): IDs devueltos por search(previous_term)
+            search_term (str): Término nuevo
+            previous_term (str): Término de la búsqueda anterior
+
+        Returns:
+            list: IDs que cumplen search_term, en el mismo orden, o None si hay
+                que llamar a search()
+        """
+        with self._search_lock:
+            index = self._search_index
+            if index is None or self._search_stale or self._search_pending or self._search_building:
+                return None
+        if not index.narrows(previous_term, search_term):
+            return None
+        return [entity_id for entity_id in entity_ids if index.matches(entity_id, search_term)]
+
+    def get_many(self, entity_ids):
+        """
+        Obtiene varias entidades por ID en una sola consulta
+
+        Args:
+            entity_ids (list): IDs buscados
+
+        Returns:
+            list: Entidades encontradas, en el mismo orden que entity_ids
+        """
+        if not entity_ids:
+            return []
+        placeholders = ', '.join(['%s'] * len(entity_ids))
+        # Consulta de texto: la lista IN cambia de tamaño y no conviene prepararla
+        rows = self.db.execute_query(
+            f"SELECT {self.primary_key}, {self.table_name}.* FROM {self.table_name} "
+            f"WHERE {self.primary_key} IN ({placeholders})",
+            tuple(entity_ids)
+        )
+        by_id = {row[0]: self._map_row(row[1:]) for row in rows or []}
+        return [by_id[entity_id] for entity_id in entity_ids if entity_id in by_id]
+
+    def _get_search_index(self):
+        """
+        Obtiene el índice de búsqueda aplicando antes las escrituras pendientes
+
+        Returns:
+            SearchIndex: Índice de search_fields por clave primaria
+        """
+        with self._search_build_lock:
+            token = self._search_server_token()
+            with self._search_lock:
+                if self._search_index is not None and token != self._search_token:
+                    logger.debug("%s cambió en el servidor: se reconstruye el índice de búsqueda",
+                                 self.table_name)
+                    self._search_stale = True
+                rebuild = self._search_index is None or self._search_stale
+                if rebuild:
+                    # Lo escrito durante la construcción queda en _search_pending
+                    self._search_stale = False
+                    self._search_pending.clear()
+                    self._search_building = True
+
+            if rebuild:
+                try:
+                    columns = ', '.join(self.search_fields)
+                    rows = self.db.iter_query(
+                        f"SELECT {self.primary_key}, {columns} FROM {self.table_name}",
+                        batch_size=5000
+                    )
+                    index = SearchIndex()
+                    index.bulk_load((row[0], row[1:]) for row in rows)
+                    self._search_index = index
+                    # Marca tomada antes de leer: un cambio durante la carga provoca
+                    # otra reconstrucción en la siguiente búsqueda
+                    self._search_token = token
+                except Exception:
+                    with self._search_lock:
+                        self._search_stale = self._search_index is not None
+                    raise
+                finally:
+                    with self._search_lock:
+                        self._search_building = False
+
+            with self._search_lock:
+                pending = list(self._search_pending)
+                self._search_pending.clear()
+            if pending:
+                try:
+                    self._reindex(pending)
+                except Exception:
+                    with self._search_lock:
+                        self._search_pending.update(pending)
+                    raise
+            return self._search_index
+
+    def _search_server_token(self):
+        """
+        Parte de servidor de get_change_token() (sin el contador local, que ya
+        cubren las escrituras pendientes)
 
         Returns:
-            list: Lista de entidades que coinciden
+            tuple: Marca comparable, o el último valor conocido si no se pudo leer
         """
-        # Implementación base, puede ser sobrescrita por modelos específicos
-        return []
+        try:
+            return self.get_change_token()[1:]
+        except DatabaseOperationError as e:
+            logger.warning("No se pudo comprobar si %s cambió: %s", self.table_name, e)
+            return self._search_token
+
+    def _reindex(self, entity_ids, chunk_size=500):
+        """Vuelve a leer e indexar entidades escritas; las que ya no existen se quitan"""
+        columns = ', '.join(self.search_fields)
+        for start in range(0, len(entity_ids), chunk_size):
+            chunk = entity_ids[start:start + chunk_size]
+            placeholders = ', '.join(['%s'] * len(chunk))
+            rows = self.db.execute_query(
+                f"SELECT {self.primary_key}, {columns} FROM {self.table_name} "
+                f"WHERE {self.primary_key} IN ({placeholders})",
+                tuple(chunk)
+            )
+            found = set()
+            for row in rows or []:
+                found.add(row[0])
+                self._search_index.add(row[0], row[1:])
+            for entity_id in chunk:
+                if entity_id not in found:
+                    self._search_index.remove(entity_id)
 
     def exists(self, entity_id):
         """
@@ -175,19 +510,234 @@ class BaseModel(ABC):
 
     def _format_entity_data(self, raw_data, field_mapping):
         """
-        Formatea los datos crudos de la base de datos a un diccionario
+        Formatea los datos crudos de la base de datos a un registro
 
         Args:
             raw_data (tuple): Datos crudos de la consulta
             field_mapping (list): Lista de nombres de campos
 
         Returns:
-            dict: Datos formateados
+            Record: Registro de solo lectura con acceso de diccionario
+                (dict vacío si no hay datos)
         """
         if not raw_data:
             return {}
 
-        return {field: value for field, value in zip(field_mapping, raw_data)}
+        return record_type_for(tuple(field_mapping)).from_row(raw_data)
+
+    def transaction(self):
+        """
+        Abre una unidad de trabajo en la conexión del modelo
+
+        Returns:
+            Context manager de DatabaseConnection.transaction(), o uno vacío si
+            la conexión no admite transacciones explícitas
+        """
+        if hasattr(self.db, 'transaction'):
+            return self.db.transaction()
+        return nullcontext()
+
+    def enable_cache(self, max_size=1000, ttl_seconds=60.0):
+        """
+        Activa la caché de entidades por ID para get_by_id
+
+        Las escrituras del propio modelo (create/update/delete y cargas en lote)
+        invalidan las entradas afectadas; ttl_seconds limita cuánto puede durar
+        un dato cambiado desde fuera de la aplicación.
+
+        Args:
+            max_size (int): Máximo de entidades en caché
+            ttl_seconds (float): Vigencia de cada entidad en segundos
+        """
+        self.entity_cache = EntityCache(max_size=max_size, ttl_seconds=ttl_seconds)
+
+    def disable_cache(self):
+        """Desactiva la caché de entidades y descarta su contenido"""
+        self.entity_cache = None
+
+    def get_cache_stats(self):
+        """
+        Obtiene los contadores de la caché de entidades
+
+        Returns:
+            dict: Ver EntityCache.stats(), o None si la caché no está activa
+        """
+        return self.entity_cache.stats() if self.entity_cache is not None else None
+
+    def _cache_lookup(self, entity_id):
+        """
+        Busca una entidad en la caché
+
+        Returns:
+            dict: Copia de la entidad, o MISSING si no hay caché o no está
+        """
+        if self.entity_cache is None:
+            return MISSING
+        return self.entity_cache.get(entity_id)
+
+    def _cache_store(self, entity_id, entity_data):
+        """
+        Guarda una entidad recién leída
+
+        Dentro de una transacción no se guarda: la lectura puede incluir cambios
+        que aún pueden deshacerse.
+        """
+        if self.entity_cache is None or not entity_data:
+            return
+        if hasattr(self.db, 'in_transaction') and self.db.in_transaction():
+            return
+        self.entity_cache.put(entity_id, entity_data)
+
+    def _entity_changed(self, entity_id=None):
+        """
+        Registra una escritura: cambia la marca de versión, invalida la caché,
+        marca la entidad para reindexarla en la próxima búsqueda y avisa a las
+        funciones registradas con add_change_listener()
+
+        Args:
+            entity_id: ID modificado, o None si pudo cambiar cualquier entidad
+        """
+        self._bump_version()
+
+        if self._search_index is not None or self._search_building:
+            with self._search_lock:
+                if entity_id is None:
+                    self._search_stale = True
+                else:
+                    self._search_pending.add(self._search_key(entity_id))
+
+        if self.entity_cache is not None:
+            if entity_id is None:
+                self.entity_cache.clear()
+            else:
+                self.entity_cache.invalidate(entity_id)
+
+        for listener in tuple(self._change_listeners):
+            try:
+                listener(entity_id)
+            except Exception as e:
+                logger.error("Error avisando un cambio de %s: %s", self.entity_name, e)
+
+    def add_change_listener(self, listener):
+        """
+        Registra una función que se llama tras cada escritura del modelo
+
+        Se llama en el hilo que escribe, con el ID modificado (o None si pudo
+        cambiar cualquier entidad); debe ser rápida y no consultar la base de
+        datos, solo anotar qué hay que actualizar.
+
+        Args:
+            listener (callable): Función listener(entity_id)
+        """
+        if listener not in self._change_listeners:
+            self._change_listeners.append(listener)
+
+    def remove_change_listener(self, listener):
+        """Deja de avisar a una función registrada con add_change_listener()"""
+        if listener in self._change_listeners:
+            self._change_listeners.remove(listener)
+
+    @staticmethod
+    def _search_key(entity_id):
+        """Los IDs del formulario llegan como texto; el índice usa los de la base de datos"""
+        if isinstance(entity_id, str) and entity_id.strip().isdigit():
+            return int(entity_id)
+        return entity_id
+
+    def _bulk_insert(self, query, records, build_params, chunk_size=500, key_field=None,
+                     atomic=False):
+        """
+        Inserta registros en bloques con executemany (INSERT multi-fila)
+
+        Cada registro se valida con build_params; los que fallan se anotan en
+        errors en lugar de abortar la carga. Cada bloque se confirma en su
+        propia transacción, y si el servidor rechaza un bloque todas sus filas
+        quedan marcadas con el error. Con atomic=True toda la carga va en una
+        sola transacción y cualquier error (de validación o del servidor) la
+        deshace por completo.
+
+        Args:
+            query (str): INSERT con marcadores %s para una fila
+            records (list): Registros a insertar
+            build_params (callable): Convierte un registro en la tupla de parámetros
+            chunk_size (int): Filas por bloque
+            key_field (str): Campo con el ID explícito (modo upsert). Si es None
+                los IDs se toman del AUTO_INCREMENT
+            atomic (bool): Todo o nada en una única transacción
+
+        Returns:
+            tuple: (ids, errors) con ids alineados con records y errors {índice: mensaje}
+
+        Raises:
+            ValidationError: Con atomic=True, si algún registro no es válido
+            DatabaseOperationError: Con atomic=True, si el servidor rechaza un bloque
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size debe ser al menos 1")
+
+        ids = [None] * len(records)
+        errors = {}
+        valid_rows = []
+
+        for index, record in enumerate(records):
+            try:
+                params = build_params(record)
+                if key_field is not None:
+                    key_value = self._clean_field(record, key_field)
+                    if not key_value:
+                        raise ValueError(f"Debe indicar {key_field}")
+                    params = (int(key_value),) + params
+                valid_rows.append((index, params))
+            except (ValueError, TypeError, AttributeError) as e:
+                errors[index] = str(e)
+
+        if atomic and errors:
+            index, message = next(iter(errors.items()))
+            raise ValidationError(f"registro {index}", message)
+
+        with self.transaction() if atomic else nullcontext():
+            for start in range(0, len(valid_rows), chunk_size):
+                chunk = valid_rows[start:start + chunk_size]
+                try:
+                    _, first_id = self.db.execute_many(query, [params for _, params in chunk])
+                except DatabaseOperationError as e:
+                    if atomic:
+                        raise
+                    for index, _ in chunk:
+                        errors[index] = str(e)
+                    continue
+
+                for offset, (index, params) in enumerate(chunk):
+                    if key_field is not None:
+                        ids[index] = params[0]
+                    elif first_id:
+                        # InnoDB asigna IDs consecutivos a un INSERT multi-fila
+                        ids[index] = first_id + offset
+
+        written = [entity_id for entity_id in ids if entity_id is not None]
+        if len(written) < len(records) - len(errors):
+            # Sin los IDs generados no se sabe qué entidades cambiaron
+            self._entity_changed()
+        else:
+            for entity_id in written:
+                self._entity_changed(entity_id)
+
+        return ids, errors
+
+    @staticmethod
+    def _clean_field(data, key):
+        """
+        Obtiene un campo de un registro como texto sin espacios
+
+        Args:
+            data (dict): Registro de origen
+            key (str): Nombre del campo
+
+        Returns:
+            str: Valor limpio o cadena vacía si no existe
+        """
+        value = data.get(key)
+        return str(value).strip() if value is not None else ''
 
     def _prepare_insert_data(self, data_dict):
         """
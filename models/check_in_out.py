@@ -0,0 +1,285 @@
+from functools import lru_cache
+from models.base_model import BaseModel
+from models.entity_cache import MISSING
+from models.records import record_type
+from utils.exceptions import EntityNotFoundError, DatabaseOperationError
+from utils.logger import get_logger
+from utils.validators import Validator
+
+logger = get_logger('models')
+
+CHECK_FIELDS = (
+    'ID_CHECK', 'ID_RESERVA', 'ID_HABITACION', 'FECHA_LLEGADA', 'HORA_LLEGADA', 'FECHA_SALIDA',
+    'HORA_SALIDA', 'ID_EMPLEADO', 'FORMA_PAGO', 'DEPOSITO_GARANTIA', 'OBSERVACIONES',
+    'ID_CLIENTE'
+)
+CheckInOutRecord = record_type('CheckInOutRecord', CHECK_FIELDS)
+
+_HORA_LLEGADA = CHECK_FIELDS.index('HORA_LLEGADA')
+_HORA_SALIDA = CHECK_FIELDS.index('HORA_SALIDA')
+
+# Formato en que se guardan las horas (las columnas son VARCHAR)
+HORA_FORMAT = '%H:%M'
+
+
+@lru_cache(maxsize=1024)
+def parse_hora(value):
+    """
+    Convierte el texto libre de hora_llegada/hora_salida ('10:00am', '18:30') a time
+
+    Los valores se repiten mucho, así que cada texto distinto se interpreta
+    una sola vez.
+
+    Returns:
+        time: Hora, o None si está vacía o no se puede interpretar
+    """
+    try:
+        return Validator.validate_time(value, "Hora")
+    except ValueError:
+        logger.warning("Hora no reconocida en check_in_out: %r", value)
+        return None
+
+
+class CheckInOut(BaseModel):
+    """Modelo para gestionar las estancias (check-in y check-out)"""
+
+    def __init__(self, db_connection):
+        super().__init__(db_connection)
+        self.table_name = "check_in_out"
+        self.entity_name = "Estancia"
+        self.primary_key = "id_check"
+        self.sortable_columns = ('fecha_llegada', 'fecha_salida')
+
+    def get_by_id(self, check_id):
+        """Obtiene una estancia por su ID"""
+        cached = self._cache_lookup(check_id)
+        if cached is not MISSING:
+            return cached
+
+        try:
+            query = "SELECT * FROM check_in_out WHERE id_check = %s"
+            results = self.db.execute_prepared(query, (check_id,))
+
+            if not results:
+                raise EntityNotFoundError(self.entity_name, check_id)
+
+            entity = self._map_check_data(results[0])
+            self._cache_store(check_id, entity)
+            return entity
+
+        except Exception:
+            raise EntityNotFoundError(self.entity_name, check_id)
+
+    def get_all(self):
+        """Obtiene todas las estancias"""
+        try:
+            query = "SELECT * FROM check_in_out ORDER BY id_check"
+            results = self.db.execute_query(query)
+            return [self._map_check_data(row) for row in results] if results else []
+
+        except Exception as e:
+            logger.error("Error obteniendo estancias: %s", e)
+            return []
+
+    def iter_all(self, batch_size=500):
+        """Recorre todas las estancias en lotes con un cursor no bufferizado"""
+        query = "SELECT * FROM check_in_out ORDER BY id_check"
+        for row in self.db.iter_query(query, batch_size=batch_size):
+            yield self._map_check_data(row)
+
+    def iter_current(self, since, batch_size=1000):
+        """
+        Recorre las estancias que siguen abiertas o terminan a partir de una fecha
+
+        Args:
+            since (date): Se omiten las estancias con fecha_salida anterior
+            batch_size (int): Filas pedidas al servidor en cada lote
+
+        Yields:
+            CheckInOutRecord: Estancias con fecha_salida >= since o sin salida
+        """
+        query = """
+            SELECT * FROM check_in_out WHERE fecha_salida >= %s
+            UNION ALL
+            SELECT * FROM check_in_out WHERE fecha_salida IS NULL
+        """
+        for row in self.db.iter_query(query, (since,), batch_size=batch_size):
+            yield self._map_check_data(row)
+
+    def get_arrivals(self, day):
+        """Estancias que llegan un día (consulta directa, ver models.front_desk)"""
+        query = "SELECT * FROM check_in_out WHERE fecha_llegada = %s ORDER BY id_check"
+        return [self._map_check_data(row) for row in self.db.execute_prepared(query, (day,)) or []]
+
+    def get_departures(self, day):
+        """Estancias que salen un día (consulta directa, ver models.front_desk)"""
+        query = "SELECT * FROM check_in_out WHERE fecha_salida = %s ORDER BY id_check"
+        return [self._map_check_data(row) for row in self.db.execute_prepared(query, (day,)) or []]
+
+    def get_in_house(self, day):
+        """
+        Estancias que ocupan habitación la noche de un día (consulta directa)
+
+        Returns:
+            list: Estancias con llegada <= day y salida posterior o sin salida
+        """
+        query = """
+            SELECT * FROM check_in_out
+            WHERE fecha_llegada <= %s AND (fecha_salida > %s OR fecha_salida IS NULL)
+            ORDER BY id_check
+        """
+        return [self._map_check_data(row)
+                for row in self.db.execute_prepared(query, (day, day)) or []]
+
+    INSERT_COLUMNS = (
+        "id_reserva, id_habitacion, fecha_llegada, hora_llegada, fecha_salida, hora_salida, "
+        "id_empleado, forma_pago, deposito_garantia, observaciones, id_cliente"
+    )
+
+    def create(self, form_data):
+        """Registra una estancia (check-in)"""
+        try:
+            params = self._build_check_params(form_data)
+
+            query = f"""
+                INSERT INTO check_in_out
+                ({self.INSERT_COLUMNS})
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            """
+
+            new_id = self.db.execute_insert(query, params)
+            self._entity_changed(new_id)
+
+            return new_id
+
+        except ValueError:
+            raise
+        except Exception as e:
+            raise DatabaseOperationError(f"Error creando estancia: {str(e)}")
+
+    def update(self, check_id, form_data):
+        """Actualiza una estancia existente"""
+        try:
+            params = self._build_check_params(form_data) + (check_id,)
+
+            query = """
+                UPDATE check_in_out
+                SET id_reserva = %s, id_habitacion = %s, fecha_llegada = %s, hora_llegada = %s,
+                    fecha_salida = %s, hora_salida = %s, id_empleado = %s, forma_pago = %s,
+                    deposito_garantia = %s, observaciones = %s, id_cliente = %s
+                WHERE id_check = %s
+            """
+
+            rows_affected = self.db.execute_prepared(query, params)
+            self._entity_changed(check_id)
+
+            if rows_affected == 0:
+                raise EntityNotFoundError(self.entity_name, check_id)
+
+            return True
+
+        except (EntityNotFoundError, ValueError):
+            raise
+        except Exception as e:
+            raise DatabaseOperationError(f"Error actualizando estancia: {str(e)}")
+
+    def check_out(self, check_id, fecha_salida, hora_salida=None):
+        """
+        Registra la salida de una estancia
+
+        Args:
+            check_id (int): ID de la estancia
+            fecha_salida (date): Fecha de salida
+            hora_salida (time): Hora de salida (None: sin hora)
+
+        Returns:
+            bool: True si se registró
+
+        Raises:
+            EntityNotFoundError: Si la estancia no existe
+        """
+        try:
+            query = "UPDATE check_in_out SET fecha_salida = %s, hora_salida = %s WHERE id_check = %s"
+            hora = hora_salida.strftime(HORA_FORMAT) if hora_salida is not None else None
+            rows_affected = self.db.execute_prepared(query, (fecha_salida, hora, check_id))
+            self._entity_changed(check_id)
+
+            if rows_affected == 0:
+                raise EntityNotFoundError(self.entity_name, check_id)
+
+            return True
+
+        except EntityNotFoundError:
+            raise
+        except Exception as e:
+            raise DatabaseOperationError(f"Error registrando salida: {str(e)}")
+
+    def delete(self, check_id):
+        """Elimina una estancia"""
+        try:
+            query = "DELETE FROM check_in_out WHERE id_check = %s"
+            rows_affected = self.db.execute_prepared(query, (check_id,))
+            self._entity_changed(check_id)
+
+            if rows_affected == 0:
+                raise EntityNotFoundError(self.entity_name, check_id)
+
+            return True
+
+        except EntityNotFoundError:
+            raise
+        except Exception as e:
+            raise DatabaseOperationError(f"Error eliminando estancia: {str(e)}")
+
+    def _build_check_params(self, form_data):
+        """
+        Valida los datos de un formulario de estancia y los convierte en parámetros SQL
+
+        Args:
+            form_data (dict): Datos de la estancia con claves en mayúsculas
+
+        Returns:
+            tuple: Parámetros en el orden de INSERT_COLUMNS; las horas se guardan
+                como HH:MM
+
+        Raises:
+            ValueError: Si falta un campo obligatorio o un valor no es válido
+        """
+        llegada = Validator.validate_date(form_data.get('FECHA_LLEGADA'), "Fecha de llegada",
+                                          allow_empty=False)
+        salida = Validator.validate_date(form_data.get('FECHA_SALIDA'), "Fecha de salida")
+        if salida is not None and salida < llegada:
+            raise ValueError("La fecha de salida no puede ser anterior a la de llegada")
+        hora_llegada = Validator.validate_time(form_data.get('HORA_LLEGADA'), "Hora de llegada")
+        hora_salida = Validator.validate_time(form_data.get('HORA_SALIDA'), "Hora de salida")
+
+        return (
+            Validator.validate_integer(form_data.get('ID_RESERVA'), "Reserva"),
+            Validator.validate_integer(form_data.get('ID_HABITACION'), "Habitación",
+                                       allow_empty=False),
+            llegada,
+            hora_llegada.strftime(HORA_FORMAT) if hora_llegada is not None else None,
+            salida,
+            hora_salida.strftime(HORA_FORMAT) if hora_salida is not None else None,
+            Validator.validate_integer(form_data.get('ID_EMPLEADO'), "Empleado"),
+            self._clean_field(form_data, 'FORMA_PAGO'),
+            self._clean_field(form_data, 'DEPOSITO_GARANTIA'),
+            self._clean_field(form_data, 'OBSERVACIONES'),
+            Validator.validate_integer(form_data.get('ID_CLIENTE'), "Cliente", allow_empty=False)
+        )
+
+    def _map_row(self, row):
+        """Mapea una fila de get_page() igual que get_all()"""
+        return self._map_check_data(row)
+
+    def _map_check_data(self, row):
+        """Mapea una fila a un CheckInOutRecord con las horas ya convertidas a time"""
+        try:
+            values = list(row[:len(CHECK_FIELDS)])
+            for position in (_HORA_LLEGADA, _HORA_SALIDA):
+                if position < len(values) and values[position] is not None:
+                    values[position] = parse_hora(values[position])
+            return CheckInOutRecord.from_row(values)
+        except Exception as e:
+            logger.error("Error en mapeo de datos: %s", e)
+            return {}
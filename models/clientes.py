@@ -1,5 +1,17 @@
 from models.base_model import BaseModel
+from models.entity_cache import MISSING
+from models.records import record_type
 from utils.exceptions import EntityNotFoundError, DatabaseOperationError
+from utils.logger import get_logger
+
+logger = get_logger('models')
+
+CLIENTE_FIELDS = (
+    'ID_CLIENTE', 'NOMBRE', 'APELLIDO', 'DOCUMENTO_IDENTIDAD', 'NACIONALIDAD',
+    'FECHA_NACIMIENTO', 'DIRECCION', 'TELEFONO', 'CORREO', 'PREFERENCIAS_ESPECIALES',
+    'NIVEL_PROGRAMA_FIDELIZACION'
+)
+ClienteRecord = record_type('ClienteRecord', CLIENTE_FIELDS)
 
 
 class Clientes(BaseModel):
@@ -9,146 +21,144 @@ class Clientes(BaseModel):
         super().__init__(db_connection)
         self.table_name = "clientes"
         self.entity_name = "Cliente"
+        self.primary_key = "id_cliente"
+        self.sortable_columns = ('nombre', 'apellido', 'documento_identidad')
+        self.search_fields = ('nombre', 'apellido', 'documento_identidad', 'correo', 'direccion')
 
     def get_by_id(self, cliente_id):
         """Obtiene un cliente por su ID"""
+        cached = self._cache_lookup(cliente_id)
+        if cached is not MISSING:
+            return cached
+
         try:
-            print(f"🔍 Buscando cliente ID: {cliente_id}")
+            logger.debug("Buscando cliente ID: %s", cliente_id)
             query = "SELECT * FROM clientes WHERE id_cliente = %s"
-            results = self.db.execute_query(query, (cliente_id,))
-
-            print(f"📊 Resultados de búsqueda: {results}")
+            results = self.db.execute_prepared(query, (cliente_id,))
 
             if not results:
-                print(f"❌ Cliente {cliente_id} no encontrado")
+                logger.error("Cliente %s no encontrado", cliente_id)
                 raise EntityNotFoundError(self.entity_name, cliente_id)
 
-            print(f"✅ Cliente {cliente_id} encontrado")
-            return self._map_cliente_data(results[0])
+            logger.debug("Cliente %s encontrado", cliente_id)
+            entity = self._map_cliente_data(results[0])
+            self._cache_store(cliente_id, entity)
+            return entity
 
         except Exception as e:
-            print(f"❌ Error en get_by_id: {e}")
+            logger.error("Error en get_by_id: %s", e)
             raise EntityNotFoundError(self.entity_name, cliente_id)
 
     def get_all(self):
         """Obtiene todos los clientes"""
         try:
-            print("🔍 Obteniendo todos los clientes")
+            logger.debug("Obteniendo todos los clientes")
             query = "SELECT * FROM clientes ORDER BY id_cliente"
             results = self.db.execute_query(query)
-            print(f"📊 Total de clientes encontrados: {len(results) if results else 0}")
             return [self._map_cliente_data(row) for row in results] if results else []
 
         except Exception as e:
-            print(f"❌ Error en get_all: {e}")
+            logger.error("Error en get_all: %s", e)
             return []
 
+    def iter_all(self, batch_size=500):
+        """Recorre todos los clientes en lotes con un cursor no bufferizado"""
+        query = "SELECT * FROM clientes ORDER BY id_cliente"
+        for row in self.db.iter_query(query, batch_size=batch_size):
+            yield self._map_cliente_data(row)
+
+    INSERT_COLUMNS = (
+        "nombre, apellido, documento_identidad, nacionalidad, fecha_nacimiento, "
+        "direccion, telefono, correo, preferencias_especiales, nivel_programa_fidelizacion"
+    )
+
     def create(self, form_data):
         """Crea un nuevo cliente"""
         try:
-            print("🆕 Creando nuevo cliente")
-            print(f"📝 Datos recibidos: {form_data}")
-
-            # Extraer y validar datos
-            nombre_val = form_data.get('NOMBRE', '').strip()
-            apellido_val = form_data.get('APELLIDO', '').strip()
-            documento_val = form_data.get('DOCUMENTO_IDENTIDAD', '').strip()
-            nacionalidad_val = form_data.get('NACIONALIDAD', '').strip()
-            fecha_nac_val = form_data.get('FECHA_NACIMIENTO', '').strip()
-            direccion_val = form_data.get('DIRECCION', '').strip()
-            telefono_val = form_data.get('TELEFONO', '').strip()
-            correo_val = form_data.get('CORREO', '').strip()
-            preferencias_val = form_data.get('PREFERENCIAS_ESPECIALES', '').strip()
-            nivel_fidel_val = form_data.get('NIVEL_PROGRAMA_FIDELIZACION', '').strip()
-
-            # Validaciones
-            if not nombre_val:
-                raise ValueError("Debe ingresar el nombre del cliente")
-            if not apellido_val:
-                raise ValueError("Debe ingresar el apellido del cliente")
-            if not documento_val:
-                raise ValueError("Debe ingresar el documento de identidad")
-
-            # Preparar parámetros
-            params = (
-                nombre_val,
-                apellido_val,
-                int(documento_val) if documento_val else None,
-                nacionalidad_val,
-                fecha_nac_val,
-                direccion_val,
-                int(telefono_val) if telefono_val else None,
-                correo_val,
-                preferencias_val,
-                nivel_fidel_val
-            )
-
-            print(f"📋 Parámetros para INSERT: {params}")
+            logger.debug("Creando nuevo cliente")
+
+            # Extraer, validar y preparar parámetros
+            params = self._build_cliente_params(form_data)
 
             # INSERT directo
-            query = """
+            query = f"""
                 INSERT INTO clientes 
-                (nombre, apellido, documento_identidad, nacionalidad, fecha_nacimiento,
-                 direccion, telefono, correo, preferencias_especiales, nivel_programa_fidelizacion)
+                ({self.INSERT_COLUMNS})
                 VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
             """
-            print(f"📝 Query: {query}")
-
-            rows_affected = self.db.execute_query(query, params)
-            print(f"✅ Filas insertadas: {rows_affected}")
 
-            # Obtener el ID insertado
-            result = self.db.execute_query("SELECT LAST_INSERT_ID()")
-            new_id = result[0][0] if result else None
-            print(f"✅ Nuevo ID insertado: {new_id}")
+            # El ID generado llega en la respuesta del propio INSERT
+            new_id = self.db.execute_insert(query, params)
+            self._entity_changed(new_id)
+            logger.debug("Nuevo ID insertado: %s", new_id)
 
             return new_id
 
         except Exception as e:
-            print(f"❌ Error en create: {e}")
+            logger.error("Error en create: %s", e)
             raise DatabaseOperationError(f"Error creando cliente: {str(e)}")
 
+    def create_many(self, records, chunk_size=500, atomic=False):
+        """
+        Crea clientes en lote con INSERT multi-fila, una transacción por bloque
+
+        Args:
+            records (list): Diccionarios con el mismo formato que create()
+            chunk_size (int): Filas por INSERT/transacción
+            atomic (bool): Si es True toda la carga se confirma o se deshace junta
+
+        Returns:
+            tuple: (ids, errors) donde ids es la lista de IDs generados en el mismo
+                orden que records (None si la fila falló) y errors es un dict
+                {índice: mensaje}
+        """
+        query = f"""
+            INSERT INTO clientes 
+            ({self.INSERT_COLUMNS})
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+        """
+        return self._bulk_insert(
+            query, records, self._build_cliente_params, chunk_size, atomic=atomic
+        )
+
+    def upsert_many(self, records, chunk_size=500, atomic=False):
+        """
+        Inserta o actualiza clientes en lote según ID_CLIENTE
+
+        Args:
+            records (list): Diccionarios con ID_CLIENTE y los campos de create()
+            chunk_size (int): Filas por INSERT/transacción
+            atomic (bool): Si es True toda la carga se confirma o se deshace junta
+
+        Returns:
+            tuple: (ids, errors) con el mismo formato que create_many()
+        """
+        query = f"""
+            INSERT INTO clientes 
+            (id_cliente, {self.INSERT_COLUMNS})
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            ON DUPLICATE KEY UPDATE
+                nombre = VALUES(nombre), apellido = VALUES(apellido),
+                documento_identidad = VALUES(documento_identidad),
+                nacionalidad = VALUES(nacionalidad), fecha_nacimiento = VALUES(fecha_nacimiento),
+                direccion = VALUES(direccion), telefono = VALUES(telefono),
+                correo = VALUES(correo), preferencias_especiales = VALUES(preferencias_especiales),
+                nivel_programa_fidelizacion = VALUES(nivel_programa_fidelizacion)
+        """
+        return self._bulk_insert(
+            query, records, self._build_cliente_params, chunk_size, atomic=atomic,
+            key_field='ID_CLIENTE'
+        )
+
     def update(self, cliente_id, form_data):
         """Actualiza un cliente existente"""
         try:
-            print(f"✏️ Actualizando cliente ID: {cliente_id}")
-            print(f"📝 Datos recibidos: {form_data}")
-
-            # Verificar que existe
-            print(f"🔍 Verificando existencia del cliente {cliente_id}")
-            existing = self.get_by_id(cliente_id)
-            print(f"✅ Cliente existe: {existing}")
-
-            # Extraer datos
-            nombre_val = form_data.get('NOMBRE', '').strip()
-            apellido_val = form_data.get('APELLIDO', '').strip()
-            documento_val = form_data.get('DOCUMENTO_IDENTIDAD', '').strip()
-            nacionalidad_val = form_data.get('NACIONALIDAD', '').strip()
-            fecha_nac_val = form_data.get('FECHA_NACIMIENTO', '').strip()
-            direccion_val = form_data.get('DIRECCION', '').strip()
-            telefono_val = form_data.get('TELEFONO', '').strip()
-            correo_val = form_data.get('CORREO', '').strip()
-            preferencias_val = form_data.get('PREFERENCIAS_ESPECIALES', '').strip()
-            nivel_fidel_val = form_data.get('NIVEL_PROGRAMA_FIDELIZACION', '').strip()
-
-            # Preparar parámetros
-            params = (
-                nombre_val,
-                apellido_val,
-                int(documento_val) if documento_val else None,
-                nacionalidad_val,
-                fecha_nac_val,
-                direccion_val,
-                int(telefono_val) if telefono_val else None,
-                correo_val,
-                preferencias_val,
-                nivel_fidel_val,
-                cliente_id
-            )
-
-            print(f"📋 Parámetros para UPDATE: {params}")
-
-            # UPDATE directo
+            logger.debug("Actualizando cliente ID: %s", cliente_id)
+
+            # Extraer datos y preparar parámetros
+            params = self._build_cliente_params(form_data) + (cliente_id,)
+
+            # UPDATE directo: rowcount (filas encontradas) indica si existe
             query = """
                 UPDATE clientes 
                 SET nombre = %s, apellido = %s, documento_identidad = %s,
@@ -157,71 +167,95 @@ class Clientes(BaseModel):
                     nivel_programa_fidelizacion = %s
                 WHERE id_cliente = %s
             """
-            print(f"📝 Query: {query}")
 
-            rows_affected = self.db.execute_query(query, params)
-            print(f"✅ Filas actualizadas: {rows_affected}")
+            rows_affected = self.db.execute_prepared(query, params)
+            self._entity_changed(cliente_id)
+            logger.debug("Filas actualizadas: %s", rows_affected)
 
             if rows_affected == 0:
-                print(f"❌ No se actualizó ninguna fila para ID {cliente_id}")
+                logger.error("No se actualizó ninguna fila para ID %s", cliente_id)
                 raise EntityNotFoundError(self.entity_name, cliente_id)
 
-            print(f"✅ Cliente {cliente_id} actualizado correctamente")
+            logger.debug("Cliente %s actualizado correctamente", cliente_id)
             return True
 
         except EntityNotFoundError:
-            print(f"❌ Cliente {cliente_id} no encontrado para actualizar")
+            logger.error("Cliente %s no encontrado para actualizar", cliente_id)
             raise
         except Exception as e:
-            print(f"❌ Error en update: {e}")
+            logger.error("Error en update: %s", e)
             raise DatabaseOperationError(f"Error actualizando cliente: {str(e)}")
 
     def delete(self, cliente_id):
         """Elimina un cliente"""
         try:
-            print(f"🗑️ Eliminando cliente ID: {cliente_id}")
-
-            # Verificar que existe
-            print(f"🔍 Verificando existencia del cliente {cliente_id}")
-            self.get_by_id(cliente_id)
+            logger.debug("Eliminando cliente ID: %s", cliente_id)
 
-            # DELETE directo
+            # DELETE directo: rowcount indica si existía
             query = "DELETE FROM clientes WHERE id_cliente = %s"
-            print(f"📝 Query: {query}")
 
-            rows_affected = self.db.execute_query(query, (cliente_id,))
-            print(f"✅ Filas eliminadas: {rows_affected}")
+            rows_affected = self.db.execute_prepared(query, (cliente_id,))
+            self._entity_changed(cliente_id)
+            logger.debug("Filas eliminadas: %s", rows_affected)
 
             if rows_affected == 0:
-                print(f"❌ No se eliminó ninguna fila para ID {cliente_id}")
+                logger.error("No se eliminó ninguna fila para ID %s", cliente_id)
                 raise EntityNotFoundError(self.entity_name, cliente_id)
 
-            print(f"✅ Cliente {cliente_id} eliminado correctamente")
+            logger.debug("Cliente %s eliminado correctamente", cliente_id)
             return True
 
         except EntityNotFoundError:
-            print(f"❌ Cliente {cliente_id} no encontrado para eliminar")
+            logger.error("Cliente %s no encontrado para eliminar", cliente_id)
             raise
 
+    def _build_cliente_params(self, form_data):
+        """
+        Valida los datos de un formulario de cliente y los convierte en parámetros SQL
+
+        Args:
+            form_data (dict): Datos del cliente con claves en mayúsculas
+
+        Returns:
+            tuple: Parámetros en el orden de INSERT_COLUMNS
+
+        Raises:
+            ValueError: Si falta un campo obligatorio o un número no es válido
+        """
+        nombre_val = self._clean_field(form_data, 'NOMBRE')
+        apellido_val = self._clean_field(form_data, 'APELLIDO')
+        documento_val = self._clean_field(form_data, 'DOCUMENTO_IDENTIDAD')
+        telefono_val = self._clean_field(form_data, 'TELEFONO')
+
+        # Validaciones
+        if not nombre_val:
+            raise ValueError("Debe ingresar el nombre del cliente")
+        if not apellido_val:
+            raise ValueError("Debe ingresar el apellido del cliente")
+        if not documento_val:
+            raise ValueError("Debe ingresar el documento de identidad")
+
+        return (
+            nombre_val,
+            apellido_val,
+            int(documento_val),
+            self._clean_field(form_data, 'NACIONALIDAD'),
+            self._clean_field(form_data, 'FECHA_NACIMIENTO'),
+            self._clean_field(form_data, 'DIRECCION'),
+            int(telefono_val) if telefono_val else None,
+            self._clean_field(form_data, 'CORREO'),
+            self._clean_field(form_data, 'PREFERENCIAS_ESPECIALES'),
+            self._clean_field(form_data, 'NIVEL_PROGRAMA_FIDELIZACION')
+        )
+
+    def _map_row(self, row):
+        """Mapea una fila de get_page() igual que get_all()"""
+        return self._map_cliente_data(row)
+
     def _map_cliente_data(self, row):
-        """Mapea una fila de la base de datos a un diccionario"""
+        """Mapea una fila de la base de datos a un ClienteRecord (valores nativos)"""
         try:
-            mapped_data = {
-                'ID_CLIENTE': str(row[0]) if row[0] is not None else '',
-                'NOMBRE': str(row[1]) if row[1] is not None else '',
-                'APELLIDO': str(row[2]) if row[2] is not None else '',
-                'DOCUMENTO_IDENTIDAD': str(row[3]) if row[3] is not None else '',
-                'NACIONALIDAD': str(row[4]) if row[4] is not None else '',
-                'FECHA_NACIMIENTO': str(row[5]) if row[5] is not None else '',
-                'DIRECCION': str(row[6]) if row[6] is not None else '',
-                'TELEFONO': str(row[7]) if row[7] is not None else '',
-                'CORREO': str(row[8]) if row[8] is not None else '',
-                'PREFERENCIAS_ESPECIALES': str(row[9]) if row[9] is not None else '',
-                'NIVEL_PROGRAMA_FIDELIZACION': str(row[10]) if row[10] is not None else ''
-            }
-            print(f"🗺️ Datos mapeados: {mapped_data}")
-            return mapped_data
+            return ClienteRecord.from_row(row)
         except Exception as e:
-            print(f"❌ Error en mapeo de datos: {e}")
-            print(f"📊 Fila recibida: {row}")
+            logger.error("Error en mapeo de datos: %s", e)
             return {}
\ No newline at end of file
@@ -0,0 +1,115 @@
+"""
+Caché de entidades por ID (mapa de identidad) con LRU y caducidad
+"""
+import threading
+import time
+from collections import OrderedDict
+
+MISSING = object()  # Valor devuelto por EntityCache.get() cuando no hay entrada válida
+
+
+class EntityCache:
+    """Entidades leídas por ID, limitadas en número y en antigüedad"""
+
+    def __init__(self, max_size=1000, ttl_seconds=60.0, clock=time.monotonic):
+        """
+        Args:
+            max_size (int): Máximo de entidades guardadas; se expulsa la menos usada
+            ttl_seconds (float): Segundos que una entidad se considera vigente
+                (cubre cambios hechos por otros clientes de la base de datos)
+            clock (callable): Reloj en segundos
+        """
+        if max_size < 1:
+            raise ValueError("max_size debe ser al menos 1")
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def _key(entity_id):
+        """Los IDs llegan como int o como texto del formulario: se unifican"""
+        return str(entity_id).strip()
+
+    def get(self, entity_id):
+        """
+        Obtiene una entidad vigente
+
+        Args:
+            entity_id: ID de la entidad
+
+        Returns:
+            dict: Copia de la entidad (o el mismo Record), o MISSING si no está o caducó
+        """
+        key = self._key(entity_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                stored_at, value = entry
+                if self._clock() - stored_at < self.ttl_seconds:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value.copy()
+                del self._entries[key]
+                self.expirations += 1
+            self.misses += 1
+            return MISSING
+
+    def put(self, entity_id, value):
+        """
+        Guarda una entidad
+
+        Args:
+            entity_id: ID de la entidad
+            value (dict): Datos de la entidad (se guarda una copia; los Record
+                son inmutables y se guardan tal cual)
+        """
+        key = self._key(entity_id)
+        with self._lock:
+            self._entries[key] = (self._clock(), value.copy())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, entity_id):
+        """Descarta la entidad de un ID si estaba guardada"""
+        with self._lock:
+            if self._entries.pop(self._key(entity_id), None) is not None:
+                self.invalidations += 1
+
+    def clear(self):
+        """Descarta todas las entidades"""
+        with self._lock:
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        """
+        Obtiene los contadores de la caché
+
+        Returns:
+            dict: size, max_size, hits, misses, evictions, expirations,
+                invalidations y hit_ratio
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'invalidations': self.invalidations,
+                'hit_ratio': (self.hits / total) if total else 0.0
+            }
@@ -0,0 +1,299 @@
+"""
+Recepción: llegadas, salidas y huéspedes alojados de un día
+
+StayIndex guarda en memoria las estancias que siguen abiertas o terminan
+desde el día de carga, indexadas por día de llegada, día de salida y cada
+noche ocupada dentro de un horizonte corto (30 días por defecto). Las
+listas de recepción salen de un diccionario por día, sin recorrer la
+tabla check_in_out:
+
+    index = StayIndex(date(2025, 3, 1))
+    index.add(estancia)
+    index.arrivals(date(2025, 3, 1))  # -> estancias que llegan hoy
+
+Una estancia sin fecha de salida se considera alojada desde su llegada.
+"Alojados" un día son las estancias que ocupan habitación esa noche
+(llegada <= día < salida); las que salen ese día aparecen en las salidas.
+
+FrontDesk mantiene un StayIndex al día con el modelo CheckInOut igual que
+AvailabilityEngine con las reservas: lo carga en la primera consulta, lo
+recarga al cambiar de día y aplica en la siguiente consulta solo las
+estancias escritas desde entonces. Como la recepción y las pantallas del
+vestíbulo son procesos distintos, cada consulta compara además
+get_change_token() de check_in_out (versionada con triggers, migración 6)
+y recarga el índice si la tabla cambió desde otro puesto. Los días fuera
+del horizonte se consultan directamente a la base de datos.
+"""
+import threading
+from datetime import date, time
+from utils.exceptions import DatabaseOperationError
+from utils.logger import get_logger
+
+logger = get_logger('models')
+
+HORIZON_DAYS = 30
+
+
+def _arrival_order(stay):
+    return (stay['HORA_LLEGADA'] or time.max, stay['ID_CHECK'])
+
+
+def _departure_order(stay):
+    return (stay['HORA_SALIDA'] or time.max, stay['ID_CHECK'])
+
+
+def _room_order(stay):
+    return (stay['ID_HABITACION'] is None, stay['ID_HABITACION'] or 0, stay['ID_CHECK'])
+
+
+class StayIndex:
+    """Estancias vigentes por día de llegada, día de salida y noche ocupada"""
+
+    def __init__(self, origin, horizon_days=HORIZON_DAYS):
+        """
+        Args:
+            origin (date): Primer día cubierto (normalmente hoy)
+            horizon_days (int): Días cubiertos desde origin
+        """
+        if horizon_days < 1:
+            raise ValueError("horizon_days debe ser al menos 1")
+        self.origin = origin
+        self.horizon_days = horizon_days
+        self._first = origin.toordinal()
+        self._end = self._first + horizon_days
+        self._stays = {}  # id_check -> CheckInOutRecord
+        self._arrivals = {}  # ordinal -> set de id_check
+        self._departures = {}  # ordinal -> set de id_check
+        self._nights = {}  # ordinal -> set de id_check que ocupan esa noche
+        self._open = set()  # id_check sin fecha de salida
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._stays)
+
+    def __contains__(self, check_id):
+        return check_id in self._stays
+
+    def covers(self, day):
+        """Indica si el día está dentro del horizonte del índice"""
+        return self._first <= day.toordinal() < self._end
+
+    def add(self, stay):
+        """
+        Añade (o reemplaza) una estancia
+
+        Args:
+            stay: CheckInOutRecord; las que no tienen fecha de llegada se ignoran
+        """
+        arrival = stay['FECHA_LLEGADA']
+        if arrival is None:
+            return
+        check_id = stay['ID_CHECK']
+        with self._lock:
+            self._remove_locked(check_id)
+            self._stays[check_id] = stay
+            start = arrival.toordinal()
+            self._arrivals.setdefault(start, set()).add(check_id)
+            departure = stay['FECHA_SALIDA']
+            if departure is None:
+                self._open.add(check_id)
+                return
+            end = departure.toordinal()
+            self._departures.setdefault(end, set()).add(check_id)
+            for night in range(max(start, self._first), min(end, self._end)):
+                self._nights.setdefault(night, set()).add(check_id)
+
+    def remove(self, check_id):
+        """Quita una estancia si estaba en el índice"""
+        with self._lock:
+            self._remove_locked(check_id)
+
+    def arrivals(self, day):
+        """Estancias que llegan el día, por hora de llegada"""
+        with self._lock:
+            ids = self._arrivals.get(day.toordinal(), ())
+            return sorted((self._stays[check_id] for check_id in ids), key=_arrival_order)
+
+    def departures(self, day):
+        """Estancias que salen el día, por hora de salida"""
+        with self._lock:
+            ids = self._departures.get(day.toordinal(), ())
+            return sorted((self._stays[check_id] for check_id in ids), key=_departure_order)
+
+    def in_house(self, day):
+        """Estancias que ocupan habitación la noche del día, por habitación"""
+        ordinal = day.toordinal()
+        with self._lock:
+            stays = [self._stays[check_id] for check_id in self._nights.get(ordinal, ())]
+            stays.extend(self._stays[check_id] for check_id in self._open
+                         if self._stays[check_id]['FECHA_LLEGADA'].toordinal() <= ordinal)
+            return sorted(stays, key=_room_order)
+
+    def _remove_locked(self, check_id):
+        stay = self._stays.pop(check_id, None)
+        if stay is None:
+            return
+        start = stay['FECHA_LLEGADA'].toordinal()
+        self._discard(self._arrivals, start, check_id)
+        departure = stay['FECHA_SALIDA']
+        if departure is None:
+            self._open.discard(check_id)
+            return
+        end = departure.toordinal()
+        self._discard(self._departures, end, check_id)
+        for night in range(max(start, self._first), min(end, self._end)):
+            self._discard(self._nights, night, check_id)
+
+    @staticmethod
+    def _discard(by_day, ordinal, check_id):
+        ids = by_day.get(ordinal)
+        if ids is not None:
+            ids.discard(check_id)
+            if not ids:
+                del by_day[ordinal]
+
+
+class FrontDesk:
+    """StayIndex alimentado por el modelo CheckInOut"""
+
+    def __init__(self, check_model, horizon_days=HORIZON_DAYS, today=date.today):
+        """
+        Args:
+            check_model: Instancia de CheckInOut
+            horizon_days (int): Días cubiertos por el índice desde hoy
+            today (callable): Fecha actual; al cambiar de día el índice se recarga
+        """
+        self.model = check_model
+        self.horizon_days = horizon_days
+        self._today = today
+        self._index = None
+        self._pending = set()  # Estancias escritas desde la última consulta
+        self._stale = False  # True si hay que recargar todas las estancias
+        self._token = None  # Parte de servidor de get_change_token() en la última carga
+        self._state_lock = threading.Lock()  # Protege _pending y _stale
+        self._load_lock = threading.Lock()  # Una sola carga o actualización a la vez
+
+        check_model.add_change_listener(self._stay_changed)
+
+    def arrivals(self, day=None):
+        """
+        Estancias que llegan un día
+
+        Args:
+            day (date): Día consultado (None: hoy)
+
+        Returns:
+            list: CheckInOutRecord por hora de llegada
+        """
+        index, day = self._index_for(day)
+        if index is None:
+            return sorted(self.model.get_arrivals(day), key=_arrival_order)
+        return index.arrivals(day)
+
+    def departures(self, day=None):
+        """
+        Estancias que salen un día
+
+        Args:
+            day (date): Día consultado (None: hoy)
+
+        Returns:
+            list: CheckInOutRecord por hora de salida
+        """
+        index, day = self._index_for(day)
+        if index is None:
+            return sorted(self.model.get_departures(day), key=_departure_order)
+        return index.departures(day)
+
+    def in_house(self, day=None):
+        """
+        Estancias alojadas la noche de un día
+
+        Args:
+            day (date): Día consultado (None: hoy)
+
+        Returns:
+            list: CheckInOutRecord por habitación
+        """
+        index, day = self._index_for(day)
+        if index is None:
+            return sorted(self.model.get_in_house(day), key=_room_order)
+        return index.in_house(day)
+
+    def invalidate(self):
+        """Fuerza la recarga completa en la próxima consulta"""
+        with self._state_lock:
+            self._stale = True
+
+    def _stay_changed(self, check_id):
+        with self._state_lock:
+            if check_id is None:
+                self._stale = True
+            else:
+                self._pending.add(int(check_id))
+
+    def _index_for(self, day):
+        """
+        Obtiene el índice si cubre el día pedido
+
+        Returns:
+            tuple: (StayIndex o None si el día queda fuera del horizonte, día)
+        """
+        index = self._get_index()
+        day = day or index.origin
+        return (index if index.covers(day) else None), day
+
+    def _get_index(self):
+        """
+        Obtiene el índice aplicando antes las escrituras pendientes
+
+        Returns:
+            StayIndex: Estancias vigentes desde hoy
+        """
+        with self._load_lock:
+            token = self._server_token()
+            with self._state_lock:
+                index = self._index
+                reload = (index is None or self._stale or index.origin != self._today()
+                          or token != self._token)
+                pending = set() if reload else self._pending
+                self._pending = set()
+                self._stale = False
+
+            if reload:
+                index = StayIndex(self._today(), self.horizon_days)
+                for stay in self.model.iter_current(index.origin):
+                    if stay:
+                        index.add(stay)
+                logger.debug("Índice de recepción: %d estancias desde %s", len(index), index.origin)
+                self._index = index
+                # Marca tomada antes de leer: lo escrito durante la carga se recarga después
+                self._token = token
+                return index
+
+            if pending:
+                stays = {stay['ID_CHECK']: stay for stay in self.model.get_many(sorted(pending))
+                         if stay}
+                for check_id in pending:
+                    index.remove(check_id)
+                    stay = stays.get(check_id)
+                    # Una estancia que ya terminó antes del horizonte no se indexa,
+                    # igual que en la carga
+                    if stay is not None and (stay['FECHA_SALIDA'] is None
+                                             or stay['FECHA_SALIDA'] >= index.origin):
+                        index.add(stay)
+            return index
+
+    def _server_token(self):
+        """
+        Marca de cambios de check_in_out en el servidor (sin el contador local,
+        que ya cubren las escrituras pendientes)
+
+        Returns:
+            tuple: Marca comparable, o la de la última carga si no se pudo leer
+        """
+        try:
+            return self.model.get_change_token()[1:]
+        except DatabaseOperationError as e:
+            logger.warning("No se pudo comprobar si check_in_out cambió: %s", e)
+            return self._token
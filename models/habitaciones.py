@@ -0,0 +1,237 @@
+from models.base_model import BaseModel
+from models.entity_cache import MISSING
+from models.records import record_type
+from utils.exceptions import EntityNotFoundError, DatabaseOperationError
+from utils.logger import get_logger
+from utils.validators import Validator
+
+logger = get_logger('models')
+
+HABITACION_FIELDS = (
+    'ID_HABITACION', 'ID_HOTEL', 'NUMERO', 'PISO', 'ID_TIPO_HABITACION', 'ORIENTACION',
+    'ESTADO_ACTUAL', 'CARACTERISTICAS_ESPECIALES', 'TARIFA_BASE', 'ID_SALON'
+)
+HabitacionRecord = record_type('HabitacionRecord', HABITACION_FIELDS)
+
+ESTADOS_HABITACION = ('disponible', 'ocupada', 'en mantenimiento')
+
+# Estados que sacan la habitación del inventario que se puede reservar
+# ('ocupada' sigue contando: su ocupación ya está en las reservas)
+ESTADOS_FUERA_DE_SERVICIO = ('en mantenimiento',)
+
+
+class Habitaciones(BaseModel):
+    """Modelo para gestionar habitaciones"""
+
+    def __init__(self, db_connection):
+        super().__init__(db_connection)
+        self.table_name = "habitaciones"
+        self.entity_name = "Habitación"
+        self.primary_key = "id_habitacion"
+
+    def get_by_id(self, habitacion_id):
+        """Obtiene una habitación por su ID"""
+        cached = self._cache_lookup(habitacion_id)
+        if cached is not MISSING:
+            return cached
+
+        try:
+            query = "SELECT * FROM habitaciones WHERE id_habitacion = %s"
+            results = self.db.execute_prepared(query, (habitacion_id,))
+
+            if not results:
+                raise EntityNotFoundError(self.entity_name, habitacion_id)
+
+            entity = self._map_habitacion_data(results[0])
+            self._cache_store(habitacion_id, entity)
+            return entity
+
+        except Exception:
+            raise EntityNotFoundError(self.entity_name, habitacion_id)
+
+    def get_all(self):
+        """Obtiene todas las habitaciones"""
+        try:
+            query = "SELECT * FROM habitaciones ORDER BY id_habitacion"
+            results = self.db.execute_query(query)
+            return [self._map_habitacion_data(row) for row in results] if results else []
+
+        except Exception as e:
+            logger.error("Error obteniendo habitaciones: %s", e)
+            return []
+
+    def iter_all(self, batch_size=500):
+        """Recorre todas las habitaciones en lotes con un cursor no bufferizado"""
+        query = "SELECT * FROM habitaciones ORDER BY id_habitacion"
+        for row in self.db.iter_query(query, batch_size=batch_size):
+            yield self._map_habitacion_data(row)
+
+    def get_by_hotel(self, hotel_id):
+        """
+        Obtiene las habitaciones de un hotel
+
+        Args:
+            hotel_id (int): ID del hotel
+
+        Returns:
+            list: HabitacionRecord ordenados por número
+        """
+        query = "SELECT * FROM habitaciones WHERE id_hotel = %s ORDER BY numero, id_habitacion"
+        results = self.db.execute_prepared(query, (hotel_id,))
+        return [self._map_habitacion_data(row) for row in results or []]
+
+    def count_inventory(self):
+        """
+        Cuenta las habitaciones reservables por hotel y tipo
+
+        Returns:
+            dict: {(id_hotel, id_tipo_habitacion): número de habitaciones}, sin
+                las que están en ESTADOS_FUERA_DE_SERVICIO
+        """
+        placeholders = ', '.join(['%s'] * len(ESTADOS_FUERA_DE_SERVICIO))
+        query = f"""
+            SELECT id_hotel, id_tipo_habitacion, COUNT(*) FROM habitaciones
+            WHERE id_hotel IS NOT NULL AND id_tipo_habitacion IS NOT NULL
+              AND (estado_actual IS NULL OR estado_actual NOT IN ({placeholders}))
+            GROUP BY id_hotel, id_tipo_habitacion
+        """
+        results = self.db.execute_prepared(query, ESTADOS_FUERA_DE_SERVICIO)
+        return {(hotel_id, tipo_id): count for hotel_id, tipo_id, count in results or []}
+
+    def lock_inventory(self, hotel_id, tipo_id):
+        """
+        Cuenta las habitaciones reservables de un par (hotel, tipo) bloqueándolas
+
+        Usa SELECT ... FOR UPDATE: dentro de db.transaction() las filas quedan
+        bloqueadas hasta el COMMIT, así que dos puestos que reservan el mismo
+        par comprueban el cupo uno después del otro. El servidor recorre
+        idx_habitaciones_hotel, de modo que bloquea también el resto de
+        habitaciones del hotel.
+
+        Args:
+            hotel_id (int): ID del hotel
+            tipo_id (int): ID del tipo de habitación
+
+        Returns:
+            int: Habitaciones del par fuera de ESTADOS_FUERA_DE_SERVICIO
+        """
+        # Se bloquean todas las del par, también las fuera de servicio, para
+        # que el conjunto bloqueado no dependa de su estado
+        query = """
+            SELECT id_habitacion, estado_actual FROM habitaciones
+            WHERE id_hotel = %s AND id_tipo_habitacion = %s
+            FOR UPDATE
+        """
+        results = self.db.execute_prepared(query, (hotel_id, tipo_id))
+        return sum(1 for _, estado in results or [] if estado not in ESTADOS_FUERA_DE_SERVICIO)
+
+    INSERT_COLUMNS = (
+        "id_hotel, numero, piso, id_tipo_habitacion, orientacion, estado_actual, "
+        "caracteristicas_especiales, tarifa_base, id_salon"
+    )
+
+    def create(self, form_data):
+        """Crea una nueva habitación"""
+        try:
+            params = self._build_habitacion_params(form_data)
+
+            query = f"""
+                INSERT INTO habitaciones
+                ({self.INSERT_COLUMNS})
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+            """
+
+            new_id = self.db.execute_insert(query, params)
+            self._entity_changed(new_id)
+
+            return new_id
+
+        except ValueError:
+            raise
+        except Exception as e:
+            raise DatabaseOperationError(f"Error creando habitación: {str(e)}")
+
+    def update(self, habitacion_id, form_data):
+        """Actualiza una habitación existente"""
+        try:
+            params = self._build_habitacion_params(form_data) + (habitacion_id,)
+
+            query = """
+                UPDATE habitaciones
+                SET id_hotel = %s, numero = %s, piso = %s, id_tipo_habitacion = %s,
+                    orientacion = %s, estado_actual = %s,
+                    caracteristicas_especiales = %s, tarifa_base = %s, id_salon = %s
+                WHERE id_habitacion = %s
+            """
+
+            rows_affected = self.db.execute_prepared(query, params)
+            self._entity_changed(habitacion_id)
+
+            if rows_affected == 0:
+                raise EntityNotFoundError(self.entity_name, habitacion_id)
+
+            return True
+
+        except (EntityNotFoundError, ValueError):
+            raise
+        except Exception as e:
+            raise DatabaseOperationError(f"Error actualizando habitación: {str(e)}")
+
+    def delete(self, habitacion_id):
+        """Elimina una habitación"""
+        try:
+            query = "DELETE FROM habitaciones WHERE id_habitacion = %s"
+            rows_affected = self.db.execute_prepared(query, (habitacion_id,))
+            self._entity_changed(habitacion_id)
+
+            if rows_affected == 0:
+                raise EntityNotFoundError(self.entity_name, habitacion_id)
+
+            return True
+
+        except EntityNotFoundError:
+            raise
+        except Exception as e:
+            raise DatabaseOperationError(f"Error eliminando habitación: {str(e)}")
+
+    def _build_habitacion_params(self, form_data):
+        """
+        Valida los datos de un formulario de habitación y los convierte en parámetros SQL
+
+        Args:
+            form_data (dict): Datos de la habitación con claves en mayúsculas
+
+        Returns:
+            tuple: Parámetros en el orden de INSERT_COLUMNS
+
+        Raises:
+            ValueError: Si falta un campo obligatorio o un valor no es válido
+        """
+        estado_val = self._clean_field(form_data, 'ESTADO_ACTUAL') or 'disponible'
+        if estado_val not in ESTADOS_HABITACION:
+            raise ValueError(f"Estado de habitación no válido: {estado_val}")
+
+        return (
+            Validator.validate_integer(form_data.get('ID_HOTEL'), "Hotel", allow_empty=False),
+            Validator.validate_integer(form_data.get('NUMERO'), "Número"),
+            Validator.validate_integer(form_data.get('PISO'), "Piso"),
+            Validator.validate_integer(form_data.get('ID_TIPO_HABITACION'), "Tipo de habitación",
+                                       allow_empty=False),
+            self._clean_field(form_data, 'ORIENTACION'),
+            estado_val,
+            self._clean_field(form_data, 'CARACTERISTICAS_ESPECIALES'),
+            Validator.validate_float(form_data.get('TARIFA_BASE'), "Tarifa base"),
+            Validator.validate_integer(form_data.get('ID_SALON'), "Salón")
+        )
+
+    def _map_row(self, row):
+        """Mapea una fila de get_page() igual que get_all()"""
+        return self._map_habitacion_data(row)
+
+    def _map_habitacion_data(self, row):
+        """Mapea una fila de la base de datos a un HabitacionRecord (valores nativos)"""
+        try:
+            return HabitacionRecord.from_row(row)
+        except Exception as e:
+            logger.error("Error en mapeo de datos: %s", e)
+            return {}
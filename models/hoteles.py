@@ -1,5 +1,16 @@
 from models.base_model import BaseModel
+from models.entity_cache import MISSING
+from models.records import record_type
 from utils.exceptions import EntityNotFoundError, DatabaseOperationError
+from utils.logger import get_logger
+
+logger = get_logger('models')
+
+HOTEL_FIELDS = (
+    'ID_HOTEL', 'NOMBRE_HOTEL', 'CATEGORIA', 'DIRECCION', 'TELEFONO', 'CORREO',
+    'AÑO_INAUGURACION', 'HABITANTES', 'SERVICIOS', 'CHECKIN', 'CHECKOUT', 'GERENTE'
+)
+HotelRecord = record_type('HotelRecord', HOTEL_FIELDS)
 
 
 class Hoteles(BaseModel):
@@ -9,17 +20,26 @@ class Hoteles(BaseModel):
         super().__init__(db_connection)
         self.table_name = "hoteles"
         self.entity_name = "Hotel"
+        self.primary_key = "id_hotel"
+        self.sortable_columns = ('nombre_hotel', 'direccion')
+        self.search_fields = ('nombre_hotel', 'direccion', 'correo', 'gerente_responsable')
 
     def get_by_id(self, hotel_id):
         """Obtiene un hotel por su ID"""
+        cached = self._cache_lookup(hotel_id)
+        if cached is not MISSING:
+            return cached
+
         try:
             query = "SELECT * FROM hoteles WHERE id_hotel = %s"
-            results = self.db.execute_query(query, (hotel_id,))
+            results = self.db.execute_prepared(query, (hotel_id,))
 
             if not results:
                 raise EntityNotFoundError(self.entity_name, hotel_id)
 
-            return self._map_hotel_data(results[0])
+            entity = self._map_hotel_data(results[0])
+            self._cache_store(hotel_id, entity)
+            return entity
 
         except Exception as e:
             raise EntityNotFoundError(self.entity_name, hotel_id)
@@ -34,100 +54,101 @@ class Hoteles(BaseModel):
         except Exception as e:
             return []
 
+    def iter_all(self, batch_size=500):
+        """Recorre todos los hoteles en lotes con un cursor no bufferizado"""
+        query = "SELECT * FROM hoteles ORDER BY id_hotel"
+        for row in self.db.iter_query(query, batch_size=batch_size):
+            yield self._map_hotel_data(row)
+
+    INSERT_COLUMNS = (
+        "nombre_hotel, categoria, direccion, telefono, correo, "
+        "año_inauguracion, numero_total_habitantes, servicios_disponibles, "
+        "horarios_check_in, horarios_check_out, gerente_responsable"
+    )
+
     def create(self, form_data):
         """Crea un nuevo hotel"""
         try:
-            # Extraer y validar datos
-            nombre_val = form_data.get('NOMBRE_HOTEL', '').strip()
-            categoria_val = form_data.get('CATEGORIA', '').strip()
-            direccion_val = form_data.get('DIRECCION', '').strip()
-            telefono_val = form_data.get('TELEFONO', '').strip()
-            correo_val = form_data.get('CORREO', '').strip()
-            año_inauguracion_val = form_data.get('AÑO_INAUGURACION', '').strip()
-            habitantes_val = form_data.get('HABITANTES', '').strip()
-            servicios_val = form_data.get('SERVICIOS', '').strip()
-            checkin_val = form_data.get('CHECKIN', '').strip()
-            checkout_val = form_data.get('CHECKOUT', '').strip()
-            gerente_val = form_data.get('GERENTE', '').strip()
-
-            # Validaciones
-            if not nombre_val:
-                raise ValueError("Debe ingresar el nombre del hotel")
-            if not direccion_val:
-                raise ValueError("Debe ingresar la dirección")
-
-            # Preparar parámetros
-            params = (
-                nombre_val,
-                int(categoria_val) if categoria_val else None,
-                direccion_val,
-                int(telefono_val) if telefono_val else None,
-                correo_val,
-                año_inauguracion_val,
-                int(habitantes_val) if habitantes_val else None,
-                servicios_val,
-                checkin_val,
-                checkout_val,
-                gerente_val
-            )
+            # Extraer, validar y preparar parámetros
+            params = self._build_hotel_params(form_data)
 
             # INSERT directo
-            query = """
+            query = f"""
                 INSERT INTO hoteles 
-                (nombre_hotel, categoria, direccion, telefono, correo,
-                 año_inauguracion, numero_total_habitantes, servicios_disponibles,
-                 horarios_check_in, horarios_check_out, gerente_responsable)
+                ({self.INSERT_COLUMNS})
                 VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
             """
 
-            rows_affected = self.db.execute_query(query, params)
-            print(f"✅ Filas insertadas: {rows_affected}")
-
-            # Obtener el ID insertado
-            result = self.db.execute_query("SELECT LAST_INSERT_ID()")
-            new_id = result[0][0] if result else None
+            # El ID generado llega en la respuesta del propio INSERT
+            new_id = self.db.execute_insert(query, params)
+            self._entity_changed(new_id)
 
             return new_id
 
         except Exception as e:
             raise DatabaseOperationError(f"Error creando hotel: {str(e)}")
 
+    def create_many(self, records, chunk_size=500, atomic=False):
+        """
+        Crea hoteles en lote con INSERT multi-fila, una transacción por bloque
+
+        Args:
+            records (list): Diccionarios con el mismo formato que create()
+            chunk_size (int): Filas por INSERT/transacción
+            atomic (bool): Si es True toda la carga se confirma o se deshace junta
+
+        Returns:
+            tuple: (ids, errors) donde ids es la lista de IDs generados en el mismo
+                orden que records (None si la fila falló) y errors es un dict
+                {índice: mensaje}
+        """
+        query = f"""
+            INSERT INTO hoteles 
+            ({self.INSERT_COLUMNS})
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+        """
+        return self._bulk_insert(
+            query, records, self._build_hotel_params, chunk_size, atomic=atomic
+        )
+
+    def upsert_many(self, records, chunk_size=500, atomic=False):
+        """
+        Inserta o actualiza hoteles en lote según ID_HOTEL
+
+        Args:
+            records (list): Diccionarios con ID_HOTEL y los campos de create()
+            chunk_size (int): Filas por INSERT/transacción
+            atomic (bool): Si es True toda la carga se confirma o se deshace junta
+
+        Returns:
+            tuple: (ids, errors) con el mismo formato que create_many()
+        """
+        query = f"""
+            INSERT INTO hoteles 
+            (id_hotel, {self.INSERT_COLUMNS})
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            ON DUPLICATE KEY UPDATE
+                nombre_hotel = VALUES(nombre_hotel), categoria = VALUES(categoria),
+                direccion = VALUES(direccion), telefono = VALUES(telefono),
+                correo = VALUES(correo), año_inauguracion = VALUES(año_inauguracion),
+                numero_total_habitantes = VALUES(numero_total_habitantes),
+                servicios_disponibles = VALUES(servicios_disponibles),
+                horarios_check_in = VALUES(horarios_check_in),
+                horarios_check_out = VALUES(horarios_check_out),
+                gerente_responsable = VALUES(gerente_responsable)
+        """
+        return self._bulk_insert(
+            query, records, self._build_hotel_params, chunk_size, atomic=atomic,
+            key_field='ID_HOTEL'
+        )
+
     def update(self, hotel_id, form_data):
         """Actualiza un hotel existente"""
         try:
-            # Verificar que existe
-            self.get_by_id(hotel_id)
-
-            # Extraer datos
-            nombre_val = form_data.get('NOMBRE_HOTEL', '').strip()
-            categoria_val = form_data.get('CATEGORIA', '').strip()
-            direccion_val = form_data.get('DIRECCION', '').strip()
-            telefono_val = form_data.get('TELEFONO', '').strip()
-            correo_val = form_data.get('CORREO', '').strip()
-            año_inauguracion_val = form_data.get('AÑO_INAUGURACION', '').strip()
-            habitantes_val = form_data.get('HABITANTES', '').strip()
-            servicios_val = form_data.get('SERVICIOS', '').strip()
-            checkin_val = form_data.get('CHECKIN', '').strip()
-            checkout_val = form_data.get('CHECKOUT', '').strip()
-            gerente_val = form_data.get('GERENTE', '').strip()
-
-            # Preparar parámetros
-            params = (
-                nombre_val,
-                int(categoria_val) if categoria_val else None,
-                direccion_val,
-                int(telefono_val) if telefono_val else None,
-                correo_val,
-                año_inauguracion_val,
-                int(habitantes_val) if habitantes_val else None,
-                servicios_val,
-                checkin_val,
-                checkout_val,
-                gerente_val,
-                hotel_id
-            )
-
-            # UPDATE directo
+            # Extraer datos y preparar parámetros
+            params = self._build_hotel_params(form_data) + (hotel_id,)
+
+            # UPDATE directo: rowcount (filas encontradas) indica si existe
             query = """
                 UPDATE hoteles 
                 SET nombre_hotel = %s, categoria = %s, direccion = %s,
@@ -138,7 +159,8 @@ class Hoteles(BaseModel):
                 WHERE id_hotel = %s
             """
 
-            rows_affected = self.db.execute_query(query, params)
+            rows_affected = self.db.execute_prepared(query, params)
+            self._entity_changed(hotel_id)
 
             if rows_affected == 0:
                 raise EntityNotFoundError(self.entity_name, hotel_id)
@@ -153,12 +175,10 @@ class Hoteles(BaseModel):
     def delete(self, hotel_id):
         """Elimina un hotel"""
         try:
-            # Verificar que existe
-            self.get_by_id(hotel_id)
-
-            # DELETE directo
+            # DELETE directo: rowcount indica si existía
             query = "DELETE FROM hoteles WHERE id_hotel = %s"
-            rows_affected = self.db.execute_query(query, (hotel_id,))
+            rows_affected = self.db.execute_prepared(query, (hotel_id,))
+            self._entity_changed(hotel_id)
 
             if rows_affected == 0:
                 raise EntityNotFoundError(self.entity_name, hotel_id)
@@ -170,23 +190,53 @@ class Hoteles(BaseModel):
         except Exception as e:
             raise DatabaseOperationError(f"Error eliminando hotel: {str(e)}")
 
+    def _build_hotel_params(self, form_data):
+        """
+        Valida los datos de un formulario de hotel y los convierte en parámetros SQL
+
+        Args:
+            form_data (dict): Datos del hotel con claves en mayúsculas
+
+        Returns:
+            tuple: Parámetros en el orden de INSERT_COLUMNS
+
+        Raises:
+            ValueError: Si falta un campo obligatorio o un número no es válido
+        """
+        nombre_val = self._clean_field(form_data, 'NOMBRE_HOTEL')
+        categoria_val = self._clean_field(form_data, 'CATEGORIA')
+        direccion_val = self._clean_field(form_data, 'DIRECCION')
+        telefono_val = self._clean_field(form_data, 'TELEFONO')
+        habitantes_val = self._clean_field(form_data, 'HABITANTES')
+
+        # Validaciones
+        if not nombre_val:
+            raise ValueError("Debe ingresar el nombre del hotel")
+        if not direccion_val:
+            raise ValueError("Debe ingresar la dirección")
+
+        return (
+            nombre_val,
+            int(categoria_val) if categoria_val else None,
+            direccion_val,
+            int(telefono_val) if telefono_val else None,
+            self._clean_field(form_data, 'CORREO'),
+            self._clean_field(form_data, 'AÑO_INAUGURACION'),
+            int(habitantes_val) if habitantes_val else None,
+            self._clean_field(form_data, 'SERVICIOS'),
+            self._clean_field(form_data, 'CHECKIN'),
+            self._clean_field(form_data, 'CHECKOUT'),
+            self._clean_field(form_data, 'GERENTE')
+        )
+
+    def _map_row(self, row):
+        """Mapea una fila de get_page() igual que get_all()"""
+        return self._map_hotel_data(row)
+
     def _map_hotel_data(self, row):
-        """Mapea una fila de la base de datos a un diccionario"""
+        """Mapea una fila de la base de datos a un HotelRecord (valores nativos)"""
         try:
-            return {
-                'ID_HOTEL': str(row[0]) if row[0] is not None else '',
-                'NOMBRE_HOTEL': str(row[1]) if row[1] is not None else '',
-                'CATEGORIA': str(row[2]) if row[2] is not None else '',
-                'DIRECCION': str(row[3]) if row[3] is not None else '',
-                'TELEFONO': str(row[4]) if row[4] is not None else '',
-                'CORREO': str(row[5]) if row[5] is not None else '',
-                'AÑO_INAUGURACION': str(row[6]) if row[6] is not None else '',
-                'HABITANTES': str(row[7]) if row[7] is not None else '',
-                'SERVICIOS': str(row[8]) if row[8] is not None else '',
-                'CHECKIN': str(row[9]) if row[9] is not None else '',
-                'CHECKOUT': str(row[10]) if row[10] is not None else '',
-                'GERENTE': str(row[11]) if row[11] is not None else ''
-            }
+            return HotelRecord.from_row(row)
         except Exception as e:
-            print(f"Error en mapeo de datos: {e}")
+            logger.error("Error en mapeo de datos: %s", e)
             return {}
\ No newline at end of file
@@ -0,0 +1,231 @@
+"""
+Detección de sobreventa: reservas que se solapan por encima del inventario
+
+find_overbookings() revisa todas las reservas a la vez con una línea de
+barrido: cada reserva aporta un evento +habitaciones en su llegada y
+-habitaciones en su salida, los eventos se ordenan por (hotel, tipo, día)
+y la suma acumulada da la ocupación de cada noche. Los tramos donde la
+ocupación supera las habitaciones del par son conflictos. Ordenar domina
+el coste, O(n log n); el resto son operaciones de NumPy sobre los eventos.
+
+OverbookingDetector aplica lo mismo a los modelos: scan() revisa la base
+de datos completa y check_reservation() solo las noches de una reserva
+recién escrita, usando el índice de ocupación de AvailabilityEngine.
+"""
+from datetime import date
+import numpy as np
+from models.records import record_type
+from utils.logger import get_logger
+
+logger = get_logger('models')
+
+CONFLICT_FIELDS = (
+    'ID_HOTEL', 'ID_TIPO_HABITACION', 'PRIMERA_NOCHE', 'ULTIMA_NOCHE', 'RESERVADAS',
+    'CAPACIDAD', 'RESERVAS'
+)
+# RESERVADAS es el máximo de habitaciones reservadas en una noche del tramo;
+# RESERVAS, la tupla de IDs de reserva que ocupan alguna noche del tramo
+ConflictRecord = record_type('ConflictRecord', CONFLICT_FIELDS)
+
+
+def find_overbookings(bookings, inventory):
+    """
+    Busca los tramos de noches en los que se reservan más habitaciones de las que hay
+
+    Args:
+        bookings (iterable): Tuplas (id_reserva, id_hotel, id_tipo_habitacion,
+            fecha_llegada, fecha_salida, numero_habitaciones), como
+            Reservas.iter_bookings(); las que no tienen hotel o tipo, o cuya
+            salida no es posterior a la llegada, se ignoran
+        inventory (dict): {(id_hotel, id_tipo_habitacion): habitaciones}; un
+            par que no aparece tiene capacidad 0
+
+    Returns:
+        list: ConflictRecord ordenados por hotel, tipo y fecha
+    """
+    ids, keys, starts, ends, rooms = [], [], [], [], []
+    key_numbers = {}
+    for reserva_id, hotel_id, tipo_id, arrival, departure, count in bookings:
+        if hotel_id is None or tipo_id is None or arrival is None or departure is None:
+            continue
+        start, end = arrival.toordinal(), departure.toordinal()
+        if end <= start:
+            continue
+        key = (hotel_id, tipo_id)
+        number = key_numbers.get(key)
+        if number is None:
+            number = key_numbers[key] = len(key_numbers)
+        ids.append(reserva_id)
+        keys.append(number)
+        starts.append(start)
+        ends.append(end)
+        rooms.append(count or 1)
+    if not ids:
+        return []
+
+    key_list = list(key_numbers)
+    capacity = np.array([inventory.get(key, 0) for key in key_list], dtype=np.int64)
+    keys = np.array(keys, dtype=np.int64)
+    starts = np.array(starts, dtype=np.int64)
+    ends = np.array(ends, dtype=np.int64)
+    rooms = np.array(rooms, dtype=np.int64)
+
+    # Eventos: +habitaciones al llegar, -habitaciones al salir
+    event_keys = np.concatenate((keys, keys))
+    event_days = np.concatenate((starts, ends))
+    event_deltas = np.concatenate((rooms, -rooms))
+    order = np.lexsort((event_days, event_keys))
+    event_keys = event_keys[order]
+    event_days = event_days[order]
+    # Cada par suma cero al final, así que la suma global sirve como ocupación de cada par
+    occupancy = np.cumsum(event_deltas[order])
+
+    # Ocupación tras el último evento de cada día: vale hasta el siguiente día con eventos
+    last_of_day = np.ones(len(event_days), dtype=bool)
+    last_of_day[:-1] = (event_keys[1:] != event_keys[:-1]) | (event_days[1:] != event_days[:-1])
+    day_keys = event_keys[last_of_day]
+    days = event_days[last_of_day]
+    occupancy = occupancy[last_of_day]
+
+    over = occupancy > capacity[day_keys]
+    if not over.any():
+        return []
+    same_key_before = np.zeros(len(days), dtype=bool)
+    same_key_before[1:] = day_keys[1:] == day_keys[:-1]
+    over_before = np.zeros(len(days), dtype=bool)
+    over_before[1:] = over[:-1]
+    over_after = np.zeros(len(days), dtype=bool)
+    over_after[:-1] = over[1:]
+    same_key_after = np.zeros(len(days), dtype=bool)
+    same_key_after[:-1] = same_key_before[1:]
+    run_starts = np.flatnonzero(over & ~(over_before & same_key_before))
+    run_ends = np.flatnonzero(over & ~(over_after & same_key_after))
+    # El día tras el último de cada tramo existe: al final de cada par la ocupación es 0
+    bounds = np.ravel(np.column_stack((run_starts, run_ends + 1)))
+    peaks = np.maximum.reduceat(occupancy, bounds)[::2]
+
+    run_keys = day_keys[run_starts]
+    run_first = days[run_starts]
+    run_last = days[run_ends + 1]  # Día siguiente a la última noche del tramo
+
+    # Tramos que toca cada reserva: los tramos de un par están ordenados y no
+    # se solapan, así que basta una búsqueda binaria por cada extremo sobre la
+    # clave compuesta (par, día)
+    shift = np.int64(1 << 32)
+    first_run = np.searchsorted(run_keys * shift + run_last, keys * shift + starts, side='right')
+    after_run = np.searchsorted(run_keys * shift + run_first, keys * shift + ends, side='left')
+    touched = np.maximum(after_run - first_run, 0)
+    member_bookings = np.repeat(np.arange(len(ids)), touched)
+    member_runs = (np.repeat(first_run, touched) + np.arange(touched.sum())
+                   - np.repeat(np.cumsum(touched) - touched, touched))
+    reserva_ids = np.array(ids)[member_bookings]
+    order = np.lexsort((reserva_ids, member_runs))
+    run_sizes = np.bincount(member_runs, minlength=len(run_keys))
+    members = np.split(reserva_ids[order], np.cumsum(run_sizes)[:-1])
+
+    conflicts = []
+    runs = zip(run_keys, run_first, run_last, peaks, members)
+    for number, first, last, peak, run_members in runs:
+        hotel_id, tipo_id = key_list[number]
+        conflicts.append(ConflictRecord.from_row((
+            hotel_id, tipo_id, date.fromordinal(int(first)), date.fromordinal(int(last) - 1),
+            int(peak), int(capacity[number]), tuple(run_members.tolist())
+        )))
+    conflicts.sort(key=lambda conflict: (conflict['ID_HOTEL'], conflict['ID_TIPO_HABITACION'],
+                                         conflict['PRIMERA_NOCHE']))
+    return conflicts
+
+
+class OverbookingDetector:
+    """Sobreventa en las reservas de la base de datos, completa o de una reserva"""
+
+    def __init__(self, reservas_model, habitaciones_model, availability):
+        """
+        Args:
+            reservas_model: Instancia de Reservas
+            habitaciones_model: Instancia de Habitaciones
+            availability: AvailabilityEngine de esos modelos (para check_reservation)
+        """
+        self.reservas = reservas_model
+        self.habitaciones = habitaciones_model
+        self.availability = availability
+
+    def scan(self, since=None):
+        """
+        Revisa todas las reservas no canceladas
+
+        Args:
+            since (date): Solo reservas que terminan después de esta fecha (None: todas)
+
+        Returns:
+            list: ConflictRecord (ver find_overbookings)
+        """
+        conflicts = find_overbookings(self.reservas.iter_bookings(since),
+                                      self.habitaciones.count_inventory())
+        if conflicts:
+            logger.warning("%d tramos con sobreventa en las reservas", len(conflicts))
+        return conflicts
+
+    def check_reservation(self, reserva_id):
+        """
+        Revisa solo las noches de una reserva (p. ej. recién creada o modificada)
+
+        La ocupación sale del índice de AvailabilityEngine, que ya incluye la
+        reserva, así que el coste depende de sus noches y no del total de
+        reservas. El índice solo carga las reservas que salen después de su
+        origen (hoy); si la reserva llega antes, las noches se revisan con
+        find_overbookings() sobre las reservas de su hotel y tipo que se
+        solapan con ella, leídas de la base de datos con el índice
+        idx_reservas_hotel_salida.
+
+        Args:
+            reserva_id (int): ID de la reserva
+
+        Returns:
+            list: ConflictRecord de su hotel y tipo en su rango de fechas (vacía
+                si la reserva está cancelada o no tiene hotel)
+        """
+        booking = self.reservas.get_bookings([reserva_id]).get(reserva_id)
+        if booking is None:
+            return []
+        _, hotel_id, tipo_id, arrival, departure, _ = booking
+        if hotel_id is None or tipo_id is None or departure <= arrival:
+            return []
+        if arrival < self.availability.origin:
+            return self._check_with_scan(hotel_id, tipo_id, arrival, departure)
+
+        counts = self.availability.nightly_booked(hotel_id, tipo_id, arrival, departure)
+        capacity = self.availability.inventory(hotel_id, tipo_id)
+        start = arrival.toordinal()
+        conflicts = []
+        run_start = None
+        for offset, booked in enumerate(counts + [0]):
+            if booked > capacity and run_start is None:
+                run_start = offset
+            elif booked <= capacity and run_start is not None:
+                first = date.fromordinal(start + run_start)
+                last = date.fromordinal(start + offset)
+                conflicts.append(ConflictRecord.from_row((
+                    hotel_id, tipo_id, first, date.fromordinal(start + offset - 1),
+                    max(counts[run_start:offset]), capacity,
+                    tuple(self.availability.bookings_between(hotel_id, tipo_id, first, last))
+                )))
+                run_start = None
+        return conflicts
+
+    def _check_with_scan(self, hotel_id, tipo_id, arrival, departure):
+        """
+        Igual que check_reservation() para un rango que empieza antes del índice
+
+        Las reservas del par se recortan al rango, de modo que los tramos y sus
+        reservas son los mismos que daría el índice.
+
+        Returns:
+            list: ConflictRecord del par dentro de [arrival, departure)
+        """
+        rows = self.reservas.iter_bookings(arrival, hotel_id=hotel_id, tipo_id=tipo_id,
+                                           until=departure)
+        bookings = [(reserva_id, hotel, tipo, max(start, arrival), min(end, departure), rooms)
+                    for reserva_id, hotel, tipo, start, end, rooms in rows]
+        capacity = self.availability.inventory(hotel_id, tipo_id)
+        return find_overbookings(bookings, {(hotel_id, tipo_id): capacity})
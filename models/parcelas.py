@@ -1,6 +1,14 @@
 from models.base_model import BaseModel
 from utils.exceptions import EntityNotFoundError, EntityInUseError, DatabaseOperationError
 from utils.validators import Validator
+from utils.logger import get_logger
+
+logger = get_logger('models')
+
+PARCELA_FIELDS = (
+    'ID_PARCELA', 'AREA_HECTAREAS_PARCELA', 'SISTEMA_RIEGO',
+    'HISTORIAL_DE_USO', 'ID_FINCA'
+)
 
 
 class Parcelas(BaseModel):
@@ -10,10 +18,8 @@ class Parcelas(BaseModel):
         super().__init__(db_connection)
         self.table_name = "PARCELAS"
         self.entity_name = "Parcela"
-        self.field_mapping = [
-            'ID_PARCELA', 'AREA_HECTAREAS_PARCELA', 'SISTEMA_RIEGO',
-            'HISTORIAL_DE_USO', 'ID_FINCA'
-        ]
+        self.primary_key = "ID_PARCELA"
+        self.field_mapping = PARCELA_FIELDS
 
     def create(self, area_hectareas_parcela, sistema_riego=None, historial_de_uso=None, id_finca=None):
         """
@@ -42,7 +48,9 @@ class Parcelas(BaseModel):
         try:
             results = self.call_procedure('sp_InsertParcela', parameters)
             if results and len(results) > 0:
-                return results[0][0]  # ID de la parcela creada
+                new_id = results[0][0]  # ID de la parcela creada
+                self._entity_changed(new_id)
+                return new_id
         except:
             # Fallback a consulta directa
             query = """
@@ -52,7 +60,9 @@ class Parcelas(BaseModel):
             self.db.execute_query(query, parameters)
             # Obtener el último ID insertado
             result = self.db.execute_query("SELECT @@IDENTITY")
-            return result[0][0] if result else None
+            new_id = result[0][0] if result else None
+            self._entity_changed(new_id)
+            return new_id
 
         raise DatabaseOperationError("No se pudo obtener el ID de la parcela creada")
 
@@ -124,6 +134,8 @@ class Parcelas(BaseModel):
             """
             self.db.execute_query(query, parameters)
 
+        # Después de escribir: una lectura intermedia no vuelve a cachear la fila antigua
+        self._entity_changed(validated_id)
         return True
 
     def delete(self, parcela_id):
@@ -142,7 +154,6 @@ class Parcelas(BaseModel):
 
         try:
             self.call_procedure('sp_DeleteParcela', (validated_id,))
-            return True
         except Exception as e:
             error_msg = str(e).lower()
             if "tiene cultivos asociados" in error_msg or "cultivos" in error_msg:
@@ -150,7 +161,9 @@ class Parcelas(BaseModel):
             # Fallback a consulta directa
             query = "DELETE FROM PARCELAS WHERE ID_PARCELA = ?"
             self.db.execute_query(query, (validated_id,))
-            return True
+
+        self._entity_changed(validated_id)
+        return True
 
     def get_all(self):
         """
@@ -160,25 +173,23 @@ class Parcelas(BaseModel):
             list: Lista de diccionarios con datos de parcelas
         """
         try:
-            print("🔍 Modelo Parcelas: Ejecutando get_all()...")
+            logger.debug("Modelo Parcelas: Ejecutando get_all()...")
 
             # Intentar diferentes procedimientos almacenados
             try:
                 results = self.call_procedure('sp_GetAllParcelas', ())
-                print("✅ Usando sp_GetAllParcelas")
+                logger.debug("Usando sp_GetAllParcelas")
             except Exception as e1:
                 try:
-                    print("⚠️ sp_GetAllParcelas falló, intentando sp_GetParcelas...")
+                    logger.warning("sp_GetAllParcelas falló, intentando sp_GetParcelas...")
                     results = self.call_procedure('sp_GetParcelas', ())
-                    print("✅ Usando sp_GetParcelas")
+                    logger.debug("Usando sp_GetParcelas")
                 except Exception as e2:
                     # Consulta directa como último recurso
-                    print("⚠️ Todos los procedimientos fallaron, usando consulta directa...")
+                    logger.warning("Todos los procedimientos fallaron, usando consulta directa...")
                     query = "SELECT * FROM PARCELAS"
                     results = self.db.execute_query(query)
-                    print("✅ Usando consulta directa")
-
-            print(f"📊 Modelo Parcelas: Resultados obtenidos: {len(results)} filas")
+                    logger.debug("Usando consulta directa")
 
             if results:
                 formatted_results = []
@@ -186,24 +197,23 @@ class Parcelas(BaseModel):
                     formatted_parcela = self._format_entity_data(row, self.field_mapping)
                     formatted_results.append(formatted_parcela)
 
-                print(f"✅ Modelo Parcelas: {len(formatted_results)} parcelas formateadas")
+                logger.debug("Modelo Parcelas: %s parcelas formateadas", len(formatted_results))
                 return formatted_results
             else:
-                print("⚠️ Modelo Parcelas: No se obtuvieron resultados")
+                logger.warning("Modelo Parcelas: No se obtuvieron resultados")
                 return []
 
         except Exception as e:
-            print(f"❌ Error en Modelo Parcelas get_all(): {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error en Modelo Parcelas get_all(): %s", e)
             return []
 
-    def search(self, search_term):
+    def search(self, search_term, limit=None):
         """
         Busca parcelas por término
 
         Args:
             search_term (str): Término de búsqueda
+            limit (int): Máximo de resultados (None: todos)
 
         Returns:
             list: Lista de parcelas que coinciden
@@ -223,6 +233,8 @@ class Parcelas(BaseModel):
             search_pattern = f"%{search_term}%"
             results = self.db.execute_query(query, (search_pattern, search_pattern, search_pattern, search_pattern))
 
+        if limit is not None:
+            results = results[:limit]
         return [self._format_entity_data(row, self.field_mapping) for row in results]
 
     def _validate_parcela_data(self, area_hectareas_parcela, sistema_riego, historial_de_uso, id_finca):
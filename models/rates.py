@@ -0,0 +1,276 @@
+"""
+Cálculo vectorizado del precio de estancias
+
+RateTable convierte tarifas y temporadas en tablas NumPy de una fila por
+tipo de habitación y una columna por día: para cada noche guarda el
+importe bruto (tarifa_base × factor de la temporada), el descuento y los
+impuestos, y de cada tabla su suma acumulada. El precio de una estancia es
+la resta de dos posiciones de esas sumas, así que miles de estancias se
+calculan con unas pocas operaciones sobre arrays:
+
+    table = RateTable(tarifas.get_rate_rows(), temporadas.get_season_rows())
+    prices = table.price_stays([1, 2], [date(2024, 12, 1)] * 2, [date(2024, 12, 4)] * 2)
+    prices['total']  # -> array([...]) un total por estancia
+
+Reglas de precio de cada noche:
+
+- La tarifa es la del tipo para la temporada de esa noche; si el tipo no
+  tiene tarifa para la temporada, o la noche no cae en ninguna, se usa su
+  tarifa sin temporada (id_temporada NULL) o, si no la tiene, la de menor
+  tarifa_base.
+- Dentro de una temporada el importe se multiplica por su factor. Las
+  fechas de inicio y fin están incluidas; si dos temporadas se solapan
+  manda la que empieza más tarde.
+- descuento_por_estadia e impuestos son porcentajes: el descuento se
+  aplica al importe bruto y los impuestos al importe ya descontado.
+
+RateEngine mantiene una RateTable construida desde los modelos Tarifas y
+Temporadas y la descarta cuando cualquiera de los dos escribe.
+"""
+import threading
+from datetime import date
+import numpy as np
+from utils.logger import get_logger
+
+logger = get_logger('models')
+
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()  # datetime64[D] cuenta días desde aquí
+
+PRICE_COMPONENTS = ('subtotal', 'descuento', 'impuestos', 'total')
+
+
+def to_ordinals(values):
+    """
+    Convierte fechas a ordinales de día (date.toordinal()) en un array
+
+    Args:
+        values: Lista de date, array datetime64 o array de ordinales enteros
+
+    Returns:
+        numpy.ndarray: Ordinales int64
+    """
+    array = np.asarray(values)
+    if array.dtype.kind == 'M':
+        return array.astype('datetime64[D]').astype(np.int64) + EPOCH_ORDINAL
+    if array.dtype.kind in 'iu':
+        return array.astype(np.int64)
+    return np.fromiter((value.toordinal() for value in array.ravel()), dtype=np.int64,
+                       count=array.size).reshape(array.shape)
+
+
+def _number(value):
+    return float(value) if value is not None else 0.0
+
+
+class RateTable:
+    """Precio por noche de cada tipo de habitación, indexado por día"""
+
+    def __init__(self, tarifas, temporadas):
+        """
+        Args:
+            tarifas (iterable): Tuplas (id_tipo_habitacion, id_temporada,
+                tarifa_base, impuestos, descuento_por_estadia)
+            temporadas (iterable): Tuplas (id_temporada, fecha_inicio, fecha_fin,
+                factor_multiplicador_tarifa)
+        """
+        rates = {}  # (tipo, temporada) -> (bruto, % impuestos, % descuento)
+        for tipo_id, temporada_id, base, impuestos, descuento in tarifas:
+            if tipo_id is None or base is None:
+                continue
+            rates[(tipo_id, temporada_id)] = (float(base), _number(impuestos), _number(descuento))
+
+        self.tipo_ids = np.array(sorted({tipo_id for tipo_id, _ in rates}), dtype=np.int64)
+        positions = {int(tipo_id): row for row, tipo_id in enumerate(self.tipo_ids)}
+
+        # Tarifa de las noches sin temporada: la de id_temporada NULL o la más baja
+        defaults = {}
+        for (tipo_id, temporada_id), rate in sorted(rates.items(), key=lambda item: item[1][0]):
+            if temporada_id is None or tipo_id not in defaults:
+                defaults[tipo_id] = rate
+        default = np.array([defaults[int(tipo_id)] for tipo_id in self.tipo_ids],
+                           dtype=np.float64).reshape(-1, 3)
+        self._default = self._components(default[:, 0], default[:, 1], default[:, 2])
+
+        seasons = sorted(
+            (start, end, temporada_id, _number(factor) if factor is not None else 1.0)
+            for temporada_id, start, end, factor in temporadas
+            if start is not None and end is not None and end >= start
+        )
+        self.first_day = seasons[0][0].toordinal() if seasons else 0
+        last_day = max(end.toordinal() for _, end, _, _ in seasons) + 1 if seasons else 0
+        self.days = last_day - self.first_day
+
+        # Sin temporada cada noche vale la tarifa por defecto; las temporadas se
+        # pintan encima por orden de inicio
+        tables = [np.repeat(component[:, None], self.days, axis=1) for component in self._default]
+        for start, end, temporada_id, factor in seasons:
+            season = default.copy()
+            for tipo_id, row in positions.items():
+                rate = rates.get((tipo_id, temporada_id))
+                if rate is not None:
+                    season[row] = rate
+            components = self._components(season[:, 0] * factor, season[:, 1], season[:, 2])
+            first = start.toordinal() - self.first_day
+            last = end.toordinal() - self.first_day + 1
+            for table, component in zip(tables, components):
+                table[:, first:last] = component[:, None]
+
+        # Sumas acumuladas con una columna inicial de ceros: noches [a, b) = cum[b] - cum[a]
+        self._cumulative = []
+        for table in tables:
+            cumulative = np.zeros((len(self.tipo_ids), self.days + 1), dtype=np.float64)
+            np.cumsum(table, axis=1, out=cumulative[:, 1:])
+            self._cumulative.append(cumulative)
+        self._nightly = tables
+
+    @staticmethod
+    def _components(gross, impuestos, descuento):
+        """Importe bruto, descuento e impuestos de una noche a partir de la tarifa"""
+        discount = gross * descuento / 100.0
+        tax = (gross - discount) * impuestos / 100.0
+        return gross, discount, tax
+
+    def price_stays(self, tipo_ids, arrivals, departures):
+        """
+        Calcula el precio de muchas estancias a la vez
+
+        Args:
+            tipo_ids: IDs de tipo de habitación (uno por estancia)
+            arrivals: Fechas de llegada (date, datetime64 u ordinales)
+            departures: Fechas de salida (su noche no se cobra)
+
+        Returns:
+            dict: Arrays noches, subtotal, descuento, impuestos y total, uno
+                por estancia y redondeados a 2 decimales; NaN si el tipo no
+                tiene tarifas
+
+        Raises:
+            ValueError: Si alguna salida no es posterior a su llegada
+        """
+        tipos = np.asarray(tipo_ids, dtype=np.int64)
+        start = to_ordinals(arrivals)
+        end = to_ordinals(departures)
+        nights = end - start
+        if np.any(nights <= 0):
+            raise ValueError("La fecha de salida debe ser posterior a la de llegada")
+
+        rows = np.searchsorted(self.tipo_ids, tipos)
+        rows = np.minimum(rows, max(len(self.tipo_ids) - 1, 0))
+        known = (self.tipo_ids[rows] == tipos) if len(self.tipo_ids) else np.zeros(tipos.shape, bool)
+
+        first = np.clip(start - self.first_day, 0, self.days)
+        last = np.clip(end - self.first_day, 0, self.days)
+        outside = nights - (last - first)
+
+        result = {'noches': nights}
+        amounts = []
+        for cumulative, default in zip(self._cumulative, self._default):
+            if not len(self.tipo_ids):
+                amounts.append(np.full(tipos.shape, np.nan))
+                continue
+            amount = cumulative[rows, last] - cumulative[rows, first] + outside * default[rows]
+            amounts.append(np.where(known, amount, np.nan))
+        gross, discount, tax = amounts
+        for name, values in zip(PRICE_COMPONENTS, (gross, discount, tax, gross - discount + tax)):
+            result[name] = np.round(values, 2)
+        return result
+
+    def price_stay(self, tipo_id, arrival, departure):
+        """
+        Calcula el precio de una estancia
+
+        Returns:
+            dict: noches, subtotal, descuento, impuestos y total (None si el
+                tipo no tiene tarifas)
+        """
+        prices = self.price_stays([tipo_id], [arrival], [departure])
+        quote = {'noches': int(prices['noches'][0])}
+        for name in PRICE_COMPONENTS:
+            value = float(prices[name][0])
+            quote[name] = None if np.isnan(value) else value
+        return quote
+
+    def nightly_totals(self, tipo_id, arrival, departure):
+        """
+        Precio final de cada noche de una estancia
+
+        Returns:
+            numpy.ndarray: Un total por noche (vacío si el tipo no tiene tarifas)
+        """
+        start, end = arrival.toordinal(), departure.toordinal()
+        if end <= start:
+            raise ValueError("La fecha de salida debe ser posterior a la de llegada")
+        row = int(np.searchsorted(self.tipo_ids, tipo_id))
+        if row >= len(self.tipo_ids) or self.tipo_ids[row] != tipo_id:
+            return np.empty(0)
+
+        days = np.arange(start, end) - self.first_day
+        inside = (days >= 0) & (days < self.days)
+        positions = np.clip(days, 0, max(self.days - 1, 0))
+        totals = []
+        for nightly, default in zip(self._nightly, self._default):
+            values = nightly[row, positions] if self.days else np.zeros(len(days))
+            totals.append(np.where(inside, values, default[row]))
+        gross, discount, tax = totals
+        return np.round(gross - discount + tax, 2)
+
+
+class RateEngine:
+    """RateTable construida desde los modelos Tarifas y Temporadas"""
+
+    def __init__(self, tarifas_model, temporadas_model):
+        """
+        Args:
+            tarifas_model: Instancia de Tarifas
+            temporadas_model: Instancia de Temporadas
+        """
+        self.tarifas = tarifas_model
+        self.temporadas = temporadas_model
+        self._table = None
+        self._generation = 0  # Cambia en cada invalidación
+        self._lock = threading.Lock()
+
+        tarifas_model.add_change_listener(self._tables_changed)
+        temporadas_model.add_change_listener(self._tables_changed)
+
+    def price_stays(self, tipo_ids, arrivals, departures):
+        """Ver RateTable.price_stays()"""
+        return self.table().price_stays(tipo_ids, arrivals, departures)
+
+    def price_stay(self, tipo_id, arrival, departure):
+        """Ver RateTable.price_stay()"""
+        return self.table().price_stay(tipo_id, arrival, departure)
+
+    def nightly_totals(self, tipo_id, arrival, departure):
+        """Ver RateTable.nightly_totals()"""
+        return self.table().nightly_totals(tipo_id, arrival, departure)
+
+    def invalidate(self):
+        """Descarta las tablas; se reconstruyen en el siguiente cálculo"""
+        self._generation += 1
+        self._table = None
+
+    def table(self):
+        """
+        Obtiene la RateTable vigente, construyéndola si hace falta
+
+        Returns:
+            RateTable: Tablas de precio por tipo y día
+        """
+        table = self._table
+        if table is not None:
+            return table
+        with self._lock:
+            if self._table is not None:
+                return self._table
+            generation = self._generation
+            table = RateTable(self.tarifas.get_rate_rows(), self.temporadas.get_season_rows())
+            logger.debug("Tablas de tarifas: %d tipos x %d días", len(table.tipo_ids), table.days)
+            # Si hubo una escritura mientras se leía, la tabla sirve para esta
+            # llamada pero no se guarda
+            if generation == self._generation:
+                self._table = table
+            return table
+
+    def _tables_changed(self, entity_id):
+        self.invalidate()
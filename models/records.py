@@ -0,0 +1,183 @@
+"""
+Registros compactos para las filas de las entidades
+
+record_type() genera, a partir de la lista de campos de un modelo, una
+clase respaldada por una tupla: cada fila ocupa una sola tupla con los
+valores en su tipo nativo (int, date, Decimal, timedelta...) en lugar de
+un diccionario con un texto por columna. El texto para mostrar se calcula
+solo cuando se pide (display, display_values).
+
+Los registros se leen como un diccionario de solo lectura, así que el
+código que usaba los diccionarios anteriores sigue funcionando:
+
+    HotelRecord = record_type('HotelRecord', ('ID_HOTEL', 'NOMBRE_HOTEL'))
+    hotel = HotelRecord.from_row((7, 'Casa Verde'))
+    hotel['NOMBRE_HOTEL'], hotel.get('ID_HOTEL'), dict(hotel)
+"""
+import sys
+from collections.abc import Mapping
+from functools import lru_cache
+
+
+def display_text(value):
+    """Texto de un valor para la interfaz (None se muestra vacío)"""
+    return '' if value is None else str(value)
+
+
+class Record(tuple):
+    """Fila inmutable con acceso por nombre de campo como un diccionario"""
+
+    __slots__ = ()
+    fields = ()  # Nombres de campo en el orden de las columnas
+    _positions = {}  # campo -> índice en la tupla
+
+    @classmethod
+    def from_row(cls, row):
+        """
+        Crea un registro desde una fila de la base de datos
+
+        Args:
+            row (tuple): Valores en el orden de fields; si sobran columnas se
+                ignoran y si faltan quedan en None
+
+        Returns:
+            Record: Registro con los valores nativos
+        """
+        width = len(cls.fields)
+        if len(row) != width:
+            row = tuple(row[:width]) + (None,) * (width - len(row))
+        return tuple.__new__(cls, row)
+
+    # Acceso de diccionario
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return tuple.__getitem__(self, self._positions[key])
+        return tuple.__getitem__(self, key)
+
+    def get(self, key, default=None):
+        position = self._positions.get(key)
+        if position is None:
+            return default
+        return tuple.__getitem__(self, position)
+
+    def __contains__(self, key):
+        return key in self._positions
+
+    def __iter__(self):
+        return iter(self.fields)
+
+    def keys(self):
+        return self.fields
+
+    def values(self):
+        return tuple(tuple.__iter__(self))
+
+    def items(self):
+        return tuple(zip(self.fields, tuple.__iter__(self)))
+
+    def copy(self):
+        """Los registros son inmutables: la copia es el propio registro"""
+        return self
+
+    def __eq__(self, other):
+        if isinstance(other, Record):
+            return self.fields == other.fields and tuple.__eq__(self, other)
+        if isinstance(other, Mapping):
+            return dict(self.items()) == dict(other.items())
+        return NotImplemented
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = tuple.__hash__
+
+    def __repr__(self):
+        pairs = ', '.join(f"{field}={value!r}" for field, value in self.items())
+        return f"{type(self).__name__}({pairs})"
+
+    # Texto para mostrar
+
+    def display(self, field):
+        """
+        Obtiene el texto de un campo para la interfaz
+
+        Args:
+            field (str): Nombre del campo
+
+        Returns:
+            str: Valor como texto ('' si es None o el campo no existe)
+        """
+        return display_text(self.get(field))
+
+    def display_values(self, fields=None):
+        """
+        Obtiene los textos de varios campos, p. ej. para una fila del TreeView
+
+        Args:
+            fields (tuple): Campos en el orden deseado (None: todos)
+
+        Returns:
+            tuple: Textos de los campos
+        """
+        if fields is None:
+            return tuple(map(display_text, tuple.__iter__(self)))
+        return tuple(display_text(self.get(field)) for field in fields)
+
+
+Mapping.register(Record)
+
+
+def record_type(name, fields, module=None):
+    """
+    Genera una clase de registro para una lista de campos
+
+    Args:
+        name (str): Nombre de la clase
+        fields (iterable): Nombres de campo en el orden de las columnas
+        module (str): Módulo de la clase (por defecto el que llama, como
+            namedtuple, para que los registros se puedan serializar con pickle)
+
+    Returns:
+        type: Subclase de Record
+    """
+    fields = tuple(fields)
+    if module is None:
+        module = sys._getframe(1).f_globals.get('__name__', __name__)
+    return type(name, (Record,), {
+        '__slots__': (),
+        '__module__': module,
+        'fields': fields,
+        '_positions': {field: position for position, field in enumerate(fields)}
+    })
+
+
+@lru_cache(maxsize=None)
+def record_type_for(fields):
+    """
+    Clase de registro compartida para una tupla de campos
+
+    Args:
+        fields (tuple): Nombres de campo
+
+    Returns:
+        type: Subclase de Record (la misma en cada llamada con los mismos campos)
+    """
+    return record_type('Record', fields, module=__name__)
+
+
+def display_row(entity, fields):
+    """
+    Textos de una entidad para el TreeView, sea un registro o un diccionario
+
+    Args:
+        entity: Record o dict
+        fields (tuple): Campos en el orden de las columnas
+
+    Returns:
+        tuple: Textos de los campos ('' para los vacíos o ausentes)
+    """
+    if isinstance(entity, Record):
+        return entity.display_values(fields)
+    return tuple(display_text(entity.get(field)) for field in fields)
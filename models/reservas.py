@@ -0,0 +1,323 @@
+from datetime import date
+from models.base_model import BaseModel
+from models.entity_cache import MISSING
+from models.records import record_type
+from utils.exceptions import EntityNotFoundError, DatabaseOperationError
+from utils.logger import get_logger
+from utils.validators import Validator
+
+logger = get_logger('models')
+
+# ID_HOTEL es la última columna: la añade la migración 4 (config/migrations.py)
+RESERVA_FIELDS = (
+    'ID_RESERVA', 'FECHA_CREACION', 'ID_CLIENTE', 'FECHA_LLEGADA', 'FECHA_SALIDA',
+    'NUMERO_NOCHES', 'NUMERO_HABITACIONES', 'ID_TIPO_HABITACION', 'HUESPEDES_ADULTOS',
+    'HUESPEDES_NIÑOS', 'TARIFA_APLICADA', 'DEPOSITO_RECIBIDO', 'METODO_PAGO_DEPOSITO',
+    'SOLICITUDES_ESPECIALES', 'ESTADO_RESERVA', 'ID_HOTEL'
+)
+ReservaRecord = record_type('ReservaRecord', RESERVA_FIELDS)
+
+ESTADOS_RESERVA = ('pendiente', 'confirmada', 'cancelada')
+ESTADO_CANCELADA = 'cancelada'
+
+# Columnas de una ocupación para models.availability, en el orden de OccupancyIndex.add()
+BOOKING_COLUMNS = (
+    "id_reserva, id_hotel, id_tipo_habitacion, fecha_llegada, fecha_salida, "
+    "COALESCE(numero_habitaciones, 1)"
+)
+
+
+class Reservas(BaseModel):
+    """Modelo para gestionar reservas"""
+
+    def __init__(self, db_connection):
+        super().__init__(db_connection)
+        self.table_name = "reservas"
+        self.entity_name = "Reserva"
+        self.primary_key = "id_reserva"
+        self.sortable_columns = ('fecha_llegada', 'fecha_salida')
+
+    def get_by_id(self, reserva_id):
+        """Obtiene una reserva por su ID"""
+        cached = self._cache_lookup(reserva_id)
+        if cached is not MISSING:
+            return cached
+
+        try:
+            query = "SELECT * FROM reservas WHERE id_reserva = %s"
+            results = self.db.execute_prepared(query, (reserva_id,))
+
+            if not results:
+                raise EntityNotFoundError(self.entity_name, reserva_id)
+
+            entity = self._map_reserva_data(results[0])
+            self._cache_store(reserva_id, entity)
+            return entity
+
+        except Exception:
+            raise EntityNotFoundError(self.entity_name, reserva_id)
+
+    def get_all(self):
+        """Obtiene todas las reservas"""
+        try:
+            query = "SELECT * FROM reservas ORDER BY id_reserva"
+            results = self.db.execute_query(query)
+            return [self._map_reserva_data(row) for row in results] if results else []
+
+        except Exception as e:
+            logger.error("Error obteniendo reservas: %s", e)
+            return []
+
+    def iter_all(self, batch_size=500):
+        """Recorre todas las reservas en lotes con un cursor no bufferizado"""
+        query = "SELECT * FROM reservas ORDER BY id_reserva"
+        for row in self.db.iter_query(query, batch_size=batch_size):
+            yield self._map_reserva_data(row)
+
+    def iter_bookings(self, since=None, batch_size=1000, hotel_id=None, tipo_id=None, until=None):
+        """
+        Recorre las ocupaciones de las reservas no canceladas que terminan después de una fecha
+
+        Con hotel_id la consulta usa idx_reservas_hotel_salida (id_hotel,
+        fecha_salida) en vez de recorrer las reservas de todos los hoteles.
+
+        Args:
+            since (date): Se omiten las reservas con fecha_salida anterior o
+                igual (None: todas)
+            batch_size (int): Filas pedidas al servidor en cada lote
+            hotel_id (int): Solo las reservas de este hotel (None: todos)
+            tipo_id (int): Solo las de este tipo de habitación (None: todos)
+            until (date): Se omiten las reservas que llegan ese día o después
+                (None: sin límite)
+
+        Yields:
+            tuple: (id_reserva, id_hotel, id_tipo_habitacion, fecha_llegada,
+                fecha_salida, numero_habitaciones); id_hotel puede ser None en
+                reservas antiguas sin estancia asignada
+        """
+        conditions, params = [], []
+        for condition, value in (("id_hotel = %s", hotel_id),
+                                 ("id_tipo_habitacion = %s", tipo_id),
+                                 ("fecha_salida > %s", since),
+                                 ("fecha_llegada < %s", until)):
+            if value is not None:
+                conditions.append(condition)
+                params.append(value)
+        where = ''.join(f"{condition} AND " for condition in conditions)
+        query = f"""
+            SELECT {BOOKING_COLUMNS} FROM reservas
+            WHERE {where}(estado_reserva IS NULL OR estado_reserva <> %s)
+        """
+        yield from self.db.iter_query(query, tuple(params) + (ESTADO_CANCELADA,),
+                                      batch_size=batch_size)
+
+    def get_overlapping_bookings(self, hotel_id, tipo_id, arrival, departure):
+        """
+        Obtiene las ocupaciones no canceladas de un par (hotel, tipo) en un rango
+
+        A diferencia de iter_bookings(), que lee por una conexión aparte, la
+        consulta va por la conexión del hilo: dentro de db.transaction() ve
+        lo escrito en la transacción y lo confirmado antes de su primera lectura.
+
+        Args:
+            hotel_id (int): ID del hotel
+            tipo_id (int): ID del tipo de habitación
+            arrival (date): Primera noche del rango
+            departure (date): Día de salida del rango
+
+        Returns:
+            list: Tuplas como las de iter_bookings() que ocupan alguna noche del rango
+        """
+        query = f"""
+            SELECT {BOOKING_COLUMNS} FROM reservas
+            WHERE id_hotel = %s AND id_tipo_habitacion = %s
+              AND fecha_salida > %s AND fecha_llegada < %s
+              AND (estado_reserva IS NULL OR estado_reserva <> %s)
+        """
+        results = self.db.execute_prepared(
+            query, (hotel_id, tipo_id, arrival, departure, ESTADO_CANCELADA)
+        )
+        return [tuple(row) for row in results or []]
+
+    def get_bookings(self, reserva_ids):
+        """
+        Obtiene las ocupaciones de varias reservas no canceladas en una sola consulta
+
+        Args:
+            reserva_ids (list): IDs de reserva
+
+        Returns:
+            dict: {id_reserva: tupla como las de iter_bookings()}; las reservas
+                canceladas o eliminadas no aparecen
+        """
+        if not reserva_ids:
+            return {}
+        placeholders = ', '.join(['%s'] * len(reserva_ids))
+        rows = self.db.execute_query(
+            f"SELECT {BOOKING_COLUMNS} FROM reservas WHERE id_reserva IN ({placeholders}) "
+            f"AND (estado_reserva IS NULL OR estado_reserva <> %s)",
+            tuple(reserva_ids) + (ESTADO_CANCELADA,)
+        )
+        return {row[0]: tuple(row) for row in rows or []}
+
+    INSERT_COLUMNS = (
+        "fecha_creacion, id_cliente, id_hotel, fecha_llegada, fecha_salida, numero_noches, "
+        "numero_habitaciones, id_tipo_habitacion, numero_huespedes_adultos, "
+        "numero_huespedes_niños, tarifa_aplicada, deposito_resivido, metodo_pago_deposito, "
+        "solicitudes_especiales, estado_reserva"
+    )
+
+    def create(self, form_data):
+        """Crea una nueva reserva"""
+        try:
+            params = (date.today(),) + self._build_reserva_params(form_data)
+
+            query = f"""
+                INSERT INTO reservas
+                ({self.INSERT_COLUMNS})
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            """
+
+            new_id = self.db.execute_insert(query, params)
+            self._entity_changed(new_id)
+
+            return new_id
+
+        except ValueError:
+            raise
+        except Exception as e:
+            raise DatabaseOperationError(f"Error creando reserva: {str(e)}")
+
+    def update(self, reserva_id, form_data):
+        """Actualiza una reserva existente (la fecha de creación no cambia)"""
+        try:
+            params = self._build_reserva_params(form_data) + (reserva_id,)
+
+            query = """
+                UPDATE reservas
+                SET id_cliente = %s, id_hotel = %s, fecha_llegada = %s, fecha_salida = %s,
+                    numero_noches = %s, numero_habitaciones = %s, id_tipo_habitacion = %s,
+                    numero_huespedes_adultos = %s, numero_huespedes_niños = %s,
+                    tarifa_aplicada = %s, deposito_resivido = %s,
+                    metodo_pago_deposito = %s, solicitudes_especiales = %s,
+                    estado_reserva = %s
+                WHERE id_reserva = %s
+            """
+
+            rows_affected = self.db.execute_prepared(query, params)
+            self._entity_changed(reserva_id)
+
+            if rows_affected == 0:
+                raise EntityNotFoundError(self.entity_name, reserva_id)
+
+            return True
+
+        except (EntityNotFoundError, ValueError):
+            raise
+        except Exception as e:
+            raise DatabaseOperationError(f"Error actualizando reserva: {str(e)}")
+
+    def cancel(self, reserva_id):
+        """
+        Marca una reserva como cancelada (libera sus habitaciones)
+
+        Args:
+            reserva_id (int): ID de la reserva
+
+        Returns:
+            bool: True si se canceló
+
+        Raises:
+            EntityNotFoundError: Si la reserva no existe
+        """
+        try:
+            query = "UPDATE reservas SET estado_reserva = %s WHERE id_reserva = %s"
+            rows_affected = self.db.execute_prepared(query, (ESTADO_CANCELADA, reserva_id))
+            self._entity_changed(reserva_id)
+
+            if rows_affected == 0:
+                raise EntityNotFoundError(self.entity_name, reserva_id)
+
+            return True
+
+        except EntityNotFoundError:
+            raise
+        except Exception as e:
+            raise DatabaseOperationError(f"Error cancelando reserva: {str(e)}")
+
+    def delete(self, reserva_id):
+        """Elimina una reserva"""
+        try:
+            query = "DELETE FROM reservas WHERE id_reserva = %s"
+            rows_affected = self.db.execute_prepared(query, (reserva_id,))
+            self._entity_changed(reserva_id)
+
+            if rows_affected == 0:
+                raise EntityNotFoundError(self.entity_name, reserva_id)
+
+            return True
+
+        except EntityNotFoundError:
+            raise
+        except Exception as e:
+            raise DatabaseOperationError(f"Error eliminando reserva: {str(e)}")
+
+    def _build_reserva_params(self, form_data):
+        """
+        Valida los datos de un formulario de reserva y los convierte en parámetros SQL
+
+        Args:
+            form_data (dict): Datos de la reserva con claves en mayúsculas
+
+        Returns:
+            tuple: Parámetros en el orden de INSERT_COLUMNS, sin fecha_creacion
+
+        Raises:
+            ValueError: Si falta un campo obligatorio o un valor no es válido
+        """
+        llegada = Validator.validate_date(form_data.get('FECHA_LLEGADA'), "Fecha de llegada",
+                                          allow_empty=False)
+        salida = Validator.validate_date(form_data.get('FECHA_SALIDA'), "Fecha de salida",
+                                         allow_empty=False)
+        if salida <= llegada:
+            raise ValueError("La fecha de salida debe ser posterior a la de llegada")
+
+        habitaciones_val = Validator.validate_integer(
+            form_data.get('NUMERO_HABITACIONES'), "Número de habitaciones"
+        )
+        if habitaciones_val is not None and habitaciones_val < 1:
+            raise ValueError("Número de habitaciones debe ser al menos 1")
+
+        estado_val = self._clean_field(form_data, 'ESTADO_RESERVA') or 'pendiente'
+        if estado_val not in ESTADOS_RESERVA:
+            raise ValueError(f"Estado de reserva no válido: {estado_val}")
+
+        return (
+            Validator.validate_integer(form_data.get('ID_CLIENTE'), "Cliente", allow_empty=False),
+            Validator.validate_integer(form_data.get('ID_HOTEL'), "Hotel", allow_empty=False),
+            llegada,
+            salida,
+            (salida - llegada).days,
+            habitaciones_val or 1,
+            Validator.validate_integer(form_data.get('ID_TIPO_HABITACION'), "Tipo de habitación",
+                                       allow_empty=False),
+            Validator.validate_integer(form_data.get('HUESPEDES_ADULTOS'), "Huéspedes adultos"),
+            Validator.validate_integer(form_data.get('HUESPEDES_NIÑOS'), "Huéspedes niños"),
+            self._clean_field(form_data, 'TARIFA_APLICADA'),
+            self._clean_field(form_data, 'DEPOSITO_RECIBIDO'),
+            self._clean_field(form_data, 'METODO_PAGO_DEPOSITO'),
+            self._clean_field(form_data, 'SOLICITUDES_ESPECIALES'),
+            estado_val
+        )
+
+    def _map_row(self, row):
+        """Mapea una fila de get_page() igual que get_all()"""
+        return self._map_reserva_data(row)
+
+    def _map_reserva_data(self, row):
+        """Mapea una fila de la base de datos a un ReservaRecord (valores nativos)"""
+        try:
+            return ReservaRecord.from_row(row)
+        except Exception as e:
+            logger.error("Error en mapeo de datos: %s", e)
+            return {}
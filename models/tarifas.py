@@ -0,0 +1,186 @@
+from models.base_model import BaseModel
+from models.entity_cache import MISSING
+from models.records import record_type
+from utils.exceptions import EntityNotFoundError, DatabaseOperationError
+from utils.logger import get_logger
+from utils.validators import Validator
+
+logger = get_logger('models')
+
+TARIFA_FIELDS = (
+    'ID_TARIFAS', 'ID_TIPO_HABITACION', 'ID_TEMPORADA', 'TARIFA_BASE', 'IMPUESTOS',
+    'DESCUENTO_POR_ESTADIA', 'CONDICIONES_ESPECIALES'
+)
+TarifaRecord = record_type('TarifaRecord', TARIFA_FIELDS)
+
+
+class Tarifas(BaseModel):
+    """Modelo para gestionar tarifas por tipo de habitación y temporada"""
+
+    def __init__(self, db_connection):
+        super().__init__(db_connection)
+        self.table_name = "tarifas"
+        self.entity_name = "Tarifa"
+        self.primary_key = "id_tarifas"
+
+    def get_by_id(self, tarifa_id):
+        """Obtiene una tarifa por su ID"""
+        cached = self._cache_lookup(tarifa_id)
+        if cached is not MISSING:
+            return cached
+
+        try:
+            query = "SELECT * FROM tarifas WHERE id_tarifas = %s"
+            results = self.db.execute_prepared(query, (tarifa_id,))
+
+            if not results:
+                raise EntityNotFoundError(self.entity_name, tarifa_id)
+
+            entity = self._map_tarifa_data(results[0])
+            self._cache_store(tarifa_id, entity)
+            return entity
+
+        except Exception:
+            raise EntityNotFoundError(self.entity_name, tarifa_id)
+
+    def get_all(self):
+        """Obtiene todas las tarifas"""
+        try:
+            query = "SELECT * FROM tarifas ORDER BY id_tarifas"
+            results = self.db.execute_query(query)
+            return [self._map_tarifa_data(row) for row in results] if results else []
+
+        except Exception as e:
+            logger.error("Error obteniendo tarifas: %s", e)
+            return []
+
+    def get_rate_rows(self):
+        """
+        Obtiene las tarifas en el formato de models.rates.RateTable
+
+        Returns:
+            list: Tuplas (id_tipo_habitacion, id_temporada, tarifa_base,
+                impuestos, descuento_por_estadia)
+        """
+        query = """
+            SELECT id_tipo_habitacion, id_temporada, tarifa_base, impuestos, descuento_por_estadia
+            FROM tarifas WHERE id_tipo_habitacion IS NOT NULL ORDER BY id_tarifas
+        """
+        return [tuple(row) for row in self.db.execute_query(query) or []]
+
+    INSERT_COLUMNS = (
+        "id_tipo_habitacion, id_temporada, tarifa_base, impuestos, descuento_por_estadia, "
+        "condiciones_especiales"
+    )
+
+    def create(self, form_data):
+        """Crea una nueva tarifa"""
+        try:
+            params = self._build_tarifa_params(form_data)
+
+            query = f"""
+                INSERT INTO tarifas
+                ({self.INSERT_COLUMNS})
+                VALUES (%s, %s, %s, %s, %s, %s)
+            """
+
+            new_id = self.db.execute_insert(query, params)
+            self._entity_changed(new_id)
+
+            return new_id
+
+        except ValueError:
+            raise
+        except Exception as e:
+            raise DatabaseOperationError(f"Error creando tarifa: {str(e)}")
+
+    def update(self, tarifa_id, form_data):
+        """Actualiza una tarifa existente"""
+        try:
+            params = self._build_tarifa_params(form_data) + (tarifa_id,)
+
+            query = """
+                UPDATE tarifas
+                SET id_tipo_habitacion = %s, id_temporada = %s, tarifa_base = %s,
+                    impuestos = %s, descuento_por_estadia = %s, condiciones_especiales = %s
+                WHERE id_tarifas = %s
+            """
+
+            rows_affected = self.db.execute_prepared(query, params)
+            self._entity_changed(tarifa_id)
+
+            if rows_affected == 0:
+                raise EntityNotFoundError(self.entity_name, tarifa_id)
+
+            return True
+
+        except (EntityNotFoundError, ValueError):
+            raise
+        except Exception as e:
+            raise DatabaseOperationError(f"Error actualizando tarifa: {str(e)}")
+
+    def delete(self, tarifa_id):
+        """Elimina una tarifa"""
+        try:
+            query = "DELETE FROM tarifas WHERE id_tarifas = %s"
+            rows_affected = self.db.execute_prepared(query, (tarifa_id,))
+            self._entity_changed(tarifa_id)
+
+            if rows_affected == 0:
+                raise EntityNotFoundError(self.entity_name, tarifa_id)
+
+            return True
+
+        except EntityNotFoundError:
+            raise
+        except Exception as e:
+            raise DatabaseOperationError(f"Error eliminando tarifa: {str(e)}")
+
+    def _build_tarifa_params(self, form_data):
+        """
+        Valida los datos de un formulario de tarifa y los convierte en parámetros SQL
+
+        Impuestos y descuento son porcentajes sobre la tarifa de cada noche.
+
+        Args:
+            form_data (dict): Datos de la tarifa con claves en mayúsculas
+
+        Returns:
+            tuple: Parámetros en el orden de INSERT_COLUMNS
+
+        Raises:
+            ValueError: Si falta un campo obligatorio o un valor no es válido
+        """
+        tarifa_val = Validator.validate_float(form_data.get('TARIFA_BASE'), "Tarifa base",
+                                              allow_empty=False)
+        impuestos_val = Validator.validate_float(form_data.get('IMPUESTOS'), "Impuestos")
+        descuento_val = Validator.validate_float(form_data.get('DESCUENTO_POR_ESTADIA'),
+                                                 "Descuento por estadía")
+        if tarifa_val < 0:
+            raise ValueError("Tarifa base no puede ser negativa")
+        if impuestos_val is not None and impuestos_val < 0:
+            raise ValueError("Impuestos no puede ser negativo")
+        if descuento_val is not None and not 0 <= descuento_val <= 100:
+            raise ValueError("Descuento por estadía debe estar entre 0 y 100")
+
+        return (
+            Validator.validate_integer(form_data.get('ID_TIPO_HABITACION'), "Tipo de habitación",
+                                       allow_empty=False),
+            Validator.validate_integer(form_data.get('ID_TEMPORADA'), "Temporada"),
+            tarifa_val,
+            impuestos_val,
+            descuento_val,
+            self._clean_field(form_data, 'CONDICIONES_ESPECIALES')
+        )
+
+    def _map_row(self, row):
+        """Mapea una fila de get_page() igual que get_all()"""
+        return self._map_tarifa_data(row)
+
+    def _map_tarifa_data(self, row):
+        """Mapea una fila de la base de datos a un TarifaRecord (valores nativos)"""
+        try:
+            return TarifaRecord.from_row(row)
+        except Exception as e:
+            logger.error("Error en mapeo de datos: %s", e)
+            return {}
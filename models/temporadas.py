@@ -0,0 +1,177 @@
+from models.base_model import BaseModel
+from models.entity_cache import MISSING
+from models.records import record_type
+from utils.exceptions import EntityNotFoundError, DatabaseOperationError
+from utils.logger import get_logger
+from utils.validators import Validator
+
+logger = get_logger('models')
+
+TEMPORADA_FIELDS = (
+    'ID_TEMPORADA', 'NOMBRE_TEMPORADA', 'FECHA_INICIO', 'FECHA_FIN', 'FACTOR_MULTIPLICADOR_TARIFA'
+)
+TemporadaRecord = record_type('TemporadaRecord', TEMPORADA_FIELDS)
+
+
+class Temporadas(BaseModel):
+    """Modelo para gestionar temporadas (rangos de fechas con factor de tarifa)"""
+
+    def __init__(self, db_connection):
+        super().__init__(db_connection)
+        self.table_name = "temporadas"
+        self.entity_name = "Temporada"
+        self.primary_key = "id_temporada"
+        self.sortable_columns = ('fecha_inicio', 'fecha_fin')
+
+    def get_by_id(self, temporada_id):
+        """Obtiene una temporada por su ID"""
+        cached = self._cache_lookup(temporada_id)
+        if cached is not MISSING:
+            return cached
+
+        try:
+            query = "SELECT * FROM temporadas WHERE id_temporada = %s"
+            results = self.db.execute_prepared(query, (temporada_id,))
+
+            if not results:
+                raise EntityNotFoundError(self.entity_name, temporada_id)
+
+            entity = self._map_temporada_data(results[0])
+            self._cache_store(temporada_id, entity)
+            return entity
+
+        except Exception:
+            raise EntityNotFoundError(self.entity_name, temporada_id)
+
+    def get_all(self):
+        """Obtiene todas las temporadas ordenadas por fecha de inicio"""
+        try:
+            query = "SELECT * FROM temporadas ORDER BY fecha_inicio, id_temporada"
+            results = self.db.execute_query(query)
+            return [self._map_temporada_data(row) for row in results] if results else []
+
+        except Exception as e:
+            logger.error("Error obteniendo temporadas: %s", e)
+            return []
+
+    def get_season_rows(self):
+        """
+        Obtiene las temporadas en el formato de models.rates.RateTable
+
+        Returns:
+            list: Tuplas (id_temporada, fecha_inicio, fecha_fin, factor)
+        """
+        query = """
+            SELECT id_temporada, fecha_inicio, fecha_fin, factor_multiplicador_tarifa
+            FROM temporadas ORDER BY fecha_inicio, id_temporada
+        """
+        return [tuple(row) for row in self.db.execute_query(query) or []]
+
+    INSERT_COLUMNS = "nombre_temporada, fecha_inicio, fecha_fin, factor_multiplicador_tarifa"
+
+    def create(self, form_data):
+        """Crea una nueva temporada"""
+        try:
+            params = self._build_temporada_params(form_data)
+
+            query = f"""
+                INSERT INTO temporadas
+                ({self.INSERT_COLUMNS})
+                VALUES (%s, %s, %s, %s)
+            """
+
+            new_id = self.db.execute_insert(query, params)
+            self._entity_changed(new_id)
+
+            return new_id
+
+        except ValueError:
+            raise
+        except Exception as e:
+            raise DatabaseOperationError(f"Error creando temporada: {str(e)}")
+
+    def update(self, temporada_id, form_data):
+        """Actualiza una temporada existente"""
+        try:
+            params = self._build_temporada_params(form_data) + (temporada_id,)
+
+            query = """
+                UPDATE temporadas
+                SET nombre_temporada = %s, fecha_inicio = %s, fecha_fin = %s,
+                    factor_multiplicador_tarifa = %s
+                WHERE id_temporada = %s
+            """
+
+            rows_affected = self.db.execute_prepared(query, params)
+            self._entity_changed(temporada_id)
+
+            if rows_affected == 0:
+                raise EntityNotFoundError(self.entity_name, temporada_id)
+
+            return True
+
+        except (EntityNotFoundError, ValueError):
+            raise
+        except Exception as e:
+            raise DatabaseOperationError(f"Error actualizando temporada: {str(e)}")
+
+    def delete(self, temporada_id):
+        """Elimina una temporada"""
+        try:
+            query = "DELETE FROM temporadas WHERE id_temporada = %s"
+            rows_affected = self.db.execute_prepared(query, (temporada_id,))
+            self._entity_changed(temporada_id)
+
+            if rows_affected == 0:
+                raise EntityNotFoundError(self.entity_name, temporada_id)
+
+            return True
+
+        except EntityNotFoundError:
+            raise
+        except Exception as e:
+            raise DatabaseOperationError(f"Error eliminando temporada: {str(e)}")
+
+    def _build_temporada_params(self, form_data):
+        """
+        Valida los datos de un formulario de temporada y los convierte en parámetros SQL
+
+        Args:
+            form_data (dict): Datos de la temporada con claves en mayúsculas
+
+        Returns:
+            tuple: Parámetros en el orden de INSERT_COLUMNS
+
+        Raises:
+            ValueError: Si falta un campo obligatorio o un valor no es válido
+        """
+        inicio = Validator.validate_date(form_data.get('FECHA_INICIO'), "Fecha de inicio",
+                                         allow_empty=False)
+        fin = Validator.validate_date(form_data.get('FECHA_FIN'), "Fecha de fin", allow_empty=False)
+        if fin < inicio:
+            raise ValueError("La fecha de fin no puede ser anterior a la de inicio")
+
+        factor_val = Validator.validate_integer(
+            form_data.get('FACTOR_MULTIPLICADOR_TARIFA'), "Factor multiplicador"
+        )
+        if factor_val is not None and factor_val < 0:
+            raise ValueError("Factor multiplicador no puede ser negativo")
+
+        return (
+            Validator.validate_string(form_data.get('NOMBRE_TEMPORADA'), "Nombre", max_length=20),
+            inicio,
+            fin,
+            factor_val if factor_val is not None else 1
+        )
+
+    def _map_row(self, row):
+        """Mapea una fila de get_page() igual que get_all()"""
+        return self._map_temporada_data(row)
+
+    def _map_temporada_data(self, row):
+        """Mapea una fila de la base de datos a un TemporadaRecord (valores nativos)"""
+        try:
+            return TemporadaRecord.from_row(row)
+        except Exception as e:
+            logger.error("Error en mapeo de datos: %s", e)
+            return {}
@@ -0,0 +1,47 @@
+"""
+MetricsCube.query: noches disponibles del rango pedido
+"""
+import pytest
+from models.analytics import MetricsCube
+
+
+def _month(year, month):
+    return year * 12 + month - 1
+
+
+@pytest.fixture
+def cube():
+    # 10 habitaciones y 30 noches vendidas, todas en noviembre de 2024
+    cube = MetricsCube()
+    cube.set_rooms({1: 10})
+    cube.add('noches_vendidas', [1], [_month(2024, 11)], [30])
+    return cube
+
+
+def test_requested_months_without_data_count_as_available(cube):
+    (total,) = cube.query(first_month=_month(2024, 1), last_month=_month(2024, 12), group_by=())
+
+    assert total['noches_disponibles'] == 3660
+    assert total['ocupacion'] == pytest.approx(30 / 3660)
+
+
+def test_year_grouping_covers_the_whole_requested_year(cube):
+    (row,) = cube.query(first_month=_month(2024, 1), last_month=_month(2024, 12),
+                        group_by=('year',))
+
+    assert row['periodo'] == '2024'
+    assert row['noches_disponibles'] == 3660
+
+
+def test_open_range_uses_the_months_with_data(cube):
+    (total,) = cube.query(group_by=())
+
+    assert total['noches_disponibles'] == 300
+    assert total['ocupacion'] == pytest.approx(0.1)
+
+
+def test_range_outside_the_data_has_no_sales(cube):
+    rows = cube.query(first_month=_month(2025, 1), last_month=_month(2025, 2), skip_empty=False)
+
+    assert [row['noches_vendidas'] for row in rows] == [0, 0]
+    assert [row['noches_disponibles'] for row in rows] == [310, 280]
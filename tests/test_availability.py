@@ -0,0 +1,133 @@
+"""
+Disponibilidad con reservas escritas desde otro puesto
+"""
+from contextlib import contextmanager
+from datetime import date
+import pytest
+from controllers.reservas_controller import ReservasController
+from models.availability import AvailabilityEngine
+from utils.exceptions import ValidationError
+
+TODAY = date(2025, 3, 1)
+
+
+class SharedTables:
+    """reservas y habitaciones compartidas; table_versions cuenta las escrituras de reservas"""
+
+    def __init__(self, rooms):
+        self.rooms = rooms  # {(hotel, tipo): habitaciones}
+        self.bookings = {}  # id_reserva -> tupla de iter_bookings()
+        self.version = 1
+        self.events = []
+
+    def book(self, reserva_id, hotel_id, tipo_id, arrival, departure, rooms=1):
+        self.bookings[reserva_id] = (reserva_id, hotel_id, tipo_id, arrival, departure, rooms)
+        self.version += 1
+
+
+class FakeReservas:
+    def __init__(self, tables):
+        self.tables = tables
+        self.in_transaction = False
+
+    def add_change_listener(self, listener):
+        pass
+
+    def get_change_token(self):
+        return (0, 'version', self.tables.version)
+
+    def iter_bookings(self, since=None, batch_size=1000, **filters):
+        return [booking for booking in self.tables.bookings.values() if booking[4] > since]
+
+    def get_bookings(self, reserva_ids):
+        return {reserva_id: self.tables.bookings[reserva_id]
+                for reserva_id in reserva_ids if reserva_id in self.tables.bookings}
+
+    def get_overlapping_bookings(self, hotel_id, tipo_id, arrival, departure):
+        self.tables.events.append(('read', self.in_transaction))
+        return [booking for booking in self.tables.bookings.values()
+                if booking[1:3] == (hotel_id, tipo_id)
+                and booking[4] > arrival and booking[3] < departure]
+
+    def create(self, form_data):
+        self.tables.events.append(('insert', self.in_transaction))
+        reserva_id = max(self.tables.bookings, default=0) + 1
+        self.tables.book(reserva_id, int(form_data['ID_HOTEL']), int(form_data['ID_TIPO_HABITACION']),
+                         form_data['FECHA_LLEGADA'], form_data['FECHA_SALIDA'])
+        return reserva_id
+
+    @contextmanager
+    def transaction(self):
+        self.in_transaction = True
+        try:
+            yield
+        finally:
+            self.in_transaction = False
+
+
+class FakeHabitaciones:
+    def __init__(self, tables):
+        self.tables = tables
+
+    def add_change_listener(self, listener):
+        pass
+
+    def count_inventory(self):
+        return dict(self.tables.rooms)
+
+    def lock_inventory(self, hotel_id, tipo_id):
+        self.tables.events.append(('lock', None))
+        return self.tables.rooms.get((hotel_id, tipo_id), 0)
+
+
+@pytest.fixture
+def tables():
+    return SharedTables({(1, 1): 2})
+
+
+def _form(arrival, departure):
+    return {'ID_HOTEL': '1', 'ID_TIPO_HABITACION': '1', 'NUMERO_HABITACIONES': '1',
+            'FECHA_LLEGADA': arrival, 'FECHA_SALIDA': departure}
+
+
+def test_engine_sees_bookings_from_other_workstations(tables):
+    engine = AvailabilityEngine(FakeReservas(tables), FakeHabitaciones(tables),
+                                today=lambda: TODAY)
+    assert engine.available(1, 1, date(2025, 3, 5), date(2025, 3, 7)) == 2
+
+    tables.book(10, 1, 1, date(2025, 3, 6), date(2025, 3, 8))
+
+    assert engine.available(1, 1, date(2025, 3, 5), date(2025, 3, 7)) == 1
+
+
+def test_last_room_is_checked_against_the_database_inside_the_transaction(tables):
+    reservas = FakeReservas(tables)
+    controller = ReservasController(reservas, FakeHabitaciones(tables))
+    controller.availability._today = lambda: TODAY
+    controller.get_availability(1, date(2025, 3, 5), date(2025, 3, 7))
+
+    # Otro puesto vende las dos habitaciones; el índice de este proceso no lo sabe aún
+    tables.book(10, 1, 1, date(2025, 3, 5), date(2025, 3, 8))
+    tables.book(11, 1, 1, date(2025, 3, 6), date(2025, 3, 7))
+    tables.events.clear()
+
+    with pytest.raises(ValidationError):
+        controller.create(_form(date(2025, 3, 6), date(2025, 3, 8)))
+
+    assert tables.events == [('lock', None), ('read', True)]
+
+
+def test_editing_a_booking_does_not_count_it_against_itself(tables):
+    reservas = FakeReservas(tables)
+    controller = ReservasController(reservas, FakeHabitaciones(tables))
+    tables.book(10, 1, 1, date(2025, 3, 5), date(2025, 3, 7))
+    tables.book(11, 1, 1, date(2025, 3, 5), date(2025, 3, 7))
+
+    libres = controller.availability.locked_available(1, 1, date(2025, 3, 5), date(2025, 3, 7),
+                                                      exclude=10)
+    assert libres == 1
+
+    tables.bookings.pop(11)
+    reserva_id = controller.create(_form(date(2025, 3, 5), date(2025, 3, 7)))
+    assert reserva_id == 11
+    assert tables.events[-1] == ('insert', True)
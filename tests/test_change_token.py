@@ -0,0 +1,59 @@
+"""
+BaseModel.get_change_token: table_versions y la alternativa COUNT/MAX
+"""
+import pytest
+from models.base_model import ER_NO_SUCH_TABLE
+from models.hoteles import Hoteles
+from utils.exceptions import DatabaseOperationError
+
+
+class FakeDB:
+    """Responde a las dos consultas de get_change_token"""
+
+    def __init__(self, version_rows=None, version_error=None):
+        self.version_rows = version_rows or []
+        self.version_error = version_error
+        self.queries = []
+
+    def execute_prepared(self, query, parameters=None):
+        self.queries.append(query)
+        if 'table_versions' in query:
+            if self.version_error is not None:
+                raise self.version_error
+            return self.version_rows
+        return [(3, 7)]
+
+
+def test_uses_table_versions_row():
+    model = Hoteles(FakeDB(version_rows=[(12,)]))
+
+    assert model.get_change_token() == (0, 'version', 12)
+
+
+def test_falls_back_to_aggregate_without_row():
+    model = Hoteles(FakeDB())
+
+    assert model.get_change_token() == (0, 'aggregate', 3, 7)
+
+
+def test_missing_table_switches_to_aggregate_for_good():
+    db = FakeDB(version_error=DatabaseOperationError("no existe", errno=ER_NO_SUCH_TABLE))
+    model = Hoteles(db)
+
+    assert model.get_change_token() == (0, 'aggregate', 3, 7)
+    db.version_error = None
+    model.get_change_token()
+
+    assert sum('table_versions' in query for query in db.queries) == 1
+
+
+def test_other_errors_propagate_and_keep_table_versions():
+    db = FakeDB(version_error=DatabaseOperationError("conexión perdida", errno=2013))
+    model = Hoteles(db)
+
+    with pytest.raises(DatabaseOperationError):
+        model.get_change_token()
+    db.version_error = None
+    db.version_rows = [(5,)]
+
+    assert model.get_change_token() == (0, 'version', 5)
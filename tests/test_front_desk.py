@@ -0,0 +1,59 @@
+"""
+FrontDesk: llegadas y salidas registradas desde otro puesto
+"""
+from datetime import date
+from models.check_in_out import CheckInOutRecord
+from models.front_desk import FrontDesk
+
+TODAY = date(2025, 3, 1)
+
+
+def _stay(check_id, room, arrival, departure=None):
+    return CheckInOutRecord.from_row((check_id, None, room, arrival, None, departure, None,
+                                      None, None, None, None, 1))
+
+
+class FakeCheckInOut:
+    """Tabla check_in_out compartida; la versión la suben los triggers de cualquier puesto"""
+
+    def __init__(self, stays):
+        self.stays = {stay['ID_CHECK']: stay for stay in stays}
+        self.version = 1
+        self.loads = 0
+
+    def add_change_listener(self, listener):
+        pass
+
+    def get_change_token(self):
+        return (0, 'version', self.version)
+
+    def iter_current(self, since):
+        self.loads += 1
+        return [stay for stay in self.stays.values()
+                if stay['FECHA_SALIDA'] is None or stay['FECHA_SALIDA'] >= since]
+
+    def write_from_other_workstation(self, stay):
+        self.stays[stay['ID_CHECK']] = stay
+        self.version += 1
+
+
+def test_lobby_screen_sees_check_ins_and_check_outs_from_the_desk():
+    model = FakeCheckInOut([_stay(1, 101, date(2025, 2, 27))])
+    lobby = FrontDesk(model, today=lambda: TODAY)
+    assert [stay['ID_CHECK'] for stay in lobby.in_house()] == [1]
+
+    model.write_from_other_workstation(_stay(2, 102, TODAY))
+    model.write_from_other_workstation(_stay(1, 101, date(2025, 2, 27), TODAY))
+
+    assert [stay['ID_CHECK'] for stay in lobby.arrivals()] == [2]
+    assert [stay['ID_CHECK'] for stay in lobby.departures()] == [1]
+    assert [stay['ID_CHECK'] for stay in lobby.in_house()] == [2]
+
+
+def test_index_is_not_reloaded_while_the_table_is_unchanged():
+    model = FakeCheckInOut([_stay(1, 101, TODAY)])
+    lobby = FrontDesk(model, today=lambda: TODAY)
+    lobby.arrivals()
+    lobby.in_house()
+
+    assert model.loads == 1
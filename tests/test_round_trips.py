@@ -0,0 +1,195 @@
+"""
+Presupuesto de viajes al servidor por operación CRUD (ver utils.benchmarks)
+
+Los viajes se cuentan en una conexión falsa de mysql.connector, no con el
+contador interno de DatabaseConnection: cada execute() es un viaje, más el
+PREPARE la primera vez que se ejecuta un cursor preparado; commit(),
+rollback() y start_transaction() son un viaje cada uno, y los fetch solo
+cuentan en cursores no bufferizados (los bufferizados ya tienen las filas).
+"""
+import pytest
+from config.database import DatabaseConnection
+from models.clientes import Clientes
+from models.hoteles import Hoteles
+from utils.benchmarks import (
+    ROUND_TRIP_BUDGET, SAMPLE_CLIENTE, SAMPLE_HOTEL, check_round_trip_budget,
+    measure_crud_round_trips
+)
+
+NEW_ID = 42
+
+
+class FakeServer:
+    """Registro de las llamadas que llegarían al servidor"""
+
+    def __init__(self):
+        self.calls = []
+
+    @property
+    def trips(self):
+        return len(self.calls)
+
+    def reset(self):
+        self.calls = []
+
+
+class FakeCursor:
+    def __init__(self, server, buffered=True, prepared=False):
+        self.server = server
+        self.buffered = buffered
+        self.prepared = prepared
+        self._is_prepared = False
+        self._rows = []
+        self.rowcount = 0
+        self.lastrowid = None
+        self.description = None
+
+    def execute(self, query, parameters=()):
+        if self.prepared and not self._is_prepared:
+            self.server.calls.append('prepare')
+            self._is_prepared = True
+        self.server.calls.append('execute')
+        statement = query.lstrip().upper()
+        if statement.startswith('SELECT'):
+            # Una fila con el ID pedido; el resto de columnas quedan en None
+            self._rows = [(parameters[0] if parameters else 1,) + (None,) * 15]
+            self.rowcount = len(self._rows)
+        else:
+            self._rows = []
+            self.rowcount = 1
+            self.lastrowid = NEW_ID if statement.startswith('INSERT') else None
+
+    def _fetch(self, count=None):
+        if not self.buffered:
+            self.server.calls.append('fetch')
+        rows = self._rows if count is None else self._rows[:count]
+        self._rows = self._rows[len(rows):]
+        return rows
+
+    def fetchall(self):
+        return self._fetch()
+
+    def fetchmany(self, size=1):
+        return self._fetch(size)
+
+    def fetchone(self):
+        rows = self._fetch(1)
+        return rows[0] if rows else None
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self, server):
+        self.server = server
+        self.autocommit = True
+        self.in_transaction = False
+        self.unread_result = False
+
+    def cursor(self, buffered=True, prepared=False):
+        return FakeCursor(self.server, buffered=buffered, prepared=prepared)
+
+    def is_connected(self):
+        return True
+
+    def start_transaction(self):
+        self.server.calls.append('start_transaction')
+        self.in_transaction = True
+
+    def commit(self):
+        self.server.calls.append('commit')
+        self.in_transaction = False
+
+    def rollback(self):
+        self.server.calls.append('rollback')
+        self.in_transaction = False
+
+    def consume_results(self):
+        pass
+
+    def ping(self, reconnect=False):
+        pass
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def server(mocker):
+    server = FakeServer()
+    mocker.patch('mysql.connector.connect', side_effect=lambda **config: FakeConnection(server))
+    return server
+
+
+@pytest.fixture
+def db(server):
+    connection = DatabaseConnection()
+    connection.connect()
+    yield connection
+    connection.disconnect()
+
+
+MODELS = [
+    pytest.param(Hoteles, SAMPLE_HOTEL, 'NOMBRE_HOTEL', id='hoteles'),
+    pytest.param(Clientes, SAMPLE_CLIENTE, 'APELLIDO', id='clientes')
+]
+
+
+def _crud_cycle(model, form_data, update_field, server):
+    """Ejecuta create/get_by_id/update/delete y devuelve los viajes de cada paso"""
+    updated = dict(form_data)
+    updated[update_field] = f"{form_data[update_field]} (editado)"
+    steps = (
+        ('create', lambda: model.create(form_data)),
+        ('get_by_id', lambda: model.get_by_id(NEW_ID)),
+        ('update', lambda: model.update(NEW_ID, updated)),
+        ('delete', lambda: model.delete(NEW_ID))
+    )
+    trips = {}
+    for name, step in steps:
+        server.reset()
+        step()
+        trips[name] = server.trips
+    return trips
+
+
+@pytest.mark.parametrize('model_class, form_data, update_field', MODELS)
+def test_crud_operations_fit_round_trip_budget(db, server, model_class, form_data, update_field):
+    model = model_class(db)
+    _crud_cycle(model, form_data, update_field, server)  # Prepara las sentencias
+
+    trips = _crud_cycle(model, form_data, update_field, server)
+
+    for operation, count in trips.items():
+        assert count <= ROUND_TRIP_BUDGET[operation], (operation, count, server.calls)
+
+
+@pytest.mark.parametrize('model_class, form_data, update_field', MODELS)
+def test_first_execution_only_adds_the_prepare(db, server, model_class, form_data, update_field):
+    model = model_class(db)
+
+    trips = _crud_cycle(model, form_data, update_field, server)
+
+    for operation, count in trips.items():
+        assert count <= ROUND_TRIP_BUDGET[operation] + 1, (operation, count)
+
+
+@pytest.mark.parametrize('model_class, form_data, update_field', MODELS)
+def test_internal_counter_matches_the_server(db, server, model_class, form_data, update_field):
+    # measure_crud_round_trips() usa el contador interno; debe coincidir con la conexión
+    model = model_class(db)
+    for cycle in range(2):  # En frío (con PREPARE) y con las sentencias ya preparadas
+        with db.measure_round_trips() as meter:
+            trips = _crud_cycle(model, form_data, update_field, server)
+        assert meter.count == sum(trips.values()), (cycle, trips)
+
+    counts = measure_crud_round_trips(db, model, form_data, update_field)
+    assert counts == _crud_cycle(model, form_data, update_field, server)
+    assert check_round_trip_budget(counts) == {}
+
+
+def test_budget_check_reports_excess():
+    counts = {'create': 1, 'get_by_id': 3, 'update': 1}
+
+    assert check_round_trip_budget(counts) == {'get_by_id': (3, ROUND_TRIP_BUDGET['get_by_id'])}
@@ -0,0 +1,79 @@
+"""
+Filtrado local de búsquedas: mismas reglas y mismos campos que search()
+"""
+from utils.search_index import SearchIndex
+
+
+def _index():
+    index = SearchIndex()
+    index.add(1, ["Mar Azul", "Calle 5"])
+    index.add(2, ["Marisol", "Avenida 9"])
+    index.add(3, ["Brisa Marina", "Calle 27"])
+    index.add(4, ["Hotel Sol", "Plaza Amar"])
+    return index
+
+
+def test_matches_agrees_with_search():
+    index = _index()
+    for query in ("mar", "mari", "sol", "ari", "amar", "calle mar", "xyz"):
+        found = set(index.search(query, None))
+        assert {doc_id for doc_id in range(1, 5) if index.matches(doc_id, query)} == found
+
+
+def test_longer_term_falling_back_to_substring_does_not_narrow():
+    index = SearchIndex()
+    index.add(1, ["Mar"])
+    index.add(2, ["Amaru"])
+    # "mar" encuentra por prefijo; "maru" no empieza ninguna palabra y busca dentro
+    assert index.search("mar", None) == [1]
+    assert index.search("maru", None) == [2]
+
+    assert not index.narrows("mar", "maru")
+
+
+def test_longer_prefix_narrows():
+    index = _index()
+    assert index.narrows("mar", "mari")
+    assert index.narrows("calle", "calle mar")
+    assert not index.narrows("calle mar", "calle")
+
+
+def test_unindexed_columns_are_ignored():
+    index = SearchIndex()
+    # La categoría se muestra en la lista pero no está en search_fields
+    index.add(1, ["Brisa"])
+
+    assert not index.matches(1, "cinco")
+
+
+class FakeDB:
+    """Tabla hoteles sin cambios; get_many devuelve las filas completas"""
+
+    rows = {
+        1: ('Mar Azul', 3, 'Calle 5', '600', 'mar@example.com', 2001, 0, '', None, None, 'Ana'),
+        2: ('Amaru', 4, 'Calle 9', '601', 'amaru@example.com', 2003, 0, '', None, None, 'Luis'),
+    }
+
+    def execute_prepared(self, query, parameters=None):
+        return [(1,)]  # table_versions
+
+    def iter_query(self, query, parameters=None, batch_size=500):
+        # SELECT id_hotel, nombre_hotel, direccion, correo, gerente_responsable
+        return iter([(hotel_id, row[0], row[2], row[4], row[10]) for hotel_id, row in self.rows.items()])
+
+    def execute_query(self, query, parameters=None):
+        return [(hotel_id, hotel_id) + self.rows[hotel_id] for hotel_id in parameters]
+
+
+def test_controller_narrows_only_when_the_index_allows_it():
+    from controllers.hoteles_controller import HotelesController
+    from models.hoteles import Hoteles
+
+    controller = HotelesController(Hoteles(FakeDB()))
+    results = controller.search('calle')
+    assert [hotel['ID_HOTEL'] for hotel in results] == [1, 2]
+
+    narrowed = controller.filter_search(results, 'calle az', 'calle')
+    assert [hotel['ID_HOTEL'] for hotel in narrowed] == [1]
+    # "maru" busca por subcadena y encuentra hoteles que "mar" no devolvía
+    assert controller.filter_search(controller.search('mar'), 'maru', 'mar') is None
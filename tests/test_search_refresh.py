@@ -0,0 +1,53 @@
+"""
+BaseModel.search: el índice en memoria ve los cambios hechos desde otro puesto
+"""
+from models.hoteles import Hoteles
+
+
+class FakeDB:
+    """Tabla hoteles compartida con otro puesto; table_versions cuenta sus escrituras"""
+
+    def __init__(self):
+        self.rows = {1: ('brisa marina', 'calle 27', 'brisa@example.com', 'carlos')}
+        self.version = 1
+        self.scans = 0
+
+    def execute_prepared(self, query, parameters=None):
+        if 'table_versions' in query:
+            return [(self.version,)]
+        raise AssertionError(query)
+
+    def iter_query(self, query, parameters=None, batch_size=500):
+        self.scans += 1
+        return iter([(hotel_id,) + row for hotel_id, row in self.rows.items()])
+
+    def execute_query(self, query, parameters=None):
+        # get_many(): SELECT id, hoteles.* ... WHERE id IN (...)
+        return [(hotel_id, hotel_id) for hotel_id in parameters if hotel_id in self.rows]
+
+    def write_from_other_workstation(self, hotel_id, row):
+        self.rows[hotel_id] = row
+        self.version += 1
+
+
+def _ids(results):
+    return [hotel['ID_HOTEL'] for hotel in results]
+
+
+def test_rows_added_elsewhere_become_searchable():
+    db = FakeDB()
+    hoteles = Hoteles(db)
+    assert _ids(hoteles.search('campo')) == []
+
+    db.write_from_other_workstation(2, ('campo libre', 'calle 30', 'campo@example.com', 'ana'))
+
+    assert _ids(hoteles.search('campo')) == [2]
+
+
+def test_index_is_reused_while_the_table_is_unchanged():
+    db = FakeDB()
+    hoteles = Hoteles(db)
+    hoteles.search('brisa')
+    hoteles.search('marina')
+
+    assert db.scans == 1
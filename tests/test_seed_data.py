@@ -0,0 +1,43 @@
+"""
+Datos de ejemplo de hoteel.sql frente a la migración 1 (config.migrations)
+
+La migración se niega a renumerar IDs repetidos o no positivos que otras
+tablas referencian, y main.py no arranca sin ella; los datos que trae el
+repositorio deben pasarla sin renumerar nada.
+"""
+import os
+import re
+import pytest
+from config.migrations import PRIMARY_KEYS
+
+SQL_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'hoteel.sql')
+
+_INSERT = re.compile(r"INSERT INTO `(\w+)` \(`(\w+)`[^)]*\) VALUES\n(.*?);\n", re.S)
+_FIRST_VALUE = re.compile(r"^\((NULL|-?\d+)", re.M)
+
+
+def _seed_ids():
+    """IDs de la primera columna de cada INSERT de datos: {tabla: (columna, [IDs])}"""
+    with open(SQL_PATH, encoding='utf-8') as sql_file:
+        sql = sql_file.read()
+    seeds = {}
+    for table, column, values in _INSERT.findall(sql):
+        ids = [None if value == 'NULL' else int(value) for value in _FIRST_VALUE.findall(values)]
+        seeds[table] = (column, ids)
+    return seeds
+
+
+SEEDS = _seed_ids()
+
+
+@pytest.mark.parametrize('table, column', [
+    pytest.param(table, column, id=table) for table, column in PRIMARY_KEYS if table in SEEDS
+])
+def test_seed_ids_are_unique_and_positive(table, column):
+    seed_column, ids = SEEDS[table]
+    assert seed_column == column
+
+    invalid = [entity_id for entity_id in ids if entity_id is None or entity_id < 1]
+    repeated = sorted({entity_id for entity_id in ids if ids.count(entity_id) > 1})
+
+    assert (invalid, repeated) == ([], []), table
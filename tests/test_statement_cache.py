@@ -0,0 +1,92 @@
+"""
+Cachés de sentencias preparadas frente a las conexiones que el pool descarta
+"""
+import pytest
+from mysql.connector import Error
+from config.database import DatabaseConnection
+
+
+class FakeCursor:
+    def __init__(self, connection):
+        self.connection = connection
+        self.closed = False
+        self.rowcount = 1
+        self.lastrowid = None
+
+    def execute(self, query, parameters=()):
+        pass
+
+    def fetchall(self):
+        return [(1,)]
+
+    def close(self):
+        self.closed = True
+
+
+class FakeConnection:
+    def __init__(self):
+        self.alive = True
+        self.closed = False
+        self.in_transaction = False
+        self.cursors = []
+
+    def cursor(self, buffered=True, prepared=False):
+        cursor = FakeCursor(self)
+        self.cursors.append(cursor)
+        return cursor
+
+    def ping(self, reconnect=False):
+        if not self.alive:
+            raise Error("conexión perdida")
+
+    def is_connected(self):
+        return self.alive
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def connections(mocker):
+    opened = []
+
+    def connect(**config):
+        opened.append(FakeConnection())
+        return opened[-1]
+
+    mocker.patch('mysql.connector.connect', side_effect=connect)
+    return opened
+
+
+def test_discarded_pool_connection_releases_its_statements(connections):
+    db = DatabaseConnection(pool_size=1)
+    db.execute_prepared("SELECT id_hotel FROM hoteles WHERE id_hotel = %s", (1,))
+    assert db.get_statement_cache_stats()['open_statements'] == 1
+
+    # La conexión se cae mientras está libre: el pool la descarta al prestarla
+    dead = connections[0]
+    dead.alive = False
+    db._pool.health_check_interval = 0
+    db.execute_prepared("SELECT id_hotel FROM hoteles WHERE id_hotel = %s", (1,))
+
+    assert dead.closed
+    assert all(cursor.closed for cursor in dead.cursors)
+    assert dead not in db._statement_caches
+    assert db.get_statement_cache_stats()['open_statements'] == 1
+    db.disconnect()
+
+
+def test_reconnect_releases_the_old_shared_connection(connections):
+    db = DatabaseConnection()
+    db.execute_prepared("SELECT id_hotel FROM hoteles WHERE id_hotel = %s", (1,))
+
+    old = connections[0]
+    old.alive = False
+    db.execute_prepared("SELECT id_hotel FROM hoteles WHERE id_hotel = %s", (1,))
+
+    assert old not in db._statement_caches
+    assert db.get_statement_cache_stats()['open_statements'] == 1
+    db.disconnect()
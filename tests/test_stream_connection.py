@@ -0,0 +1,91 @@
+"""
+iter_query: conexiones propias fuera del pool principal
+"""
+import pytest
+from config.database import DatabaseConnection
+
+
+class FakeCursor:
+    def __init__(self, connection, buffered):
+        self.connection = connection
+        self.buffered = buffered
+        self._rows = []
+
+    def execute(self, query, parameters=()):
+        self._rows = [(number,) for number in range(5)]
+        self.connection.unread_result = not self.buffered
+
+    def fetchmany(self, size=1):
+        rows, self._rows = self._rows[:size], self._rows[size:]
+        if not self._rows:
+            self.connection.unread_result = False
+        return rows
+
+    def fetchall(self):
+        return self.fetchmany(len(self._rows))
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self):
+        self.in_transaction = False
+        self.unread_result = False
+        self.closed = False
+
+    def cursor(self, buffered=True, prepared=False):
+        return FakeCursor(self, buffered)
+
+    def consume_results(self):
+        self.unread_result = False
+
+    def ping(self, reconnect=False):
+        pass
+
+    def is_connected(self):
+        return not self.closed
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def opened(mocker):
+    opened = []
+
+    def connect(**config):
+        opened.append(FakeConnection())
+        return opened[-1]
+
+    mocker.patch('mysql.connector.connect', side_effect=connect)
+    return opened
+
+
+def test_streams_leave_the_main_pool_alone(opened):
+    db = DatabaseConnection(pool_size=2, checkout_timeout=0, stream_pool_size=1)
+    with db.borrow():
+        first = db.iter_query("SELECT 1", batch_size=2)
+        second = db.iter_query("SELECT 2", batch_size=2)
+        assert next(first) == (0,)
+        assert next(second) == (0,)
+
+        # La otra conexión del pool principal sigue libre para otro hilo
+        assert db.pool_stats()['in_use'] == 1
+        first.close()
+        second.close()
+
+    assert db.pool_stats() == {'size': 2, 'created': 1, 'idle': 1, 'in_use': 0}
+    db.disconnect()
+
+
+def test_stream_pool_connection_is_reused_after_abandoned_iteration(opened):
+    db = DatabaseConnection(stream_pool_size=1)
+    rows = db.iter_query("SELECT 1", batch_size=2)
+    next(rows)
+    rows.close()
+
+    assert list(db.iter_query("SELECT 1")) == [(number,) for number in range(5)]
+    stream_connections = [connection for connection in opened if connection is not db.connection]
+    assert len(stream_connections) == 1
+    db.disconnect()
@@ -0,0 +1,481 @@
+"""
+Micro-benchmarks de rendimiento de la capa de datos y de las listas
+
+Se ejecutan a mano contra una base de datos real:
+
+    python -m utils.benchmarks
+"""
+import random
+import time
+
+
+def _time_calls(func, repetitions):
+    """Ejecuta func repetidas veces y devuelve el tiempo total en segundos"""
+    start = time.perf_counter()
+    for _ in range(repetitions):
+        func()
+    return time.perf_counter() - start
+
+
+def benchmark_prepared_lookups(db, query, parameters, repetitions=1000):
+    """
+    Compara consultas de texto contra sentencias preparadas reutilizadas
+
+    Args:
+        db: Instancia de DatabaseConnection
+        query (str): Consulta SELECT con marcadores %s
+        parameters (tuple): Parámetros de la consulta
+        repetitions (int): Número de ejecuciones de cada variante
+
+    Returns:
+        dict: Tiempos totales, por llamada y estadísticas de la caché
+    """
+    # Calentar ambas rutas para no medir la primera preparación ni la conexión
+    db.execute_query(query, parameters)
+    db.execute_prepared(query, parameters)
+
+    text_seconds = _time_calls(lambda: db.execute_query(query, parameters), repetitions)
+    prepared_seconds = _time_calls(lambda: db.execute_prepared(query, parameters), repetitions)
+
+    return {
+        'repetitions': repetitions,
+        'text_seconds': text_seconds,
+        'prepared_seconds': prepared_seconds,
+        'text_us_per_call': text_seconds / repetitions * 1e6,
+        'prepared_us_per_call': prepared_seconds / repetitions * 1e6,
+        'speedup': (text_seconds / prepared_seconds) if prepared_seconds else 0.0,
+        'statement_cache': db.get_statement_cache_stats()
+    }
+
+
+# Viajes al servidor permitidos por operación CRUD (con sentencias ya preparadas)
+ROUND_TRIP_BUDGET = {'create': 1, 'get_by_id': 1, 'update': 1, 'delete': 1}
+
+SAMPLE_CLIENTE = {
+    'NOMBRE': 'Benchmark', 'APELLIDO': 'Viajes', 'DOCUMENTO_IDENTIDAD': '999000111',
+    'NACIONALIDAD': 'Colombiana', 'TELEFONO': '6012345'
+}
+SAMPLE_HOTEL = {
+    'NOMBRE_HOTEL': 'Hotel Benchmark', 'DIRECCION': 'Calle 0 # 0-00', 'CATEGORIA': '3'
+}
+
+
+def measure_crud_round_trips(db, model, form_data, update_field):
+    """
+    Mide los viajes al servidor de create/get_by_id/update/delete de un modelo
+
+    Hace un ciclo completo de calentamiento (para que las sentencias queden
+    preparadas) y mide el segundo. El registro de prueba se elimina al final.
+
+    Args:
+        db: Instancia de DatabaseConnection
+        model: Modelo con create/get_by_id/update/delete
+        form_data (dict): Datos válidos para create()
+        update_field (str): Campo de form_data a modificar en update()
+
+    Returns:
+        dict: Viajes medidos por operación
+    """
+    updated_data = dict(form_data)
+    updated_data[update_field] = f"{form_data[update_field]} (editado)"
+
+    def run_cycle(measure):
+        counts = {}
+
+        def step(name, func, *args):
+            with db.measure_round_trips() as meter:
+                result = func(*args)
+            if measure:
+                counts[name] = meter.count
+            return result
+
+        entity_id = step('create', model.create, form_data)
+        step('get_by_id', model.get_by_id, entity_id)
+        step('update', model.update, entity_id, updated_data)
+        step('delete', model.delete, entity_id)
+        return counts
+
+    run_cycle(measure=False)
+    return run_cycle(measure=True)
+
+
+def check_round_trip_budget(counts, budget=None):
+    """
+    Compara los viajes medidos con el presupuesto por operación
+
+    Args:
+        counts (dict): Resultado de measure_crud_round_trips()
+        budget (dict): Presupuesto por operación; por defecto ROUND_TRIP_BUDGET
+
+    Returns:
+        dict: Operaciones que exceden el presupuesto {operación: (medido, permitido)}
+    """
+    budget = budget or ROUND_TRIP_BUDGET
+    return {
+        operation: (count, budget[operation])
+        for operation, count in counts.items()
+        if operation in budget and count > budget[operation]
+    }
+
+
+def _sample_row(index):
+    """Fila sintética con el ancho de la lista de clientes"""
+    return (
+        str(index), f"Nombre {index}", f"Apellido {index}", str(10_000_000 + index),
+        'Colombiana', '1990-01-01', f"Calle {index}", '3000000000',
+        f"cliente{index}@correo.com", '', 'Oro'
+    )
+
+
+def _changed_rows(rows, change_ratio, seed=7):
+    """
+    Copia de rows con un porcentaje de filas cambiadas
+
+    La mitad de los cambios son ediciones, un cuarto borrados y un cuarto
+    inserciones al final (IDs nuevos).
+    """
+    generator = random.Random(seed)
+    changes = max(1, int(len(rows) * change_ratio))
+    picked = generator.sample(range(len(rows)), changes)
+    edits = set(picked[:changes // 2])
+    deletions = set(picked[changes // 2:changes // 2 + changes // 4])
+
+    changed = []
+    for index, row in enumerate(rows):
+        if index in deletions:
+            continue
+        if index in edits:
+            row = row[:2] + (row[2] + ' (editado)',) + row[3:]
+        changed.append(row)
+
+    next_id = len(rows) + 1
+    for offset in range(changes - len(edits) - len(deletions)):
+        changed.append(_sample_row(next_id + offset))
+    return changed
+
+
+def benchmark_tree_refresh(row_count=50_000, change_ratio=0.01):
+    """
+    Compara el refresco completo del TreeView con la reconciliación por clave
+
+    Siempre mide diff_rows() en memoria. Si hay pantalla disponible también
+    mide, sobre un Treeview real oculto, borrar y reinsertar todas las filas
+    frente a VirtualList.reconcile().
+
+    Args:
+        row_count (int): Filas de la lista
+        change_ratio (float): Fracción de filas cambiadas entre refrescos
+
+    Returns:
+        dict: Operaciones del diff y tiempos en milisegundos
+    """
+    from views.tree_reconciler import diff_rows
+
+    rows = [_sample_row(index) for index in range(1, row_count + 1)]
+    changed = _changed_rows(rows, change_ratio)
+
+    start = time.perf_counter()
+    diff = diff_rows(rows, changed)
+    result = dict(diff.as_dict(), rows=row_count, diff_ms=(time.perf_counter() - start) * 1000.0)
+
+    try:
+        import tkinter as tk
+        from tkinter import ttk
+        from views.virtual_list import VirtualList
+        root = tk.Tk()
+    except Exception as e:
+        result['tk'] = f"omitido ({e})"
+        return result
+
+    try:
+        root.withdraw()
+        frame = tk.Frame(root)
+        frame.pack(fill="both", expand=True)
+
+        full_tree = ttk.Treeview(frame, columns=list(range(len(rows[0]))), show='headings')
+        for values in rows:
+            full_tree.insert('', 'end', values=values)
+        start = time.perf_counter()
+        full_tree.delete(*full_tree.get_children())
+        for index, values in enumerate(changed):
+            full_tree.insert('', 'end', values=values, tags=('evenrow' if index % 2 == 0 else 'oddrow',))
+        root.update_idletasks()
+        result['full_refresh_ms'] = (time.perf_counter() - start) * 1000.0
+        full_tree.destroy()
+
+        virtual_tree = ttk.Treeview(frame, columns=list(range(len(rows[0]))), show='headings')
+        virtual_tree.pack(side="left", fill="both", expand=True)
+        virtual_list = VirtualList(virtual_tree)
+        virtual_list.set_rows(rows)
+        start = time.perf_counter()
+        virtual_list.reconcile(changed)
+        root.update_idletasks()
+        result['reconcile_ms'] = (time.perf_counter() - start) * 1000.0
+    finally:
+        root.destroy()
+
+    return result
+
+
+def _legacy_cliente_dict(row):
+    """Mapeo anterior a models.records: un diccionario con un texto por columna"""
+    from models.clientes import CLIENTE_FIELDS
+    return {field: str(value) if value is not None else '' for field, value in zip(CLIENTE_FIELDS, row)}
+
+
+def benchmark_record_mapping(row_count=100_000):
+    """
+    Compara el mapeo de filas a diccionarios de textos con los registros compactos
+
+    Las filas llevan tipos nativos (int, date) como las devuelve el conector.
+
+    Args:
+        row_count (int): Filas mapeadas
+
+    Returns:
+        dict: Milisegundos de mapeo y MB retenidos por cada representación
+    """
+    import datetime
+    import gc
+    import tracemalloc
+    from models.clientes import ClienteRecord
+
+    birth = datetime.date(1990, 1, 1)
+    rows = [
+        (index, f"Nombre {index}", f"Apellido {index}", str(10_000_000 + index), 'Colombiana',
+         birth, f"Calle {index}", '3000000000', f"cliente{index}@correo.com", None, 'Oro')
+        for index in range(1, row_count + 1)
+    ]
+
+    result = {'rows': row_count}
+    for label, mapper in (('dict', _legacy_cliente_dict), ('record', ClienteRecord.from_row)):
+        gc.collect()
+        start = time.perf_counter()
+        mapped = [mapper(row) for row in rows]
+        result[f"{label} ms"] = (time.perf_counter() - start) * 1000.0
+        del mapped
+
+        gc.collect()
+        tracemalloc.start()
+        mapped = [mapper(row) for row in rows]
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        result[f"{label} MB"] = current / (1024 * 1024)
+        del mapped
+
+    result['memory saved %'] = 100.0 * (1 - result['record MB'] / result['dict MB'])
+    result['time saved %'] = 100.0 * (1 - result['record ms'] / result['dict ms'])
+    return result
+
+
+SEARCH_QUERIES = ('10000123', 'fernando gomez12', 'perez999 sofia', 'nand', 'garcia')
+
+
+def benchmark_search_index(document_count=1_000_000, queries=SEARCH_QUERIES, repetitions=20):
+    """
+    Mide la construcción y las consultas del índice de búsqueda en memoria
+
+    Args:
+        document_count (int): Clientes sintéticos indexados
+        queries (tuple): Consultas a medir
+        repetitions (int): Ejecuciones de cada consulta (se informa la mediana)
+
+    Returns:
+        dict: Segundos de construcción y milisegundos por consulta
+    """
+    from utils.search_index import SearchIndex
+
+    generator = random.Random(11)
+    names = ('fernando', 'maría', 'josé', 'ana', 'luis', 'carlos', 'sofía', 'valentina')
+    surnames = ('gómez', 'fernández', 'rodríguez', 'lópez', 'martínez', 'garcía', 'pérez')
+
+    def documents():
+        for doc_id in range(1, document_count + 1):
+            yield doc_id, (
+                generator.choice(names), f"{generator.choice(surnames)}{generator.randrange(1000)}",
+                str(10_000_000 + doc_id), f"cliente{doc_id}@correo.com",
+                f"calle {generator.randrange(200)}"
+            )
+
+    start = time.perf_counter()
+    index = SearchIndex()
+    index.bulk_load(documents())
+    result = {'documents': document_count, 'build_seconds': time.perf_counter() - start}
+
+    for query in queries:
+        timings = []
+        for _ in range(repetitions):
+            start = time.perf_counter()
+            index.search(query, 50)
+            timings.append((time.perf_counter() - start) * 1000.0)
+        timings.sort()
+        result[f"'{query}' ms"] = timings[len(timings) // 2]
+    return result
+
+
+def benchmark_rate_engine(stay_count=10_000, repetitions=5):
+    """
+    Compara el cálculo de precios vectorizado con el de una estancia cada vez
+
+    Usa tarifas de cuatro tipos de habitación y temporadas de dos años.
+
+    Args:
+        stay_count (int): Estancias candidatas por llamada
+        repetitions (int): Llamadas medidas (se informa la mediana)
+
+    Returns:
+        dict: Milisegundos por llamada de cada forma de cálculo
+    """
+    import datetime
+    import numpy as np
+    from models.rates import RateTable
+
+    tarifas = [(tipo, temporada, 100 + 50 * tipo, 8, 5 * temporada)
+               for tipo in range(1, 5) for temporada in range(1, 5)]
+    start = datetime.date(2025, 1, 1)
+    temporadas = [
+        (temporada, start + datetime.timedelta(days=90 * (temporada - 1)),
+         start + datetime.timedelta(days=90 * temporada + 10), temporada)
+        for temporada in range(1, 9)
+    ]
+    table = RateTable(tarifas, temporadas)
+
+    generator = np.random.default_rng(5)
+    tipos = generator.integers(1, 5, stay_count)
+    arrivals = generator.integers(start.toordinal(), start.toordinal() + 700, stay_count)
+    departures = arrivals + generator.integers(1, 15, stay_count)
+
+    def per_stay():
+        for tipo, arrival, departure in zip(tipos, arrivals, departures):
+            table.nightly_totals(int(tipo), datetime.date.fromordinal(int(arrival)),
+                                 datetime.date.fromordinal(int(departure))).sum()
+
+    result = {'stays': stay_count}
+    for label, run in (('per stay', per_stay),
+                       ('vectorized', lambda: table.price_stays(tipos, arrivals, departures))):
+        timings = []
+        for _ in range(repetitions):
+            began = time.perf_counter()
+            run()
+            timings.append((time.perf_counter() - began) * 1000.0)
+        timings.sort()
+        result[f"{label} ms"] = timings[len(timings) // 2]
+    return result
+
+
+def benchmark_overbooking(reservation_count=1_000_000, hotel_count=200):
+    """
+    Mide la revisión completa de sobreventa sobre reservas sintéticas
+
+    Args:
+        reservation_count (int): Reservas revisadas
+        hotel_count (int): Hoteles, con 4 tipos de habitación y 12 habitaciones por tipo
+
+    Returns:
+        dict: Segundos de la revisión y tramos con sobreventa encontrados
+    """
+    import datetime
+    from models.overbooking import find_overbookings
+
+    generator = random.Random(17)
+    start = datetime.date(2025, 1, 1)
+    bookings = []
+    for reserva_id in range(1, reservation_count + 1):
+        arrival = start + datetime.timedelta(days=generator.randrange(700))
+        departure = arrival + datetime.timedelta(days=generator.randint(1, 10))
+        bookings.append((reserva_id, generator.randint(1, hotel_count), generator.randint(1, 4),
+                         arrival, departure, 1))
+    inventory = {(hotel_id, tipo_id): 12
+                 for hotel_id in range(1, hotel_count + 1) for tipo_id in range(1, 5)}
+
+    began = time.perf_counter()
+    conflicts = find_overbookings(bookings, inventory)
+    return {
+        'reservations': reservation_count,
+        'seconds': time.perf_counter() - began,
+        'conflicts': len(conflicts)
+    }
+
+
+def benchmark_analytics_cube(segment_count=1_000_000, hotel_count=200, repetitions=20):
+    """
+    Mide la carga del cubo de indicadores y sus consultas
+
+    Args:
+        segment_count (int): Tramos (reserva, mes) sintéticos sumados al cubo
+        hotel_count (int): Hoteles, con 48 habitaciones cada uno
+        repetitions (int): Veces que se repite cada consulta
+
+    Returns:
+        dict: Segundos de la carga y milisegundos por consulta según la agrupación
+    """
+    import numpy as np
+    from models.analytics import MetricsCube
+
+    generator = np.random.default_rng(17)
+    hotels = generator.integers(1, hotel_count + 1, segment_count)
+    months = generator.integers(2024 * 12, 2027 * 12, segment_count)
+    nights = generator.integers(1, 10, segment_count)
+
+    began = time.perf_counter()
+    cube = MetricsCube()
+    cube.set_rooms({hotel_id: 48 for hotel_id in range(1, hotel_count + 1)})
+    cube.add('noches_vendidas', hotels, months, nights)
+    cube.add('ingresos_habitaciones', hotels, months, nights * 95.0)
+    result = {'segments': segment_count, 'load_seconds': time.perf_counter() - began}
+
+    for name, group_by in (('hotel_month', ('hotel', 'month')), ('hotel_year', ('hotel', 'year')),
+                           ('month', ('month',)), ('total', ())):
+        seconds = _time_calls(lambda: cube.query(group_by=group_by), repetitions)
+        result[f"{name}_ms"] = seconds * 1000 / repetitions
+    return result
+
+
+def _print_result(title, result):
+    """Muestra un resultado de benchmark en consola"""
+    print(f"\n== {title} ==")
+    for key, value in result.items():
+        if isinstance(value, float):
+            print(f"  {key}: {value:.3f}")
+        else:
+            print(f"  {key}: {value}")
+
+
+def main():
+    """Ejecuta los benchmarks de la interfaz y los de la base de datos configurada"""
+    from config.database import DatabaseConnection
+    from models.clientes import Clientes
+    from models.hoteles import Hoteles
+
+    _print_result("Refresco de lista: 50k filas, 1% de cambios", benchmark_tree_refresh())
+    _print_result("Índice de búsqueda: 1M clientes", benchmark_search_index())
+    _print_result("Mapeo de filas: 100k clientes", benchmark_record_mapping())
+    _print_result("Precio de estancias: 10k candidatas", benchmark_rate_engine())
+    _print_result("Sobreventa: 1M reservas", benchmark_overbooking())
+    _print_result("Cubo de indicadores: 1M tramos", benchmark_analytics_cube())
+
+    db = DatabaseConnection()
+    failed = False
+    try:
+        _print_result(
+            "Búsqueda por ID: texto vs. preparada",
+            benchmark_prepared_lookups(db, "SELECT * FROM clientes WHERE id_cliente = %s", (1,))
+        )
+
+        for title, model, sample, field in (
+            ("Viajes por operación: clientes", Clientes(db), SAMPLE_CLIENTE, 'APELLIDO'),
+            ("Viajes por operación: hoteles", Hoteles(db), SAMPLE_HOTEL, 'NOMBRE_HOTEL')
+        ):
+            counts = measure_crud_round_trips(db, model, sample, field)
+            _print_result(title, counts)
+            for operation, (count, allowed) in check_round_trip_budget(counts).items():
+                failed = True
+                print(f"  EXCEDE: {operation} hizo {count} viajes (máximo {allowed})")
+    finally:
+        db.disconnect()
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -15,7 +15,9 @@ class DatabaseConnectionError(NorthwindException):
 
 class DatabaseOperationError(NorthwindException):
     """Excepción para errores en operaciones de base de datos"""
-    pass
+    def __init__(self, message, errno=None):
+        self.errno = errno  # Código de error de MySQL, si lo hay (p. ej. 1146: tabla inexistente)
+        super().__init__(message)
 
 
 class ValidationError(NorthwindException):
@@ -0,0 +1,348 @@
+"""
+Exportación de listas de entidades a archivos de reporte
+
+Las filas se consumen de un iterable (p. ej. controller.iter_all(), que lee
+la tabla por lotes) y se escriben a medida que llegan, sin cargar la tabla
+ni el documento completo en memoria:
+
+    columns = (ExportColumn('ID_HOTEL', 'ID HOTEL', 10, centered=True), ...)
+    export_excel(path, controller.iter_all(), columns, 'REPORTE DE HOTELES')
+    export_pdf(path, controller.iter_all(), columns, 'REPORTE DE HOTELES')
+
+Dentro de una tarea del TaskRunner se informa el avance cada
+PROGRESS_EVERY filas y se respeta la cancelación.
+"""
+from datetime import datetime
+from decimal import Decimal
+from itertools import chain, islice
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, NamedStyle, PatternFill, Side
+from openpyxl.utils import get_column_letter
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.pdfgen.canvas import Canvas
+from utils.task_runner import current_task
+
+PROGRESS_EVERY = 500  # Filas entre avisos de avance
+
+# Geometría de los reportes PDF (puntos)
+PDF_MARGIN = 54
+PDF_TITLE_HEIGHT = 70  # Título y fecha de la primera página
+PDF_HEADER_HEIGHT = 22
+PDF_ROW_HEIGHT = 16
+PDF_FONT_SIZE = 8
+PDF_HEADER_COLOR = colors.HexColor('#2ecc71')
+PDF_STRIPE_COLOR = colors.HexColor('#f8f8f8')
+
+# Colores de los reportes (los mismos de las exportaciones anteriores)
+HEADER_COLOR = '2E8B57'
+STRIPE_COLOR = 'F0F8FF'
+SUMMARY_COLOR = 'E6E6FA'
+
+_NATIVE_TYPES = (int, float, Decimal)
+
+
+class ExportColumn:
+    """Columna de un reporte: campo de la entidad, encabezado y formato"""
+
+    __slots__ = ('field', 'header', 'width', 'centered')
+
+    def __init__(self, field, header, width=15, centered=False):
+        """
+        Args:
+            field (str): Clave del campo en la entidad
+            header (str): Texto del encabezado
+            width (int): Ancho de la columna (en caracteres)
+            centered (bool): Centrar los valores en lugar de alinearlos a la izquierda
+        """
+        self.field = field
+        self.header = header
+        self.width = width
+        self.centered = centered
+
+
+def _cell_value(value):
+    """Números tal cual (Excel los trata como números); el resto como texto"""
+    if value is None:
+        return ''
+    if isinstance(value, _NATIVE_TYPES) and not isinstance(value, bool):
+        return value
+    return str(value)
+
+
+def _cell_text(value, limit):
+    """Texto de una celda PDF recortado a los caracteres que caben en la columna"""
+    text = '' if value is None else str(value).replace('\n', ' ')
+    if len(text) > limit:
+        return text[:limit - 1] + '…'
+    return text
+
+
+def _register_styles(workbook):
+    """
+    Registra en el libro los estilos con nombre del reporte
+
+    Cada celda referencia uno de estos estilos en lugar de recibir su propia
+    fuente, relleno, borde y alineación.
+
+    Returns:
+        dict: Nombre lógico -> nombre del estilo registrado
+    """
+    side = Side(style='thin')
+    border = Border(left=side, right=side, top=side, bottom=side)
+    center = Alignment(horizontal='center', vertical='center')
+    left = Alignment(horizontal='left', vertical='center')
+    normal_font = Font(name='Arial', size=10)
+
+    styles = {
+        'title': NamedStyle('reporte_titulo', font=Font(name='Arial', size=14, bold=True), alignment=center),
+        'date': NamedStyle('reporte_fecha', font=normal_font, alignment=center),
+        'header': NamedStyle(
+            'reporte_encabezado',
+            font=Font(name='Arial', size=12, bold=True, color='FFFFFF'),
+            fill=PatternFill(start_color=HEADER_COLOR, end_color=HEADER_COLOR, fill_type='solid'),
+            border=border, alignment=center
+        ),
+        'summary': NamedStyle(
+            'reporte_resumen',
+            font=Font(name='Arial', size=11, bold=True),
+            fill=PatternFill(start_color=SUMMARY_COLOR, end_color=SUMMARY_COLOR, fill_type='solid'),
+            alignment=center
+        )
+    }
+    for striped in (False, True):
+        fill = PatternFill(start_color=STRIPE_COLOR, end_color=STRIPE_COLOR, fill_type='solid') if striped else None
+        for centered in (False, True):
+            name = f"reporte_fila{'_rayada' if striped else ''}{'_centro' if centered else ''}"
+            style = NamedStyle(name, font=normal_font, border=border, alignment=center if centered else left)
+            if fill is not None:
+                style.fill = fill
+            styles[(striped, centered)] = style
+
+    for style in styles.values():
+        workbook.add_named_style(style)
+    return {key: style.name for key, style in styles.items()}
+
+
+def export_excel(file_path, rows, columns, title, sheet_title='Datos', summary=None, total=None):
+    """
+    Escribe un reporte Excel en modo de solo escritura (streaming)
+
+    Args:
+        file_path (str): Ruta del archivo .xlsx
+        rows (iterable): Entidades (Record o dict) en el orden del reporte
+        columns (tuple): ExportColumn del reporte
+        title (str): Título de la primera fila
+        sheet_title (str): Nombre de la hoja
+        summary (str): Texto final con {count} (None: sin fila de resumen)
+        total (int): Filas esperadas, solo para informar el avance
+
+    Returns:
+        int: Filas escritas. Si es 0 no se crea el archivo.
+
+    Raises:
+        TaskCancelledError: Si la tarea en curso se cancela
+    """
+    rows = iter(rows)
+    first = next(rows, None)
+    if first is None:
+        return 0
+
+    task = current_task()
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(sheet_title)
+    styles = _register_styles(workbook)
+
+    for index, column in enumerate(columns, start=1):
+        sheet.column_dimensions[get_column_letter(index)].width = column.width
+    last_column = get_column_letter(len(columns))
+
+    def styled(value, style):
+        cell = WriteOnlyCell(sheet, value=value)
+        cell.style = style
+        return cell
+
+    sheet.merged_cells.add(f'A1:{last_column}1')
+    sheet.append([styled(title, styles['title'])])
+    sheet.merged_cells.add(f'A2:{last_column}2')
+    sheet.append([styled(f'Generado el: {datetime.now().strftime("%d/%m/%Y %H:%M:%S")}', styles['date'])])
+    sheet.append([])
+    sheet.append([styled(column.header, styles['header']) for column in columns])
+
+    row_styles = [
+        [styles[(striped, column.centered)] for column in columns]
+        for striped in (False, True)
+    ]
+    fields = [column.field for column in columns]
+
+    count = 0
+    try:
+        for entity in chain((first,), rows):
+            # Las filas de datos empiezan en la 5: las impares van rayadas
+            cell_styles = row_styles[count % 2 == 0]
+            sheet.append([
+                styled(_cell_value(entity.get(field)), style)
+                for field, style in zip(fields, cell_styles)
+            ])
+            count += 1
+            if task is not None and count % PROGRESS_EVERY == 0:
+                task.raise_if_cancelled()
+                task.report_progress(count, total)
+
+        if summary:
+            summary_row = count + 6
+            sheet.append([])
+            sheet.merged_cells.add(f'A{summary_row}:{last_column}{summary_row}')
+            sheet.append([styled(summary.format(count=count), styles['summary'])])
+
+        if task is not None:
+            task.raise_if_cancelled()
+    except BaseException:
+        # Cierra el archivo temporal de la hoja; el libro no llega a guardarse
+        sheet.close()
+        raise
+
+    workbook.save(file_path)
+    return count
+
+
+def _draw_pdf_page(canvas, top, header, chunk, columns, col_widths):
+    """
+    Dibuja un bloque de filas como tabla: encabezado, rayado, rejilla y textos
+
+    Cada capa se dibuja de una vez para todo el bloque (un rectángulo por
+    fila rayada, una sola rejilla y un objeto de texto por columna) en lugar
+    de celda a celda.
+
+    Returns:
+        float: Coordenada y del borde inferior de la tabla
+    """
+    left = PDF_MARGIN
+    width = sum(col_widths)
+    header_bottom = top - PDF_HEADER_HEIGHT
+    bottom = header_bottom - PDF_ROW_HEIGHT * len(chunk)
+    xs = [left]
+    for col_width in col_widths:
+        xs.append(xs[-1] + col_width)
+
+    canvas.setFillColor(PDF_HEADER_COLOR)
+    canvas.rect(left, header_bottom, width, PDF_HEADER_HEIGHT, stroke=0, fill=1)
+    canvas.setFillColor(PDF_STRIPE_COLOR)
+    for index in range(1, len(chunk), 2):
+        canvas.rect(left, header_bottom - PDF_ROW_HEIGHT * (index + 1), width, PDF_ROW_HEIGHT, stroke=0, fill=1)
+
+    canvas.setStrokeColor(colors.grey)
+    canvas.setLineWidth(0.5)
+    canvas.grid(xs, [top, header_bottom] + [header_bottom - PDF_ROW_HEIGHT * (index + 1)
+                                            for index in range(len(chunk))])
+
+    canvas.setFillColor(colors.whitesmoke)
+    canvas.setFont('Helvetica-Bold', 10)
+    for index, text in enumerate(header):
+        canvas.drawCentredString(xs[index] + col_widths[index] / 2, header_bottom + 7, text)
+
+    first_baseline = header_bottom - PDF_ROW_HEIGHT + (PDF_ROW_HEIGHT - PDF_FONT_SIZE) / 2 + 1
+    for index, column in enumerate(columns):
+        text = canvas.beginText()
+        text.setFont('Helvetica', PDF_FONT_SIZE, PDF_ROW_HEIGHT)
+        text.setFillColor(colors.black)
+        values = [row[index] for row in chunk]
+        if column.centered:
+            middle = xs[index] + col_widths[index] / 2
+            for position, value in enumerate(values):
+                value_width = canvas.stringWidth(value, 'Helvetica', PDF_FONT_SIZE)
+                text.setTextOrigin(middle - value_width / 2, first_baseline - PDF_ROW_HEIGHT * position)
+                text.textOut(value)
+        else:
+            text.setTextOrigin(xs[index] + 3, first_baseline)
+            text.textLines(values, trim=0)
+        canvas.drawText(text)
+    return bottom
+
+
+def export_pdf(file_path, rows, columns, title, summary=None, total=None, pagesize=A4):
+    """
+    Escribe un reporte PDF página a página
+
+    Las filas se agrupan en bloques del tamaño de una página y cada bloque se
+    dibuja directamente en el lienzo como una tabla con anchos y alturas
+    fijos (encabezado repetido en cada página), sin medir el contenido ni
+    construir flowables para todo el reporte. Los textos que no caben en su
+    columna se recortan con "…".
+
+    Args:
+        file_path (str): Ruta del archivo .pdf
+        rows (iterable): Entidades (Record o dict) en el orden del reporte
+        columns (tuple): ExportColumn del reporte; los anchos se escalan al
+            ancho útil de la página manteniendo sus proporciones
+        title (str): Título de la primera página
+        summary (str): Texto final con {count} (None: sin resumen)
+        total (int): Filas esperadas, solo para informar el avance
+        pagesize (tuple): Tamaño de página de reportlab
+
+    Returns:
+        int: Filas escritas. Si es 0 no se crea el archivo.
+
+    Raises:
+        TaskCancelledError: Si la tarea en curso se cancela
+    """
+    rows = iter(rows)
+    first = next(rows, None)
+    if first is None:
+        return 0
+
+    task = current_task()
+    page_width, page_height = pagesize
+    usable_width = page_width - 2 * PDF_MARGIN
+    scale = usable_width / sum(column.width for column in columns)
+    col_widths = [column.width * scale for column in columns]
+    # Caracteres que caben por columna (Helvetica: ~0,5 del tamaño por carácter)
+    limits = [max(2, int((width - 6) / (PDF_FONT_SIZE * 0.5))) for width in col_widths]
+    fields = [column.field for column in columns]
+    header = [column.header for column in columns]
+
+    canvas = Canvas(file_path, pagesize=pagesize, pageCompression=1)
+    canvas.setTitle(title)
+
+    top = page_height - PDF_MARGIN
+    canvas.setFillColor(colors.darkblue)
+    canvas.setFont('Helvetica-Bold', 16)
+    canvas.drawCentredString(page_width / 2, top - 16, title)
+    canvas.setFillColor(colors.black)
+    canvas.setFont('Helvetica', 10)
+    canvas.drawString(PDF_MARGIN, top - 46, f"Generado el: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}")
+    top -= PDF_TITLE_HEIGHT
+
+    pending = chain((first,), rows)
+    count = 0
+    while True:
+        capacity = max(1, int((top - PDF_MARGIN - PDF_HEADER_HEIGHT) // PDF_ROW_HEIGHT))
+        chunk = [
+            [_cell_text(entity.get(field), limit) for field, limit in zip(fields, limits)]
+            for entity in islice(pending, capacity)
+        ]
+        if not chunk:
+            break
+
+        bottom = _draw_pdf_page(canvas, top, header, chunk, columns, col_widths)
+        count += len(chunk)
+        if task is not None:
+            task.raise_if_cancelled()
+            task.report_progress(count, total)
+
+        if len(chunk) < capacity:
+            break
+        canvas.showPage()
+        top = bottom = page_height - PDF_MARGIN
+
+    if summary:
+        if bottom - 30 < PDF_MARGIN:
+            canvas.showPage()
+            bottom = page_height - PDF_MARGIN
+        canvas.setFillColor(colors.black)
+        canvas.setFont('Helvetica', 10)
+        canvas.drawString(PDF_MARGIN, bottom - 30, summary.format(count=count))
+
+    canvas.save()
+    return count
@@ -8,6 +8,9 @@ from PIL import Image, ImageTk
 import tkinter as tk
 from tkinter import filedialog, messagebox
 from utils.exceptions import FileOperationError, ImageProcessingError
+from utils.logger import get_logger
+
+logger = get_logger('views')
 
 
 class FileManager:
@@ -271,7 +274,7 @@ class ImageProcessor:
                 # Convertir para Tkinter
                 return ImageTk.PhotoImage(img)
         except Exception as e:
-            print(f"Error cargando imagen para Tkinter: {e}")
+            logger.error("Error cargando imagen para Tkinter: %s", e)
             return None
 
 
@@ -634,10 +637,10 @@ class ThemeManager:
                     if hasattr(view, 'main_frame'):
                         ThemeManager._apply_theme_to_view(view, colors)
 
-            print(f"✅ Tema cambiado a: {ThemeManager.current_theme}")
+            logger.debug("Tema cambiado a: %s", ThemeManager.current_theme)
 
         except Exception as e:
-            print(f"❌ Error aplicando tema: {e}")
+            logger.error("Error aplicando tema: %s", e)
 
     @staticmethod
     def _apply_theme_to_view(view, colors):
@@ -672,7 +675,7 @@ class ThemeManager:
             ThemeManager._update_buttons_in_frame(view.button_frame, colors)
 
         except Exception as e:
-            print(f"Error aplicando tema a vista: {e}")
+            logger.error("Error aplicando tema a vista: %s", e)
 
     @staticmethod
     def _update_labels_in_frame(frame, colors):
@@ -0,0 +1,142 @@
+"""
+Registro por niveles para la aplicación
+
+Cada área (db, models, controllers, views) tiene su propio logger hijo de
+"hoteel", con nivel y muestreo ajustables en caliente. Los mensajes usan
+formato diferido ("%s" y argumentos), así que un nivel desactivado no
+formatea nada:
+
+    logger = get_logger('db')
+    logger.debug("Consulta ejecutada en %.2f ms", elapsed)
+
+Los niveles iniciales pueden fijarse con la variable de entorno
+HOTEEL_LOG, por ejemplo: HOTEEL_LOG="db=DEBUG,views=INFO"
+"""
+import logging
+import os
+import random
+import threading
+
+ROOT_LOGGER_NAME = 'hoteel'
+AREAS = ('db', 'models', 'controllers', 'views')
+DEFAULT_LEVEL = logging.WARNING
+LOG_FORMAT = '%(asctime)s %(levelname)-7s [%(name)s] %(message)s'
+
+_configured = False
+_configure_lock = threading.Lock()
+_sampling_filters = {}
+
+
+class SamplingFilter(logging.Filter):
+    """Deja pasar solo una fracción de los mensajes por debajo de WARNING"""
+
+    def __init__(self, rate=1.0):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record):
+        if record.levelno >= logging.WARNING or self.rate >= 1.0:
+            return True
+        return random.random() < self.rate
+
+
+def configure(levels=None, stream=None):
+    """
+    Configura el manejador de consola y los niveles iniciales (solo la primera vez)
+
+    Args:
+        levels (dict): Nivel por área, por ejemplo {'db': 'DEBUG'}
+        stream: Flujo de salida; por defecto stderr
+    """
+    global _configured
+    with _configure_lock:
+        if _configured:
+            return
+        root = logging.getLogger(ROOT_LOGGER_NAME)
+        handler = logging.StreamHandler(stream)
+        handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        root.addHandler(handler)
+        root.setLevel(DEFAULT_LEVEL)
+        root.propagate = False
+        _configured = True
+
+    initial_levels = _levels_from_env()
+    initial_levels.update(levels or {})
+    for area, level in initial_levels.items():
+        set_level(area, level)
+
+
+def get_logger(area):
+    """
+    Obtiene el logger de un área
+
+    Args:
+        area (str): Área de la aplicación ('db', 'models', 'controllers', 'views')
+
+    Returns:
+        logging.Logger: Logger del área
+    """
+    configure()
+    return logging.getLogger(f"{ROOT_LOGGER_NAME}.{area}")
+
+
+def set_level(area, level):
+    """
+    Cambia el nivel de un área en tiempo de ejecución
+
+    Args:
+        area (str): Área o '*' para todas
+        level (str|int): Nivel ('DEBUG', 'INFO', ...) o constante de logging
+    """
+    if isinstance(level, str):
+        level = logging.getLevelName(level.strip().upper())
+        if not isinstance(level, int):
+            raise ValueError(f"Nivel de log desconocido: {level}")
+
+    areas = AREAS if area == '*' else (area,)
+    for name in areas:
+        get_logger(name).setLevel(level)
+
+
+def get_level(area):
+    """
+    Obtiene el nivel efectivo de un área
+
+    Returns:
+        str: Nombre del nivel
+    """
+    return logging.getLevelName(get_logger(area).getEffectiveLevel())
+
+
+def set_sampling(area, rate):
+    """
+    Registra solo una fracción de los mensajes DEBUG/INFO de un área
+
+    Args:
+        area (str): Área o '*' para todas
+        rate (float): Fracción entre 0 y 1 (1 desactiva el muestreo)
+    """
+    if not 0.0 <= rate <= 1.0:
+        raise ValueError("La tasa de muestreo debe estar entre 0 y 1")
+
+    areas = AREAS if area == '*' else (area,)
+    for name in areas:
+        sampling_filter = _sampling_filters.get(name)
+        if sampling_filter is None:
+            sampling_filter = SamplingFilter(rate)
+            _sampling_filters[name] = sampling_filter
+            get_logger(name).addFilter(sampling_filter)
+        else:
+            sampling_filter.rate = rate
+
+
+def _levels_from_env():
+    """Lee los niveles iniciales de la variable de entorno HOTEEL_LOG"""
+    levels = {}
+    for item in os.environ.get('HOTEEL_LOG', '').split(','):
+        if '=' in item:
+            area, level = item.split('=', 1)
+            levels[area.strip()] = level.strip()
+        elif item.strip():
+            levels['*'] = item.strip()
+    return levels
@@ -0,0 +1,345 @@
+"""
+Índice invertido en memoria para búsqueda de texto
+
+Los textos se normalizan (minúsculas, sin tildes) y se dividen en palabras.
+Cada término de la consulta encuentra palabras por coincidencia exacta, por
+prefijo (búsqueda binaria sobre el vocabulario ordenado) o, si ninguna
+empieza por él y tiene tres letras o más, por subcadena mediante trigramas.
+Un documento coincide si cumple todos los términos y se ordena por la
+calidad de las coincidencias.
+
+    index = SearchIndex()
+    index.add(7, ["Fernando", "Gómez", "1020304"])
+    index.search("fer gome")  # -> [7]
+"""
+import heapq
+import re
+import threading
+import unicodedata
+from bisect import bisect_left, insort
+
+_WORD = re.compile(r"[0-9a-zñ]+")
+
+# Puntuación por término según el tipo de coincidencia
+EXACT_SCORE = 3
+PREFIX_SCORE = 2
+SUBSTRING_SCORE = 1
+
+
+def fold(text):
+    """
+    Normaliza un texto para comparar: minúsculas y sin tildes (la ñ se conserva)
+
+    Args:
+        text (str): Texto original
+
+    Returns:
+        str: Texto normalizado
+    """
+    text = str(text).lower().replace('ñ', '\0')
+    decomposed = unicodedata.normalize('NFKD', text)
+    stripped = ''.join(char for char in decomposed if not unicodedata.combining(char))
+    return stripped.replace('\0', 'ñ')
+
+
+def tokenize(text):
+    """
+    Divide un texto normalizado en palabras
+
+    Args:
+        text (str): Texto original
+
+    Returns:
+        list: Palabras (letras y dígitos) sin tildes y en minúsculas
+    """
+    if text is None:
+        return []
+    return _WORD.findall(fold(text))
+
+
+def _trigrams(token):
+    return {token[index:index + 3] for index in range(len(token) - 2)}
+
+
+class SearchIndex:
+    """Índice palabra -> documentos con búsqueda por prefijo y por subcadena"""
+
+    def __init__(self):
+        self._postings = {}  # palabra -> set de IDs de documento
+        self._doc_tokens = {}  # ID -> frozenset de palabras (para quitarlo)
+        self._vocabulary = []  # palabras ordenadas, para prefijos con bisect
+        self._trigram_tokens = {}  # trigrama -> set de palabras
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._doc_tokens)
+
+    def __contains__(self, doc_id):
+        return doc_id in self._doc_tokens
+
+    def add(self, doc_id, texts):
+        """
+        Indexa (o reindexa) un documento
+
+        Args:
+            doc_id: ID del documento
+            texts (iterable): Valores de los campos a indexar
+        """
+        tokens = frozenset(token for text in texts for token in tokenize(text))
+        with self._lock:
+            if doc_id in self._doc_tokens:
+                if self._doc_tokens[doc_id] == tokens:
+                    return
+                self._remove_locked(doc_id)
+            self._doc_tokens[doc_id] = tokens
+            for token in tokens:
+                postings = self._postings.get(token)
+                if postings is None:
+                    self._postings[token] = {doc_id}
+                    self._add_token(token)
+                else:
+                    postings.add(doc_id)
+
+    def remove(self, doc_id):
+        """Quita un documento del índice si estaba"""
+        with self._lock:
+            self._remove_locked(doc_id)
+
+    def clear(self):
+        """Vacía el índice"""
+        with self._lock:
+            self._postings.clear()
+            self._doc_tokens.clear()
+            self._vocabulary.clear()
+            self._trigram_tokens.clear()
+
+    def bulk_load(self, documents):
+        """
+        Construye el índice desde cero de forma más rápida que add() uno a uno
+
+        Args:
+            documents (iterable): Pares (doc_id, textos)
+        """
+        postings = {}
+        doc_tokens = {}
+        for doc_id, texts in documents:
+            tokens = frozenset(token for text in texts for token in tokenize(text))
+            doc_tokens[doc_id] = tokens
+            for token in tokens:
+                bucket = postings.get(token)
+                if bucket is None:
+                    postings[token] = {doc_id}
+                else:
+                    bucket.add(doc_id)
+
+        trigram_tokens = {}
+        for token in postings:
+            for trigram in _trigrams(token):
+                trigram_tokens.setdefault(trigram, set()).add(token)
+
+        with self._lock:
+            self._postings = postings
+            self._doc_tokens = doc_tokens
+            self._vocabulary = sorted(postings)
+            self._trigram_tokens = trigram_tokens
+
+    def search(self, query, limit=100):
+        """
+        Busca documentos que contengan todos los términos de la consulta
+
+        El coste depende del término más selectivo: solo se recorren los
+        documentos que casan con él y el resto de términos se comprueba contra
+        las palabras de cada candidato.
+
+        Args:
+            query (str): Texto buscado
+            limit (int): Máximo de resultados (None para todos)
+
+        Returns:
+            list: IDs de documento de mayor a menor puntuación (a igual
+                puntuación, en orden de ID; los IDs deben ser comparables)
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+
+        with self._lock:
+            matches = []
+            for term in terms:
+                prefix_tokens = self._prefix_tokens(term)
+                # Dentro de la palabra solo se busca si ninguna empieza por el término
+                tokens = prefix_tokens or self._substring_tokens(term)
+                if not tokens:
+                    return []
+                size = sum(len(self._postings[token]) for token in tokens)
+                matches.append((size, term, frozenset(prefix_tokens), frozenset(tokens)))
+            matches.sort(key=lambda match: match[0])
+
+            if len(matches) == 1:
+                return self._search_single(matches[0], limit)
+
+            candidates = set()
+            for token in matches[0][3]:
+                candidates |= self._postings[token]
+
+            ranked = []
+            for doc_id in candidates:
+                doc_tokens = self._doc_tokens[doc_id]
+                total = 0
+                for _, term, prefix_tokens, tokens in matches:
+                    if doc_tokens.isdisjoint(tokens):
+                        break
+                    if term in doc_tokens:
+                        total += EXACT_SCORE
+                    elif not doc_tokens.isdisjoint(prefix_tokens):
+                        total += PREFIX_SCORE
+                    else:
+                        total += SUBSTRING_SCORE
+                else:
+                    ranked.append((-total, doc_id))
+
+        if limit is None:
+            ranked.sort()
+            return [doc_id for _, doc_id in ranked]
+        return [doc_id for _, doc_id in heapq.nsmallest(limit, ranked)]
+
+    def matches(self, doc_id, query):
+        """
+        Indica si un documento indexado cumple la consulta
+
+        Aplica las mismas reglas que search(): cada término casa con las
+        palabras del vocabulario que empiezan por él o, si no hay ninguna,
+        con las que lo contienen. Sirve para filtrar resultados ya obtenidos
+        sin repetir la búsqueda.
+
+        Args:
+            doc_id: ID del documento
+            query (str): Texto buscado
+
+        Returns:
+            bool: True si el documento aparecería en search(query, None)
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return False
+
+        with self._lock:
+            doc_tokens = self._doc_tokens.get(doc_id)
+            if doc_tokens is None:
+                return False
+            for term in terms:
+                tokens = self._prefix_tokens(term) or self._substring_tokens(term)
+                if doc_tokens.isdisjoint(tokens):
+                    return False
+        return True
+
+    def narrows(self, previous, query):
+        """
+        Indica si los resultados de query están contenidos en los de previous
+
+        Ocurre cuando cada término de previous tiene un término de query cuyas
+        palabras coincidentes son un subconjunto de las suyas. Un término más
+        largo no siempre lo cumple: "mari" puede no tener palabras que empiecen
+        por él y buscar por subcadena palabras que "mar" no encontraba.
+
+        Args:
+            previous (str): Consulta ya resuelta
+            query (str): Consulta nueva
+
+        Returns:
+            bool: True si basta con filtrar los resultados de previous
+        """
+        previous_terms = list(dict.fromkeys(tokenize(previous)))
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not previous_terms or not terms:
+            return False
+
+        with self._lock:
+            term_tokens = [frozenset(self._prefix_tokens(term) or self._substring_tokens(term))
+                           for term in terms]
+            for previous_term in previous_terms:
+                previous_tokens = set(self._prefix_tokens(previous_term)
+                                      or self._substring_tokens(previous_term))
+                if not any(tokens <= previous_tokens for tokens in term_tokens):
+                    return False
+        return True
+
+    def _search_single(self, match, limit):
+        """
+        Resultados de un único término sin puntuar documento a documento
+
+        Con un solo término la puntuación solo depende del grupo (exacta,
+        prefijo o subcadena), así que basta con recorrer los grupos en orden
+        y tomar de cada uno los IDs menores.
+        """
+        _, term, prefix_tokens, tokens = match
+        if prefix_tokens:
+            groups = ([term] if term in self._postings else [],
+                      [token for token in prefix_tokens if token != term])
+        else:
+            groups = (tokens,)
+
+        results = []
+        for group in groups:
+            docs = set()
+            for token in group:
+                docs |= self._postings[token]
+            docs.difference_update(results)
+            if limit is None:
+                results.extend(sorted(docs))
+                continue
+            results.extend(heapq.nsmallest(limit - len(results), docs))
+            if len(results) >= limit:
+                break
+        return results
+
+    def _prefix_tokens(self, term):
+        """Palabras del vocabulario que empiezan por el término (incluida la exacta)"""
+        tokens = []
+        start = bisect_left(self._vocabulary, term)
+        for position in range(start, len(self._vocabulary)):
+            token = self._vocabulary[position]
+            if not token.startswith(term):
+                break
+            tokens.append(token)
+        return tokens
+
+    def _substring_tokens(self, term):
+        """Palabras que contienen el término (de tres letras o más) en cualquier posición"""
+        if len(term) < 3:
+            return []
+        trigram_sets = [self._trigram_tokens.get(trigram) for trigram in _trigrams(term)]
+        if any(tokens is None for tokens in trigram_sets):
+            return []
+        trigram_sets.sort(key=len)
+        tokens = set(trigram_sets[0])
+        for other in trigram_sets[1:]:
+            tokens &= other
+        return [token for token in tokens if term in token]
+
+    def _add_token(self, token):
+        insort(self._vocabulary, token)
+        for trigram in _trigrams(token):
+            self._trigram_tokens.setdefault(trigram, set()).add(token)
+
+    def _remove_locked(self, doc_id):
+        tokens = self._doc_tokens.pop(doc_id, None)
+        if not tokens:
+            return
+        for token in tokens:
+            postings = self._postings.get(token)
+            if postings is None:
+                continue
+            postings.discard(doc_id)
+            if not postings:
+                del self._postings[token]
+                position = bisect_left(self._vocabulary, token)
+                if position < len(self._vocabulary) and self._vocabulary[position] == token:
+                    del self._vocabulary[position]
+                for trigram in _trigrams(token):
+                    bucket = self._trigram_tokens.get(trigram)
+                    if bucket is not None:
+                        bucket.discard(token)
+                        if not bucket:
+                            del self._trigram_tokens[trigram]
+
@@ -0,0 +1,239 @@
+"""
+Ejecución de tareas en segundo plano para las vistas Tkinter
+
+Tkinter no es seguro entre hilos: las tareas (consultas, exportaciones) se
+ejecutan en un pool de hilos y sus resultados se entregan en el hilo de la
+interfaz mediante una cola que se revisa con root.after().
+
+    runner = TaskRunner(root)
+    runner.submit(controller.get_all, key='clientes', on_success=render)
+
+Dentro de la tarea, current_task() da acceso a la cancelación cooperativa y
+al avance:
+
+    task = current_task()
+    for index, row in enumerate(rows):
+        task.raise_if_cancelled()
+        task.report_progress(index + 1, len(rows))
+"""
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from utils.logger import get_logger
+
+logger = get_logger('views')
+
+_current = threading.local()
+
+
+class TaskCancelledError(Exception):
+    """Se lanza dentro de una tarea cuando fue cancelada"""
+    pass
+
+
+def current_task():
+    """
+    Obtiene la tarea que se está ejecutando en el hilo actual
+
+    Returns:
+        TaskHandle: Tarea en curso, o None fuera de un hilo del TaskRunner
+    """
+    return getattr(_current, 'task', None)
+
+
+class TaskHandle:
+    """Referencia a una tarea enviada al TaskRunner"""
+
+    def __init__(self, runner, key, on_success, on_error, on_progress, on_finally):
+        self.runner = runner
+        self.key = key
+        self.on_success = on_success
+        self.on_error = on_error
+        self.on_progress = on_progress
+        self.on_finally = on_finally
+        self.future = None
+        self._cancelled = threading.Event()
+
+    @property
+    def cancelled(self):
+        """Indica si se pidió cancelar la tarea"""
+        return self._cancelled.is_set()
+
+    def cancel(self):
+        """
+        Cancela la tarea
+
+        Si aún no empezó no llega a ejecutarse; si está en curso su resultado se
+        descarta y la propia tarea puede detenerse antes con raise_if_cancelled().
+        """
+        self._cancelled.set()
+        if self.future is not None:
+            self.future.cancel()
+
+    def raise_if_cancelled(self):
+        """Lanza TaskCancelledError si la tarea fue cancelada (para usar dentro de la tarea)"""
+        if self.cancelled:
+            raise TaskCancelledError()
+
+    def report_progress(self, done, total=None):
+        """
+        Notifica avance a on_progress en el hilo de la interfaz
+
+        Args:
+            done (int): Unidades completadas
+            total (int): Total de unidades, si se conoce
+        """
+        if self.on_progress is not None and not self.cancelled:
+            self.runner._post(self._deliver_progress, done, total)
+
+    def _deliver_progress(self, done, total):
+        if not self.cancelled:
+            self.on_progress(done, total)
+
+
+class TaskRunner:
+    """Pool de hilos cuyos resultados se entregan en el hilo de Tkinter"""
+
+    def __init__(self, root, max_workers=4, poll_interval_ms=30):
+        """
+        Args:
+            root: Widget de Tkinter (se usa su after() para revisar la cola)
+            max_workers (int): Hilos de trabajo; no debe superar el tamaño del
+                pool de conexiones si las tareas consultan la base de datos
+            poll_interval_ms (int): Intervalo de revisión de resultados pendientes
+        """
+        self.root = root
+        self.poll_interval_ms = poll_interval_ms
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='hoteel-task')
+        self._results = queue.Queue()
+        self._by_key = {}
+        self._pending = 0
+        self._polling = False
+        self._closed = False
+
+    def submit(self, func, *args, key=None, on_success=None, on_error=None,
+               on_progress=None, on_finally=None, **kwargs):
+        """
+        Ejecuta func(*args, **kwargs) en segundo plano
+
+        Los callbacks se llaman siempre en el hilo de la interfaz. Si ya hay una
+        tarea con la misma key, se cancela y solo se entrega el resultado de la
+        más reciente (por ejemplo, varios refrescos seguidos de la misma lista).
+
+        Args:
+            func (callable): Trabajo a ejecutar (sin tocar widgets)
+            key (str): Clave de agrupación de tareas equivalentes
+            on_success (callable): Recibe el resultado
+            on_error (callable): Recibe la excepción
+            on_progress (callable): Recibe (done, total) desde report_progress()
+            on_finally (callable): Se llama siempre al terminar, incluso con error o
+                cancelación (para ocultar indicadores de carga)
+
+        Returns:
+            TaskHandle: Referencia para cancelar la tarea
+        """
+        if self._closed:
+            raise RuntimeError("El ejecutor de tareas está cerrado")
+
+        if key is not None:
+            previous = self._by_key.get(key)
+            if previous is not None:
+                previous.cancel()
+
+        handle = TaskHandle(self, key, on_success, on_error, on_progress, on_finally)
+        if key is not None:
+            self._by_key[key] = handle
+
+        self._pending += 1
+        handle.future = self._executor.submit(self._run, handle, func, args, kwargs)
+        # Una tarea cancelada antes de empezar no pasa por _run
+        handle.future.add_done_callback(
+            lambda future: future.cancelled() and self._post(self._finish, handle, None, None)
+        )
+        self._ensure_polling()
+        return handle
+
+    def cancel(self, key):
+        """
+        Cancela la tarea vigente de una clave
+
+        Args:
+            key (str): Clave usada en submit()
+        """
+        handle = self._by_key.get(key)
+        if handle is not None:
+            handle.cancel()
+
+    def shutdown(self):
+        """Cancela todo lo pendiente y libera los hilos sin esperar a las tareas en curso"""
+        self._closed = True
+        for handle in list(self._by_key.values()):
+            handle.cancel()
+        self._by_key.clear()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, handle, func, args, kwargs):
+        """Cuerpo ejecutado en el hilo de trabajo"""
+        if handle.cancelled:
+            self._post(self._finish, handle, None, None)
+            return
+
+        _current.task = handle
+        try:
+            result = func(*args, **kwargs)
+            error = None
+        except TaskCancelledError:
+            result, error = None, None
+        except Exception as e:
+            result, error = None, e
+        finally:
+            _current.task = None
+
+        self._post(self._finish, handle, result, error)
+
+    def _finish(self, handle, result, error):
+        """Entrega el resultado de una tarea en el hilo de la interfaz"""
+        self._pending -= 1
+        if handle.key is not None and self._by_key.get(handle.key) is handle:
+            del self._by_key[handle.key]
+
+        try:
+            if handle.cancelled:
+                return
+            if error is not None:
+                if handle.on_error is not None:
+                    handle.on_error(error)
+                else:
+                    logger.error("Error en tarea en segundo plano: %s", error)
+            elif handle.on_success is not None:
+                handle.on_success(result)
+        finally:
+            if handle.on_finally is not None:
+                handle.on_finally()
+
+    def _post(self, callback, *args):
+        """Encola una llamada para el hilo de la interfaz"""
+        self._results.put((callback, args))
+
+    def _ensure_polling(self):
+        """Programa la revisión de la cola si no está ya programada"""
+        if not self._polling:
+            self._polling = True
+            self.root.after(self.poll_interval_ms, self._poll)
+
+    def _poll(self):
+        """Procesa los resultados pendientes y se reprograma mientras haya tareas"""
+        while True:
+            try:
+                callback, args = self._results.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                callback(*args)
+            except Exception as e:
+                logger.exception("Error entregando resultado de tarea: %s", e)
+
+        if (self._pending > 0 or not self._results.empty()) and not self._closed:
+            self.root.after(self.poll_interval_ms, self._poll)
+        else:
+            self._polling = False
@@ -2,7 +2,12 @@
 Módulo de validaciones para la aplicación
 """
 import re
-from datetime import datetime
+from datetime import date, datetime, time, timedelta
+
+# HH[:MM[:SS]] con am/pm opcional ('10:00am', '6:00 p.m.', '18:30')
+_TIME_PATTERN = re.compile(
+    r'^\s*(\d{1,2})(?::(\d{2}))?(?::(\d{2}))?\s*(?:([ap])\.?\s*m\.?)?\s*$', re.IGNORECASE
+)
 
 
 class Validator:
@@ -86,6 +91,62 @@ class Validator:
         except (ValueError, TypeError):
             raise ValueError(f"{field_name} debe ser un número válido")
 
+    @staticmethod
+    def validate_date(value, field_name, allow_empty=True):
+        """
+        Valida una fecha en formato AAAA-MM-DD (o un objeto date)
+        """
+        if value is None or (isinstance(value, str) and not value.strip()):
+            if allow_empty:
+                return None
+            else:
+                raise ValueError(f"{field_name} es requerido")
+
+        if isinstance(value, datetime):
+            return value.date()
+        if isinstance(value, date):
+            return value
+
+        try:
+            return datetime.strptime(str(value).strip(), '%Y-%m-%d').date()
+        except ValueError:
+            raise ValueError(f"{field_name} debe ser una fecha válida (AAAA-MM-DD)")
+
+    @staticmethod
+    def validate_time(value, field_name, allow_empty=True):
+        """
+        Valida una hora: objeto time, timedelta (columnas TIME de MySQL) o texto
+        como '18:30', '6:00pm', '7am' o '10:00 a.m.'
+        """
+        if value is None or (isinstance(value, str) and not value.strip()):
+            if allow_empty:
+                return None
+            else:
+                raise ValueError(f"{field_name} es requerido")
+
+        if isinstance(value, datetime):
+            return value.time()
+        if isinstance(value, time):
+            return value
+        if isinstance(value, timedelta):
+            seconds = int(value.total_seconds())
+            if 0 <= seconds < 24 * 3600:
+                return time(seconds // 3600, seconds // 60 % 60, seconds % 60)
+            raise ValueError(f"{field_name} debe ser una hora válida (HH:MM)")
+
+        match = _TIME_PATTERN.match(str(value))
+        if match:
+            hour, minute, second, meridiem = match.groups()
+            hour, minute, second = int(hour), int(minute or 0), int(second or 0)
+            if meridiem:
+                if not 1 <= hour <= 12:
+                    hour = -1
+                else:
+                    hour = hour % 12 + (12 if meridiem.lower() == 'p' else 0)
+            if 0 <= hour < 24 and minute < 60 and second < 60:
+                return time(hour, minute, second)
+        raise ValueError(f"{field_name} debe ser una hora válida (HH:MM)")
+
     @staticmethod
     def validate_string_length(value, field_name, min_length=None, max_length=None, allow_empty=True):
         """
@@ -2,33 +2,65 @@
 Clase base para todas las vistas de la aplicación Northwind
 """
 import tkinter as tk
+from collections import OrderedDict
 from tkinter import ttk
 from abc import ABC, abstractmethod
 from utils.helpers import UIHelpers
+from utils.task_runner import TaskRunner
+from utils.exporters import export_excel, export_pdf
+from views.virtual_list import VirtualList
 from utils.exceptions import ValidationError, DatabaseOperationError
+from utils.logger import get_logger
+from utils.search_index import tokenize
+
+logger = get_logger('views')
 
 
 class BaseView(ABC):
     """Clase abstracta base para todas las vistas"""
 
-    def __init__(self, parent_frame, controller):
+    page_size = 200  # Filas pedidas por página al desplazarse por la lista
+    page_order_by = None  # Columna de ordenación de get_page (None: clave primaria)
+    search_delay_ms = 300  # Espera tras la última tecla antes de buscar
+    search_limit = 200  # Resultados pedidos por búsqueda
+    search_cache_size = 32  # Búsquedas recientes guardadas por término
+    export_columns = ()  # ExportColumn de los reportes (utils.exporters)
+    export_title = ""  # Título de los reportes
+    export_summary = None  # Texto final de los reportes, con {count}
+    pdf_columns = ()  # ExportColumn del reporte PDF (menos columnas que el Excel)
+    export_batch_size = 1000  # Filas leídas por lote al exportar
+
+    def __init__(self, parent_frame, controller, task_runner=None):
         """
         Inicializa la vista base
 
         Args:
             parent_frame: Frame padre donde se colocará esta vista
             controller: Controlador asociado a esta vista
+            task_runner (TaskRunner): Ejecutor compartido de tareas en segundo
+                plano; si es None la vista crea uno propio al necesitarlo
         """
         self.parent_frame = parent_frame
         self.controller = controller
+        self.task_runner = task_runner
+        self.loading_label = None
+        self._loading_count = 0
+        self._next_after = None
+        self._has_more = False
+        self._loading_page = False
+        self._list_token = None  # Marca de cambios de la tabla en la última carga
+        self.search_entry = None
+        self._search_after_id = None
+        self._search_cache = OrderedDict()  # término normalizado -> (resultados, completos)
+        self._showing_search = False
         self.main_frame = None
         self.form_frame = None
         self.list_frame = None
         self.form_fields = {}
         self.tree = None
+        self.virtual_list = None
         self.entity_name = ""  # Debe ser definido por cada vista hija, esto es para qye se muestre en los mensajes
 
-
         self._setup_ui()
         self._bind_events()
 
@@ -86,6 +118,15 @@ class BaseView(ABC):
         )
         list_title.pack(pady=10)
 
+        # Filtro de la lista (búsqueda mientras se escribe)
+        search_frame = tk.Frame(self.right_frame)
+        search_frame.pack(fill="x", padx=10)
+        tk.Label(search_frame, text="Buscar:", font=("Arial", 10)).pack(side="left")
+        self.search_entry = tk.Entry(search_frame, font=("Arial", 11), relief="solid", bd=1)
+        self.search_entry.pack(side="left", fill="x", expand=True, padx=(5, 0))
+        self.form_fields['search'] = self.search_entry
+        self.setup_search_functionality('search')
+
         # Frame para el TreeView y scrollbar
         tree_frame = tk.Frame(self.right_frame)
         tree_frame.pack(fill="both", expand=True, padx=10, pady=10)
@@ -93,13 +134,11 @@ class BaseView(ABC):
         # Crear TreeView PRIMERO (esto establece self.tree)
         self._create_treeview(tree_frame)
 
-        # SOLO crear scrollbar si self.tree existe
+        # La lista virtual sustituye la scrollbar y solo crea las filas visibles
         if hasattr(self, 'tree') and self.tree is not None:
-            scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=self.tree.yview)
-            self.tree.configure(yscrollcommand=scrollbar.set)
-            scrollbar.pack(side="right", fill="y")
+            self.virtual_list = VirtualList(self.tree, on_near_end=self._load_next_page)
         else:
-            print(f"Advertencia: {self.entity_name} no creó un TreeView")
+            logger.warning("Advertencia: %s no creó un TreeView", self.entity_name)
     def _create_buttons(self):
         """Crea los botones de acción"""
         buttons_config = [
@@ -253,6 +292,9 @@ class BaseView(ABC):
     def _clear_form(self):
         """Limpia todos los campos del formulario"""
         for field_name, field_widget in self.form_fields.items():
+            if field_name == 'search':
+                # El filtro de la lista no es parte del formulario
+                continue
             if isinstance(field_widget, tk.Entry):
                 field_widget.delete(0, tk.END)
             elif isinstance(field_widget, tk.Text):
@@ -261,19 +303,282 @@ class BaseView(ABC):
                 field_widget.set("")
 
     def _refresh_list(self):
-        """Actualiza la lista de entidades"""
-        try:
-            # Limpiar TreeView
-            for item in self.tree.get_children():
-                self.tree.delete(item)
-
-            # Cargar datos
-            entities = self.controller.get_all()
-            for entity in entities:
-                values = self._entity_to_tree_values(entity)
-                self.tree.insert('', 'end', values=values)
-        except Exception as e:
-            UIHelpers.show_error_message("Error", f"Error cargando lista: {str(e)}")
+        """
+        Actualiza la lista de entidades sin bloquear la interfaz
+
+        Se vuelven a pedir tantas filas como hay cargadas (al menos una página);
+        las siguientes se cargan al desplazarse hasta el final de la lista. El
+        resultado se compara por clave con lo mostrado y solo se aplican las
+        diferencias. La consulta corre en segundo plano y varios refrescos
+        seguidos se agrupan en uno solo. Si hay un filtro escrito, se repite la
+        búsqueda en lugar de cargar la lista completa.
+        """
+        self._search_cache.clear()
+        if self._search_term():
+            self._on_search_changed()
+            return
+
+        self.cancel_task('next_page')
+        self._loading_page = False
+        self.run_task(
+            self._fetch_if_changed, None, self._loaded_row_limit(),
+            key='refresh_list',
+            on_success=self._on_first_page,
+            on_error=lambda e: UIHelpers.show_error_message("Error", f"Error cargando lista: {str(e)}"),
+            message="Cargando..."
+        )
+
+    def refresh_if_changed(self):
+        """
+        Recarga la lista solo si la tabla cambió desde la última carga
+
+        La comprobación (una consulta de la marca de cambios) corre en segundo
+        plano sin indicador de carga; si la marca coincide no se pide ninguna fila.
+        """
+        if self._list_token is None or self._search_term():
+            self._refresh_list()
+            return
+
+        self.run_task(
+            self._fetch_if_changed, self._list_token, self._loaded_row_limit(),
+            key='refresh_list',
+            on_success=self._on_refresh_checked,
+            on_error=lambda e: logger.error("Error comprobando cambios de %s: %s", self.entity_name, e)
+        )
+
+    def _loaded_row_limit(self):
+        """Filas a pedir al refrescar: las ya cargadas, y al menos una página"""
+        loaded = len(self.virtual_list) if self.virtual_list is not None else 0
+        return max(self.page_size, loaded)
+
+    def _fetch_if_changed(self, known_token, limit):
+        """
+        Obtiene la primera página si la marca de cambios difiere (fuera del hilo de la interfaz)
+
+        La marca se lee antes que las filas: un cambio intermedio hará que la
+        siguiente comprobación vuelva a cargar.
+
+        Args:
+            known_token: Marca de la última carga, o None para cargar siempre
+            limit (int): Tamaño de la página
+
+        Returns:
+            dict: Página con 'change_token', o None si no hubo cambios
+        """
+        token = self.controller.get_change_token() if hasattr(self.controller, 'get_change_token') else None
+        if known_token is not None and token == known_token:
+            return None
+
+        page = self._fetch_entities(None, limit)
+        page['change_token'] = token
+        return page
+
+    def _on_refresh_checked(self, page):
+        """Aplica el resultado de refresh_if_changed()"""
+        if page is None:
+            logger.debug("%s sin cambios: no se recarga la lista", self.entity_name)
+            return
+        self.cancel_task('next_page')
+        self._loading_page = False
+        self._on_first_page(page)
+
+    def _fetch_entities(self, after_id=None, limit=None):
+        """
+        Obtiene una página de entidades (se ejecuta fuera del hilo de la interfaz)
+
+        Args:
+            after_id: Clave devuelta por la página anterior, o None para la primera
+            limit (int): Tamaño de la página; por defecto page_size
+
+        Returns:
+            dict: items, next_after y has_more
+        """
+        if hasattr(self.controller, 'get_page'):
+            return self.controller.get_page(
+                after_id=after_id, limit=limit or self.page_size, order_by=self.page_order_by
+            )
+        return {'items': self.controller.get_all(), 'next_after': None, 'has_more': False}
+
+    def _on_first_page(self, page):
+        """Repinta la lista con la primera página"""
+        self._next_after = page['next_after']
+        self._has_more = page['has_more']
+        self._list_token = page.get('change_token')
+        self._showing_search = False
+        self._render_entities(page['items'])
+
+    def _load_next_page(self):
+        """Pide la siguiente página si existe y no hay otra en camino"""
+        if not self._has_more or self._loading_page:
+            return
+
+        self._loading_page = True
+        self.run_task(
+            self._fetch_entities, self._next_after,
+            key='next_page',
+            on_success=self._on_next_page,
+            on_error=self._on_next_page_error,
+            message="Cargando más..."
+        )
+
+    def _on_next_page(self, page):
+        """Añade al final de la lista la página recibida"""
+        self._loading_page = False
+        self._next_after = page['next_after']
+        self._has_more = page['has_more']
+        self._append_entities(page['items'])
+
+    def _on_next_page_error(self, error):
+        """Detiene la carga incremental tras un error"""
+        self._loading_page = False
+        self._has_more = False
+        UIHelpers.show_error_message("Error", f"Error cargando lista: {str(error)}")
+
+    def _render_entities(self, entities, keep_position=True):
+        """
+        Sustituye el contenido del TreeView (hilo de la interfaz)
+
+        Args:
+            entities (list): Entidades a mostrar
+            keep_position (bool): Aplicar solo las diferencias por clave conservando
+                desplazamiento y selección; si es False se vuelve al principio
+        """
+        rows = [self._entity_to_tree_values(entity) for entity in entities]
+        if keep_position:
+            diff = self.virtual_list.reconcile(rows)
+            logger.debug("Refresco de %s: %s", self.entity_name, diff.as_dict())
+        else:
+            self.virtual_list.set_rows(rows)
+
+    def _append_entities(self, entities):
+        """
+        Añade entidades al final del TreeView
+
+        Args:
+            entities (list): Entidades a añadir
+        """
+        self.virtual_list.append_rows([self._entity_to_tree_values(entity) for entity in entities])
+
+    def run_task(self, func, *args, key=None, on_success=None, on_error=None, message=None,
+                 on_progress=None):
+        """
+        Ejecuta trabajo de base de datos o de archivos en segundo plano
+
+        Args:
+            func (callable): Trabajo a ejecutar; no debe tocar widgets
+            key (str): Clave para agrupar/cancelar tareas equivalentes de esta vista
+            on_success (callable): Recibe el resultado en el hilo de la interfaz
+            on_error (callable): Recibe la excepción en el hilo de la interfaz
+            message (str): Si se indica, se muestra el indicador de carga mientras dura
+            on_progress (callable): Recibe (done, total) de report_progress() en el
+                hilo de la interfaz
+
+        Returns:
+            TaskHandle: Referencia para cancelar la tarea
+        """
+        if self.task_runner is None:
+            self.task_runner = TaskRunner(self.parent_frame.winfo_toplevel(), max_workers=1)
+
+        if message:
+            self.show_loading(message)
+
+        return self.task_runner.submit(
+            func, *args,
+            key=f"{id(self)}:{key}" if key else None,
+            on_success=on_success,
+            on_error=on_error,
+            on_progress=on_progress,
+            on_finally=self.hide_loading if message else None
+        )
+
+    def cancel_task(self, key):
+        """
+        Cancela la tarea en segundo plano de esta vista con la clave indicada
+
+        Args:
+            key (str): Clave usada en run_task()
+        """
+        if self.task_runner is not None:
+            self.task_runner.cancel(f"{id(self)}:{key}")
+
+    def _run_export(self, writer, file_path, format_name):
+        """
+        Genera un archivo de exportación en segundo plano y avisa al terminar
+
+        Args:
+            writer (callable): Recibe file_path y devuelve el número de registros escritos
+            file_path (str): Ruta elegida por el usuario
+            format_name (str): Nombre del formato para los mensajes ('Excel', 'PDF')
+        """
+        message = f"Exportando a {format_name}..."
+
+        def on_success(count):
+            if count:
+                UIHelpers.show_success_message("Éxito", f"{format_name} exportado correctamente:\n{file_path}")
+            else:
+                UIHelpers.show_error_message("Error", "No hay datos para exportar")
+
+        def on_progress(done, total):
+            if self.loading_label is not None:
+                progress = f"{done:,}/{total:,}" if total and total >= done else f"{done:,}"
+                self.loading_label.config(text=f"{message} {progress} registros")
+
+        self.run_task(
+            writer, file_path,
+            key=f"export_{format_name}",
+            on_success=on_success,
+            on_error=lambda e: UIHelpers.show_error_message(
+                "Error", f"Error exportando a {format_name}: {str(e)}"
+            ),
+            message=message,
+            on_progress=on_progress
+        )
+
+    def _write_excel(self, file_path):
+        """
+        Genera el reporte Excel de la entidad (se ejecuta en segundo plano)
+
+        Las filas se leen por lotes de export_batch_size y se escriben con
+        utils.exporters.export_excel() según export_columns.
+
+        Args:
+            file_path (str): Ruta del archivo de salida
+
+        Returns:
+            int: Registros exportados (0 si no había datos)
+        """
+        return export_excel(
+            file_path,
+            self.controller.iter_all(batch_size=self.export_batch_size),
+            self.export_columns,
+            self.export_title,
+            sheet_title=self.entity_name.capitalize() or 'Datos',
+            summary=self.export_summary,
+            # Estimación (information_schema): solo sirve para mostrar el avance
+            total=self.controller.estimate_count() or None
+        )
+
+    def _write_pdf(self, file_path):
+        """
+        Genera el reporte PDF de la entidad (se ejecuta en segundo plano)
+
+        Las filas se leen por lotes y se dibujan página a página con
+        utils.exporters.export_pdf() según pdf_columns.
+
+        Args:
+            file_path (str): Ruta del archivo de salida
+
+        Returns:
+            int: Registros exportados (0 si no había datos)
+        """
+        return export_pdf(
+            file_path,
+            self.controller.iter_all(batch_size=self.export_batch_size),
+            self.pdf_columns,
+            self.export_title,
+            summary=self.export_summary,
+            total=self.controller.estimate_count() or None
+        )
 
     def _entity_to_tree_values(self, entity):
         """
@@ -465,25 +770,44 @@ class BaseView(ABC):
 
     def show_loading(self, message="Cargando..."):
         """
-        Muestra un indicador de carga (placeholder para implementación futura)
+        Muestra un indicador de carga sobre la lista
+
+        Las llamadas se anidan: el indicador desaparece con el último hide_loading().
 
         Args:
             message (str): Mensaje de carga
         """
-        # TODO: Implementar indicador de carga visual
-        pass
+        self._loading_count += 1
+        if self.loading_label is None:
+            self.loading_label = tk.Label(
+                self.right_frame,
+                font=("Arial", 10, "italic"),
+                fg="white",
+                bg="#34495e",
+                padx=12,
+                pady=4
+            )
+        self.loading_label.config(text=message)
+        self.loading_label.place(relx=0.5, rely=0.0, anchor="n", y=8)
+        self.loading_label.lift()
+        self.main_frame.config(cursor="watch")
 
     def hide_loading(self):
         """
-        Oculta el indicador de carga (placeholder para implementación futura)
+        Oculta el indicador de carga
         """
-        # TODO: Implementar ocultación del indicador de carga
-        pass
+        self._loading_count = max(0, self._loading_count - 1)
+        if self._loading_count == 0 and self.loading_label is not None:
+            self.loading_label.place_forget()
+            self.main_frame.config(cursor="")
 
     def setup_search_functionality(self, search_field_name, search_callback=None):
         """
         Configura funcionalidad de búsqueda en tiempo real
 
+        La búsqueda espera search_delay_ms desde la última tecla, de modo que
+        escribir una palabra completa lanza una sola consulta.
+
         Args:
             search_field_name (str): Nombre del campo de búsqueda
             search_callback (function): Función callback para búsqueda personalizada
@@ -491,26 +815,101 @@ class BaseView(ABC):
         field = self.form_fields.get(search_field_name)
         if field and isinstance(field, tk.Entry):
             # Vincular evento de tecla para búsqueda en tiempo real
-            field.bind('<KeyRelease>', lambda e: self._on_search_changed(search_callback))
+            field.bind('<KeyRelease>', lambda e: self._schedule_search(search_callback))
+
+    def _schedule_search(self, callback=None):
+        """Reinicia la espera de la búsqueda en cada tecla"""
+        if self._search_after_id is not None:
+            self.main_frame.after_cancel(self._search_after_id)
+        self._search_after_id = self.main_frame.after(
+            self.search_delay_ms, lambda: self._on_search_changed(callback)
+        )
+
+    def _search_term(self):
+        """Texto del filtro normalizado (sin tildes ni mayúsculas, palabras separadas por espacio)"""
+        return ' '.join(tokenize(self.get_field_value('search')))
 
     def _on_search_changed(self, callback=None):
         """
         Maneja cambios en el campo de búsqueda
 
+        Primero se intenta resolver en memoria: con el mismo término ya
+        buscado, o filtrando los resultados completos de un término que el
+        nuevo amplía ("fer" -> "fernando"). Si no, la consulta va al
+        controlador en segundo plano y cualquier búsqueda anterior aún en
+        curso se descarta.
+
         Args:
             callback (function): Función callback personalizada
         """
+        self._search_after_id = None
         if callback:
             callback()
-        else:
-            # Implementación por defecto: filtrar lista
-            search_term = self.get_field_value('search')
-            if hasattr(self.controller, 'search'):
-                try:
-                    results = self.controller.search(search_term)
-                    self._update_tree_with_results(results)
-                except Exception as e:
-                    print(f"Error en búsqueda: {e}")
+            return
+
+        term = self._search_term()
+        if not term:
+            self.cancel_task('search')
+            if self._showing_search:
+                self._showing_search = False
+                self._refresh_list()
+            return
+
+        if not hasattr(self.controller, 'search'):
+            return
+
+        cached = self._cached_search(term)
+        if cached is not None:
+            self.cancel_task('search')
+            self._update_tree_with_results(cached)
+            return
+
+        self.run_task(
+            self.controller.search, term, self.search_limit,
+            key='search',
+            on_success=lambda results: self._on_search_results(term, results),
+            on_error=lambda e: logger.error("Error en búsqueda: %s", e)
+        )
+
+    def _on_search_results(self, term, results):
+        """Guarda y muestra los resultados si el filtro no cambió mientras tanto"""
+        self._store_search(term, results)
+        if term == self._search_term():
+            self._update_tree_with_results(results)
+
+    def _cached_search(self, term):
+        """
+        Resultados de un término sin ir a la base de datos
+
+        Returns:
+            list: Resultados, o None si hay que consultarlos
+        """
+        entry = self._search_cache.get(term)
+        if entry is not None:
+            self._search_cache.move_to_end(term)
+            return entry[0]
+
+        # El término más largo ya buscado que el nuevo amplía, con resultados completos
+        if not hasattr(self.controller, 'filter_search'):
+            return None
+        for previous in sorted(self._search_cache, key=len, reverse=True):
+            results, complete = self._search_cache[previous]
+            if complete and term.startswith(previous):
+                narrowed = self.controller.filter_search(results, term, previous)
+                if narrowed is None:
+                    continue
+                self._store_search(term, narrowed, complete=True)
+                return narrowed
+        return None
+
+    def _store_search(self, term, results, complete=None):
+        """Guarda unos resultados en la caché de búsquedas (LRU)"""
+        if complete is None:
+            complete = len(results) < self.search_limit
+        self._search_cache[term] = (results, complete)
+        self._search_cache.move_to_end(term)
+        while len(self._search_cache) > self.search_cache_size:
+            self._search_cache.popitem(last=False)
 
     def _update_tree_with_results(self, results):
         """
@@ -519,11 +918,11 @@ class BaseView(ABC):
         Args:
             results (list): Lista de resultados
         """
-        # Limpiar TreeView
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-
-        # Agregar resultados
-        for result in results:
-            values = self._entity_to_tree_values(result)
-            self.tree.insert('', 'end', values=values)
\ No newline at end of file
+        # Los resultados de búsqueda no se paginan
+        self.cancel_task('next_page')
+        self._loading_page = False
+        self._has_more = False
+        # La lista ya no refleja la tabla: el próximo refresco debe recargarla
+        self._list_token = None
+        self._showing_search = True
+        self._render_entities(results, keep_position=False)
\ No newline at end of file
@@ -5,29 +5,48 @@ import tkinter as tk
 from tkinter import ttk
 from tkinter import filedialog, messagebox
 from views.base_view import BaseView
-from utils.helpers import safe_str
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib import colors
-from reportlab.lib.units import inch
-from datetime import datetime
+from models.clientes import CLIENTE_FIELDS
+from models.records import display_row
+from utils.exporters import ExportColumn
 import os
-import openpyxl
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-from openpyxl.utils import get_column_letter
 from utils.exceptions import EntityNotFoundError, EntityInUseError
+from utils.logger import get_logger
+
+logger = get_logger('views')
 
 
 class ClientesView(BaseView):
     """Vista específica para clientes"""
 
-    def __init__(self, parent_frame, controller):
+    export_title = 'REPORTE DE CLIENTES'
+    export_summary = 'Total de clientes registrados: {count}'
+    export_columns = (
+        ExportColumn('ID_CLIENTE', 'ID CLIENTE', 10),
+        ExportColumn('NOMBRE', 'NOMBRE', 15),
+        ExportColumn('APELLIDO', 'APELLIDO', 15),
+        ExportColumn('DOCUMENTO_IDENTIDAD', 'DOCUMENTO IDENTIDAD', 15),
+        ExportColumn('NACIONALIDAD', 'NACIONALIDAD', 12),
+        ExportColumn('FECHA_NACIMIENTO', 'FECHA NACIMIENTO', 15),
+        ExportColumn('DIRECCION', 'DIRECCIÓN', 20),
+        ExportColumn('TELEFONO', 'TELÉFONO', 12),
+        ExportColumn('CORREO', 'CORREO', 20),
+        ExportColumn('PREFERENCIAS_ESPECIALES', 'PREFERENCIAS ESPECIALES', 20),
+        ExportColumn('NIVEL_PROGRAMA_FIDELIZACION', 'NIVEL FIDELIZACIÓN', 15)
+    )
+    pdf_columns = (
+        ExportColumn('ID_CLIENTE', 'ID', 6, centered=True),
+        ExportColumn('NOMBRE', 'Nombre', 15),
+        ExportColumn('APELLIDO', 'Apellido', 15),
+        ExportColumn('DOCUMENTO_IDENTIDAD', 'Documento', 14),
+        ExportColumn('TELEFONO', 'Teléfono', 12),
+        ExportColumn('CORREO', 'Correo', 24)
+    )
+
+    def __init__(self, parent_frame, controller, task_runner=None):
         self.form_title = "GESTIÓN DE CLIENTES"
         self.entity_name = "CLIENTES"
         self.dark_theme = True
-        super().__init__(parent_frame, controller)
+        super().__init__(parent_frame, controller, task_runner)
 
     def _create_form_fields(self):
         """Crea los campos específicos del formulario de clientes"""
@@ -295,11 +314,10 @@ class ClientesView(BaseView):
                     'PREFERENCIAS_ESPECIALES': values[9],
                     'NIVEL_PROGRAMA_FIDELIZACION': values[10]
                 }
-                print(f"Datos seleccionados del treeview: {data}")
                 self._populate_form(data)
 
         except Exception as e:
-            print(f"Error en selección de treeview: {e}")
+            logger.error("Error en selección de treeview: %s", e)
 
     def _get_form_data(self):
         """Obtiene los datos del formulario de clientes"""
@@ -316,7 +334,6 @@ class ClientesView(BaseView):
             'PREFERENCIAS_ESPECIALES': self.get_field_value('preferencias_especiales'),
             'NIVEL_PROGRAMA_FIDELIZACION': self.get_field_value('nivel_programa_fidelizacion')
         }
-        print(f"Datos obtenidos del formulario: {form_data}")
         return form_data
 
     def _populate_form(self, data):
@@ -325,8 +342,6 @@ class ClientesView(BaseView):
             if not data:
                 return
 
-            print(f"Poblando formulario con datos: {data}")
-
             # Limpiar formulario primero
             self._clear_form()
 
@@ -343,10 +358,10 @@ class ClientesView(BaseView):
             self.set_field_value('preferencias_especiales', data.get('PREFERENCIAS_ESPECIALES', ''))
             self.set_field_value('nivel_programa_fidelizacion', data.get('NIVEL_PROGRAMA_FIDELIZACION', ''))
 
-            print("Formulario poblado exitosamente")
+            logger.debug("Formulario poblado exitosamente")
 
         except Exception as e:
-            print(f"Error poblando formulario: {e}")
+            logger.error("Error poblando formulario: %s", e)
 
     def _get_entity_id_from_form(self):
         """Obtiene el ID del cliente desde el formulario"""
@@ -356,48 +371,15 @@ class ClientesView(BaseView):
         except ValueError:
             return None
 
-    def _refresh_list(self):
-        """Actualiza la lista de clientes con colores alternados"""
-        try:
-            # Limpiar TreeView completamente
-            for item in self.tree.get_children():
-                self.tree.delete(item)
-
-            # Obtener datos actualizados del controlador
-            clientes = self.controller.get_all()
-            print(f"Refrescando lista con {len(clientes)} clientes")
-
-            # Insertar datos actualizados
-            for index, cliente in enumerate(clientes):
-                values = (
-                    safe_str(cliente.get('ID_CLIENTE', '')),
-                    safe_str(cliente.get('NOMBRE', '')),
-                    safe_str(cliente.get('APELLIDO', '')),
-                    safe_str(cliente.get('DOCUMENTO_IDENTIDAD', '')),
-                    safe_str(cliente.get('NACIONALIDAD', '')),
-                    safe_str(cliente.get('FECHA_NACIMIENTO', '')),
-                    safe_str(cliente.get('DIRECCION', '')),
-                    safe_str(cliente.get('TELEFONO', '')),
-                    safe_str(cliente.get('CORREO', '')),
-                    safe_str(cliente.get('PREFERENCIAS_ESPECIALES', '')),
-                    safe_str(cliente.get('NIVEL_PROGRAMA_FIDELIZACION', ''))
-                )
-                tag = 'evenrow' if index % 2 == 0 else 'oddrow'
-                self.tree.insert('', 'end', values=values, tags=(tag,))
-
-            print("Lista refrescada exitosamente")
-
-        except Exception as e:
-            print(f"Error en _refresh_list: {e}")
-            import traceback
-            traceback.print_exc()
+    def _entity_to_tree_values(self, cliente):
+        """Convierte un cliente en los valores de una fila del TreeView"""
+        return display_row(cliente, CLIENTE_FIELDS)
 
     def _on_save(self):
         """Maneja el guardado de clientes"""
         try:
             form_data = self._get_form_data()
-            print("=== INICIANDO GUARDADO ===")
-            print("Datos del formulario (GUARDAR):", form_data)
+            logger.debug("=== INICIANDO GUARDADO ===")
 
             # Validar campos obligatorios
             if not form_data.get('NOMBRE') or not form_data.get('NOMBRE').strip():
@@ -413,7 +395,7 @@ class ClientesView(BaseView):
                 return
 
             # Crear nuevo cliente
-            print("Llamando a controller.create...")
+            logger.debug("Llamando a controller.create...")
             new_id = self.controller.create(form_data)
 
             if new_id:
@@ -427,23 +409,20 @@ class ClientesView(BaseView):
             messagebox.showerror("Error de validación", str(ve))
         except Exception as e:
             messagebox.showerror("Error", f"Error al guardar cliente: {str(e)}")
-            print(f"ERROR DETALLADO en _on_save: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("ERROR DETALLADO en _on_save: %s", e)
 
     def _on_update(self):
         """Maneja la actualización de clientes"""
         try:
             cliente_id = self._get_entity_id_from_form()
-            print("=== INICIANDO ACTUALIZACIÓN ===")
-            print(f"ID para actualizar: {cliente_id}")
+            logger.debug("=== INICIANDO ACTUALIZACIÓN ===")
+            logger.debug("ID para actualizar: %s", cliente_id)
 
             if not cliente_id:
                 messagebox.showerror("Error", "Seleccione un cliente para actualizar")
                 return
 
             form_data = self._get_form_data()
-            print("Datos del formulario (ACTUALIZAR):", form_data)
 
             # Validar campos obligatorios
             if not form_data.get('NOMBRE') or not form_data.get('NOMBRE').strip():
@@ -463,7 +442,7 @@ class ClientesView(BaseView):
             if not confirmar:
                 return
 
-            print("Llamando a controller.update...")
+            logger.debug("Llamando a controller.update...")
             # Actualizar cliente
             success = self.controller.update(cliente_id, form_data)
 
@@ -478,16 +457,14 @@ class ClientesView(BaseView):
             messagebox.showerror("Error de validación", str(ve))
         except Exception as e:
             messagebox.showerror("Error", f"Error actualizando cliente: {str(e)}")
-            print(f"ERROR DETALLADO en _on_update: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("ERROR DETALLADO en _on_update: %s", e)
 
     def _on_delete(self):
         """Elimina un cliente"""
         try:
             cliente_id = self._get_entity_id_from_form()
-            print("=== INICIANDO ELIMINACIÓN ===")
-            print(f"ID para eliminar: {cliente_id}")
+            logger.debug("=== INICIANDO ELIMINACIÓN ===")
+            logger.debug("ID para eliminar: %s", cliente_id)
 
             if not cliente_id:
                 messagebox.showwarning("Advertencia", "Seleccione un cliente para eliminar")
@@ -500,7 +477,7 @@ class ClientesView(BaseView):
                 messagebox.showinfo("Cancelado", "Eliminación cancelada")
                 return
 
-            print("Llamando a controller.delete...")
+            logger.debug("Llamando a controller.delete...")
             success = self.controller.delete(cliente_id)
 
             if success:
@@ -521,17 +498,15 @@ class ClientesView(BaseView):
             )
         except Exception as e:
             messagebox.showerror("Error", f"No se pudo eliminar el cliente: {str(e)}")
-            print(f"ERROR DETALLADO en _on_delete: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("ERROR DETALLADO en _on_delete: %s", e)
 
     def _on_search(self):
         """Busca un cliente por ID"""
         cliente_id = self.get_field_value('id_cliente')
 
         try:
-            print("=== INICIANDO BÚSQUEDA ===")
-            print(f"ID a buscar: {cliente_id}")
+            logger.debug("=== INICIANDO BÚSQUEDA ===")
+            logger.debug("ID a buscar: %s", cliente_id)
 
             if not cliente_id or not cliente_id.strip():
                 messagebox.showerror("Error", "Ingrese un ID de cliente para buscar")
@@ -544,7 +519,7 @@ class ClientesView(BaseView):
                 messagebox.showerror("Error", "El ID del cliente debe ser un número positivo")
                 return
 
-            print("Llamando a controller.get_by_id...")
+            logger.debug("Llamando a controller.get_by_id...")
             # Llamar al controlador para buscar
             data = self.controller.get_by_id(entity_id)
 
@@ -558,225 +533,35 @@ class ClientesView(BaseView):
             messagebox.showerror("Error", "El ID del cliente debe ser un número válido")
         except Exception as e:
             messagebox.showerror("Error", f"Error en búsqueda: {str(e)}")
-            print(f"ERROR DETALLADO en _on_search: {e}")
+            logger.error("ERROR DETALLADO en _on_search: %s", e)
 
     def _export_excel(self):
         """Exporta datos de clientes a Excel"""
-        try:
-            clientes = self.controller.get_all()
-            if not clientes:
-                messagebox.showerror("Error", "No hay datos para exportar")
-                return
-
-            file_path = filedialog.asksaveasfilename(
-                defaultextension=".xlsx",
-                filetypes=[("Excel files", "*.xlsx")],
-                title="Guardar Excel como",
-                initialfile="clientes.xlsx"
-            )
-
-            if not file_path:
-                return
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".xlsx",
+            filetypes=[("Excel files", "*.xlsx")],
+            title="Guardar Excel como",
+            initialfile="clientes.xlsx"
+        )
 
-            wb = Workbook()
-            ws = wb.active
-            ws.title = "Clientes"
-
-            # Estilos (similar a hoteles_view)
-            header_font = Font(name='Arial', size=12, bold=True, color='FFFFFF')
-            header_fill = PatternFill(start_color='2E8B57', end_color='2E8B57', fill_type='solid')
-            normal_font = Font(name='Arial', size=10)
-            border = Border(
-                left=Side(style='thin'),
-                right=Side(style='thin'),
-                top=Side(style='thin'),
-                bottom=Side(style='thin')
-            )
-            center_align = Alignment(horizontal='center', vertical='center')
-            left_align = Alignment(horizontal='left', vertical='center')
-
-            # Título
-            ws.merge_cells('A1:K1')
-            ws['A1'] = 'REPORTE DE CLIENTES'
-            ws['A1'].font = Font(name='Arial', size=14, bold=True)
-            ws['A1'].alignment = center_align
-
-            # Fecha
-            ws.merge_cells('A2:K2')
-            ws['A2'] = f'Generado el: {datetime.now().strftime("%d/%m/%Y %H:%M:%S")}'
-            ws['A2'].font = normal_font
-            ws['A2'].alignment = center_align
-
-            # Espacio
-            ws.append([])
-
-            # Encabezados
-            headers = [
-                'ID CLIENTE', 'NOMBRE', 'APELLIDO', 'DOCUMENTO IDENTIDAD',
-                'NACIONALIDAD', 'FECHA NACIMIENTO', 'DIRECCIÓN', 'TELÉFONO',
-                'CORREO', 'PREFERENCIAS ESPECIALES', 'NIVEL FIDELIZACIÓN'
-            ]
-            ws.append(headers)
-
-            # Aplicar estilo a los encabezados
-            for col in range(1, 12):
-                cell = ws.cell(row=4, column=col)
-                cell.font = header_font
-                cell.fill = header_fill
-                cell.alignment = center_align
-                cell.border = border
-
-            # Datos
-            for cliente in clientes:
-                row = [
-                    safe_str(cliente.get('ID_CLIENTE', '')),
-                    safe_str(cliente.get('NOMBRE', '')),
-                    safe_str(cliente.get('APELLIDO', '')),
-                    safe_str(cliente.get('DOCUMENTO_IDENTIDAD', '')),
-                    safe_str(cliente.get('NACIONALIDAD', '')),
-                    safe_str(cliente.get('FECHA_NACIMIENTO', '')),
-                    safe_str(cliente.get('DIRECCION', '')),
-                    safe_str(cliente.get('TELEFONO', '')),
-                    safe_str(cliente.get('CORREO', '')),
-                    safe_str(cliente.get('PREFERENCIAS_ESPECIALES', '')),
-                    safe_str(cliente.get('NIVEL_PROGRAMA_FIDELIZACION', ''))
-                ]
-                ws.append(row)
-
-            # Aplicar estilo a los datos
-            for row in range(5, len(clientes) + 5):
-                fill_color = PatternFill(
-                    start_color='F0F8FF' if row % 2 == 1 else 'FFFFFF',
-                    end_color='F0F8FF' if row % 2 == 1 else 'FFFFFF',
-                    fill_type='solid'
-                )
-
-                for col in range(1, 12):
-                    cell = ws.cell(row=row, column=col)
-                    cell.font = normal_font
-                    cell.border = border
-                    cell.fill = fill_color
-                    cell.alignment = left_align
-
-            # Ajustar anchos
-            column_widths = {
-                'A': 10, 'B': 15, 'C': 15, 'D': 15, 'E': 12,
-                'F': 15, 'G': 20, 'H': 12, 'I': 20, 'J': 20, 'K': 15
-            }
-
-            for col_letter, width in column_widths.items():
-                ws.column_dimensions[col_letter].width = width
-
-            # Resumen
-            summary_row = len(clientes) + 6
-            ws.merge_cells(f'A{summary_row}:K{summary_row}')
-            ws[f'A{summary_row}'] = f'Total de clientes registrados: {len(clientes)}'
-            ws[f'A{summary_row}'].font = Font(name='Arial', size=11, bold=True)
-            ws[f'A{summary_row}'].alignment = center_align
-            ws[f'A{summary_row}'].fill = PatternFill(start_color='E6E6FA', end_color='E6E6FA', fill_type='solid')
-
-            wb.save(file_path)
-            messagebox.showinfo("Éxito", f"Excel exportado correctamente:\n{file_path}")
+        if not file_path:
+            return
 
-        except Exception as e:
-            messagebox.showerror("Error", f"Error exportando a Excel: {str(e)}")
+        self._run_export(self._write_excel, file_path, "Excel")
 
     def _export_pdf(self):
         """Exporta datos de clientes a PDF"""
-        try:
-            clientes = self.controller.get_all()
-            if not clientes:
-                messagebox.showerror("Error", "No hay datos para exportar")
-                return
-
-            file_path = filedialog.asksaveasfilename(
-                defaultextension=".pdf",
-                filetypes=[("PDF files", "*.pdf")],
-                title="Guardar PDF como",
-                initialfile="clientes.pdf"
-            )
-
-            if not file_path:
-                return
-
-            doc = SimpleDocTemplate(
-                file_path,
-                pagesize=A4,
-                rightMargin=72,
-                leftMargin=72,
-                topMargin=72,
-                bottomMargin=18
-            )
-
-            styles = getSampleStyleSheet()
-            title_style = ParagraphStyle(
-                'CustomTitle',
-                parent=styles['Heading1'],
-                fontSize=16,
-                spaceAfter=30,
-                alignment=1,
-                textColor=colors.darkblue
-            )
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".pdf",
+            filetypes=[("PDF files", "*.pdf")],
+            title="Guardar PDF como",
+            initialfile="clientes.pdf"
+        )
 
-            elements = []
-
-            # Título
-            title = Paragraph("REPORTE DE CLIENTES", title_style)
-            elements.append(title)
-
-            # Fecha
-            fecha = Paragraph(f"Generado el: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}", styles['Normal'])
-            elements.append(fecha)
-            elements.append(Spacer(1, 20))
-
-            # Tabla
-            table_data = [['ID', 'Nombre', 'Apellido', 'Documento', 'Teléfono', 'Correo']]
-
-            for cliente in clientes:
-                table_data.append([
-                    safe_str(cliente.get('ID_CLIENTE', '')),
-                    safe_str(cliente.get('NOMBRE', '')),
-                    safe_str(cliente.get('APELLIDO', '')),
-                    safe_str(cliente.get('DOCUMENTO_IDENTIDAD', '')),
-                    safe_str(cliente.get('TELEFONO', '')),
-                    safe_str(cliente.get('CORREO', ''))
-                ])
-
-            table = Table(table_data, repeatRows=1)
-            table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2ecc71')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 10),
-                ('ALIGN', (0, 1), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 1), (-1, -1), 8),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
-                ('TOPPADDING', (0, 1), (-1, -1), 6),
-                ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ]))
-
-            # Alternar colores
-            for i in range(1, len(table_data)):
-                bg_color = colors.HexColor('#f8f8f8') if i % 2 == 0 else colors.white
-                table.setStyle(TableStyle([('BACKGROUND', (0, i), (-1, i), bg_color)]))
-
-            elements.append(table)
-            elements.append(Spacer(1, 20))
-
-            # Resumen
-            total_clientes = len(clientes)
-            resumen = Paragraph(f"Total de clientes registrados: {total_clientes}", styles['Normal'])
-            elements.append(resumen)
-
-            doc.build(elements)
-            messagebox.showinfo("Éxito", f"PDF exportado correctamente:\n{file_path}")
+        if not file_path:
+            return
 
-        except Exception as e:
-            messagebox.showerror("Error", f"Error exportando a PDF: {str(e)}")
+        self._run_export(self._write_pdf, file_path, "PDF")
 
     def _change_theme(self):
         """Cambia el tema de la aplicación"""
@@ -823,7 +608,7 @@ class ClientesView(BaseView):
                             foreground="white")
 
         except Exception as e:
-            print(f"Error aplicando tema: {e}")
+            logger.error("Error aplicando tema: %s", e)
 
     def _apply_theme_to_container(self, container, bg_color, fg_color):
         """Aplica el tema recursivamente a un contenedor y sus hijos"""
@@ -853,7 +638,7 @@ class ClientesView(BaseView):
                         self._apply_theme_to_widget(grandchild, bg_color, fg_color)
 
         except Exception as e:
-            print(f"Error aplicando tema al contenedor: {e}")
+            logger.error("Error aplicando tema al contenedor: %s", e)
 
     def _apply_theme_to_widget(self, widget, bg_color, fg_color):
         """Aplica el tema a un widget individual"""
@@ -877,7 +662,7 @@ class ClientesView(BaseView):
                                  fg=fg_color, insertbackground=fg_color)
 
         except Exception as e:
-            print(f"Error aplicando tema al widget: {e}")
+            logger.error("Error aplicando tema al widget: %s", e)
 
     def _clear_form(self):
         """Limpia el formulario y resetea validaciones"""
@@ -5,29 +5,50 @@ import tkinter as tk
 from tkinter import ttk
 from tkinter import filedialog, messagebox
 from views.base_view import BaseView
-from utils.helpers import UIHelpers, safe_str
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib import colors
-from reportlab.lib.units import inch
-from datetime import datetime
+from utils.helpers import UIHelpers
+from models.hoteles import HOTEL_FIELDS
+from models.records import display_row
+from utils.exporters import ExportColumn
 import os
-import openpyxl
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-from openpyxl.utils import get_column_letter
 from utils.exceptions import EntityNotFoundError, EntityInUseError
+from utils.logger import get_logger
+
+logger = get_logger('views')
 
 
 class HotelesView(BaseView):
     """Vista específica para hoteles"""
 
-    def __init__(self, parent_frame, controller):
+    export_title = 'REPORTE DE HOTELES'
+    export_summary = 'Total de hoteles registrados: {count}'
+    export_columns = (
+        ExportColumn('ID_HOTEL', 'ID HOTEL', 10, centered=True),
+        ExportColumn('NOMBRE_HOTEL', 'NOMBRE HOTEL', 25),
+        ExportColumn('CATEGORIA', 'CATEGORÍA', 12, centered=True),
+        ExportColumn('DIRECCION', 'DIRECCIÓN', 30),
+        ExportColumn('TELEFONO', 'TELÉFONO', 15),
+        ExportColumn('CORREO', 'CORREO', 25),
+        ExportColumn('AÑO_INAUGURACION', 'AÑO INAUGURACIÓN', 15, centered=True),
+        ExportColumn('HABITANTES', 'NÚMERO HABITANTES', 15),
+        ExportColumn('SERVICIOS', 'SERVICIOS DISPONIBLES', 30),
+        ExportColumn('CHECKIN', 'HORARIOS CHECK-IN', 15),
+        ExportColumn('CHECKOUT', 'HORARIOS CHECK-OUT', 15),
+        ExportColumn('GERENTE', 'GERENTE RESPONSABLE', 20)
+    )
+    pdf_columns = (
+        ExportColumn('ID_HOTEL', 'ID', 6, centered=True),
+        ExportColumn('NOMBRE_HOTEL', 'Nombre Hotel', 20),
+        ExportColumn('CATEGORIA', 'Categoría', 9, centered=True),
+        ExportColumn('DIRECCION', 'Dirección', 22),
+        ExportColumn('TELEFONO', 'Teléfono', 12),
+        ExportColumn('CORREO', 'Correo', 22)
+    )
+
+    def __init__(self, parent_frame, controller, task_runner=None):
         self.form_title = "GESTIÓN DE HOTELES"
         self.entity_name = "HOTELES"
         self.dark_theme = True
-        super().__init__(parent_frame, controller)
+        super().__init__(parent_frame, controller, task_runner)
 
     def _create_form_fields(self):
         """Crea los campos específicos del formulario de hoteles"""
@@ -268,11 +289,10 @@ class HotelesView(BaseView):
                     'CHECKOUT': values[10],
                     'GERENTE': values[11]
                 }
-                print(f"Datos seleccionados del treeview: {data}")
                 self._populate_form(data)
 
         except Exception as e:
-            print(f"Error en selección de treeview: {e}")
+            logger.error("Error en selección de treeview: %s", e)
 
     def _configure_treeview_styles(self, bg_color=None, fg_color=None, heading_bg=None, odd_bg=None, even_bg=None):
         """Configura los estilos del TreeView"""
@@ -311,7 +331,7 @@ class HotelesView(BaseView):
             self.tree.tag_configure('evenrow', background=even_bg)
 
         except Exception as e:
-            print(f"Error configurando estilos: {e}")
+            logger.error("Error configurando estilos: %s", e)
 
     def _get_form_data(self):
         """Obtiene los datos del formulario de hoteles"""
@@ -329,7 +349,6 @@ class HotelesView(BaseView):
             'CHECKOUT': self.get_field_value('checkout'),
             'GERENTE': self.get_field_value('gerente')
         }
-        print(f"Datos obtenidos del formulario: {form_data}")
         return form_data
 
     def _populate_form(self, data):
@@ -338,8 +357,6 @@ class HotelesView(BaseView):
             if not data:
                 return
 
-            print(f"Poblando formulario con datos: {data}")
-
             # Limpiar formulario primero
             self._clear_form()
 
@@ -357,10 +374,10 @@ class HotelesView(BaseView):
             self.set_field_value('checkout', data.get('CHECKOUT', ''))
             self.set_field_value('gerente', data.get('GERENTE', ''))
 
-            print("Formulario poblado exitosamente")
+            logger.debug("Formulario poblado exitosamente")
 
         except Exception as e:
-            print(f"Error poblando formulario: {e}")
+            logger.error("Error poblando formulario: %s", e)
 
     def _get_entity_id_from_form(self):
         """Obtiene el ID del hotel desde el formulario"""
@@ -370,49 +387,15 @@ class HotelesView(BaseView):
         except ValueError:
             return None
 
-    def _refresh_list(self):
-        """Actualiza la lista de hoteles con colores alternados"""
-        try:
-            # Limpiar TreeView completamente
-            for item in self.tree.get_children():
-                self.tree.delete(item)
-
-            # Obtener datos actualizados del controlador
-            hoteles = self.controller.get_all()
-            print(f"Refrescando lista con {len(hoteles)} hoteles")
-
-            # Insertar datos actualizados
-            for index, hotel in enumerate(hoteles):
-                values = (
-                    safe_str(hotel.get('ID_HOTEL', '')),
-                    safe_str(hotel.get('NOMBRE_HOTEL', '')),
-                    safe_str(hotel.get('CATEGORIA', '')),
-                    safe_str(hotel.get('DIRECCION', '')),
-                    safe_str(hotel.get('TELEFONO', '')),
-                    safe_str(hotel.get('CORREO', '')),
-                    safe_str(hotel.get('AÑO_INAUGURACION', '')),
-                    safe_str(hotel.get('HABITANTES', '')),
-                    safe_str(hotel.get('SERVICIOS', '')),
-                    safe_str(hotel.get('CHECKIN', '')),
-                    safe_str(hotel.get('CHECKOUT', '')),
-                    safe_str(hotel.get('GERENTE', ''))
-                )
-                tag = 'evenrow' if index % 2 == 0 else 'oddrow'
-                self.tree.insert('', 'end', values=values, tags=(tag,))
-
-            print("Lista refrescada exitosamente")
-
-        except Exception as e:
-            print(f"Error en _refresh_list: {e}")
-            import traceback
-            traceback.print_exc()
+    def _entity_to_tree_values(self, hotel):
+        """Convierte un hotel en los valores de una fila del TreeView"""
+        return display_row(hotel, HOTEL_FIELDS)
 
     def _on_save(self):
         """Maneja el guardado de hoteles"""
         try:
             form_data = self._get_form_data()
-            print("=== INICIANDO GUARDADO ===")
-            print("Datos del formulario (GUARDAR):", form_data)
+            logger.debug("=== INICIANDO GUARDADO ===")
 
             # Validar campos obligatorios
             if not form_data.get('NOMBRE_HOTEL') or not form_data.get('NOMBRE_HOTEL').strip():
@@ -424,7 +407,7 @@ class HotelesView(BaseView):
                 return
 
             # Crear nuevo hotel
-            print("Llamando a controller.create...")
+            logger.debug("Llamando a controller.create...")
             new_id = self.controller.create(form_data)
 
             if new_id:
@@ -438,23 +421,20 @@ class HotelesView(BaseView):
             messagebox.showerror("Error de validación", str(ve))
         except Exception as e:
             messagebox.showerror("Error", f"Error al guardar hotel: {str(e)}")
-            print(f"ERROR DETALLADO en _on_save: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("ERROR DETALLADO en _on_save: %s", e)
 
     def _on_update(self):
         """Maneja la actualización de hoteles"""
         try:
             hotel_id = self._get_entity_id_from_form()
-            print("=== INICIANDO ACTUALIZACIÓN ===")
-            print(f"ID para actualizar: {hotel_id}")
+            logger.debug("=== INICIANDO ACTUALIZACIÓN ===")
+            logger.debug("ID para actualizar: %s", hotel_id)
 
             if not hotel_id:
                 messagebox.showerror("Error", "Seleccione un hotel para actualizar")
                 return
 
             form_data = self._get_form_data()
-            print("Datos del formulario (ACTUALIZAR):", form_data)
 
             # Validar campos obligatorios
             if not form_data.get('NOMBRE_HOTEL') or not form_data.get('NOMBRE_HOTEL').strip():
@@ -470,7 +450,7 @@ class HotelesView(BaseView):
             if not confirmar:
                 return
 
-            print("Llamando a controller.update...")
+            logger.debug("Llamando a controller.update...")
             # Actualizar hotel
             success = self.controller.update(hotel_id, form_data)
 
@@ -485,16 +465,14 @@ class HotelesView(BaseView):
             messagebox.showerror("Error de validación", str(ve))
         except Exception as e:
             messagebox.showerror("Error", f"Error actualizando hotel: {str(e)}")
-            print(f"ERROR DETALLADO en _on_update: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("ERROR DETALLADO en _on_update: %s", e)
 
     def _on_delete(self):
         """Elimina un hotel"""
         try:
             hotel_id = self._get_entity_id_from_form()
-            print("=== INICIANDO ELIMINACIÓN ===")
-            print(f"ID para eliminar: {hotel_id}")
+            logger.debug("=== INICIANDO ELIMINACIÓN ===")
+            logger.debug("ID para eliminar: %s", hotel_id)
 
             if not hotel_id:
                 messagebox.showwarning("Advertencia", "Seleccione un hotel para eliminar")
@@ -507,7 +485,7 @@ class HotelesView(BaseView):
                 messagebox.showinfo("Cancelado", "Eliminación cancelada")
                 return
 
-            print("Llamando a controller.delete...")
+            logger.debug("Llamando a controller.delete...")
             success = self.controller.delete(hotel_id)
 
             if success:
@@ -528,17 +506,15 @@ class HotelesView(BaseView):
             )
         except Exception as e:
             messagebox.showerror("Error", f"No se pudo eliminar el hotel: {str(e)}")
-            print(f"ERROR DETALLADO en _on_delete: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("ERROR DETALLADO en _on_delete: %s", e)
 
     def _on_search(self):
         """Busca un hotel por ID"""
         hotel_id = self.get_field_value('id_hotel')
 
         try:
-            print("=== INICIANDO BÚSQUEDA ===")
-            print(f"ID a buscar: {hotel_id}")
+            logger.debug("=== INICIANDO BÚSQUEDA ===")
+            logger.debug("ID a buscar: %s", hotel_id)
 
             if not hotel_id or not hotel_id.strip():
                 messagebox.showerror("Error", "Ingrese un ID de hotel para buscar")
@@ -551,7 +527,7 @@ class HotelesView(BaseView):
                 messagebox.showerror("Error", "El ID del hotel debe ser un número positivo")
                 return
 
-            print("Llamando a controller.get_by_id...")
+            logger.debug("Llamando a controller.get_by_id...")
             # Llamar al controlador para buscar
             data = self.controller.get_by_id(entity_id)
 
@@ -565,7 +541,7 @@ class HotelesView(BaseView):
             messagebox.showerror("Error", "El ID del hotel debe ser un número válido")
         except Exception as e:
             messagebox.showerror("Error", f"Error en búsqueda: {str(e)}")
-            print(f"ERROR DETALLADO en _on_search: {e}")
+            logger.error("ERROR DETALLADO en _on_search: %s", e)
 
     def _change_theme(self):
         """Cambia el tema de la aplicación"""
@@ -618,7 +594,7 @@ class HotelesView(BaseView):
             self._configure_treeview_styles(tree_bg, tree_fg, heading_bg, odd_bg, even_bg)
 
         except Exception as e:
-            print(f"Error aplicando tema: {e}")
+            logger.error("Error aplicando tema: %s", e)
 
     def _apply_theme_to_container(self, container, bg_color, fg_color, entry_bg, entry_fg, button_bg):
         """Aplica el tema recursivamente a un contenedor y todos sus hijos"""
@@ -636,7 +612,7 @@ class HotelesView(BaseView):
                     self._apply_theme_to_container(widget, bg_color, fg_color, entry_bg, entry_fg, button_bg)
 
         except Exception as e:
-            print(f"Error aplicando tema al contenedor: {e}")
+            logger.error("Error aplicando tema al contenedor: %s", e)
 
     def _apply_theme_to_widget(self, widget, bg_color, fg_color, entry_bg, entry_fg, button_bg):
         """Aplica el tema a un widget específico"""
@@ -665,267 +641,31 @@ class HotelesView(BaseView):
 
     def _export_excel(self):
         """Exporta datos de hoteles a Excel con formato profesional"""
-        try:
-            hoteles = self.controller.get_all()
-            if not hoteles:
-                messagebox.showerror("Error", "No hay datos para exportar")
-                return
+        # Pedir al usuario donde guardar el Excel
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".xlsx",
+            filetypes=[("Excel files", "*.xlsx")],
+            title="Guardar Excel como"
+        )
 
-            # Pedir al usuario donde guardar el Excel
-            file_path = filedialog.asksaveasfilename(
-                defaultextension=".xlsx",
-                filetypes=[("Excel files", "*.xlsx")],
-                title="Guardar Excel como"
-            )
+        if not file_path:
+            return  # Usuario canceló
 
-            if not file_path:
-                return  # Usuario canceló
-
-            # Crear libro de trabajo y hoja
-            wb = Workbook()
-            ws = wb.active
-            ws.title = "Hoteles"
-
-            # Estilos
-            header_font = Font(name='Arial', size=12, bold=True, color='FFFFFF')
-            header_fill = PatternFill(start_color='2E8B57', end_color='2E8B57', fill_type='solid')
-            normal_font = Font(name='Arial', size=10)
-            border = Border(
-                left=Side(style='thin'),
-                right=Side(style='thin'),
-                top=Side(style='thin'),
-                bottom=Side(style='thin')
-            )
-            center_align = Alignment(horizontal='center', vertical='center')
-            left_align = Alignment(horizontal='left', vertical='center')
-
-            # Título
-            ws.merge_cells('A1:L1')
-            ws['A1'] = 'REPORTE DE HOTELES'
-            ws['A1'].font = Font(name='Arial', size=14, bold=True)
-            ws['A1'].alignment = center_align
-
-            # Fecha
-            ws.merge_cells('A2:L2')
-            ws['A2'] = f'Generado el: {datetime.now().strftime("%d/%m/%Y %H:%M:%S")}'
-            ws['A2'].font = normal_font
-            ws['A2'].alignment = center_align
-
-            # Espacio
-            ws.append([])
-
-            # Encabezados de columnas
-            headers = [
-                'ID HOTEL',
-                'NOMBRE HOTEL',
-                'CATEGORÍA',
-                'DIRECCIÓN',
-                'TELÉFONO',
-                'CORREO',
-                'AÑO INAUGURACIÓN',
-                'NÚMERO HABITANTES',
-                'SERVICIOS DISPONIBLES',
-                'HORARIOS CHECK-IN',
-                'HORARIOS CHECK-OUT',
-                'GERENTE RESPONSABLE'
-            ]
-            ws.append(headers)
-
-            # Aplicar estilo a los encabezados
-            for col in range(1, 13):  # Columnas A a L
-                cell = ws.cell(row=4, column=col)
-                cell.font = header_font
-                cell.fill = header_fill
-                cell.alignment = center_align
-                cell.border = border
-
-            # Datos de los hoteles
-            for hotel in hoteles:
-                row = [
-                    safe_str(hotel.get('ID_HOTEL', '')),
-                    safe_str(hotel.get('NOMBRE_HOTEL', '')),
-                    safe_str(hotel.get('CATEGORIA', '')),
-                    safe_str(hotel.get('DIRECCION', '')),
-                    safe_str(hotel.get('TELEFONO', '')),
-                    safe_str(hotel.get('CORREO', '')),
-                    safe_str(hotel.get('AÑO_INAUGURACION', '')),
-                    safe_str(hotel.get('HABITANTES', '')),
-                    safe_str(hotel.get('SERVICIOS', '')),
-                    safe_str(hotel.get('CHECKIN', '')),
-                    safe_str(hotel.get('CHECKOUT', '')),
-                    safe_str(hotel.get('GERENTE', ''))
-                ]
-                ws.append(row)
-
-            # Aplicar estilo a los datos
-            for row in range(5, len(hoteles) + 5):
-                # Alternar colores de fila
-                if row % 2 == 1:
-                    fill_color = PatternFill(start_color='F0F8FF', end_color='F0F8FF', fill_type='solid')
-                else:
-                    fill_color = PatternFill(start_color='FFFFFF', end_color='FFFFFF', fill_type='solid')
-
-                for col in range(1, 13):
-                    cell = ws.cell(row=row, column=col)
-                    cell.font = normal_font
-                    cell.border = border
-                    cell.fill = fill_color
-
-                    # Alineación específica por columna
-                    if col in [1, 3, 7]:  # ID, Categoría, Habitantes - centrados
-                        cell.alignment = center_align
-                    else:  # Texto - alineado a la izquierda
-                        cell.alignment = left_align
-
-            # Ajustar anchos de columna
-            column_widths = {
-                'A': 10,   # ID
-                'B': 25,   # Nombre Hotel
-                'C': 12,   # Categoría
-                'D': 30,   # Dirección
-                'E': 15,   # Teléfono
-                'F': 25,   # Correo
-                'G': 15,   # Año Inauguración
-                'H': 15,   # Habitantes
-                'I': 30,   # Servicios
-                'J': 15,   # Check-in
-                'K': 15,   # Check-out
-                'L': 20    # Gerente
-            }
-
-            for col_letter, width in column_widths.items():
-                ws.column_dimensions[col_letter].width = width
-
-            # Resumen
-            summary_row = len(hoteles) + 6
-            ws.merge_cells(f'A{summary_row}:L{summary_row}')
-            ws[f'A{summary_row}'] = f'Total de hoteles registrados: {len(hoteles)}'
-            ws[f'A{summary_row}'].font = Font(name='Arial', size=11, bold=True)
-            ws[f'A{summary_row}'].alignment = center_align
-            ws[f'A{summary_row}'].fill = PatternFill(start_color='E6E6FA', end_color='E6E6FA', fill_type='solid')
-
-            # Guardar el archivo
-            wb.save(file_path)
-
-            messagebox.showinfo("Éxito", f"Excel exportado correctamente:\n{file_path}")
-
-        except Exception as e:
-            messagebox.showerror("Error", f"Error exportando a Excel: {str(e)}")
+        self._run_export(self._write_excel, file_path, "Excel")
 
     def _export_pdf(self):
         """Exporta datos de hoteles a PDF"""
-        try:
-            hoteles = self.controller.get_all()
-            if not hoteles:
-                messagebox.showerror("Error", "No hay datos para exportar")
-                return
-
-            # Pedir al usuario donde guardar el PDF
-            file_path = filedialog.asksaveasfilename(
-                defaultextension=".pdf",
-                filetypes=[("PDF files", "*.pdf")],
-                title="Guardar PDF como"
-            )
-
-            if not file_path:
-                return  # Usuario canceló
-
-            # Crear el documento PDF
-            doc = SimpleDocTemplate(
-                file_path,
-                pagesize=A4,
-                rightMargin=72,
-                leftMargin=72,
-                topMargin=72,
-                bottomMargin=18
-            )
-
-            # Estilos
-            styles = getSampleStyleSheet()
-            title_style = ParagraphStyle(
-                'CustomTitle',
-                parent=styles['Heading1'],
-                fontSize=16,
-                spaceAfter=30,
-                alignment=1,  # Centrado
-                textColor=colors.darkblue
-            )
-
-            # Contenido del PDF
-            elements = []
-
-            # Título
-            title = Paragraph("REPORTE DE HOTELES", title_style)
-            elements.append(title)
-
-            # Fecha de generación
-            fecha = Paragraph(f"Generado el: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}", styles['Normal'])
-            elements.append(fecha)
-            elements.append(Spacer(1, 20))
-
-            # Preparar datos para la tabla
-            table_data = [
-                ['ID', 'Nombre Hotel', 'Categoría', 'Dirección', 'Teléfono', 'Correo']
-            ]
-
-            for hotel in hoteles:
-                table_data.append([
-                    safe_str(hotel.get('ID_HOTEL', '')),
-                    safe_str(hotel.get('NOMBRE_HOTEL', '')),
-                    safe_str(hotel.get('CATEGORIA', '')),
-                    safe_str(hotel.get('DIRECCION', '')),
-                    safe_str(hotel.get('TELEFONO', '')),
-                    safe_str(hotel.get('CORREO', ''))
-                ])
-
-            # Crear tabla
-            table = Table(table_data, repeatRows=1)
-            table.setStyle(TableStyle([
-                # Estilo del encabezado
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2ecc71')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 10),
-
-                # Estilo de las filas
-                ('ALIGN', (0, 1), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 1), (-1, -1), 8),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
-                ('TOPPADDING', (0, 1), (-1, -1), 6),
-
-                # Grid
-                ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ]))
-
-            # Alternar colores de filas
-            for i in range(1, len(table_data)):
-                if i % 2 == 0:
-                    bg_color = colors.HexColor('#f8f8f8')
-                else:
-                    bg_color = colors.white
-                table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, i), (-1, i), bg_color)
-                ]))
-
-            elements.append(table)
-            elements.append(Spacer(1, 20))
-
-            # Resumen
-            total_hoteles = len(hoteles)
-            resumen = Paragraph(f"Total de hoteles registrados: {total_hoteles}", styles['Normal'])
-            elements.append(resumen)
-
-            # Generar PDF
-            doc.build(elements)
+        # Pedir al usuario donde guardar el PDF
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".pdf",
+            filetypes=[("PDF files", "*.pdf")],
+            title="Guardar PDF como"
+        )
 
-            messagebox.showinfo("Éxito", f"PDF exportado correctamente:\n{file_path}")
+        if not file_path:
+            return  # Usuario canceló
 
-        except Exception as e:
-            messagebox.showerror("Error", f"Error exportando a PDF: {str(e)}")
+        self._run_export(self._write_pdf, file_path, "PDF")
 
     def _clear_form(self):
         """Limpia el formulario y resetea validaciones"""
@@ -0,0 +1,208 @@
+"""
+Panel de indicadores: ocupación, ADR, RevPAR e ingresos por hotel y periodo
+"""
+import tkinter as tk
+from tkinter import ttk
+from utils.exceptions import ValidationError
+from utils.helpers import UIHelpers
+from utils.logger import get_logger
+
+logger = get_logger('views')
+
+
+class IndicadoresView:
+    """Muestra cortes del cubo de IndicadoresController"""
+
+    COLUMNS = (
+        ('NOMBRE_HOTEL', 'Hotel', 220, 'w'),
+        ('periodo', 'Periodo', 80, 'w'),
+        ('noches_vendidas', 'Noches vendidas', 110, 'e'),
+        ('noches_disponibles', 'Noches disponibles', 120, 'e'),
+        ('ocupacion', 'Ocupación', 90, 'e'),
+        ('adr', 'ADR', 90, 'e'),
+        ('revpar', 'RevPAR', 90, 'e'),
+        ('ingresos_habitaciones', 'Ingresos habitaciones', 140, 'e'),
+        ('ingresos_servicios', 'Ingresos servicios', 130, 'e'),
+        ('ingresos_totales', 'Ingresos totales', 130, 'e'),
+        ('llegadas', 'Llegadas', 80, 'e')
+    )
+
+    # Texto del selector de agrupación -> group_by de IndicadoresController.query()
+    GROUPINGS = (
+        ('Hotel y mes', ('hotel', 'month')),
+        ('Hotel y año', ('hotel', 'year')),
+        ('Hotel', ('hotel',)),
+        ('Mes', ('month',)),
+        ('Año', ('year',)),
+        ('Total', ())
+    )
+
+    ALL_HOTELS = "Todos"
+
+    def __init__(self, parent_frame, controller, task_runner):
+        """
+        Inicializa el panel
+
+        Args:
+            parent_frame: Frame padre donde se colocará el panel
+            controller: Instancia de IndicadoresController
+            task_runner: TaskRunner compartido de la ventana principal
+        """
+        self.parent_frame = parent_frame
+        self.controller = controller
+        self.task_runner = task_runner
+        self.hotel_choices = {self.ALL_HOTELS: None}
+        self._setup_ui()
+
+    def _setup_ui(self):
+        """Crea los filtros y la tabla"""
+        self.main_frame = tk.Frame(self.parent_frame)
+        self.main_frame.pack(fill="both", expand=True, padx=10, pady=10)
+
+        title_label = tk.Label(
+            self.main_frame,
+            text="INDICADORES DE OCUPACIÓN E INGRESOS",
+            font=("Arial", 14, "bold")
+        )
+        title_label.pack(pady=10)
+
+        # models.analytics valora las noches con el RateEngine, no con reservas.tarifa_aplicada
+        note_label = tk.Label(
+            self.main_frame,
+            text="Ingresos por habitaciones estimados con las tarifas vigentes hoy (tarifa menos "
+                 "descuento, sin impuestos), no con la tarifa aplicada en cada reserva. Noches "
+                 "disponibles según las habitaciones actuales de cada hotel.",
+            font=("Arial", 9, "italic"),
+            fg="#555555",
+            wraplength=900,
+            justify=tk.LEFT
+        )
+        note_label.pack(pady=(0, 10))
+
+        self.filter_frame = tk.Frame(self.main_frame)
+        self.filter_frame.pack(fill="x", pady=(0, 10))
+
+        tk.Label(self.filter_frame, text="Hotel:", font=("Arial", 10)).pack(side=tk.LEFT)
+        self.hotel_var = tk.StringVar(value=self.ALL_HOTELS)
+        self.hotel_combo = ttk.Combobox(self.filter_frame, textvariable=self.hotel_var,
+                                        values=[self.ALL_HOTELS], state="readonly", width=25)
+        self.hotel_combo.pack(side=tk.LEFT, padx=(3, 10))
+
+        tk.Label(self.filter_frame, text="Desde (AAAA-MM):", font=("Arial", 10)).pack(side=tk.LEFT)
+        self.desde_var = tk.StringVar()
+        tk.Entry(self.filter_frame, textvariable=self.desde_var, width=9).pack(side=tk.LEFT, padx=(3, 10))
+
+        tk.Label(self.filter_frame, text="Hasta (AAAA-MM):", font=("Arial", 10)).pack(side=tk.LEFT)
+        self.hasta_var = tk.StringVar()
+        tk.Entry(self.filter_frame, textvariable=self.hasta_var, width=9).pack(side=tk.LEFT, padx=(3, 10))
+
+        tk.Label(self.filter_frame, text="Agrupar por:", font=("Arial", 10)).pack(side=tk.LEFT)
+        self.group_var = tk.StringVar(value=self.GROUPINGS[0][0])
+        group_combo = ttk.Combobox(self.filter_frame, textvariable=self.group_var,
+                                   values=[label for label, _ in self.GROUPINGS],
+                                   state="readonly", width=12)
+        group_combo.pack(side=tk.LEFT, padx=(3, 10))
+
+        # Los filtros solo cortan el cubo ya cargado: no vuelven a la base de datos
+        self.hotel_combo.bind("<<ComboboxSelected>>", lambda event: self.show())
+        group_combo.bind("<<ComboboxSelected>>", lambda event: self.show())
+
+        buttons_config = [
+            ("Aplicar", "#4CAF50", self.show),
+            ("Actualizar", "#2196F3", self.refresh)
+        ]
+        for text, color, command in buttons_config:
+            btn = tk.Button(
+                self.filter_frame,
+                text=text,
+                font=("Arial", 10),
+                bg=color,
+                fg="white",
+                width=12,
+                command=command
+            )
+            btn.pack(side=tk.LEFT, padx=3)
+
+        self.summary_label = tk.Label(self.filter_frame, text="", font=("Arial", 9))
+        self.summary_label.pack(side=tk.RIGHT, padx=10)
+
+        tree_frame = tk.Frame(self.main_frame)
+        tree_frame.pack(fill="both", expand=True)
+
+        self.tree = ttk.Treeview(
+            tree_frame, columns=[column[0] for column in self.COLUMNS], show='headings'
+        )
+        for key, heading, width, anchor in self.COLUMNS:
+            self.tree.heading(key, text=heading)
+            self.tree.column(key, width=width, anchor=anchor, stretch=(key == 'NOMBRE_HOTEL'))
+
+        scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side="right", fill="y")
+        self.tree.pack(side="left", fill="both", expand=True)
+
+    def refresh(self):
+        """Pone el cubo al día en segundo plano y repinta la tabla al terminar"""
+        self.summary_label.config(text="Actualizando indicadores...")
+        self.task_runner.submit(
+            self.controller.refresh,
+            key="indicadores:refresh",
+            on_success=self._on_refreshed,
+            on_error=self._on_refresh_error
+        )
+
+    def _on_refreshed(self, hotel_names):
+        """Actualiza la lista de hoteles y muestra el corte seleccionado"""
+        self.hotel_choices = {self.ALL_HOTELS: None}
+        for hotel_id, name in sorted(hotel_names.items(), key=lambda item: str(item[1])):
+            self.hotel_choices[f"{name} ({hotel_id})"] = hotel_id
+        self.hotel_combo.config(values=list(self.hotel_choices))
+        if self.hotel_var.get() not in self.hotel_choices:
+            self.hotel_var.set(self.ALL_HOTELS)
+        self.show()
+
+    def _on_refresh_error(self, error):
+        logger.error("Error actualizando indicadores: %s", error)
+        self.summary_label.config(text="")
+        UIHelpers.show_error_message("Error", f"No se pudieron actualizar los indicadores: {str(error)}")
+
+    def show(self):
+        """Repinta la tabla con los filtros actuales (consulta en memoria)"""
+        group_by = dict(self.GROUPINGS).get(self.group_var.get(), self.GROUPINGS[0][1])
+        filters = {
+            'hotel_id': self.hotel_choices.get(self.hotel_var.get()),
+            'desde': self.desde_var.get(),
+            'hasta': self.hasta_var.get()
+        }
+        try:
+            rows = self.controller.query(group_by=group_by, **filters)
+            # El resumen sale del total del cubo: la tabla omite los meses sin
+            # ventas y sumar sus noches disponibles inflaría la ocupación
+            totals = self.controller.query(group_by=(), **filters)
+        except ValidationError as e:
+            UIHelpers.show_error_message("Filtro no válido", e.message)
+            return
+
+        self.tree.delete(*self.tree.get_children())
+        for row in rows:
+            self.tree.insert('', 'end', values=[self._format(key, row.get(key))
+                                                for key, _, _, _ in self.COLUMNS])
+
+        total = totals[0] if totals else {}
+        occupancy = total.get('ocupacion', 0.0)
+        revenue = total.get('ingresos_totales', 0.0)
+        self.summary_label.config(
+            text=f"{len(rows)} filas | Ocupación: {occupancy:.1%} | Ingresos: {revenue:,.2f}"
+        )
+
+    @staticmethod
+    def _format(key, value):
+        if value is None:
+            return ''
+        if key == 'ocupacion':
+            return f"{value:.1%}"
+        if key in ('noches_vendidas', 'noches_disponibles', 'llegadas'):
+            return f"{value:,.0f}"
+        if isinstance(value, float):
+            return f"{value:,.2f}"
+        return value
@@ -7,20 +7,34 @@ from tkinter import ttk
 from views.hoteles_view import HotelesView
 from views.clientes_view import ClientesView
 from views.parcelas_view import ParcelasView
+from views.performance_view import PerformanceView
+from views.indicadores_view import IndicadoresView
 from controllers.hoteles_controller import HotelesController
 from controllers.clientes_controller import ClientesController
 from controllers.parcelas_controller import ParcelasController
+from controllers.tarifas_controller import TarifasController
+from controllers.indicadores_controller import IndicadoresController
 from models.hoteles import Hoteles
 from models.clientes import Clientes
 from models.parcelas import Parcelas
+from models.reservas import Reservas
+from models.habitaciones import Habitaciones
+from models.tarifas import Tarifas
+from models.temporadas import Temporadas
 from utils.helpers import UIHelpers, ThemeManager
+from utils.task_runner import TaskRunner
 import os
 import sys
+from utils.logger import get_logger
+
+logger = get_logger('views')
 
 
 class MainWindow:
     """Ventana principal con pestañas para cada entidad"""
 
+    PERF_STATUS_INTERVAL_MS = 5000
+
     def __init__(self, root, db_connection):
         """
         Inicializa la ventana principal
@@ -33,6 +47,13 @@ class MainWindow:
         self.db = db_connection
         self.views = {}  # ✅ Diccionario para almacenar las vistas
 
+        # Consultas y exportaciones fuera del hilo de Tkinter; un hilo por
+        # conexión del pool menos una, que queda libre para las operaciones del
+        # hilo de la interfaz (uno solo si la conexión es compartida). Las
+        # lecturas por lotes (iter_query) usan conexiones aparte y no cuentan
+        pool_size = getattr(self.db, 'pool_size', None) or 1
+        self.task_runner = TaskRunner(self.root, max_workers=max(pool_size - 1, 1))
+
         # Configurar ventana principal
         self._setup_main_window()
 
@@ -69,11 +90,11 @@ class MainWindow:
 
     def _setup_favicon(self):
         """Configura el favicon de la aplicación de forma robusta"""
-        print("🔄 Intentando cargar favicon...")
+        logger.debug("Intentando cargar favicon...")
 
         # Obtener el directorio actual del script
         current_dir = os.path.dirname(os.path.abspath(__file__))
-        print(f"📁 Directorio actual: {current_dir}")
+        logger.debug("Directorio actual: %s", current_dir)
 
         # Lista de posibles ubicaciones del favicon
         favicon_paths = [
@@ -88,10 +109,10 @@ class MainWindow:
         ]
 
         # Verificar qué archivos existen
-        print("🔍 Buscando favicon en las siguientes rutas:")
+        logger.debug("Buscando favicon en las siguientes rutas:")
         for path in favicon_paths:
             exists = os.path.exists(path)
-            print(f"   {path} - {'✅ EXISTE' if exists else '❌ NO EXISTE'}")
+            logger.debug("%s - %s", path, '✅ EXISTE' if exists else '❌ NO EXISTE')
 
         # Intentar cargar el favicon
         favicon_loaded = False
@@ -99,15 +120,15 @@ class MainWindow:
             try:
                 if os.path.exists(path):
                     self.root.iconbitmap(path)
-                    print(f"✅ Favicon cargado exitosamente: {path}")
+                    logger.debug("Favicon cargado exitosamente: %s", path)
                     favicon_loaded = True
                     break
             except Exception as e:
-                print(f"❌ Error cargando {path}: {str(e)}")
+                logger.error("Error cargando %s: %s", path, str(e))
                 continue
 
         if not favicon_loaded:
-            print("⚠️ No se pudo cargar ningún favicon. La aplicación funcionará sin él.")
+            logger.warning("No se pudo cargar ningún favicon. La aplicación funcionará sin él.")
 
             # Intentar método alternativo con PhotoImage para PNG
             png_paths = [
@@ -123,11 +144,11 @@ class MainWindow:
                     if os.path.exists(path):
                         icon = tk.PhotoImage(file=path)
                         self.root.iconphoto(True, icon)
-                        print(f"✅ Favicon PNG cargado: {path}")
+                        logger.debug("Favicon PNG cargado: %s", path)
                         favicon_loaded = True
                         break
                 except Exception as e:
-                    print(f"❌ Error cargando PNG {path}: {str(e)}")
+                    logger.error("Error cargando PNG %s: %s", path, str(e))
                     continue
 
     def _setup_styles(self):
@@ -153,12 +174,25 @@ class MainWindow:
         self.hotels_model = Hoteles(self.db)
         self.clients_model = Clientes(self.db)
         self.parcelas_model = Parcelas(self.db)
+        self.reservas_model = Reservas(self.db)
+        self.habitaciones_model = Habitaciones(self.db)
+        self.tarifas_model = Tarifas(self.db)
+        self.temporadas_model = Temporadas(self.db)
+
+        # Hoteles y clientes se releen por ID al seleccionarlos y al guardar
+        self.hotels_model.enable_cache()
+        self.clients_model.enable_cache()
 
     def _create_controllers(self):
         """Crea las instancias de los controladores"""
         self.hotels_controller = HotelesController(self.hotels_model)
         self.clients_controller = ClientesController(self.clients_model)
         self.parcelas_controller = ParcelasController(self.parcelas_model)
+        self.tarifas_controller = TarifasController(self.tarifas_model, self.temporadas_model)
+        self.indicadores_controller = IndicadoresController(
+            self.db, self.reservas_model, self.habitaciones_model, self.hotels_model,
+            self.tarifas_controller.rates
+        )
 
     def _create_interface(self):
         """Crea la interfaz de usuario principal"""
@@ -210,21 +244,32 @@ class MainWindow:
         # Pestaña de Hoteles
         self.hotels_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.hotels_frame, text="🏨 Hoteles")
-        self.hotels_view = HotelesView(self.hotels_frame, self.hotels_controller)
+        self.hotels_view = HotelesView(self.hotels_frame, self.hotels_controller, self.task_runner)
         self.views['hotels'] = self.hotels_view
 
         # Pestaña de Clientes
         self.clients_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.clients_frame, text="👥 Clientes")
-        self.clients_view = ClientesView(self.clients_frame, self.clients_controller)
+        self.clients_view = ClientesView(self.clients_frame, self.clients_controller, self.task_runner)
         self.views['clients'] = self.clients_view
 
         # Pestaña de Parcelas
         self.parcelas_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.parcelas_frame, text="🌾 Parcelas")
-        self.parcelas_view = ParcelasView(self.parcelas_frame, self.parcelas_controller)
+        self.parcelas_view = ParcelasView(self.parcelas_frame, self.parcelas_controller, self.task_runner)
         self.views['parcelas'] = self.parcelas_view
 
+        # Pestaña de Rendimiento (latencias por consulta)
+        self.performance_frame = ttk.Frame(self.notebook)
+        self.notebook.add(self.performance_frame, text="📈 Rendimiento")
+        self.performance_view = PerformanceView(self.performance_frame, self.db)
+
+        # Pestaña de Indicadores (ocupación e ingresos por hotel y mes)
+        self.indicadores_frame = ttk.Frame(self.notebook)
+        self.notebook.add(self.indicadores_frame, text="📊 Indicadores")
+        self.indicadores_view = IndicadoresView(self.indicadores_frame, self.indicadores_controller,
+                                                self.task_runner)
+
         # Configurar evento de cambio de pestaña
         self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
 
@@ -253,6 +298,39 @@ class MainWindow:
         )
         self.version_label.pack(side="right", padx=10)
 
+        # Resumen de latencias de la base de datos
+        self.perf_label = tk.Label(
+            self.status_frame,
+            text="",
+            font=("Arial", 9),
+            fg="white",
+            bg='#34495e'
+        )
+        self.perf_label.pack(side="right", padx=10)
+        self._update_perf_status()
+
+    def _update_perf_status(self):
+        """Muestra en la barra de estado la consulta con peor p95 y se reprograma"""
+        try:
+            stats = self.db.get_query_stats(order_by='p95_ms') if hasattr(self.db, 'get_query_stats') else []
+            if stats:
+                total_calls = sum(entry['calls'] for entry in stats)
+                slowest = stats[0]
+                text = f"Consultas: {total_calls} | Peor p95: {slowest['p95_ms']:.1f} ms"
+                cache_stats = [
+                    model.get_cache_stats() for model in (self.hotels_model, self.clients_model)
+                ]
+                cache_stats = [entry for entry in cache_stats if entry]
+                lookups = sum(entry['hits'] + entry['misses'] for entry in cache_stats)
+                if lookups:
+                    hits = sum(entry['hits'] for entry in cache_stats)
+                    text += f" | Caché: {hits / lookups:.0%}"
+                self.perf_label.config(text=text)
+        except Exception as e:
+            logger.error("Error actualizando resumen de rendimiento: %s", e)
+
+        self.root.after(self.PERF_STATUS_INTERVAL_MS, self._update_perf_status)
+
     def _on_tab_changed(self, event):
         """Maneja el cambio de pestaña"""
         try:
@@ -261,43 +339,46 @@ class MainWindow:
                 tab_index = self.notebook.index(selected_tab)
                 tab_text = self.notebook.tab(tab_index, "text")
 
-                print(f"Cambiando a pestaña: {tab_text}")
+                logger.debug("Cambiando a pestaña: %s", tab_text)
 
-                # Actualizar datos cuando se cambia de pestaña
+                # Recargar la lista solo si la tabla cambió desde la última carga
                 if hasattr(self, 'hotels_view') and tab_text == "🏨 Hoteles":
-                    self.hotels_view._refresh_list()
+                    self.hotels_view.refresh_if_changed()
                 elif hasattr(self, 'clients_view') and tab_text == "👥 Clientes":
-                    self.clients_view._refresh_list()
+                    self.clients_view.refresh_if_changed()
                 elif hasattr(self, 'parcelas_view') and tab_text == "🌾 Parcelas":
-                    self.parcelas_view._refresh_list()
+                    self.parcelas_view.refresh_if_changed()
+                elif hasattr(self, 'performance_view') and tab_text == "📈 Rendimiento":
+                    self.performance_view.refresh()
+                elif hasattr(self, 'indicadores_view') and tab_text == "📊 Indicadores":
+                    # Solo aplica lo que cambió desde la última vez
+                    self.indicadores_view.refresh()
 
         except Exception as e:
-            print(f"Error al cambiar pestaña: {e}")
+            logger.error("Error al cambiar pestaña: %s", e)
 
     def _load_initial_data(self):
-        """Carga datos iniciales en las vistas"""
+        """Carga datos iniciales en las vistas (las consultas corren en segundo plano)"""
         try:
-            print("🔄 Cargando datos iniciales...")
+            logger.debug("Cargando datos iniciales...")
 
             # Actualizar todas las listas inicialmente
             if hasattr(self, 'hotels_view'):
-                print("🏨 Cargando hoteles...")
+                logger.debug("Cargando hoteles...")
                 self.hotels_view._refresh_list()
 
             if hasattr(self, 'clients_view'):
-                print("👥 Cargando clientes...")
+                logger.debug("Cargando clientes...")
                 self.clients_view._refresh_list()
 
             if hasattr(self, 'parcelas_view'):
-                print("🌾 Cargando parcelas...")
+                logger.debug("Cargando parcelas...")
                 self.parcelas_view._refresh_list()
 
-            print("✅ Datos iniciales cargados correctamente")
+            logger.debug("Datos iniciales cargados correctamente")
 
         except Exception as e:
-            print(f"❌ Error cargando datos iniciales: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error cargando datos iniciales: %s", e)
 
     def change_theme(self):
         """Cambia el tema de la aplicación"""
@@ -321,10 +402,20 @@ class MainWindow:
             self.status_label.config(text=message)
 
     def show_loading(self, show=True):
-        """Muestra u oculta indicador de carga (placeholder)"""
-        pass
+        """Muestra u oculta el indicador de carga en la barra de estado"""
+        if show:
+            self.update_status("Cargando...")
+            self.root.config(cursor="watch")
+        else:
+            self.update_status("Sistema listo | AgroControl Database Management System")
+            self.root.config(cursor="")
+
+    def shutdown(self):
+        """Cancela las tareas en segundo plano pendientes"""
+        self.task_runner.shutdown()
 
     def _on_closing(self):
         """Maneja el cierre de la aplicación"""
         if messagebox.askokcancel("Salir", "¿Quieres salir de la aplicación?"):
+            self.shutdown()
             self.root.destroy()
\ No newline at end of file
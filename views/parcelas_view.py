@@ -3,17 +3,35 @@ Vista específica para la gestión de parcelas
 """
 import tkinter as tk
 from tkinter import ttk
+from tkinter import filedialog
 from views.base_view import BaseView
-from utils.helpers import UIHelpers, safe_str
+from utils.helpers import UIHelpers
+from models.parcelas import PARCELA_FIELDS
+from models.records import display_row
+from utils.exporters import ExportColumn
+from utils.logger import get_logger
+
+logger = get_logger('views')
 
 
 class ParcelasView(BaseView):
     """Vista específica para parcelas"""
 
-    def __init__(self, parent_frame, controller):
+    export_title = 'REPORTE DE PARCELAS'
+    export_summary = 'Total de parcelas registradas: {count}'
+    export_columns = (
+        ExportColumn('ID_PARCELA', 'ID PARCELA', 12, centered=True),
+        ExportColumn('AREA_HECTAREAS_PARCELA', 'ÁREA (HECTÁREAS)', 18, centered=True),
+        ExportColumn('SISTEMA_RIEGO', 'SISTEMA DE RIEGO', 18),
+        ExportColumn('HISTORIAL_DE_USO', 'HISTORIAL DE USO', 40),
+        ExportColumn('ID_FINCA', 'ID FINCA', 12, centered=True)
+    )
+    pdf_columns = export_columns
+
+    def __init__(self, parent_frame, controller, task_runner=None):
         self.form_title = "GESTIÓN DE PARCELAS"
         self.entity_name = "PARCELAS"
-        super().__init__(parent_frame, controller)
+        super().__init__(parent_frame, controller, task_runner)
 
     def _create_form_fields(self):
         """Crea los campos específicos del formulario de parcelas"""
@@ -156,7 +174,7 @@ class ParcelasView(BaseView):
             self.tree.tag_configure('evenrow', background='#2e2e2e')
 
         except Exception as e:
-            print(f"Error configurando estilos: {e}")
+            logger.error("Error configurando estilos: %s", e)
 
     def _get_form_data(self):
         """Obtiene los datos del formulario de parcelas"""
@@ -195,13 +213,7 @@ class ParcelasView(BaseView):
 
     def _entity_to_tree_values(self, entity):
         """Convierte una entidad parcela a valores para el TreeView"""
-        return (
-            safe_str(entity.get('ID_PARCELA', '')),
-            safe_str(entity.get('AREA_HECTAREAS_PARCELA', '')),
-            safe_str(entity.get('SISTEMA_RIEGO', '')),
-            safe_str(entity.get('HISTORIAL_DE_USO', '')),
-            safe_str(entity.get('ID_FINCA', ''))
-        )
+        return display_row(entity, PARCELA_FIELDS)
 
     def _get_entity_id_from_form(self):
         """Obtiene el ID de la parcela desde el formulario"""
@@ -211,32 +223,6 @@ class ParcelasView(BaseView):
         except ValueError:
             return None
 
-    def _refresh_list(self):
-        """Actualiza la lista de parcelas con colores alternados"""
-        try:
-            print("_refresh_list de ParcelasView llamado")
-
-            # Limpiar TreeView
-            for item in self.tree.get_children():
-                self.tree.delete(item)
-
-            # Obtener datos
-            parcelas = self.controller.get_all()
-            print(f"Se obtuvieron {len(parcelas)} parcelas del controlador")
-
-            # Insertar datos
-            for index, parcela in enumerate(parcelas):
-                values = self._entity_to_tree_values(parcela)
-                tag = 'evenrow' if index % 2 == 0 else 'oddrow'
-                self.tree.insert('', 'end', values=values, tags=(tag,))
-
-            print(f"TreeView de parcelas actualizado con {len(parcelas)} parcelas")
-
-        except Exception as e:
-            print(f"Error en _refresh_list de ParcelasView: {e}")
-            import traceback
-            traceback.print_exc()
-
     def _on_search(self):
         """Sobrescribe la búsqueda para parcelas"""
         parcela_id = self.get_field_value('id_parcela')
@@ -260,27 +246,31 @@ class ParcelasView(BaseView):
     # Métodos adicionales específicos para parcelas
     def _export_excel(self):
         """Exporta datos de parcelas a Excel"""
-        try:
-            parcelas = self.controller.get_all()
-            if parcelas:
-                # Aquí iría la lógica para exportar a Excel
-                UIHelpers.show_success_message("Éxito", "Datos exportados a Excel correctamente")
-            else:
-                UIHelpers.show_error_message("Error", "No hay datos para exportar")
-        except Exception as e:
-            UIHelpers.show_error_message("Error", f"Error exportando a Excel: {str(e)}")
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".xlsx",
+            filetypes=[("Excel files", "*.xlsx")],
+            title="Guardar Excel como",
+            initialfile="parcelas.xlsx"
+        )
+
+        if not file_path:
+            return
+
+        self._run_export(self._write_excel, file_path, "Excel")
 
     def _export_pdf(self):
         """Exporta datos de parcelas a PDF"""
-        try:
-            parcelas = self.controller.get_all()
-            if parcelas:
-                # Aquí iría la lógica para exportar a PDF
-                UIHelpers.show_success_message("Éxito", "Datos exportados a PDF correctamente")
-            else:
-                UIHelpers.show_error_message("Error", "No hay datos para exportar")
-        except Exception as e:
-            UIHelpers.show_error_message("Error", f"Error exportando a PDF: {str(e)}")
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".pdf",
+            filetypes=[("PDF files", "*.pdf")],
+            title="Guardar PDF como",
+            initialfile="parcelas.pdf"
+        )
+
+        if not file_path:
+            return
+
+        self._run_export(self._write_pdf, file_path, "PDF")
 
     def _change_theme(self):
         """Cambia el tema de la aplicación"""
@@ -0,0 +1,133 @@
+"""
+Panel de rendimiento: latencias por consulta de la base de datos
+"""
+import tkinter as tk
+from tkinter import ttk, filedialog
+from utils.helpers import UIHelpers
+from utils.logger import get_logger
+
+logger = get_logger('views')
+
+
+class PerformanceView:
+    """Muestra las estadísticas de DatabaseConnection.get_query_stats()"""
+
+    COLUMNS = (
+        ('query', 'Consulta', 520, 'w'),
+        ('calls', 'Llamadas', 80, 'e'),
+        ('rows', 'Filas', 80, 'e'),
+        ('p50_ms', 'p50 (ms)', 80, 'e'),
+        ('p95_ms', 'p95 (ms)', 80, 'e'),
+        ('p99_ms', 'p99 (ms)', 80, 'e'),
+        ('max_ms', 'Máx (ms)', 80, 'e'),
+        ('total_ms', 'Total (ms)', 90, 'e'),
+        ('errors', 'Errores', 70, 'e')
+    )
+
+    def __init__(self, parent_frame, db_connection):
+        """
+        Inicializa el panel
+
+        Args:
+            parent_frame: Frame padre donde se colocará el panel
+            db_connection: Instancia de DatabaseConnection
+        """
+        self.parent_frame = parent_frame
+        self.db = db_connection
+        self.order_by = 'total_ms'
+        self._setup_ui()
+
+    def _setup_ui(self):
+        """Crea la barra de botones y la tabla"""
+        self.main_frame = tk.Frame(self.parent_frame)
+        self.main_frame.pack(fill="both", expand=True, padx=10, pady=10)
+
+        title_label = tk.Label(
+            self.main_frame,
+            text="RENDIMIENTO DE CONSULTAS",
+            font=("Arial", 14, "bold")
+        )
+        title_label.pack(pady=10)
+
+        self.button_frame = tk.Frame(self.main_frame)
+        self.button_frame.pack(fill="x", pady=(0, 10))
+
+        buttons_config = [
+            ("Actualizar", "#2196F3", self.refresh),
+            ("Reiniciar", "#f44336", self._on_reset),
+            ("Exportar JSON", "#4CAF50", self._on_export)
+        ]
+        for text, color, command in buttons_config:
+            btn = tk.Button(
+                self.button_frame,
+                text=text,
+                font=("Arial", 10),
+                bg=color,
+                fg="white",
+                width=14,
+                command=command
+            )
+            btn.pack(side=tk.LEFT, padx=3)
+
+        self.summary_label = tk.Label(self.button_frame, text="", font=("Arial", 9))
+        self.summary_label.pack(side=tk.RIGHT, padx=10)
+
+        tree_frame = tk.Frame(self.main_frame)
+        tree_frame.pack(fill="both", expand=True)
+
+        self.tree = ttk.Treeview(
+            tree_frame, columns=[column[0] for column in self.COLUMNS], show='headings'
+        )
+        for key, heading, width, anchor in self.COLUMNS:
+            self.tree.heading(key, text=heading, command=lambda k=key: self._sort_by(k))
+            self.tree.column(key, width=width, anchor=anchor, stretch=(key == 'query'))
+
+        scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side="right", fill="y")
+        self.tree.pack(side="left", fill="both", expand=True)
+
+    def refresh(self):
+        """Vuelve a leer las estadísticas y repinta la tabla"""
+        try:
+            stats = self.db.get_query_stats(order_by=self.order_by)
+        except Exception as e:
+            logger.error("Error obteniendo estadísticas de consultas: %s", e)
+            return
+
+        self.tree.delete(*self.tree.get_children())
+        for entry in stats:
+            values = []
+            for key, _, _, _ in self.COLUMNS:
+                value = entry.get(key, '')
+                values.append(f"{value:.2f}" if isinstance(value, float) else value)
+            self.tree.insert('', 'end', values=values)
+
+        total_calls = sum(entry['calls'] for entry in stats)
+        self.summary_label.config(text=f"{len(stats)} consultas distintas | {total_calls} ejecuciones")
+
+    def _sort_by(self, key):
+        """Ordena la tabla por la métrica de la columna pulsada"""
+        if key != 'query':
+            self.order_by = key
+            self.refresh()
+
+    def _on_reset(self):
+        """Descarta las mediciones acumuladas"""
+        self.db.reset_query_stats()
+        self.refresh()
+
+    def _on_export(self):
+        """Guarda las estadísticas en un archivo JSON"""
+        path = filedialog.asksaveasfilename(
+            title="Guardar estadísticas de consultas",
+            defaultextension=".json",
+            filetypes=[("JSON", "*.json")]
+        )
+        if not path:
+            return
+        try:
+            self.db.dump_query_stats(path)
+            UIHelpers.show_success_message("Exportación", f"Estadísticas guardadas en {path}")
+        except Exception as e:
+            UIHelpers.show_error_message("Error", f"No se pudieron guardar las estadísticas: {str(e)}")
@@ -0,0 +1,123 @@
+"""
+Comparación por clave de dos listas de filas para refrescar el TreeView
+sin borrarlo y volver a llenarlo
+"""
+from bisect import bisect_left
+
+
+def first_column_key(values):
+    """Clave por defecto de una fila: la primera columna (el ID de la entidad)"""
+    return values[0]
+
+
+class RowDiff:
+    """Resultado de diff_rows(): operaciones necesarias para pasar de una lista a otra"""
+
+    __slots__ = ('inserted', 'updated', 'deleted', 'moved')
+
+    def __init__(self, inserted, updated, deleted, moved):
+        """
+        Args:
+            inserted (list): Índices en la lista nueva de las filas añadidas
+            updated (list): Índices en la lista nueva de las filas con valores distintos
+            deleted (list): Claves de las filas eliminadas
+            moved (list): Claves de las filas que cambiaron de orden relativo
+        """
+        self.inserted = inserted
+        self.updated = updated
+        self.deleted = deleted
+        self.moved = moved
+
+    @property
+    def operation_count(self):
+        """Total de operaciones de inserción, actualización, borrado y movimiento"""
+        return len(self.inserted) + len(self.updated) + len(self.deleted) + len(self.moved)
+
+    def __bool__(self):
+        return self.operation_count > 0
+
+    def as_dict(self):
+        """
+        Obtiene el resumen del diff
+
+        Returns:
+            dict: Número de operaciones de cada tipo
+        """
+        return {
+            'inserted': len(self.inserted),
+            'updated': len(self.updated),
+            'deleted': len(self.deleted),
+            'moved': len(self.moved)
+        }
+
+
+def diff_rows(old_rows, new_rows, key=first_column_key):
+    """
+    Compara dos listas de filas por clave
+
+    Una fila está "movida" si sigue existiendo pero su orden relativo respecto
+    al resto cambió; el conjunto mínimo de movidas se obtiene con la mayor
+    subsecuencia creciente de las posiciones antiguas (O(n log n)).
+
+    Args:
+        old_rows (list): Filas mostradas actualmente (tuplas de valores)
+        new_rows (list): Filas nuevas
+        key (callable): Obtiene la clave única de una fila
+
+    Returns:
+        RowDiff: Operaciones necesarias
+    """
+    old_index = {key(row): index for index, row in enumerate(old_rows)}
+    new_keys = set()
+
+    inserted = []
+    updated = []
+    kept_keys = []
+    kept_positions = []
+    for index, row in enumerate(new_rows):
+        row_key = key(row)
+        new_keys.add(row_key)
+        position = old_index.get(row_key)
+        if position is None:
+            inserted.append(index)
+            continue
+        if old_rows[position] != row:
+            updated.append(index)
+        kept_keys.append(row_key)
+        kept_positions.append(position)
+
+    deleted = [row_key for row_key in old_index if row_key not in new_keys]
+    stable = _longest_increasing(kept_positions)
+    moved = [row_key for index, row_key in enumerate(kept_keys) if index not in stable]
+    return RowDiff(inserted, updated, deleted, moved)
+
+
+def _longest_increasing(values):
+    """
+    Índices de una subsecuencia creciente de longitud máxima
+
+    Args:
+        values (list): Enteros distintos
+
+    Returns:
+        set: Índices de values que forman la subsecuencia
+    """
+    tails = []  # Último valor de la mejor subsecuencia de cada longitud
+    tail_indices = []
+    previous = [-1] * len(values)
+    for index, value in enumerate(values):
+        length = bisect_left(tails, value)
+        if length == len(tails):
+            tails.append(value)
+            tail_indices.append(index)
+        else:
+            tails[length] = value
+            tail_indices[length] = index
+        previous[index] = tail_indices[length - 1] if length else -1
+
+    result = set()
+    index = tail_indices[-1] if tail_indices else -1
+    while index != -1:
+        result.add(index)
+        index = previous[index]
+    return result
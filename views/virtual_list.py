@@ -0,0 +1,281 @@
+"""
+Lista virtual sobre un ttk.Treeview para listas de entidades grandes
+"""
+from tkinter import ttk
+from views.tree_reconciler import diff_rows, first_column_key
+
+
+class VirtualList:
+    """
+    Muestra miles de filas con solo tantos items de Tk como filas visibles
+
+    Las filas completas viven en memoria (self.rows) como tuplas de valores;
+    el Treeview solo tiene un item por fila visible ("ranura") y al
+    desplazarse se reescriben sus valores. Las filas alternadas se calculan
+    por índice absoluto, así que el rayado no cambia al desplazarse.
+
+    El Treeview conserva su <<TreeviewSelect>>: al pulsar una ranura la
+    selección de Tk contiene ese item con los valores de la fila, igual que
+    antes. Al desplazarse, la fila seleccionada se marca con la etiqueta
+    'selectedrow' en lugar de volver a seleccionarla, para no disparar de
+    nuevo el evento y no sobrescribir el formulario.
+
+    reconcile() compara las filas nuevas con las actuales por clave y solo
+    reescribe las ranuras visibles que cambiaron, conservando la posición de
+    desplazamiento y la fila seleccionada.
+    """
+
+    def __init__(self, tree, on_near_end=None, near_end_rows=20, key=first_column_key):
+        """
+        Args:
+            tree: ttk.Treeview ya configurado (columnas, encabezados, estilos)
+            on_near_end (callable): Se llama cuando la vista llega cerca del final
+                de las filas cargadas (para pedir la siguiente página)
+            near_end_rows (int): Distancia al final, en filas, que dispara on_near_end
+            key (callable): Obtiene la clave única de una fila (por defecto la primera columna)
+        """
+        self.tree = tree
+        self.on_near_end = on_near_end
+        self.near_end_rows = near_end_rows
+        self.key = key
+        self.rows = []
+        self.offset = 0
+        self.selected_index = None
+        self._slots = []
+        self._shown = []  # (valores, etiquetas) pintados en cada ranura
+
+        self._replace_scrollbars()
+        self._configure_selection_tag()
+        self._bind_events()
+
+    # API de datos
+
+    def set_rows(self, rows):
+        """
+        Sustituye todas las filas y vuelve al principio
+
+        Args:
+            rows (list): Tuplas de valores en el orden de las columnas del Treeview
+        """
+        self.rows = list(rows)
+        self.offset = 0
+        self.selected_index = None
+        selection = self.tree.selection()
+        if selection:
+            self.tree.selection_remove(*selection)
+        self._render()
+
+    def append_rows(self, rows):
+        """
+        Añade filas al final sin mover la vista
+
+        Args:
+            rows (list): Tuplas de valores
+        """
+        self.rows.extend(rows)
+        self._render()
+
+    def reconcile(self, rows):
+        """
+        Sustituye las filas aplicando solo las diferencias
+
+        La vista se mantiene anclada a la fila superior y la selección sigue a
+        su clave; si ambas desaparecieron se conserva la posición numérica.
+
+        Args:
+            rows (list): Tuplas de valores nuevas
+
+        Returns:
+            RowDiff: Operaciones detectadas (vacío si no hubo cambios)
+        """
+        rows = list(rows)
+        diff = diff_rows(self.rows, rows, self.key)
+        if not diff:
+            return diff
+
+        anchor_key = self.key(self.rows[self.offset]) if self.offset < len(self.rows) else None
+        selected_key = None
+        if self.selected_index is not None and self.selected_index < len(self.rows):
+            selected_key = self.key(self.rows[self.selected_index])
+
+        self.rows = rows
+        positions = {self.key(row): index for index, row in enumerate(rows)}
+        self.offset = positions.get(anchor_key, self.offset)
+        self.selected_index = positions.get(selected_key)
+        self._render()
+        return diff
+
+    def clear(self):
+        """Elimina todas las filas"""
+        self.set_rows([])
+
+    def __len__(self):
+        return len(self.rows)
+
+    def see(self, index):
+        """
+        Desplaza la vista para que la fila indicada quede visible
+
+        Args:
+            index (int): Índice absoluto de la fila
+        """
+        visible = self._visible_count()
+        if index < self.offset:
+            self._scroll_to(index)
+        elif index >= self.offset + visible:
+            self._scroll_to(index - visible + 1)
+
+    # Construcción
+
+    def _replace_scrollbars(self):
+        """Sustituye las barras verticales del contenedor por una propia"""
+        parent = self.tree.master
+        for child in parent.winfo_children():
+            if isinstance(child, ttk.Scrollbar) and str(child.cget('orient')) == 'vertical':
+                child.destroy()
+
+        self.scrollbar = ttk.Scrollbar(parent, orient="vertical", command=self._on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y", before=self.tree)
+        # El Treeview nunca se desplaza por sí mismo: todas sus ranuras caben
+        self.tree.configure(yscrollcommand=lambda first, last: None)
+
+    def _configure_selection_tag(self):
+        """Colores de la fila seleccionada cuando no está en la selección de Tk"""
+        style = ttk.Style()
+        selected = style.map("Treeview", query_opt="background")
+        background = next((color for state, color in _state_pairs(selected) if 'selected' in state), '#4CAF50')
+        self.tree.tag_configure('selectedrow', background=background, foreground='white')
+
+    def _bind_events(self):
+        """Rueda del ratón, teclado, redimensionado y selección"""
+        self.tree.bind('<Configure>', lambda e: self._render(), add='+')
+        self.tree.bind('<<TreeviewSelect>>', self._on_select, add='+')
+        self.tree.bind('<MouseWheel>', self._on_mousewheel)
+        self.tree.bind('<Button-4>', lambda e: self._scroll_by(-3))
+        self.tree.bind('<Button-5>', lambda e: self._scroll_by(3))
+        self.tree.bind('<Up>', lambda e: self._on_arrow(-1))
+        self.tree.bind('<Down>', lambda e: self._on_arrow(1))
+        self.tree.bind('<Prior>', lambda e: self._scroll_by(-self._visible_count()) or 'break')
+        self.tree.bind('<Next>', lambda e: self._scroll_by(self._visible_count()) or 'break')
+
+    # Desplazamiento
+
+    def _visible_count(self):
+        """Filas que caben en el área visible del Treeview"""
+        row_height = _row_height(self.tree)
+        height = self.tree.winfo_height()
+        if height <= 1:
+            # Aún no dibujado: se usa la altura configurada en filas
+            return max(1, int(self.tree.cget('height')))
+        # Se descuenta la fila de encabezados
+        return max(1, height // row_height - 1)
+
+    def _max_offset(self):
+        return max(0, len(self.rows) - self._visible_count())
+
+    def _scroll_to(self, offset):
+        offset = min(max(0, int(offset)), self._max_offset())
+        if offset != self.offset:
+            self.offset = offset
+            self._render()
+
+    def _scroll_by(self, delta):
+        self._scroll_to(self.offset + delta)
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        """Comando de la barra: 'moveto' fracción o 'scroll' n units/pages"""
+        if action == 'moveto':
+            self._scroll_to(round(float(amount) * len(self.rows)))
+        elif action == 'scroll':
+            step = self._visible_count() if unit == 'pages' else 1
+            self._scroll_by(int(amount) * step)
+
+    def _on_mousewheel(self, event):
+        self._scroll_by(-3 if event.delta > 0 else 3)
+        return 'break'
+
+    def _on_arrow(self, delta):
+        """Mueve la selección con el teclado desplazando la ventana si hace falta"""
+        if self.selected_index is None:
+            return 'break'
+        index = min(max(0, self.selected_index + delta), len(self.rows) - 1)
+        self.see(index)
+        slot = index - self.offset
+        if 0 <= slot < len(self._slots):
+            self.tree.selection_set(self._slots[slot])
+            self.tree.focus(self._slots[slot])
+        return 'break'
+
+    # Pintado
+
+    def _render(self):
+        """Ajusta el número de ranuras y copia en ellas las filas visibles"""
+        visible = min(self._visible_count(), len(self.rows))
+        self.offset = min(self.offset, self._max_offset())
+
+        while len(self._slots) < visible:
+            self._slots.append(self.tree.insert('', 'end', values=()))
+            self._shown.append(None)
+        while len(self._slots) > visible:
+            self.tree.delete(self._slots.pop())
+            self._shown.pop()
+
+        selection = set(self.tree.selection())
+        for slot_index, item in enumerate(self._slots):
+            index = self.offset + slot_index
+            tags = ['evenrow' if index % 2 == 0 else 'oddrow']
+            if index == self.selected_index:
+                if item not in selection:
+                    tags.append('selectedrow')
+            elif item in selection:
+                # La ranura muestra ahora otra fila: se quita la selección de Tk
+                self.tree.selection_remove(item)
+            shown = (self.rows[index], tuple(tags))
+            if self._shown[slot_index] != shown:
+                self.tree.item(item, values=shown[0], tags=shown[1])
+                self._shown[slot_index] = shown
+
+        self._update_scrollbar()
+
+        if self.on_near_end and len(self.rows) - (self.offset + visible) <= self.near_end_rows:
+            self.on_near_end()
+
+    def _update_scrollbar(self):
+        total = len(self.rows)
+        if not total:
+            self.scrollbar.set(0.0, 1.0)
+            return
+        first = self.offset / total
+        last = min(1.0, (self.offset + len(self._slots)) / total)
+        self.scrollbar.set(first, last)
+
+    def _on_select(self, event):
+        """Recuerda el índice absoluto de la fila pulsada"""
+        selection = self.tree.selection()
+        if selection and selection[0] in self._slots:
+            self.selected_index = self.offset + self._slots.index(selection[0])
+            for slot_index, shown in enumerate(self._shown):
+                if shown is not None and 'selectedrow' in shown[1]:
+                    tags = tuple(tag for tag in shown[1] if tag != 'selectedrow')
+                    self.tree.item(self._slots[slot_index], tags=tags)
+                    self._shown[slot_index] = (shown[0], tags)
+
+
+def _row_height(tree):
+    """Altura de fila del estilo del Treeview (25 px si no está definida)"""
+    style = ttk.Style()
+    value = style.lookup(tree.cget('style') or 'Treeview', 'rowheight')
+    try:
+        return max(1, int(value))
+    except (TypeError, ValueError):
+        return 25
+
+
+def _state_pairs(style_map):
+    """Normaliza el resultado de Style.map() a pares (estados, valor)"""
+    pairs = []
+    for entry in style_map or []:
+        if isinstance(entry, (tuple, list)) and len(entry) >= 2:
+            states, value = entry[:-1], entry[-1]
+            pairs.append((tuple(str(state) for state in states), value))
+    return pairs